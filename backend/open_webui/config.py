@@ -36,6 +36,7 @@ from open_webui.env import (
     log,
 )
 from open_webui.internal.db import Base, get_db
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
 from open_webui.utils.redis import get_redis_connection
 
 
@@ -153,12 +154,43 @@ def save_config(config):
         # Trigger updates on all registered PersistentConfig entries
         for config_item in PERSISTENT_CONFIG_REGISTRY:
             config_item.update()
+
+        CACHE_INVALIDATOR.publish("config")
     except Exception as e:
         log.exception(e)
         return False
     return True
 
 
+def reload_config():
+    """
+    Reloads CONFIG_DATA and the persistent config values from the database after
+    another worker saved them, so that this worker neither serves stale values nor
+    overwrites the other worker's changes on its next save.
+    """
+    global CONFIG_DATA
+    CONFIG_DATA = get_config()
+
+    if not ENABLE_PERSISTENT_CONFIG:
+        return
+
+    for config_item in PERSISTENT_CONFIG_REGISTRY:
+        if (
+            config_item.config_path.startswith("oauth.")
+            and not ENABLE_OAUTH_PERSISTENT_CONFIG
+        ):
+            continue
+
+        new_value = get_config_value(config_item.config_path)
+        if new_value is not None and new_value != config_item.value:
+            config_item.value = new_value
+            config_item.config_value = new_value
+
+
+# Saving a config section sets one key after the other, reload once for all of them
+CACHE_INVALIDATOR.register("config", lambda key: reload_config(), debounce=0.5)
+
+
 T = TypeVar("T")
 
 ENABLE_PERSISTENT_CONFIG = (
@@ -258,6 +290,7 @@ class AppConfig:
         else:
             self._state[key].value = value
             self._state[key].save()
+            CACHE_INVALIDATOR.publish("config", key)
 
             if self._redis and ENABLE_PERSISTENT_CONFIG:
                 redis_key = f"{self._redis_key_prefix}:config:{key}"
@@ -2312,6 +2345,33 @@ Ensure that the tools are effectively utilized to achieve the highest-quality an
 
 VECTOR_DB = os.environ.get("VECTOR_DB", "chroma")
 
+# Size of the thread pool shared by the async methods of backends without a native
+# async client (asearch, aget, aupsert run the sync methods there)
+VECTOR_DB_EXECUTOR_MAX_WORKERS = os.environ.get("VECTOR_DB_EXECUTOR_MAX_WORKERS", "16")
+try:
+    VECTOR_DB_EXECUTOR_MAX_WORKERS = int(VECTOR_DB_EXECUTOR_MAX_WORKERS)
+except ValueError:
+    VECTOR_DB_EXECUTOR_MAX_WORKERS = 16
+
+# Store all users' memories in one collection, partitioned by a user_id metadata
+# field, instead of one user-memory-{id} collection per user. Memories are copied
+# to the shared collection (re-embedded) on their user's first recall, the old
+# user-memory-{id} collections are left in place and can be deleted once every
+# user has been migrated; they are not used again unless this is turned off.
+ENABLE_MEMORY_MULTITENANCY = (
+    os.environ.get("ENABLE_MEMORY_MULTITENANCY", "False").lower() == "true"
+)
+MEMORY_COLLECTION_NAME = os.environ.get("MEMORY_COLLECTION_NAME", "user-memories")
+
+# Memory each worker uses to keep recently recalled users' memory vectors for
+# recall, 0 disables it
+try:
+    MEMORY_VECTOR_CACHE_MAX_MEMORY_MB = int(
+        os.environ.get("MEMORY_VECTOR_CACHE_MAX_MEMORY_MB", "128")
+    )
+except ValueError:
+    MEMORY_VECTOR_CACHE_MAX_MEMORY_MB = 128
+
 # Chroma
 CHROMA_DATA_PATH = f"{DATA_DIR}/vector_db"
 
@@ -2503,6 +2563,24 @@ else:
     except Exception:
         PGVECTOR_IVFFLAT_LISTS = 100
 
+# Batches with at least this many chunks are ingested with binary COPY into a
+# staging table and merged with a single statement (0 disables the COPY path)
+PGVECTOR_COPY_THRESHOLD = os.environ.get("PGVECTOR_COPY_THRESHOLD", 500)
+
+if PGVECTOR_COPY_THRESHOLD == "":
+    PGVECTOR_COPY_THRESHOLD = 500
+else:
+    try:
+        PGVECTOR_COPY_THRESHOLD = int(PGVECTOR_COPY_THRESHOLD)
+    except Exception:
+        PGVECTOR_COPY_THRESHOLD = 500
+
+# Drop the vector index during bulk loads (e.g. knowledge reindexing) and build
+# it once at the end. Searches fall back to sequential scans meanwhile.
+PGVECTOR_DEFER_INDEX_BUILD = (
+    os.getenv("PGVECTOR_DEFER_INDEX_BUILD", "false").lower() == "true"
+)
+
 # openGauss
 OPENGAUSS_DB_URL = os.environ.get("OPENGAUSS_DB_URL", DATABASE_URL)
 
@@ -2978,6 +3056,19 @@ RAG_EMBEDDING_CONCURRENT_REQUESTS = PersistentConfig(
     int(os.getenv("RAG_EMBEDDING_CONCURRENT_REQUESTS", "0")),
 )
 
+# Micro-batching of concurrent embedding calls (e.g. RAG queries from many users)
+ENABLE_RAG_EMBEDDING_MICRO_BATCHING = (
+    os.environ.get("ENABLE_RAG_EMBEDDING_MICRO_BATCHING", "False").lower() == "true"
+)
+
+RAG_EMBEDDING_MICRO_BATCH_MAX_SIZE = int(
+    os.environ.get("RAG_EMBEDDING_MICRO_BATCH_MAX_SIZE", "64")
+)
+
+RAG_EMBEDDING_MICRO_BATCH_MAX_LATENCY_MS = float(
+    os.environ.get("RAG_EMBEDDING_MICRO_BATCH_MAX_LATENCY_MS", "5")
+)
+
 RAG_EMBEDDING_QUERY_PREFIX = os.environ.get("RAG_EMBEDDING_QUERY_PREFIX", None)
 
 RAG_EMBEDDING_CONTENT_PREFIX = os.environ.get("RAG_EMBEDDING_CONTENT_PREFIX", None)
@@ -3028,6 +3119,18 @@ RAG_EXTERNAL_RERANKER_TIMEOUT = PersistentConfig(
     os.environ.get("RAG_EXTERNAL_RERANKER_TIMEOUT", ""),
 )
 
+# (query, chunk) -> score cache for reranking, 0 disables caching
+RAG_RERANKING_CACHE_SIZE = int(os.environ.get("RAG_RERANKING_CACHE_SIZE", "10000"))
+
+RAG_RERANKING_CACHE_TTL = int(os.environ.get("RAG_RERANKING_CACHE_TTL", "3600"))
+
+# Batching of concurrent local reranker calls, 0 disables batching
+RAG_RERANKING_BATCH_WAIT_MS = float(os.environ.get("RAG_RERANKING_BATCH_WAIT_MS", "5"))
+
+RAG_RERANKING_MAX_BATCH_PAIRS = int(
+    os.environ.get("RAG_RERANKING_MAX_BATCH_PAIRS", "256")
+)
+
 
 RAG_TEXT_SPLITTER = PersistentConfig(
     "RAG_TEXT_SPLITTER",
@@ -3271,6 +3374,76 @@ WEB_SEARCH_TRUST_ENV = PersistentConfig(
 )
 
 
+# Seconds search results (per engine and query) and fetched pages (per URL) are
+# reused for, 0 disables. Pages are never kept longer than their Cache-Control allows.
+try:
+    WEB_SEARCH_CACHE_TTL = int(os.environ.get("WEB_SEARCH_CACHE_TTL", "3600"))
+except ValueError:
+    WEB_SEARCH_CACHE_TTL = 3600
+
+try:
+    WEB_FETCH_CACHE_TTL = int(os.environ.get("WEB_FETCH_CACHE_TTL", "3600"))
+except ValueError:
+    WEB_FETCH_CACHE_TTL = 3600
+
+try:
+    WEB_CACHE_MAX_ENTRIES = int(os.environ.get("WEB_CACHE_MAX_ENTRIES", "1000"))
+except ValueError:
+    WEB_CACHE_MAX_ENTRIES = 1000
+
+# "memory" (per worker), "redis" (shared through REDIS_URL) or "disk" (CACHE_DIR/web)
+WEB_CACHE_BACKEND = os.environ.get("WEB_CACHE_BACKEND", "memory").lower()
+
+# Shared connection pool of the web page fetcher (see retrieval/web/fetcher.py)
+try:
+    WEB_FETCH_MAX_CONNECTIONS = int(os.environ.get("WEB_FETCH_MAX_CONNECTIONS", "100"))
+except ValueError:
+    WEB_FETCH_MAX_CONNECTIONS = 100
+
+try:
+    WEB_FETCH_MAX_CONNECTIONS_PER_HOST = int(
+        os.environ.get("WEB_FETCH_MAX_CONNECTIONS_PER_HOST", "6")
+    )
+except ValueError:
+    WEB_FETCH_MAX_CONNECTIONS_PER_HOST = 6
+
+# Pages are read up to this many bytes (the rest is dropped) and for at most
+# WEB_FETCH_TIMEOUT seconds unless WEB_LOADER_TIMEOUT is set
+try:
+    WEB_FETCH_MAX_BYTES = int(
+        os.environ.get("WEB_FETCH_MAX_BYTES", str(5 * 1024 * 1024))
+    )
+except ValueError:
+    WEB_FETCH_MAX_BYTES = 5 * 1024 * 1024
+
+try:
+    WEB_FETCH_TIMEOUT = int(os.environ.get("WEB_FETCH_TIMEOUT", "30"))
+except ValueError:
+    WEB_FETCH_TIMEOUT = 30
+
+# Timeout in seconds of the requests of the async search providers
+try:
+    WEB_SEARCH_TIMEOUT = int(os.environ.get("WEB_SEARCH_TIMEOUT", "15"))
+except ValueError:
+    WEB_SEARCH_TIMEOUT = 15
+
+# Requests per second allowed per search provider, e.g. {"brave": 1} for the
+# Brave free tier. Providers not listed are not throttled.
+try:
+    WEB_SEARCH_RATE_LIMITS = json.loads(os.environ.get("WEB_SEARCH_RATE_LIMITS", "{}"))
+except Exception as e:
+    log.exception(f"Error loading WEB_SEARCH_RATE_LIMITS: {e}")
+    WEB_SEARCH_RATE_LIMITS = {}
+
+# Threads extracting text from fetched HTML off the event loop
+try:
+    WEB_EXTRACT_WORKERS = int(
+        os.environ.get("WEB_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1)))
+    )
+except ValueError:
+    WEB_EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+
+
 OLLAMA_CLOUD_WEB_SEARCH_API_KEY = PersistentConfig(
     "OLLAMA_CLOUD_WEB_SEARCH_API_KEY",
     "rag.web.search.ollama_cloud_api_key",
@@ -3909,6 +4082,45 @@ IMAGES_EDIT_COMFYUI_WORKFLOW_NODES = PersistentConfig(
     images_edit_comfyui_workflow_nodes,
 )
 
+# Images of the chat history are sent to models as base64 data URLs, encoded
+# images are cached by content (see utils/image_cache.py) in memory and, when
+# CHAT_IMAGE_CACHE_MAX_DISK_MB is set, in CACHE_DIR/images.
+try:
+    CHAT_IMAGE_CACHE_MAX_MEMORY_MB = int(
+        os.environ.get("CHAT_IMAGE_CACHE_MAX_MEMORY_MB", "256")
+    )
+except ValueError:
+    CHAT_IMAGE_CACHE_MAX_MEMORY_MB = 256
+
+try:
+    CHAT_IMAGE_CACHE_MAX_DISK_MB = int(
+        os.environ.get("CHAT_IMAGE_CACHE_MAX_DISK_MB", "0")
+    )
+except ValueError:
+    CHAT_IMAGE_CACHE_MAX_DISK_MB = 0
+
+# Seconds the content of an image URL is reused for before it is fetched again
+try:
+    CHAT_IMAGE_URL_CACHE_TTL = int(os.environ.get("CHAT_IMAGE_URL_CACHE_TTL", "3600"))
+except ValueError:
+    CHAT_IMAGE_URL_CACHE_TTL = 3600
+
+# Images larger than CHAT_IMAGE_MAX_SIZE pixels (width or height) are downscaled
+# and, with CHAT_IMAGE_FORMAT (jpeg, png or webp), re-encoded before being sent.
+# 0 and "" keep the original image. Models override them with the imageMaxSize
+# and imageFormat fields of their meta.
+try:
+    CHAT_IMAGE_MAX_SIZE = int(os.environ.get("CHAT_IMAGE_MAX_SIZE", "0"))
+except ValueError:
+    CHAT_IMAGE_MAX_SIZE = 0
+
+CHAT_IMAGE_FORMAT = os.environ.get("CHAT_IMAGE_FORMAT", "").lower()
+
+try:
+    CHAT_IMAGE_QUALITY = int(os.environ.get("CHAT_IMAGE_QUALITY", "85"))
+except ValueError:
+    CHAT_IMAGE_QUALITY = 85
+
 ####################################
 # Audio
 ####################################
@@ -3933,6 +4145,19 @@ WHISPER_MULTILINGUAL = os.getenv("WHISPER_MULTILINGUAL", "False").lower() == "tr
 
 WHISPER_LANGUAGE = os.getenv("WHISPER_LANGUAGE", "").lower() or None
 
+# Run the local Whisper model in a single process per node, shared by all the
+# workers over a Unix socket, instead of loading a copy in each worker.
+ENABLE_WHISPER_SERVICE = os.getenv("ENABLE_WHISPER_SERVICE", "False").lower() == "true"
+WHISPER_SERVICE_SOCKET = os.getenv(
+    "WHISPER_SERVICE_SOCKET", f"{CACHE_DIR}/audio/whisper.sock"
+)
+
+# Speech segments of a file transcribed together by the service, 0 disables batching
+try:
+    WHISPER_SERVICE_BATCH_SIZE = int(os.getenv("WHISPER_SERVICE_BATCH_SIZE", "8"))
+except ValueError:
+    WHISPER_SERVICE_BATCH_SIZE = 8
+
 # Add Deepgram configuration
 DEEPGRAM_API_KEY = PersistentConfig(
     "DEEPGRAM_API_KEY",
@@ -4104,6 +4329,29 @@ AUDIO_TTS_AZURE_SPEECH_OUTPUT_FORMAT = PersistentConfig(
     ),
 )
 
+# Streaming transcriptions (POST /audio/transcriptions with stream=true) split
+# the audio in the first pause after AUDIO_STT_STREAM_CHUNK_SECONDS (at most
+# twice as long) and transcribe up to AUDIO_STT_STREAM_WORKERS chunks at once.
+try:
+    AUDIO_STT_STREAM_CHUNK_SECONDS = int(
+        os.getenv("AUDIO_STT_STREAM_CHUNK_SECONDS", "30")
+    )
+except ValueError:
+    AUDIO_STT_STREAM_CHUNK_SECONDS = 30
+
+try:
+    AUDIO_STT_STREAM_WORKERS = int(os.getenv("AUDIO_STT_STREAM_WORKERS", "4"))
+except ValueError:
+    AUDIO_STT_STREAM_WORKERS = 4
+
+# Synthesized speech is cached in CACHE_DIR/audio/speech, the least recently
+# used files are removed once it holds more than AUDIO_TTS_CACHE_MAX_SIZE_MB.
+# 0 disables the limit.
+try:
+    AUDIO_TTS_CACHE_MAX_SIZE_MB = int(os.getenv("AUDIO_TTS_CACHE_MAX_SIZE_MB", "1024"))
+except ValueError:
+    AUDIO_TTS_CACHE_MAX_SIZE_MB = 1024
+
 
 ####################################
 # LDAP
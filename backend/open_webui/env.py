@@ -1,3 +1,4 @@
+import hashlib
 import importlib.metadata
 import json
 import logging
@@ -5,6 +6,7 @@ import os
 import pkgutil
 import sys
 import shutil
+import tempfile
 import traceback
 from datetime import datetime, timezone
 from typing import Any
@@ -63,13 +65,15 @@ if USE_CUDA.lower() == "true":
 else:
     DEVICE_TYPE = "cpu"
 
-try:
-    import torch
+# MPS only exists on macOS; skip importing torch just to probe for it elsewhere
+if sys.platform == "darwin":
+    try:
+        import torch
 
-    if torch.backends.mps.is_available() and torch.backends.mps.is_built():
-        DEVICE_TYPE = "mps"
-except Exception:
-    pass
+        if torch.backends.mps.is_available() and torch.backends.mps.is_built():
+            DEVICE_TYPE = "mps"
+    except Exception:
+        pass
 
 ####################################
 # LOGGING
@@ -486,6 +490,23 @@ except ValueError:
     UVICORN_WORKERS = 1
     log.info(f"Invalid UVICORN_WORKERS value, defaulting to {UVICORN_WORKERS}")
 
+# Node-local directory shared by the workers of this instance (cache invalidation
+# sockets, rate limit counters). Derived from DATA_DIR so that separate instances
+# on the same host don't share it.
+WORKER_RUNTIME_DIR = Path(
+    os.environ.get(
+        "WORKER_RUNTIME_DIR",
+        Path(tempfile.gettempdir())
+        / f"open-webui-{hashlib.sha256(str(DATA_DIR).encode()).hexdigest()[:12]}",
+    )
+)
+
+# Defer vector DB clients, embedding/reranking models and other heavy
+# subsystems until their first use instead of initializing them at import time
+ENABLE_DEFERRED_STARTUP = (
+    os.environ.get("ENABLE_DEFERRED_STARTUP", "False").lower() == "true"
+)
+
 ####################################
 # WEBUI_AUTH (Required for security)
 ####################################
@@ -723,6 +744,20 @@ else:
         CHAT_STREAM_RESPONSE_CHUNK_MAX_BUFFER_SIZE = None
 
 
+# Timeouts in seconds of the chat payload pre-processing stages (memory, web_search,
+# image_generation, mcp, terminal_tools, tools, files), a stage running longer is
+# cancelled and the chat continues without its result. Stages not listed have none.
+CHAT_PAYLOAD_STAGE_TIMEOUTS = os.environ.get("CHAT_PAYLOAD_STAGE_TIMEOUTS", "")
+
+if CHAT_PAYLOAD_STAGE_TIMEOUTS == "":
+    CHAT_PAYLOAD_STAGE_TIMEOUTS = {"memory": 30, "mcp": 30, "terminal_tools": 30}
+else:
+    try:
+        CHAT_PAYLOAD_STAGE_TIMEOUTS = json.loads(CHAT_PAYLOAD_STAGE_TIMEOUTS)
+    except Exception:
+        CHAT_PAYLOAD_STAGE_TIMEOUTS = {}
+
+
 ####################################
 # WEBSOCKET SUPPORT
 ####################################
@@ -839,6 +874,47 @@ AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL = (
     os.environ.get("AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL", "True").lower() == "true"
 )
 
+# Seconds between background revalidations of OpenAPI tool server specs, 0 disables
+# (specs are then only fetched at startup and when the connections are saved)
+try:
+    TOOL_SERVER_SPEC_REFRESH_INTERVAL = int(
+        os.environ.get("TOOL_SERVER_SPEC_REFRESH_INTERVAL", "300")
+    )
+except ValueError:
+    TOOL_SERVER_SPEC_REFRESH_INTERVAL = 300
+
+####################################
+# MCP SESSION POOL
+####################################
+
+# Keep MCP client sessions open across chat completions instead of connecting
+# (and listing tools) on every tool-enabled request
+ENABLE_MCP_SESSION_POOL = (
+    os.environ.get("ENABLE_MCP_SESSION_POOL", "True").lower() == "true"
+)
+
+try:
+    MCP_SESSION_IDLE_TIMEOUT = int(os.environ.get("MCP_SESSION_IDLE_TIMEOUT", "300"))
+except ValueError:
+    MCP_SESSION_IDLE_TIMEOUT = 300
+
+try:
+    MCP_SESSION_HEALTH_CHECK_INTERVAL = int(
+        os.environ.get("MCP_SESSION_HEALTH_CHECK_INTERVAL", "60")
+    )
+except ValueError:
+    MCP_SESSION_HEALTH_CHECK_INTERVAL = 60
+
+try:
+    MCP_SESSION_POOL_MAX_SIZE = int(os.environ.get("MCP_SESSION_POOL_MAX_SIZE", "100"))
+except ValueError:
+    MCP_SESSION_POOL_MAX_SIZE = 100
+
+try:
+    MCP_TOOL_SPECS_CACHE_TTL = int(os.environ.get("MCP_TOOL_SPECS_CACHE_TTL", "300"))
+except ValueError:
+    MCP_TOOL_SPECS_CACHE_TTL = 300
+
 
 RAG_EMBEDDING_TIMEOUT = os.environ.get("RAG_EMBEDDING_TIMEOUT", "")
 
@@ -905,6 +981,39 @@ SENTENCE_TRANSFORMERS_CROSS_ENCODER_SIGMOID_ACTIVATION_FUNCTION = (
     == "true"
 )
 
+####################################
+# DOCUMENT PARSER PROCESS POOL
+####################################
+
+# Parse uploaded documents with the local loaders (PyPDF, docx2txt, unstructured,
+# ...) in this many worker processes instead of the request thread, 0 disables
+try:
+    DOCUMENT_PARSER_WORKERS = int(os.environ.get("DOCUMENT_PARSER_WORKERS", "0"))
+except ValueError:
+    DOCUMENT_PARSER_WORKERS = 0
+
+# Seconds a single parsing job may run before it is aborted
+try:
+    DOCUMENT_PARSER_TIMEOUT = int(os.environ.get("DOCUMENT_PARSER_TIMEOUT", "300"))
+except ValueError:
+    DOCUMENT_PARSER_TIMEOUT = 300
+
+# Address space limit of each worker process in MB, 0 for no limit
+try:
+    DOCUMENT_PARSER_MAX_MEMORY_MB = int(
+        os.environ.get("DOCUMENT_PARSER_MAX_MEMORY_MB", "0")
+    )
+except ValueError:
+    DOCUMENT_PARSER_MAX_MEMORY_MB = 0
+
+# PDFs with more pages are split into jobs of this many pages parsed in parallel
+try:
+    DOCUMENT_PARSER_PDF_PAGES_PER_JOB = int(
+        os.environ.get("DOCUMENT_PARSER_PDF_PAGES_PER_JOB", "25")
+    )
+except ValueError:
+    DOCUMENT_PARSER_PDF_PAGES_PER_JOB = 25
+
 ####################################
 # OFFLINE_MODE
 ####################################
@@ -1035,6 +1144,15 @@ ENABLE_PIP_INSTALL_FRONTMATTER_REQUIREMENTS = (
 PIP_OPTIONS = os.getenv("PIP_OPTIONS", "").split()
 PIP_PACKAGE_INDEX_OPTIONS = os.getenv("PIP_PACKAGE_INDEX_OPTIONS", "").split()
 
+# Seconds a loaded tool/function module (and its valves) is used without
+# checking the database for a newer version
+try:
+    PLUGIN_CACHE_REVALIDATE_INTERVAL = int(
+        os.environ.get("PLUGIN_CACHE_REVALIDATE_INTERVAL", "10")
+    )
+except ValueError:
+    PLUGIN_CACHE_REVALIDATE_INTERVAL = 10
+
 
 ####################################
 # PROGRESSIVE WEB APP OPTIONS
@@ -33,6 +33,7 @@ from open_webui.models.models import Models
 from open_webui.utils.plugin import (
     load_function_module_by_id,
     get_function_module_from_cache,
+    get_function_valves_from_cache,
 )
 from open_webui.utils.tools import get_tools
 
@@ -59,7 +60,7 @@ def get_function_module_by_id(request: Request, pipe_id: str):
 
     if hasattr(function_module, "valves") and hasattr(function_module, "Valves"):
         Valves = function_module.Valves
-        valves = Functions.get_function_valves_by_id(pipe_id)
+        valves = get_function_valves_from_cache(request, pipe_id)
 
         if valves:
             try:
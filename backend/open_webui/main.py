@@ -6,14 +6,11 @@ import mimetypes
 import os
 import shutil
 import sys
-import time
 import random
-import re
 from uuid import uuid4
 
 
 from contextlib import asynccontextmanager
-from urllib.parse import urlencode, parse_qs, urlparse
 from pydantic import BaseModel
 from sqlalchemy import text
 
@@ -40,13 +37,12 @@ from fastapi import (
 from fastapi.openapi.docs import get_swagger_ui_html
 
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from starlette_compress import CompressMiddleware
 
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.responses import Response, StreamingResponse
 from starlette.datastructures import Headers
@@ -60,6 +56,7 @@ from starsessions.stores.redis import RedisStore
 from open_webui.utils import logger
 from open_webui.utils.audit import AuditLevel, AuditLoggingMiddleware
 from open_webui.utils.logger import start_logger
+from open_webui.utils.pagination import NEXT_CURSOR_HEADER
 from open_webui.socket.main import (
     MODELS,
     app as socket_app,
@@ -244,6 +241,7 @@ from open_webui.config import (
     RAG_EMBEDDING_BATCH_SIZE,
     ENABLE_ASYNC_EMBEDDING,
     RAG_EMBEDDING_CONCURRENT_REQUESTS,
+    ENABLE_RAG_EMBEDDING_MICRO_BATCHING,
     RAG_TOP_K,
     RAG_TOP_K_RERANKER,
     RAG_RELEVANCE_THRESHOLD,
@@ -465,6 +463,9 @@ from open_webui.config import (
 )
 from open_webui.env import (
     ENABLE_CUSTOM_MODEL_FALLBACK,
+    ENABLE_DEFERRED_STARTUP,
+    UVICORN_WORKERS,
+    WEBSOCKET_MANAGER,
     LICENSE_KEY,
     AUDIT_EXCLUDED_PATHS,
     AUDIT_LOG_LEVEL,
@@ -527,7 +528,13 @@ from open_webui.utils.middleware import (
     process_chat_payload,
     process_chat_response,
 )
-from open_webui.utils.tools import set_tool_servers, set_terminal_servers
+from open_webui.retrieval.memory import MEMORY_STORE
+from open_webui.retrieval.web.cache import WEB_SEARCH_CACHE
+from open_webui.utils.tools import (
+    TOOL_SERVER_REGISTRY,
+    set_tool_servers,
+    set_terminal_servers,
+)
 
 from open_webui.utils.auth import (
     get_license_data,
@@ -537,7 +544,14 @@ from open_webui.utils.auth import (
     get_verified_user,
     create_admin_user,
 )
-from open_webui.utils.plugin import install_tool_and_function_dependencies
+from open_webui.utils.plugin import (
+    PluginCache,
+    install_tool_and_function_dependencies,
+    invalidate_function_cache,
+    invalidate_function_valves,
+    invalidate_tool_cache,
+    invalidate_tool_valves,
+)
 from open_webui.utils.oauth import (
     get_oauth_client_info_with_dynamic_client_registration,
     encrypt_data,
@@ -546,7 +560,15 @@ from open_webui.utils.oauth import (
     OAuthClientManager,
     OAuthClientInformationFull,
 )
-from open_webui.utils.security_headers import SecurityHeadersMiddleware
+from open_webui.utils.request_middleware import RequestPipelineMiddleware
+from open_webui.utils.lazy import LazyObject, resolve
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
+from open_webui.utils.mcp.pool import MCP_SESSION_POOL
+from open_webui.retrieval.web.fetcher import WEB_FETCHER
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.loaders.process_pool import DOCUMENT_PARSER_POOL
+from open_webui.socket.utils import RedisDict
 from open_webui.utils.redis import get_redis_connection
 
 from open_webui.tasks import (
@@ -601,6 +623,25 @@ https://github.com/open-webui/open-webui
 """)
 
 
+def get_internal_request() -> Request:
+    """A mock request for calling request handlers outside of a request."""
+    return Request(
+        {
+            "type": "http",
+            "asgi.version": "3.0",
+            "asgi.spec_version": "2.0",
+            "method": "GET",
+            "path": "/internal",
+            "query_string": b"",
+            "headers": Headers({}).raw,
+            "client": ("127.0.0.1", 12345),
+            "server": ("127.0.0.1", 80),
+            "scheme": "http",
+            "app": app,
+        }
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Store reference to main event loop for sync->async calls (e.g., embedding generation)
@@ -641,6 +682,15 @@ async def lifespan(app: FastAPI):
             redis_task_command_listener(app)
         )
 
+    await CACHE_INVALIDATOR.start(app.state.redis)
+    MCP_SESSION_POOL.start()
+
+    if UVICORN_WORKERS > 1 and WEBSOCKET_MANAGER != "redis":
+        log.warning(
+            "Running multiple workers without WEBSOCKET_MANAGER=redis, "
+            "socket events are only delivered to clients of the same worker"
+        )
+
     if THREAD_POOL_SIZE and THREAD_POOL_SIZE > 0:
         limiter = anyio.to_thread.current_default_thread_limiter()
         limiter.total_tokens = THREAD_POOL_SIZE
@@ -651,22 +701,7 @@ async def lifespan(app: FastAPI):
     if app.state.config.ENABLE_BASE_MODELS_CACHE:
         try:
             await get_all_models(
-                Request(
-                    # Creating a mock request object to pass to get_all_models
-                    {
-                        "type": "http",
-                        "asgi.version": "3.0",
-                        "asgi.spec_version": "2.0",
-                        "method": "GET",
-                        "path": "/internal",
-                        "query_string": b"",
-                        "headers": Headers({}).raw,
-                        "client": ("127.0.0.1", 12345),
-                        "server": ("127.0.0.1", 80),
-                        "scheme": "http",
-                        "app": app,
-                    }
-                ),
+                get_internal_request(),
                 None,
             )
         except Exception as e:
@@ -676,21 +711,7 @@ async def lifespan(app: FastAPI):
     if len(app.state.config.TOOL_SERVER_CONNECTIONS) > 0:
         log.info("Initializing tool servers...")
         try:
-            mock_request = Request(
-                {
-                    "type": "http",
-                    "asgi.version": "3.0",
-                    "asgi.spec_version": "2.0",
-                    "method": "GET",
-                    "path": "/internal",
-                    "query_string": b"",
-                    "headers": Headers({}).raw,
-                    "client": ("127.0.0.1", 12345),
-                    "server": ("127.0.0.1", 80),
-                    "scheme": "http",
-                    "app": app,
-                }
-            )
+            mock_request = get_internal_request()
             await set_tool_servers(mock_request)
             log.info(f"Initialized {len(app.state.TOOL_SERVERS)} tool server(s)")
 
@@ -701,11 +722,22 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             log.warning(f"Failed to initialize tool/terminal servers at startup: {e}")
 
+    TOOL_SERVER_REGISTRY.start(app)
+
     yield
 
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    await CACHE_INVALIDATOR.stop()
+    await MCP_SESSION_POOL.stop()
+    await TOOL_SERVER_REGISTRY.stop()
+    await WEB_FETCHER.close()
+    await WEB_SEARCH_CLIENT.close()
+    if not isinstance(VECTOR_DB_CLIENT, LazyObject) or VECTOR_DB_CLIENT.is_resolved:
+        await VECTOR_DB_CLIENT.aclose()
+    DOCUMENT_PARSER_POOL.shutdown()
+
 
 app = FastAPI(
     title="Open WebUI",
@@ -926,10 +958,10 @@ app.state.EXTERNAL_PWA_MANIFEST_URL = EXTERNAL_PWA_MANIFEST_URL
 app.state.USER_COUNT = None
 
 app.state.TOOLS = {}
-app.state.TOOL_CONTENTS = {}
+app.state.TOOL_CACHE = PluginCache()
 
 app.state.FUNCTIONS = {}
-app.state.FUNCTION_CONTENTS = {}
+app.state.FUNCTION_CACHE = PluginCache()
 
 ########################################
 #
@@ -1110,26 +1142,41 @@ app.state.rf = None
 app.state.YOUTUBE_LOADER_TRANSLATION = None
 
 
-try:
-    app.state.ef = get_ef(
-        app.state.config.RAG_EMBEDDING_ENGINE, app.state.config.RAG_EMBEDDING_MODEL
-    )
-    if (
-        app.state.config.ENABLE_RAG_HYBRID_SEARCH
-        and not app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
-    ):
-        app.state.rf = get_rf(
-            app.state.config.RAG_RERANKING_ENGINE,
-            app.state.config.RAG_RERANKING_MODEL,
-            app.state.config.RAG_EXTERNAL_RERANKER_URL,
-            app.state.config.RAG_EXTERNAL_RERANKER_API_KEY,
-            app.state.config.RAG_EXTERNAL_RERANKER_TIMEOUT,
+def load_embedding_model():
+    try:
+        return get_ef(
+            app.state.config.RAG_EMBEDDING_ENGINE, app.state.config.RAG_EMBEDDING_MODEL
         )
-    else:
-        app.state.rf = None
-except Exception as e:
-    log.error(f"Error updating models: {e}")
-    pass
+    except Exception as e:
+        log.error(f"Error updating models: {e}")
+        return None
+
+
+def load_reranking_model():
+    try:
+        if (
+            app.state.config.ENABLE_RAG_HYBRID_SEARCH
+            and not app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
+        ):
+            return get_rf(
+                app.state.config.RAG_RERANKING_ENGINE,
+                app.state.config.RAG_RERANKING_MODEL,
+                app.state.config.RAG_EXTERNAL_RERANKER_URL,
+                app.state.config.RAG_EXTERNAL_RERANKER_API_KEY,
+                app.state.config.RAG_EXTERNAL_RERANKER_TIMEOUT,
+            )
+    except Exception as e:
+        log.error(f"Error updating models: {e}")
+    return None
+
+
+if ENABLE_DEFERRED_STARTUP:
+    # Load the local embedding/reranking models on first use
+    app.state.ef = LazyObject(load_embedding_model, name="embedding model")
+    app.state.rf = LazyObject(load_reranking_model, name="reranking model")
+else:
+    app.state.ef = load_embedding_model()
+    app.state.rf = load_reranking_model()
 
 
 app.state.EMBEDDING_FUNCTION = get_embedding_function(
@@ -1162,13 +1209,34 @@ app.state.EMBEDDING_FUNCTION = get_embedding_function(
     ),
     enable_async=app.state.config.ENABLE_ASYNC_EMBEDDING,
     concurrent_requests=app.state.config.RAG_EMBEDDING_CONCURRENT_REQUESTS,
+    enable_micro_batching=ENABLE_RAG_EMBEDDING_MICRO_BATCHING,
 )
 
-app.state.RERANKING_FUNCTION = get_reranking_function(
-    app.state.config.RAG_RERANKING_ENGINE,
-    app.state.config.RAG_RERANKING_MODEL,
-    reranking_function=app.state.rf,
-)
+if ENABLE_DEFERRED_STARTUP:
+    # Only wrapped when a reranker is configured, so that checking whether
+    # there is one (`is not None`) doesn't load the model
+    app.state.RERANKING_FUNCTION = (
+        LazyObject(
+            lambda: get_reranking_function(
+                app.state.config.RAG_RERANKING_ENGINE,
+                app.state.config.RAG_RERANKING_MODEL,
+                reranking_function=resolve(app.state.rf),
+            )
+            # The model failed to load, documents are returned unranked
+            or (lambda query, documents, user=None: None),
+            name="reranking function",
+        )
+        if app.state.config.ENABLE_RAG_HYBRID_SEARCH
+        and not app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
+        and app.state.config.RAG_RERANKING_MODEL
+        else None
+    )
+else:
+    app.state.RERANKING_FUNCTION = get_reranking_function(
+        app.state.config.RAG_RERANKING_ENGINE,
+        app.state.config.RAG_RERANKING_MODEL,
+        reranking_function=app.state.rf,
+    )
 
 ########################################
 #
@@ -1349,104 +1417,51 @@ app.state.config.VOICE_MODE_PROMPT_TEMPLATE = VOICE_MODE_PROMPT_TEMPLATE
 
 app.state.MODELS = MODELS
 
-# Add the middleware to the app
-if ENABLE_COMPRESSION_MIDDLEWARE:
-    app.add_middleware(CompressMiddleware)
-
-
-class RedirectMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Check if the request is a GET request
-        if request.method == "GET":
-            path = request.url.path
-            query_params = dict(parse_qs(urlparse(str(request.url)).query))
-
-            redirect_params = {}
 
-            # Check for the specific watch path and the presence of 'v' parameter
-            if path.endswith("/watch") and "v" in query_params:
-                # Extract the first 'v' parameter
-                youtube_video_id = query_params["v"][0]
-                redirect_params["youtube"] = youtube_video_id
+# Every worker keeps its own copy of the following caches; drop them when another
+# worker (or replica) changes the underlying data, see utils/invalidation.py
+async def invalidate_models(key=None):
+    app.state.BASE_MODELS = []
+    app.state.OPENAI_MODELS = {}
+    app.state.OLLAMA_MODELS = {}
+    if not isinstance(app.state.MODELS, RedisDict):
+        # Readers use app.state.MODELS directly, so rebuild it in place of
+        # emptying it; the stale list keeps serving until the new one is ready.
+        # Not a refresh, which would publish the invalidation again.
+        await get_all_models(get_internal_request(), None)
 
-            if "shared" in query_params and len(query_params["shared"]) > 0:
-                # PWA share_target support
 
-                text = query_params["shared"][0]
-                if text:
-                    urls = re.match(r"https://\S+", text)
-                    if urls:
-                        from open_webui.retrieval.loaders.youtube import _parse_video_id
-
-                        if youtube_video_id := _parse_video_id(urls[0]):
-                            redirect_params["youtube"] = youtube_video_id
-                        else:
-                            redirect_params["load-url"] = urls[0]
-                    else:
-                        redirect_params["q"] = text
-
-            if redirect_params:
-                redirect_url = f"/?{urlencode(redirect_params)}"
-                return RedirectResponse(url=redirect_url)
-
-        # Proceed with the normal flow of other requests
-        response = await call_next(request)
-        return response
+def invalidate_tool(key=None):
+    invalidate_tool_cache(app.state, key)
 
 
-app.add_middleware(RedirectMiddleware)
-app.add_middleware(SecurityHeadersMiddleware)
+def invalidate_function(key=None):
+    invalidate_function_cache(app.state, key)
 
 
-class APIKeyRestrictionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        auth_header = request.headers.get("Authorization")
-        token = None
+def invalidate_tool_valve(key=None):
+    invalidate_tool_valves(app.state, key)
 
-        if auth_header:
-            parts = auth_header.split(" ", 1)
-            if len(parts) == 2:
-                token = parts[1]
 
-        # Only apply restrictions if an sk- API key is used
-        if token and token.startswith("sk-"):
-            # Check if restrictions are enabled
-            if request.app.state.config.ENABLE_API_KEYS_ENDPOINT_RESTRICTIONS:
-                allowed_paths = [
-                    path.strip()
-                    for path in str(
-                        request.app.state.config.API_KEYS_ALLOWED_ENDPOINTS
-                    ).split(",")
-                    if path.strip()
-                ]
+def invalidate_function_valve(key=None):
+    invalidate_function_valves(app.state, key)
 
-                request_path = request.url.path
 
-                # Match exact path or prefix path
-                is_allowed = any(
-                    request_path == allowed or request_path.startswith(allowed + "/")
-                    for allowed in allowed_paths
-                )
+CACHE_INVALIDATOR.register("models", invalidate_models, debounce=1)
+CACHE_INVALIDATOR.register("tools", invalidate_tool)
+CACHE_INVALIDATOR.register("functions", invalidate_function)
+CACHE_INVALIDATOR.register("tool_valves", invalidate_tool_valve)
+CACHE_INVALIDATOR.register("function_valves", invalidate_function_valve)
+CACHE_INVALIDATOR.register("tool_servers", TOOL_SERVER_REGISTRY.invalidate)
+CACHE_INVALIDATOR.register("memories", MEMORY_STORE.invalidate)
+CACHE_INVALIDATOR.register("web_search", WEB_SEARCH_CACHE.invalidate)
 
-                if not is_allowed:
-                    return JSONResponse(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        content={
-                            "detail": "API key not allowed to access this endpoint."
-                        },
-                    )
-
-        response = await call_next(request)
-        return response
-
-
-app.add_middleware(APIKeyRestrictionMiddleware)
+# Add the middleware to the app
+if ENABLE_COMPRESSION_MIDDLEWARE:
+    app.add_middleware(CompressMiddleware)
 
 
-@app.middleware("http")
-async def commit_session_after_request(request: Request, call_next):
-    response = await call_next(request)
-    # log.debug("Commit session after request")
+def commit_session_after_request():
     try:
         ScopedSession.commit()
     finally:
@@ -1454,56 +1469,13 @@ async def commit_session_after_request(request: Request, call_next):
         # Without this, connections remain "checked out" and accumulate
         # as "idle in transaction" in PostgreSQL.
         ScopedSession.remove()
-    return response
-
-
-@app.middleware("http")
-async def check_url(request: Request, call_next):
-    start_time = int(time.time())
-    request.state.token = get_http_authorization_cred(
-        request.headers.get("Authorization")
-    )
-    # Fallback to cookie token for browser sessions
-    if request.state.token is None and request.cookies.get("token"):
-        from fastapi.security import HTTPAuthorizationCredentials
-
-        request.state.token = HTTPAuthorizationCredentials(
-            scheme="Bearer", credentials=request.cookies.get("token")
-        )
 
-    # Fallback to x-api-key header for Anthropic Messages API routes
-    if request.state.token is None and request.headers.get("x-api-key"):
-        request_path = request.url.path
-        if request_path in ("/api/message", "/api/v1/messages"):
-            from fastapi.security import HTTPAuthorizationCredentials
 
-            request.state.token = HTTPAuthorizationCredentials(
-                scheme="Bearer", credentials=request.headers.get("x-api-key")
-            )
-
-    request.state.enable_api_keys = app.state.config.ENABLE_API_KEYS
-    response = await call_next(request)
-    process_time = int(time.time()) - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
-
-
-@app.middleware("http")
-async def inspect_websocket(request: Request, call_next):
-    if (
-        "/ws/socket.io" in request.url.path
-        and request.query_params.get("transport") == "websocket"
-    ):
-        upgrade = (request.headers.get("Upgrade") or "").lower()
-        connection = (request.headers.get("Connection") or "").lower().split(",")
-        # Check that there's the correct headers for an upgrade, else reject the connection
-        # This is to work around this upstream issue: https://github.com/miguelgrinberg/python-engineio/issues/367
-        if upgrade != "websocket" or "upgrade" not in connection:
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={"detail": "Invalid WebSocket upgrade request"},
-            )
-    return await call_next(request)
+# Websocket upgrade inspection, request credentials, session commit, API key
+# restrictions, security headers and redirects composed as one ASGI layer
+app.add_middleware(
+    RequestPipelineMiddleware, on_response_start=commit_session_after_request
+)
 
 
 app.add_middleware(
@@ -1512,6 +1484,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 
@@ -1909,6 +1882,8 @@ async def chat_completion(
                     pass
         finally:
             try:
+                for mcp_session in metadata.get("mcp_sessions", []):
+                    mcp_session.release()
                 if mcp_clients := metadata.get("mcp_clients"):
                     for client in reversed(mcp_clients.values()):
                         await client.disconnect()
@@ -0,0 +1,200 @@
+"""Add chat_message_stat and chat_message_activity tables
+
+Revision ID: 5e8f2a9c1d34
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+log = logging.getLogger(__name__)
+
+revision: str = "5e8f2a9c1d34"
+down_revision: Union[str, None] = "b2c3d4e5f6a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Frozen copies of the rollup in open_webui.models.chat_messages as of this
+# revision, later changes to the model must not change the backfill
+STAT_PERIODS = ("hour", "day")
+STAT_COLUMNS = (
+    "message_count",
+    "assistant_count",
+    "usage_count",
+    "input_tokens",
+    "output_tokens",
+)
+
+
+def _normalize_timestamp(timestamp: int) -> float:
+    now = time.time()
+
+    # Convert milliseconds to seconds if needed
+    if timestamp > 10_000_000_000:
+        timestamp = timestamp / 1000
+
+    # Must be after 2020 and not in the future (with 1 day tolerance)
+    if timestamp < 1577836800 or timestamp > now + 86400:
+        return now
+    return timestamp
+
+
+def _get_bucket(timestamp: float, period: str) -> int:
+    dt = datetime.fromtimestamp(timestamp).replace(minute=0, second=0, microsecond=0)
+    if period == "day":
+        dt = dt.replace(hour=0)
+    return int(dt.timestamp())
+
+
+def _get_tokens(usage, key: str) -> int:
+    try:
+        return int(usage.get(key) or 0)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def get_stat_rows(messages) -> tuple[list[dict], list[dict], int]:
+    stats: dict[tuple, dict] = {}
+    activity: dict[tuple, str] = {}
+    count = 0
+
+    for chat_id, user_id, role, model_id, usage, created_at in messages:
+        if not user_id or user_id.startswith("shared-"):
+            continue
+        count += 1
+
+        assistant = role == "assistant"
+        has_usage = assistant and usage is not None
+        message_stats = {
+            "message_count": 1,
+            "assistant_count": int(assistant),
+            "usage_count": int(has_usage),
+            "input_tokens": _get_tokens(usage, "input_tokens") if has_usage else 0,
+            "output_tokens": _get_tokens(usage, "output_tokens") if has_usage else 0,
+        }
+
+        timestamp = _normalize_timestamp(created_at or 0)
+        for period in STAT_PERIODS:
+            bucket = _get_bucket(timestamp, period)
+            row = stats.setdefault(
+                (period, bucket, user_id, model_id or ""),
+                {column: 0 for column in STAT_COLUMNS},
+            )
+            for column in STAT_COLUMNS:
+                row[column] += message_stats[column]
+            activity[(period, bucket, chat_id)] = user_id
+
+    stat_rows = [
+        {
+            "period": period,
+            "bucket": bucket,
+            "user_id": user_id,
+            "model_id": model_id,
+            **row,
+        }
+        for (period, bucket, user_id, model_id), row in stats.items()
+    ]
+    activity_rows = [
+        {"period": period, "bucket": bucket, "chat_id": chat_id, "user_id": user_id}
+        for (period, bucket, chat_id), user_id in activity.items()
+    ]
+    return stat_rows, activity_rows, count
+
+
+def upgrade() -> None:
+    # Step 1: Create tables
+    op.create_table(
+        "chat_message_stat",
+        sa.Column("period", sa.Text(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("model_id", sa.Text(), nullable=False),
+        sa.Column("message_count", sa.Integer(), nullable=False, default=0),
+        sa.Column("assistant_count", sa.Integer(), nullable=False, default=0),
+        sa.Column("usage_count", sa.Integer(), nullable=False, default=0),
+        sa.Column("input_tokens", sa.BigInteger(), nullable=False, default=0),
+        sa.Column("output_tokens", sa.BigInteger(), nullable=False, default=0),
+        sa.PrimaryKeyConstraint("period", "bucket", "user_id", "model_id"),
+    )
+    op.create_index(
+        "chat_message_stat_period_bucket_idx",
+        "chat_message_stat",
+        ["period", "bucket"],
+    )
+
+    op.create_table(
+        "chat_message_activity",
+        sa.Column("period", sa.Text(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("chat_id", sa.Text(), nullable=False),
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("period", "bucket", "chat_id"),
+    )
+
+    # Step 2: Backfill from existing messages
+    conn = op.get_bind()
+
+    chat_message_table = sa.table(
+        "chat_message",
+        sa.column("chat_id", sa.Text()),
+        sa.column("user_id", sa.Text()),
+        sa.column("role", sa.Text()),
+        sa.column("model_id", sa.Text()),
+        sa.column("usage", sa.JSON()),
+        sa.column("created_at", sa.BigInteger()),
+    )
+    stat_table = sa.table(
+        "chat_message_stat",
+        sa.column("period", sa.Text()),
+        sa.column("bucket", sa.BigInteger()),
+        sa.column("user_id", sa.Text()),
+        sa.column("model_id", sa.Text()),
+        *[sa.column(column, sa.BigInteger()) for column in STAT_COLUMNS],
+    )
+    activity_table = sa.table(
+        "chat_message_activity",
+        sa.column("period", sa.Text()),
+        sa.column("bucket", sa.BigInteger()),
+        sa.column("chat_id", sa.Text()),
+        sa.column("user_id", sa.Text()),
+    )
+
+    # Stream the messages, only the rollups are held in memory
+    messages = conn.execution_options(yield_per=BATCH_SIZE).execute(
+        sa.select(
+            chat_message_table.c.chat_id,
+            chat_message_table.c.user_id,
+            chat_message_table.c.role,
+            chat_message_table.c.model_id,
+            chat_message_table.c.usage,
+            chat_message_table.c.created_at,
+        ).where(~chat_message_table.c.user_id.like("shared-%"))
+    )
+
+    stat_rows, activity_rows, messages_counted = get_stat_rows(messages)
+
+    for start in range(0, len(stat_rows), BATCH_SIZE):
+        conn.execute(sa.insert(stat_table), stat_rows[start : start + BATCH_SIZE])
+    for start in range(0, len(activity_rows), BATCH_SIZE):
+        conn.execute(
+            sa.insert(activity_table), activity_rows[start : start + BATCH_SIZE]
+        )
+
+    log.info(
+        f"Backfilled chat_message_stat from {messages_counted} messages ({len(stat_rows)} rows)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("chat_message_activity")
+    op.drop_index("chat_message_stat_period_bucket_idx", table_name="chat_message_stat")
+    op.drop_table("chat_message_stat")
@@ -0,0 +1,34 @@
+"""Add model_rating table
+
+Revision ID: 9b1c7e4f2a60
+Revises: 5e8f2a9c1d34
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "9b1c7e4f2a60"
+down_revision: Union[str, None] = "5e8f2a9c1d34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled from the feedback table on the first leaderboard read
+    op.create_table(
+        "model_rating",
+        sa.Column("model_id", sa.Text(), primary_key=True),
+        sa.Column("rating", sa.Float(), nullable=False),
+        sa.Column("won", sa.BigInteger(), nullable=False, default=0),
+        sa.Column("lost", sa.BigInteger(), nullable=False, default=0),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("updated_at", sa.BigInteger()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("model_rating")
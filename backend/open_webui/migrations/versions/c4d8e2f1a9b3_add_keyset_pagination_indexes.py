@@ -0,0 +1,42 @@
+"""Add keyset pagination indexes
+
+Revision ID: c4d8e2f1a9b3
+Revises: 9b1c7e4f2a60
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "c4d8e2f1a9b3"
+down_revision = "9b1c7e4f2a60"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Chat list: WHERE user_id = ... ORDER BY updated_at DESC, id DESC
+    op.create_index(
+        "user_id_updated_at_id_idx", "chat", ["user_id", "updated_at", "id"]
+    )
+
+    # File search, for one user or for all of them
+    op.create_index("file_updated_at_id_idx", "file", ["updated_at", "id"])
+    op.create_index(
+        "file_user_id_updated_at_id_idx", "file", ["user_id", "updated_at", "id"]
+    )
+
+    # Knowledge list
+    op.create_index("knowledge_updated_at_id_idx", "knowledge", ["updated_at", "id"])
+
+    # User list: ORDER BY created_at DESC, id DESC
+    op.create_index("user_created_at_id_idx", "user", ["created_at", "id"])
+
+
+def downgrade():
+    op.drop_index("user_created_at_id_idx", table_name="user")
+    op.drop_index("knowledge_updated_at_id_idx", table_name="knowledge")
+    op.drop_index("file_user_id_updated_at_id_idx", table_name="file")
+    op.drop_index("file_updated_at_id_idx", table_name="file")
+    op.drop_index("user_id_updated_at_id_idx", table_name="chat")
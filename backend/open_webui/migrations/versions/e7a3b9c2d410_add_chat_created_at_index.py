@@ -0,0 +1,26 @@
+"""Add chat created_at index
+
+Revision ID: e7a3b9c2d410
+Revises: c4d8e2f1a9b3
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "e7a3b9c2d410"
+down_revision = "c4d8e2f1a9b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Chat export: WHERE user_id = ... ORDER BY created_at, id
+    op.create_index(
+        "user_id_created_at_id_idx", "chat", ["user_id", "created_at", "id"]
+    )
+
+
+def downgrade():
+    op.drop_index("user_id_created_at_id_idx", table_name="chat")
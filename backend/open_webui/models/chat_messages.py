@@ -1,6 +1,8 @@
 import json
+import logging
 import time
 import uuid
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
 from sqlalchemy.orm import Session
@@ -12,11 +14,19 @@ from sqlalchemy import (
     Boolean,
     Column,
     ForeignKey,
+    Integer,
+    PrimaryKeyConstraint,
     Text,
     JSON,
     Index,
+    and_,
     func,
+    or_,
 )
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+log = logging.getLogger(__name__)
 
 ####################
 # Helpers
@@ -41,6 +51,94 @@ def _normalize_timestamp(timestamp: int) -> float:
     return timestamp
 
 
+def _get_bucket(timestamp: float, period: str) -> int:
+    """Start of the local hour or day of a timestamp."""
+    dt = datetime.fromtimestamp(timestamp).replace(minute=0, second=0, microsecond=0)
+    if period == "day":
+        dt = dt.replace(hour=0)
+    return int(dt.timestamp())
+
+
+def _get_next_day(bucket: int) -> int:
+    return int((datetime.fromtimestamp(bucket) + timedelta(days=1)).timestamp())
+
+
+def _get_tokens(usage: Optional[dict], key: str) -> int:
+    try:
+        return int(usage.get(key) or 0)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def _get_message_stats(
+    user_id: Optional[str],
+    role: Optional[str],
+    model_id: Optional[str],
+    usage: Optional[dict],
+) -> Optional[dict]:
+    """What a message adds to the rollups, None for messages they leave out."""
+    if not user_id or user_id.startswith("shared-"):
+        return None
+
+    assistant = role == "assistant"
+    has_usage = assistant and usage is not None
+    return {
+        "user_id": user_id,
+        "model_id": model_id or "",
+        "message_count": 1,
+        "assistant_count": int(assistant),
+        "usage_count": int(has_usage),
+        "input_tokens": _get_tokens(usage, "input_tokens") if has_usage else 0,
+        "output_tokens": _get_tokens(usage, "output_tokens") if has_usage else 0,
+    }
+
+
+def get_stat_rows(messages) -> tuple[list[dict], list[dict], int]:
+    """
+    Rolls up `messages`, an iterable of (chat_id, user_id, role, model_id,
+    usage, created_at) rows, into chat_message_stat and chat_message_activity
+    rows. Returns them with the number of messages counted. Used by
+    rebuild_stats and to subtract deleted chats, the backfill migration keeps
+    its own copy.
+    """
+    stats: dict[tuple, dict] = {}
+    activity: dict[tuple, str] = {}
+    count = 0
+
+    for chat_id, user_id, role, model_id, usage, created_at in messages:
+        message_stats = _get_message_stats(user_id, role, model_id, usage)
+        if message_stats is None:
+            continue
+        count += 1
+
+        timestamp = _normalize_timestamp(created_at or 0)
+        for period in STAT_PERIODS:
+            bucket = _get_bucket(timestamp, period)
+            row = stats.setdefault(
+                (period, bucket, user_id, message_stats["model_id"]),
+                {column: 0 for column in STAT_COLUMNS},
+            )
+            for column in STAT_COLUMNS:
+                row[column] += message_stats[column]
+            activity[(period, bucket, chat_id)] = user_id
+
+    stat_rows = [
+        {
+            "period": period,
+            "bucket": bucket,
+            "user_id": user_id,
+            "model_id": model_id,
+            **row,
+        }
+        for (period, bucket, user_id, model_id), row in stats.items()
+    ]
+    activity_rows = [
+        {"period": period, "bucket": bucket, "chat_id": chat_id, "user_id": user_id}
+        for (period, bucket, chat_id), user_id in activity.items()
+    ]
+    return stat_rows, activity_rows, count
+
+
 ####################
 # ChatMessage DB Schema
 ####################
@@ -91,6 +189,57 @@ class ChatMessage(Base):
     )
 
 
+STAT_PERIODS = ("hour", "day")
+STAT_COLUMNS = (
+    "message_count",
+    "assistant_count",
+    "usage_count",
+    "input_tokens",
+    "output_tokens",
+)
+
+
+class ChatMessageStat(Base):
+    """
+    Message counts and token usage per user and model, rolled up by hour and
+    by day (local time) as messages are written so analytics never scan
+    chat_message. Deleting chats subtracts their messages, deleting users
+    drops their rows.
+    """
+
+    __tablename__ = "chat_message_stat"
+
+    period = Column(Text, nullable=False)  # hour, day
+    bucket = Column(BigInteger, nullable=False)  # start of the hour or day
+    user_id = Column(Text, nullable=False)
+    model_id = Column(Text, nullable=False)  # "" for messages without a model
+
+    message_count = Column(Integer, nullable=False, default=0)
+    assistant_count = Column(Integer, nullable=False, default=0)
+    # Assistant messages that reported token usage
+    usage_count = Column(Integer, nullable=False, default=0)
+    input_tokens = Column(BigInteger, nullable=False, default=0)
+    output_tokens = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("period", "bucket", "user_id", "model_id"),
+        Index("chat_message_stat_period_bucket_idx", "period", "bucket"),
+    )
+
+
+class ChatMessageActivity(Base):
+    """Chats with messages in each hour and day, to count active chats."""
+
+    __tablename__ = "chat_message_activity"
+
+    period = Column(Text, nullable=False)
+    bucket = Column(BigInteger, nullable=False)
+    chat_id = Column(Text, nullable=False)
+    user_id = Column(Text, nullable=False)
+
+    __table_args__ = (PrimaryKeyConstraint("period", "bucket", "chat_id"),)
+
+
 ####################
 # Pydantic Models
 ####################
@@ -124,6 +273,117 @@ class ChatMessageModel(BaseModel):
 
 
 class ChatMessageTable:
+    def _get_insert(self, db: Session):
+        dialect = db.bind.dialect.name
+
+        if dialect == "sqlite":
+            return sqlite_insert
+        elif dialect == "postgresql":
+            return postgresql_insert
+        else:
+            raise NotImplementedError(f"Unsupported dialect: {dialect}")
+
+    def _add_stats(self, db: Session, rows: list[dict]):
+        """Adds the counts of `rows` to the rollups, at most one row per key."""
+        if not rows:
+            return
+
+        insert = self._get_insert(db)
+        stmt = insert(ChatMessageStat).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["period", "bucket", "user_id", "model_id"],
+            set_={
+                column: getattr(ChatMessageStat, column)
+                + getattr(stmt.excluded, column)
+                for column in STAT_COLUMNS
+            },
+        )
+        db.execute(stmt)
+
+    def _add_activity(self, db: Session, rows: list[dict]):
+        if not rows:
+            return
+
+        insert = self._get_insert(db)
+        db.execute(
+            insert(ChatMessageActivity)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["period", "bucket", "chat_id"])
+        )
+
+    def _update_stats(
+        self,
+        db: Session,
+        chat_id: str,
+        created_at: int,
+        old: Optional[dict],
+        new: Optional[dict],
+    ):
+        """Moves the rollups from the `old` to the `new` stats of a message."""
+        deltas: dict[tuple, dict] = {}
+        for stats, sign in ((old, -1), (new, 1)):
+            if stats is None:
+                continue
+            delta = deltas.setdefault(
+                (stats["user_id"], stats["model_id"]),
+                {column: 0 for column in STAT_COLUMNS},
+            )
+            for column in STAT_COLUMNS:
+                delta[column] += sign * stats[column]
+
+        timestamp = _normalize_timestamp(created_at)
+        buckets = {period: _get_bucket(timestamp, period) for period in STAT_PERIODS}
+        self._add_stats(
+            db,
+            [
+                {
+                    "period": period,
+                    "bucket": bucket,
+                    "user_id": user_id,
+                    "model_id": model_id,
+                    **delta,
+                }
+                for (user_id, model_id), delta in deltas.items()
+                if any(delta.values())
+                for period, bucket in buckets.items()
+            ],
+        )
+        if old is None and new is not None:
+            self._add_activity(
+                db,
+                [
+                    {
+                        "period": period,
+                        "bucket": bucket,
+                        "chat_id": chat_id,
+                        "user_id": new["user_id"],
+                    }
+                    for period, bucket in buckets.items()
+                ],
+            )
+
+    def _commit_with_stats(
+        self,
+        db: Session,
+        message: ChatMessage,
+        old: Optional[dict],
+    ):
+        new = _get_message_stats(
+            message.user_id, message.role, message.model_id, message.usage
+        )
+        if new != old:
+            # Write the message first, so only the rollups are guarded below
+            db.flush()
+            try:
+                # The message is kept if the rollups cannot be updated
+                with db.begin_nested():
+                    self._update_stats(
+                        db, message.chat_id, message.created_at, old, new
+                    )
+            except Exception as e:
+                log.warning(f"Failed to update chat message stats: {e}")
+        db.commit()
+
     def upsert_message(
         self,
         message_id: str,
@@ -140,8 +400,18 @@ class ChatMessageTable:
             # Use composite ID: {chat_id}-{message_id}
             composite_id = f"{chat_id}-{message_id}"
 
-            existing = db.get(ChatMessage, composite_id)
+            # Locked until the commit (on Postgres), so concurrent updates of
+            # the message don't both move the rollups from the same old stats
+            existing = db.get(
+                ChatMessage,
+                composite_id,
+                with_for_update=True,
+                populate_existing=True,
+            )
             if existing:
+                stats = _get_message_stats(
+                    existing.user_id, existing.role, existing.model_id, existing.usage
+                )
                 # Update existing
                 if "role" in data:
                     existing.role = data["role"]
@@ -175,7 +445,7 @@ class ChatMessageTable:
                 if usage:
                     existing.usage = usage
                 existing.updated_at = now
-                db.commit()
+                self._commit_with_stats(db, existing, stats)
                 db.refresh(existing)
                 return ChatMessageModel.model_validate(existing)
             else:
@@ -206,7 +476,7 @@ class ChatMessageTable:
                     updated_at=now,
                 )
                 db.add(message)
-                db.commit()
+                self._commit_with_stats(db, message, None)
                 db.refresh(message)
                 return ChatMessageModel.model_validate(message)
 
@@ -301,15 +571,139 @@ class ChatMessageTable:
             )
             return [chat_id for chat_id, _ in chat_ids]
 
+    def _get_stat_sources(self, db: Session, *criteria, batch_size: int = 1000):
+        """The columns get_stat_rows reads of the messages matching `criteria`."""
+        return (
+            db.query(
+                ChatMessage.chat_id,
+                ChatMessage.user_id,
+                ChatMessage.role,
+                ChatMessage.model_id,
+                ChatMessage.usage,
+                ChatMessage.created_at,
+            )
+            .filter(*criteria)
+            .yield_per(batch_size)
+        )
+
+    def delete_chat_messages(self, db: Session, *criteria):
+        """
+        Deletes the messages matching `criteria`, which must select whole chats,
+        and subtracts them from the rollups. The caller commits.
+        """
+        stat_rows, activity_rows, _ = get_stat_rows(
+            self._get_stat_sources(db, *criteria)
+        )
+
+        for start in range(0, len(stat_rows), 1000):
+            self._add_stats(
+                db,
+                [
+                    {
+                        **row,
+                        **{column: -row[column] for column in STAT_COLUMNS},
+                    }
+                    for row in stat_rows[start : start + 1000]
+                ],
+            )
+        user_ids = {row["user_id"] for row in stat_rows}
+        if user_ids:
+            db.query(ChatMessageStat).filter(
+                ChatMessageStat.user_id.in_(user_ids),
+                ChatMessageStat.message_count <= 0,
+            ).delete(synchronize_session=False)
+
+        chat_ids = list({row["chat_id"] for row in activity_rows})
+        for start in range(0, len(chat_ids), 1000):
+            db.query(ChatMessageActivity).filter(
+                ChatMessageActivity.chat_id.in_(chat_ids[start : start + 1000])
+            ).delete(synchronize_session=False)
+
+        db.query(ChatMessage).filter(*criteria).delete(synchronize_session=False)
+
     def delete_messages_by_chat_id(
         self, chat_id: str, db: Optional[Session] = None
     ) -> bool:
         with get_db_context(db) as db:
-            db.query(ChatMessage).filter_by(chat_id=chat_id).delete()
+            self.delete_chat_messages(db, ChatMessage.chat_id == chat_id)
+            db.commit()
+            return True
+
+    def delete_stats_by_user_id(
+        self, user_id: str, db: Optional[Session] = None
+    ) -> bool:
+        with get_db_context(db) as db:
+            db.query(ChatMessageStat).filter_by(user_id=user_id).delete()
+            db.query(ChatMessageActivity).filter_by(user_id=user_id).delete()
             db.commit()
             return True
 
-    # Analytics methods
+    # Analytics methods, served from the hourly and daily rollups
+    def _get_stats_filter(
+        self,
+        table,
+        start_date: Optional[int] = None,
+        end_date: Optional[int] = None,
+        hourly: bool = False,
+    ):
+        """
+        Selects the rollup rows covering start_date..end_date to the hour:
+        daily rows for the whole days in the range and hourly rows for the
+        hours at its edges, so a range costs O(days) rows per user and model.
+        """
+        start = _get_bucket(start_date, "hour") if start_date else None
+        end = _get_bucket(end_date, "hour") + 3600 if end_date else None
+
+        def in_range(period, lower, upper):
+            conditions = [table.period == period]
+            if lower is not None:
+                conditions.append(table.bucket >= lower)
+            if upper is not None:
+                conditions.append(table.bucket < upper)
+            return and_(*conditions)
+
+        if hourly:
+            return in_range("hour", start, end)
+
+        first_day = start
+        if start is not None and start != _get_bucket(start, "day"):
+            first_day = _get_next_day(_get_bucket(start, "day"))
+        last_day = _get_bucket(end, "day") if end is not None else None
+
+        if first_day is not None and last_day is not None and first_day >= last_day:
+            return in_range("hour", start, end)
+
+        conditions = [in_range("day", first_day, last_day)]
+        if start is not None:
+            conditions.append(in_range("hour", start, first_day))
+        if end is not None:
+            conditions.append(in_range("hour", last_day, end))
+        return or_(*conditions)
+
+    def _query_stats(
+        self,
+        db: Session,
+        columns: list,
+        start_date: Optional[int] = None,
+        end_date: Optional[int] = None,
+        group_id: Optional[str] = None,
+        hourly: bool = False,
+        table=ChatMessageStat,
+    ):
+        from open_webui.models.groups import GroupMember
+
+        query = db.query(*columns).filter(
+            self._get_stats_filter(table, start_date, end_date, hourly)
+        )
+        if group_id:
+            group_users = (
+                db.query(GroupMember.user_id)
+                .filter(GroupMember.group_id == group_id)
+                .subquery()
+            )
+            query = query.filter(table.user_id.in_(group_users))
+        return query
+
     def get_message_count_by_model(
         self,
         start_date: Optional[int] = None,
@@ -318,31 +712,22 @@ class ChatMessageTable:
         db: Optional[Session] = None,
     ) -> dict[str, int]:
         with get_db_context(db) as db:
-            from sqlalchemy import func
-            from open_webui.models.groups import GroupMember
-
-            query = db.query(
-                ChatMessage.model_id, func.count(ChatMessage.id).label("count")
-            ).filter(
-                ChatMessage.role == "assistant",
-                ChatMessage.model_id.isnot(None),
-                ~ChatMessage.user_id.like("shared-%"),
-            )
-
-            if start_date:
-                query = query.filter(ChatMessage.created_at >= start_date)
-            if end_date:
-                query = query.filter(ChatMessage.created_at <= end_date)
-            if group_id:
-                group_users = (
-                    db.query(GroupMember.user_id)
-                    .filter(GroupMember.group_id == group_id)
-                    .subquery()
+            results = (
+                self._query_stats(
+                    db,
+                    [
+                        ChatMessageStat.model_id,
+                        func.sum(ChatMessageStat.assistant_count).label("count"),
+                    ],
+                    start_date,
+                    end_date,
+                    group_id,
                 )
-                query = query.filter(ChatMessage.user_id.in_(group_users))
-
-            results = query.group_by(ChatMessage.model_id).all()
-            return {row.model_id: row.count for row in results}
+                .filter(ChatMessageStat.model_id != "")
+                .group_by(ChatMessageStat.model_id)
+                .all()
+            )
+            return {row.model_id: int(row.count) for row in results if row.count}
 
     def get_token_usage_by_model(
         self,
@@ -351,128 +736,72 @@ class ChatMessageTable:
         group_id: Optional[str] = None,
         db: Optional[Session] = None,
     ) -> dict[str, dict]:
-        """Aggregate token usage by model using database-level aggregation."""
+        """Aggregate token usage by model from the rollups."""
         with get_db_context(db) as db:
-            from sqlalchemy import func, cast, Integer
-            from open_webui.models.groups import GroupMember
-
-            dialect = db.bind.dialect.name
-
-            if dialect == "sqlite":
-                input_tokens = cast(
-                    func.json_extract(ChatMessage.usage, "$.input_tokens"), Integer
-                )
-                output_tokens = cast(
-                    func.json_extract(ChatMessage.usage, "$.output_tokens"), Integer
+            results = (
+                self._query_stats(
+                    db,
+                    [
+                        ChatMessageStat.model_id,
+                        func.sum(ChatMessageStat.input_tokens).label("input_tokens"),
+                        func.sum(ChatMessageStat.output_tokens).label("output_tokens"),
+                        func.sum(ChatMessageStat.usage_count).label("message_count"),
+                    ],
+                    start_date,
+                    end_date,
+                    group_id,
                 )
-            elif dialect == "postgresql":
-                # Use json_extract_path_text for PostgreSQL JSON columns
-                input_tokens = cast(
-                    func.json_extract_path_text(ChatMessage.usage, "input_tokens"),
-                    Integer,
-                )
-                output_tokens = cast(
-                    func.json_extract_path_text(ChatMessage.usage, "output_tokens"),
-                    Integer,
-                )
-            else:
-                raise NotImplementedError(f"Unsupported dialect: {dialect}")
-
-            query = db.query(
-                ChatMessage.model_id,
-                func.coalesce(func.sum(input_tokens), 0).label("input_tokens"),
-                func.coalesce(func.sum(output_tokens), 0).label("output_tokens"),
-                func.count(ChatMessage.id).label("message_count"),
-            ).filter(
-                ChatMessage.role == "assistant",
-                ChatMessage.model_id.isnot(None),
-                ChatMessage.usage.isnot(None),
-                ~ChatMessage.user_id.like("shared-%"),
+                .filter(ChatMessageStat.model_id != "")
+                .group_by(ChatMessageStat.model_id)
+                .all()
             )
 
-            if start_date:
-                query = query.filter(ChatMessage.created_at >= start_date)
-            if end_date:
-                query = query.filter(ChatMessage.created_at <= end_date)
-            if group_id:
-                group_users = (
-                    db.query(GroupMember.user_id)
-                    .filter(GroupMember.group_id == group_id)
-                    .subquery()
-                )
-                query = query.filter(ChatMessage.user_id.in_(group_users))
-
-            results = query.group_by(ChatMessage.model_id).all()
-
             return {
                 row.model_id: {
-                    "input_tokens": row.input_tokens,
-                    "output_tokens": row.output_tokens,
-                    "total_tokens": row.input_tokens + row.output_tokens,
-                    "message_count": row.message_count,
+                    "input_tokens": int(row.input_tokens),
+                    "output_tokens": int(row.output_tokens),
+                    "total_tokens": int(row.input_tokens + row.output_tokens),
+                    "message_count": int(row.message_count),
                 }
                 for row in results
+                if row.message_count
             }
 
     def get_token_usage_by_user(
         self,
         start_date: Optional[int] = None,
         end_date: Optional[int] = None,
+        group_id: Optional[str] = None,
         db: Optional[Session] = None,
     ) -> dict[str, dict]:
-        """Aggregate token usage by user using database-level aggregation."""
+        """Aggregate token usage by user from the rollups."""
         with get_db_context(db) as db:
-            from sqlalchemy import func, cast, Integer
-
-            dialect = db.bind.dialect.name
-
-            if dialect == "sqlite":
-                input_tokens = cast(
-                    func.json_extract(ChatMessage.usage, "$.input_tokens"), Integer
-                )
-                output_tokens = cast(
-                    func.json_extract(ChatMessage.usage, "$.output_tokens"), Integer
-                )
-            elif dialect == "postgresql":
-                # Use json_extract_path_text for PostgreSQL JSON columns
-                input_tokens = cast(
-                    func.json_extract_path_text(ChatMessage.usage, "input_tokens"),
-                    Integer,
+            results = (
+                self._query_stats(
+                    db,
+                    [
+                        ChatMessageStat.user_id,
+                        func.sum(ChatMessageStat.input_tokens).label("input_tokens"),
+                        func.sum(ChatMessageStat.output_tokens).label("output_tokens"),
+                        func.sum(ChatMessageStat.usage_count).label("message_count"),
+                    ],
+                    start_date,
+                    end_date,
+                    group_id,
                 )
-                output_tokens = cast(
-                    func.json_extract_path_text(ChatMessage.usage, "output_tokens"),
-                    Integer,
-                )
-            else:
-                raise NotImplementedError(f"Unsupported dialect: {dialect}")
-
-            query = db.query(
-                ChatMessage.user_id,
-                func.coalesce(func.sum(input_tokens), 0).label("input_tokens"),
-                func.coalesce(func.sum(output_tokens), 0).label("output_tokens"),
-                func.count(ChatMessage.id).label("message_count"),
-            ).filter(
-                ChatMessage.role == "assistant",
-                ChatMessage.user_id.isnot(None),
-                ChatMessage.usage.isnot(None),
-                ~ChatMessage.user_id.like("shared-%"),
+                .group_by(ChatMessageStat.user_id)
+                .all()
             )
 
-            if start_date:
-                query = query.filter(ChatMessage.created_at >= start_date)
-            if end_date:
-                query = query.filter(ChatMessage.created_at <= end_date)
-
-            results = query.group_by(ChatMessage.user_id).all()
-
             return {
                 row.user_id: {
-                    "input_tokens": row.input_tokens,
-                    "output_tokens": row.output_tokens,
-                    "total_tokens": row.input_tokens + row.output_tokens,
-                    "message_count": row.message_count,
+                    "input_tokens": int(row.input_tokens),
+                    "output_tokens": int(row.output_tokens),
+                    "total_tokens": int(row.input_tokens + row.output_tokens),
+                    "message_count": int(row.message_count),
                 }
                 for row in results
+                if row.message_count
             }
 
     def get_message_count_by_user(
@@ -483,57 +812,80 @@ class ChatMessageTable:
         db: Optional[Session] = None,
     ) -> dict[str, int]:
         with get_db_context(db) as db:
-            from sqlalchemy import func
-            from open_webui.models.groups import GroupMember
-
-            query = db.query(
-                ChatMessage.user_id, func.count(ChatMessage.id).label("count")
-            ).filter(~ChatMessage.user_id.like("shared-%"))
-
-            if start_date:
-                query = query.filter(ChatMessage.created_at >= start_date)
-            if end_date:
-                query = query.filter(ChatMessage.created_at <= end_date)
-            if group_id:
-                group_users = (
-                    db.query(GroupMember.user_id)
-                    .filter(GroupMember.group_id == group_id)
-                    .subquery()
+            results = (
+                self._query_stats(
+                    db,
+                    [
+                        ChatMessageStat.user_id,
+                        func.sum(ChatMessageStat.message_count).label("count"),
+                    ],
+                    start_date,
+                    end_date,
+                    group_id,
                 )
-                query = query.filter(ChatMessage.user_id.in_(group_users))
-
-            results = query.group_by(ChatMessage.user_id).all()
-            return {row.user_id: row.count for row in results}
+                .group_by(ChatMessageStat.user_id)
+                .all()
+            )
+            return {row.user_id: int(row.count) for row in results if row.count}
 
-    def get_message_count_by_chat(
+    def get_chat_count(
         self,
         start_date: Optional[int] = None,
         end_date: Optional[int] = None,
         group_id: Optional[str] = None,
         db: Optional[Session] = None,
-    ) -> dict[str, int]:
+    ) -> int:
+        """Count the chats with messages in the range."""
         with get_db_context(db) as db:
-            from sqlalchemy import func
-            from open_webui.models.groups import GroupMember
-
-            query = db.query(
-                ChatMessage.chat_id, func.count(ChatMessage.id).label("count")
-            ).filter(~ChatMessage.user_id.like("shared-%"))
-
-            if start_date:
-                query = query.filter(ChatMessage.created_at >= start_date)
-            if end_date:
-                query = query.filter(ChatMessage.created_at <= end_date)
-            if group_id:
-                group_users = (
-                    db.query(GroupMember.user_id)
-                    .filter(GroupMember.group_id == group_id)
-                    .subquery()
-                )
-                query = query.filter(ChatMessage.user_id.in_(group_users))
+            return (
+                self._query_stats(
+                    db,
+                    [func.count(func.distinct(ChatMessageActivity.chat_id))],
+                    start_date,
+                    end_date,
+                    group_id,
+                    table=ChatMessageActivity,
+                ).scalar()
+                or 0
+            )
 
-            results = query.group_by(ChatMessage.chat_id).all()
-            return {row.chat_id: row.count for row in results}
+    def _get_message_counts_by_bucket(
+        self,
+        db: Session,
+        date_format: str,
+        start_date: Optional[int] = None,
+        end_date: Optional[int] = None,
+        group_id: Optional[str] = None,
+        hourly: bool = False,
+    ) -> dict[str, dict[str, int]]:
+        results = (
+            self._query_stats(
+                db,
+                [
+                    ChatMessageStat.bucket,
+                    ChatMessageStat.model_id,
+                    func.sum(ChatMessageStat.assistant_count).label("count"),
+                ],
+                start_date,
+                end_date,
+                group_id,
+                hourly,
+            )
+            .filter(ChatMessageStat.model_id != "")
+            .group_by(ChatMessageStat.bucket, ChatMessageStat.model_id)
+            .all()
+        )
+
+        # Group by date -> model -> count, the hours at the edges of a range
+        # fall on the same dates as the days
+        counts: dict[str, dict[str, int]] = {}
+        for bucket, model_id, count in results:
+            if not count:
+                continue
+            date_str = datetime.fromtimestamp(bucket).strftime(date_format)
+            counts.setdefault(date_str, {})
+            counts[date_str][model_id] = counts[date_str].get(model_id, 0) + int(count)
+        return counts
 
     def get_daily_message_counts_by_model(
         self,
@@ -544,41 +896,10 @@ class ChatMessageTable:
     ) -> dict[str, dict[str, int]]:
         """Get message counts grouped by day and model."""
         with get_db_context(db) as db:
-            from datetime import datetime, timedelta
-            from open_webui.models.groups import GroupMember
-
-            query = db.query(ChatMessage.created_at, ChatMessage.model_id).filter(
-                ChatMessage.role == "assistant",
-                ChatMessage.model_id.isnot(None),
-                ~ChatMessage.user_id.like("shared-%"),
+            daily_counts = self._get_message_counts_by_bucket(
+                db, "%Y-%m-%d", start_date, end_date, group_id
             )
 
-            if start_date:
-                query = query.filter(ChatMessage.created_at >= start_date)
-            if end_date:
-                query = query.filter(ChatMessage.created_at <= end_date)
-            if group_id:
-                group_users = (
-                    db.query(GroupMember.user_id)
-                    .filter(GroupMember.group_id == group_id)
-                    .subquery()
-                )
-                query = query.filter(ChatMessage.user_id.in_(group_users))
-
-            results = query.all()
-
-            # Group by date -> model -> count
-            daily_counts: dict[str, dict[str, int]] = {}
-            for timestamp, model_id in results:
-                date_str = datetime.fromtimestamp(
-                    _normalize_timestamp(timestamp)
-                ).strftime("%Y-%m-%d")
-                if date_str not in daily_counts:
-                    daily_counts[date_str] = {}
-                daily_counts[date_str][model_id] = (
-                    daily_counts[date_str].get(model_id, 0) + 1
-                )
-
             # Fill in missing days
             if start_date and end_date:
                 current = datetime.fromtimestamp(_normalize_timestamp(start_date))
@@ -595,37 +916,15 @@ class ChatMessageTable:
         self,
         start_date: Optional[int] = None,
         end_date: Optional[int] = None,
+        group_id: Optional[str] = None,
         db: Optional[Session] = None,
     ) -> dict[str, dict[str, int]]:
         """Get message counts grouped by hour and model."""
         with get_db_context(db) as db:
-            from datetime import datetime, timedelta
-
-            query = db.query(ChatMessage.created_at, ChatMessage.model_id).filter(
-                ChatMessage.role == "assistant",
-                ChatMessage.model_id.isnot(None),
-                ~ChatMessage.user_id.like("shared-%"),
+            hourly_counts = self._get_message_counts_by_bucket(
+                db, "%Y-%m-%d %H:00", start_date, end_date, group_id, hourly=True
             )
 
-            if start_date:
-                query = query.filter(ChatMessage.created_at >= start_date)
-            if end_date:
-                query = query.filter(ChatMessage.created_at <= end_date)
-
-            results = query.all()
-
-            # Group by hour -> model -> count
-            hourly_counts: dict[str, dict[str, int]] = {}
-            for timestamp, model_id in results:
-                hour_str = datetime.fromtimestamp(
-                    _normalize_timestamp(timestamp)
-                ).strftime("%Y-%m-%d %H:00")
-                if hour_str not in hourly_counts:
-                    hourly_counts[hour_str] = {}
-                hourly_counts[hour_str][model_id] = (
-                    hourly_counts[hour_str].get(model_id, 0) + 1
-                )
-
             # Fill in missing hours
             if start_date and end_date:
                 current = datetime.fromtimestamp(
@@ -640,5 +939,40 @@ class ChatMessageTable:
 
             return hourly_counts
 
+    def rebuild_stats(
+        self, batch_size: int = 1000, db: Optional[Session] = None
+    ) -> int:
+        """
+        Recomputes the rollups from chat_message, streaming the messages in
+        batches. Messages written meanwhile may be counted twice or not at
+        all, run it while the instance is quiet. Returns the number of
+        messages counted.
+        """
+        with get_db_context(db) as db:
+            stat_rows, activity_rows, count = get_stat_rows(
+                self._get_stat_sources(db, batch_size=batch_size)
+            )
+
+            db.query(ChatMessageStat).delete()
+            db.query(ChatMessageActivity).delete()
+
+            for start in range(0, len(stat_rows), batch_size):
+                db.execute(
+                    ChatMessageStat.__table__.insert(),
+                    stat_rows[start : start + batch_size],
+                )
+            for start in range(0, len(activity_rows), batch_size):
+                db.execute(
+                    ChatMessageActivity.__table__.insert(),
+                    activity_rows[start : start + batch_size],
+                )
+            db.commit()
+
+            log.info(
+                f"Rebuilt chat message stats from {count} messages "
+                f"({len(stat_rows)} rollup rows)"
+            )
+            return count
+
 
 ChatMessages = ChatMessageTable()
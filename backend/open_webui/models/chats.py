@@ -2,7 +2,7 @@ import logging
 import json
 import time
 import uuid
-from typing import Optional
+from typing import Iterator, Optional
 
 from sqlalchemy.orm import Session
 from open_webui.internal.db import Base, JSONField, get_db, get_db_context
@@ -10,6 +10,7 @@ from open_webui.models.tags import TagModel, Tag, Tags
 from open_webui.models.folders import Folders
 from open_webui.models.chat_messages import ChatMessage, ChatMessages
 from open_webui.utils.misc import sanitize_data_for_db, sanitize_text_for_db
+from open_webui.utils.pagination import after_cursor
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import (
@@ -64,6 +65,10 @@ class Chat(Base):
         Index("updated_at_user_id_idx", "updated_at", "user_id"),
         # WHERE folder_id = ... AND user_id = ...
         Index("folder_id_user_id_idx", "folder_id", "user_id"),
+        # WHERE user_id = ... ORDER BY updated_at DESC, id DESC (keyset pages)
+        Index("user_id_updated_at_id_idx", "user_id", "updated_at", "id"),
+        # WHERE user_id = ... ORDER BY created_at, id (exports)
+        Index("user_id_created_at_id_idx", "user_id", "created_at", "id"),
     )
 
 
@@ -837,6 +842,7 @@ class ChatTable:
         filter: Optional[dict] = None,
         skip: int = 0,
         limit: int = 50,
+        cursor: Optional[str] = None,
         db: Optional[Session] = None,
     ) -> list[ChatModel]:
         with get_db_context(db) as db:
@@ -853,16 +859,23 @@ class ChatTable:
                 direction = filter.get("direction")
 
                 if order_by and direction and getattr(Chat, order_by):
+                    if cursor:
+                        raise ValueError("Cursors only page the default ordering")
+
                     if direction.lower() == "asc":
                         query = query.order_by(getattr(Chat, order_by).asc())
                     elif direction.lower() == "desc":
                         query = query.order_by(getattr(Chat, order_by).desc())
                     else:
                         raise ValueError("Invalid direction for ordering")
+                else:
+                    query = query.order_by(Chat.updated_at.desc(), Chat.id.desc())
             else:
-                query = query.order_by(Chat.updated_at.desc())
+                query = query.order_by(Chat.updated_at.desc(), Chat.id.desc())
 
-            if skip:
+            if cursor:
+                query = query.filter(after_cursor((Chat.updated_at, Chat.id), cursor))
+            elif skip:
                 query = query.offset(skip)
             if limit:
                 query = query.limit(limit)
@@ -878,11 +891,15 @@ class ChatTable:
         include_pinned: bool = False,
         skip: Optional[int] = None,
         limit: Optional[int] = None,
+        cursor: Optional[str] = None,
         db: Optional[Session] = None,
     ) -> list[ChatTitleIdResponse]:
         with get_db_context(db) as db:
             query = db.query(Chat).filter_by(user_id=user_id)
 
+            if cursor:
+                query = query.filter(after_cursor((Chat.updated_at, Chat.id), cursor))
+
             if not include_folders:
                 query = query.filter_by(folder_id=None)
 
@@ -892,11 +909,11 @@ class ChatTable:
             if not include_archived:
                 query = query.filter_by(archived=False)
 
-            query = query.order_by(Chat.updated_at.desc()).with_entities(
-                Chat.id, Chat.title, Chat.updated_at, Chat.created_at
-            )
+            query = query.order_by(
+                Chat.updated_at.desc(), Chat.id.desc()
+            ).with_entities(Chat.id, Chat.title, Chat.updated_at, Chat.created_at)
 
-            if skip:
+            if skip and not cursor:
                 query = query.offset(skip)
             if limit:
                 query = query.limit(limit)
@@ -1064,6 +1081,49 @@ class ChatTable:
                 }
             )
 
+    def iter_chats(
+        self,
+        user_id: Optional[str] = None,
+        batch_size: int = 100,
+    ) -> Iterator[ChatModel]:
+        """
+        Yields the chats of `user_id` (or of every user), oldest first, holding
+        at most `batch_size` of them in memory.
+
+        Each batch is streamed from a server-side cursor in its own short-lived
+        session, continuing after the last (created_at, id) seen rather than at
+        an offset, so long exports don't hold SQLite locks between batches.
+        Unlike updated_at, the key doesn't change when a chat is edited during
+        the export, which would skip or repeat it.
+        """
+        last = None
+        while True:
+            with get_db_context() as db:
+                query = select(Chat)
+                if user_id is not None:
+                    query = query.where(Chat.user_id == user_id)
+                if last is not None:
+                    query = query.where(
+                        or_(
+                            Chat.created_at > last[0],
+                            and_(Chat.created_at == last[0], Chat.id > last[1]),
+                        )
+                    )
+
+                chats = db.scalars(
+                    query.order_by(Chat.created_at.asc(), Chat.id.asc()).limit(
+                        batch_size
+                    ),
+                    execution_options={"yield_per": batch_size},
+                )
+                batch = [ChatModel.model_validate(chat) for chat in chats]
+
+            # The session is closed while the batch is consumed
+            yield from batch
+            if len(batch) < batch_size:
+                break
+            last = (batch[-1].created_at, batch[-1].id)
+
     def get_pinned_chats_by_user_id(
         self, user_id: str, db: Optional[Session] = None
     ) -> list[ChatTitleIdResponse]:
@@ -1513,7 +1573,7 @@ class ChatTable:
     def delete_chat_by_id(self, id: str, db: Optional[Session] = None) -> bool:
         try:
             with get_db_context(db) as db:
-                db.query(ChatMessage).filter_by(chat_id=id).delete()
+                ChatMessages.delete_chat_messages(db, ChatMessage.chat_id == id)
                 db.query(Chat).filter_by(id=id).delete()
                 db.commit()
 
@@ -1526,7 +1586,7 @@ class ChatTable:
     ) -> bool:
         try:
             with get_db_context(db) as db:
-                db.query(ChatMessage).filter_by(chat_id=id).delete()
+                ChatMessages.delete_chat_messages(db, ChatMessage.chat_id == id)
                 db.query(Chat).filter_by(id=id, user_id=user_id).delete()
                 db.commit()
 
@@ -1544,9 +1604,9 @@ class ChatTable:
                 chat_id_subquery = (
                     db.query(Chat.id).filter_by(user_id=user_id).subquery()
                 )
-                db.query(ChatMessage).filter(
-                    ChatMessage.chat_id.in_(chat_id_subquery)
-                ).delete(synchronize_session=False)
+                ChatMessages.delete_chat_messages(
+                    db, ChatMessage.chat_id.in_(chat_id_subquery)
+                )
                 db.query(Chat).filter_by(user_id=user_id).delete()
                 db.commit()
 
@@ -1564,9 +1624,9 @@ class ChatTable:
                     .filter_by(user_id=user_id, folder_id=folder_id)
                     .subquery()
                 )
-                db.query(ChatMessage).filter(
-                    ChatMessage.chat_id.in_(chat_id_subquery)
-                ).delete(synchronize_session=False)
+                ChatMessages.delete_chat_messages(
+                    db, ChatMessage.chat_id.in_(chat_id_subquery)
+                )
                 db.query(Chat).filter_by(user_id=user_id, folder_id=folder_id).delete()
                 db.commit()
 
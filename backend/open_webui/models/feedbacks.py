@@ -1,6 +1,8 @@
 import logging
+import threading
 import time
 import uuid
+from contextlib import contextmanager
 from typing import Optional
 
 from sqlalchemy.orm import Session
@@ -8,11 +10,86 @@ from open_webui.internal.db import Base, JSONField, get_db, get_db_context
 from open_webui.models.users import User
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Column, Text, JSON, Boolean
+from sqlalchemy import BigInteger, Column, Float, Text, JSON, Boolean, text
 
 log = logging.getLogger(__name__)
 
 
+####################
+# Elo Rating
+####################
+
+ELO_K_FACTOR = 32  # Standard Elo K-factor for rating volatility
+ELO_INITIAL_RATING = 1000.0
+
+
+def get_feedback_matches(data: Optional[dict]) -> list[tuple[str, str, bool]]:
+    """
+    The comparisons a rating feedback holds: the rated model against each of
+    its opponents (sibling_model_ids), as (model_id, opponent_id, won).
+    """
+    data = data or {}
+    model_id = data.get("model_id")
+    rating_value = str(data.get("rating", ""))
+    if not model_id or rating_value not in ("1", "-1"):
+        return []
+
+    won = rating_value == "1"
+    return [
+        (model_id, opponent_id, won)
+        for opponent_id in data.get("sibling_model_ids") or []
+        if opponent_id
+    ]
+
+
+def apply_elo_match(
+    model_stats: dict,
+    model_id: str,
+    opponent_id: str,
+    won: bool,
+    weight: float = 1.0,
+):
+    """
+    Adjusts the {model_id: {"rating", "won", "lost"}} stats for one comparison,
+    new_rating = old_rating + K * (actual - expected), scaled by `weight`.
+    """
+    winner = model_stats.setdefault(
+        model_id, {"rating": ELO_INITIAL_RATING, "won": 0, "lost": 0}
+    )
+    opponent = model_stats.setdefault(
+        opponent_id, {"rating": ELO_INITIAL_RATING, "won": 0, "lost": 0}
+    )
+    expected = 1 / (1 + 10 ** ((opponent["rating"] - winner["rating"]) / 400))
+
+    winner["rating"] += ELO_K_FACTOR * ((1 if won else 0) - expected) * weight
+    opponent["rating"] += ELO_K_FACTOR * ((0 if won else 1) - (1 - expected)) * weight
+
+    if won:
+        winner["won"] += 1
+        opponent["lost"] += 1
+    else:
+        winner["lost"] += 1
+        opponent["won"] += 1
+
+
+def get_feedback_tags(data: Optional[dict]) -> list[tuple[str, str]]:
+    """The (model_id, tag) pairs a feedback adds to the tag counts."""
+    data = data or {}
+    model_id = data.get("model_id")
+    if not model_id:
+        return []
+    return [(model_id, tag) for tag in data.get("tags") or []]
+
+
+# Serializes the rebuilds and updates of model_rating, see _lock_model_ratings
+MODEL_RATING_LOCK = threading.RLock()
+MODEL_RATING_LOCK_ID = 7_238_012_954
+
+# model_id of the model_rating row recording that the other rows replay all
+# feedback, also when there are none
+MODEL_RATINGS_BUILT_ID = ""
+
+
 ####################
 # Feedback DB Schema
 ####################
@@ -31,6 +108,24 @@ class Feedback(Base):
     updated_at = Column(BigInteger)
 
 
+class ModelRating(Base):
+    """
+    Leaderboard state per model, updated as rating feedback comes in. Elo
+    depends on the order of the matches, so editing or deleting feedback
+    removes the MODEL_RATINGS_BUILT_ID row and the next read replays all
+    feedback once.
+    """
+
+    __tablename__ = "model_rating"
+
+    model_id = Column(Text, primary_key=True)
+    rating = Column(Float, nullable=False)
+    won = Column(BigInteger, nullable=False, default=0)
+    lost = Column(BigInteger, nullable=False, default=0)
+    tags = Column(JSON, nullable=True)  # {tag: count} of the model's feedback
+    updated_at = Column(BigInteger)
+
+
 class FeedbackModel(BaseModel):
     id: str
     user_id: str
@@ -138,6 +233,16 @@ class ModelHistoryResponse(BaseModel):
     history: list[ModelHistoryEntry]
 
 
+class ModelRatingModel(BaseModel):
+    model_id: str
+    rating: float
+    won: int
+    lost: int
+    tags: Optional[dict] = None
+
+    model_config = ConfigDict(from_attributes=True, protected_namespaces=())
+
+
 class FeedbackTable:
     def insert_new_feedback(
         self, user_id: str, form_data: FeedbackForm, db: Optional[Session] = None
@@ -156,8 +261,11 @@ class FeedbackTable:
             )
             try:
                 result = Feedback(**feedback.model_dump())
-                db.add(result)
-                db.commit()
+                with self._lock_model_ratings(db, feedback.data):
+                    db.add(result)
+                    db.flush()
+                    self._add_to_model_ratings(db, result.data)
+                    db.commit()
                 db.refresh(result)
                 if result:
                     return FeedbackModel.model_validate(result)
@@ -167,6 +275,164 @@ class FeedbackTable:
                 log.exception(f"Error creating a new feedback: {e}")
                 return None
 
+    ####################
+    # Model Ratings
+    ####################
+
+    @contextmanager
+    def _lock_model_ratings(self, db: Session, *datas: Optional[dict]):
+        """
+        Serializes the writers of model_rating until the transaction ends, so
+        a feedback is either replayed by a rebuild or applied on top of it:
+        a transaction advisory lock on Postgres, a lock of this worker
+        otherwise. Feedback `datas` that can't change the ratings skip it.
+        """
+        if datas and not any(
+            get_feedback_matches(data) or get_feedback_tags(data) for data in datas
+        ):
+            yield
+            return
+
+        with MODEL_RATING_LOCK:
+            if db.bind.dialect.name == "postgresql":
+                db.execute(
+                    text("SELECT pg_advisory_xact_lock(:id)"),
+                    {"id": MODEL_RATING_LOCK_ID},
+                )
+            yield
+
+    def _add_to_model_ratings(self, db: Session, data: Optional[dict]):
+        """
+        Plays the matches of a new feedback on top of the stored ratings,
+        without committing. The caller holds _lock_model_ratings. A failed
+        update marks the ratings stale instead.
+        """
+        matches = get_feedback_matches(data)
+        tags = get_feedback_tags(data)
+        if not matches and not tags:
+            return
+
+        try:
+            with db.begin_nested():
+                if db.get(ModelRating, MODEL_RATINGS_BUILT_ID) is None:
+                    # Stale or never built, the next read replays all feedback
+                    return
+
+                model_ids = {id for match in matches for id in match[:2]} | {
+                    model_id for model_id, _ in tags
+                }
+                rows = {
+                    row.model_id: row
+                    for row in db.query(ModelRating)
+                    .filter(ModelRating.model_id.in_(model_ids))
+                    .with_for_update()
+                    .all()
+                }
+                model_stats = {
+                    row.model_id: {
+                        "rating": row.rating,
+                        "won": row.won,
+                        "lost": row.lost,
+                    }
+                    for row in rows.values()
+                }
+                for match in matches:
+                    apply_elo_match(model_stats, *match)
+
+                now = int(time.time())
+                for model_id in model_ids:
+                    row = rows.get(model_id)
+                    if row is None:
+                        row = rows[model_id] = ModelRating(model_id=model_id, tags={})
+                        db.add(row)
+                    stats = model_stats.get(
+                        model_id, {"rating": ELO_INITIAL_RATING, "won": 0, "lost": 0}
+                    )
+                    row.rating = stats["rating"]
+                    row.won = stats["won"]
+                    row.lost = stats["lost"]
+
+                    row.tags = dict(row.tags or {})
+                    for tag_model_id, tag in tags:
+                        if tag_model_id == model_id:
+                            row.tags[tag] = row.tags.get(tag, 0) + 1
+                    row.updated_at = now
+        except Exception as e:
+            log.warning(f"Failed to update model ratings, replaying them: {e}")
+            self._mark_model_ratings_stale(db)
+
+    def _mark_model_ratings_stale(self, db: Session):
+        """Makes the next read replay all feedback, without committing."""
+        db.query(ModelRating).filter_by(model_id=MODEL_RATINGS_BUILT_ID).delete()
+
+    @staticmethod
+    def _changes_model_ratings(old: Optional[dict], new: Optional[dict]) -> bool:
+        return get_feedback_matches(old) != get_feedback_matches(new) or sorted(
+            get_feedback_tags(old)
+        ) != sorted(get_feedback_tags(new))
+
+    def _rebuild_model_ratings(self, db: Session) -> list[ModelRating]:
+        model_stats = {}
+        tag_counts = {}
+
+        for (data,) in (
+            db.query(Feedback.data).order_by(Feedback.created_at.asc()).yield_per(1000)
+        ):
+            for match in get_feedback_matches(data):
+                apply_elo_match(model_stats, *match)
+
+            for model_id, tag in get_feedback_tags(data):
+                counts = tag_counts.setdefault(model_id, {})
+                counts[tag] = counts.get(tag, 0) + 1
+
+        now = int(time.time())
+        rows = [
+            ModelRating(
+                model_id=model_id,
+                rating=model_stats.get(model_id, {}).get("rating", ELO_INITIAL_RATING),
+                won=model_stats.get(model_id, {}).get("won", 0),
+                lost=model_stats.get(model_id, {}).get("lost", 0),
+                tags=tag_counts.get(model_id, {}),
+                updated_at=now,
+            )
+            for model_id in model_stats.keys() | tag_counts.keys()
+        ]
+
+        db.query(ModelRating).delete()
+        db.add_all(rows)
+        db.add(
+            ModelRating(
+                model_id=MODEL_RATINGS_BUILT_ID,
+                rating=ELO_INITIAL_RATING,
+                tags={},
+                updated_at=now,
+            )
+        )
+        db.commit()
+        return rows
+
+    def get_model_ratings(self, db: Optional[Session] = None) -> list[ModelRatingModel]:
+        """Elo ratings and tag counts per model, replaying all feedback if stale."""
+        with get_db_context(db) as db:
+            rows = db.query(ModelRating).all()
+            if not any(row.model_id == MODEL_RATINGS_BUILT_ID for row in rows):
+                with self._lock_model_ratings(db):
+                    # Another reader may have rebuilt them while we waited
+                    rows = db.query(ModelRating).all()
+                    if not any(row.model_id == MODEL_RATINGS_BUILT_ID for row in rows):
+                        rows = self._rebuild_model_ratings(db)
+            return [
+                ModelRatingModel.model_validate(row)
+                for row in rows
+                if row.model_id != MODEL_RATINGS_BUILT_ID
+            ]
+
+    def reset_model_ratings(self, db: Optional[Session] = None):
+        with get_db_context(db) as db:
+            with self._lock_model_ratings(db):
+                self._mark_model_ratings_stale(db)
+                db.commit()
+
     def get_feedback_by_id(
         self, id: str, db: Optional[Session] = None
     ) -> Optional[FeedbackModel]:
@@ -313,7 +579,9 @@ class FeedbackTable:
         with get_db_context(db) as db:
             return [
                 LeaderboardFeedbackData(id=row.id, data=row.data)
-                for row in db.query(Feedback.id, Feedback.data).all()
+                for row in db.query(Feedback.id, Feedback.data)
+                .order_by(Feedback.created_at.asc())
+                .all()
             ]
 
     def get_model_evaluation_history(
@@ -417,16 +685,20 @@ class FeedbackTable:
             if not feedback:
                 return None
 
-            if form_data.data:
-                feedback.data = form_data.data.model_dump()
-            if form_data.meta:
-                feedback.meta = form_data.meta
-            if form_data.snapshot:
-                feedback.snapshot = form_data.snapshot.model_dump()
+            data = form_data.data.model_dump() if form_data.data else None
+            with self._lock_model_ratings(db, feedback.data, data):
+                if data:
+                    if self._changes_model_ratings(feedback.data, data):
+                        self._mark_model_ratings_stale(db)
+                    feedback.data = data
+                if form_data.meta:
+                    feedback.meta = form_data.meta
+                if form_data.snapshot:
+                    feedback.snapshot = form_data.snapshot.model_dump()
 
-            feedback.updated_at = int(time.time())
+                feedback.updated_at = int(time.time())
 
-            db.commit()
+                db.commit()
             return FeedbackModel.model_validate(feedback)
 
     def update_feedback_by_id_and_user_id(
@@ -441,16 +713,20 @@ class FeedbackTable:
             if not feedback:
                 return None
 
-            if form_data.data:
-                feedback.data = form_data.data.model_dump()
-            if form_data.meta:
-                feedback.meta = form_data.meta
-            if form_data.snapshot:
-                feedback.snapshot = form_data.snapshot.model_dump()
+            data = form_data.data.model_dump() if form_data.data else None
+            with self._lock_model_ratings(db, feedback.data, data):
+                if data:
+                    if self._changes_model_ratings(feedback.data, data):
+                        self._mark_model_ratings_stale(db)
+                    feedback.data = data
+                if form_data.meta:
+                    feedback.meta = form_data.meta
+                if form_data.snapshot:
+                    feedback.snapshot = form_data.snapshot.model_dump()
 
-            feedback.updated_at = int(time.time())
+                feedback.updated_at = int(time.time())
 
-            db.commit()
+                db.commit()
             return FeedbackModel.model_validate(feedback)
 
     def delete_feedback_by_id(self, id: str, db: Optional[Session] = None) -> bool:
@@ -458,8 +734,11 @@ class FeedbackTable:
             feedback = db.query(Feedback).filter_by(id=id).first()
             if not feedback:
                 return False
-            db.delete(feedback)
-            db.commit()
+            with self._lock_model_ratings(db, feedback.data):
+                if self._changes_model_ratings(feedback.data, None):
+                    self._mark_model_ratings_stale(db)
+                db.delete(feedback)
+                db.commit()
             return True
 
     def delete_feedback_by_id_and_user_id(
@@ -469,22 +748,30 @@ class FeedbackTable:
             feedback = db.query(Feedback).filter_by(id=id, user_id=user_id).first()
             if not feedback:
                 return False
-            db.delete(feedback)
-            db.commit()
+            with self._lock_model_ratings(db, feedback.data):
+                if self._changes_model_ratings(feedback.data, None):
+                    self._mark_model_ratings_stale(db)
+                db.delete(feedback)
+                db.commit()
             return True
 
     def delete_feedbacks_by_user_id(
         self, user_id: str, db: Optional[Session] = None
     ) -> bool:
         with get_db_context(db) as db:
-            result = db.query(Feedback).filter_by(user_id=user_id).delete()
-            db.commit()
+            with self._lock_model_ratings(db):
+                result = db.query(Feedback).filter_by(user_id=user_id).delete()
+                if result:
+                    self._mark_model_ratings_stale(db)
+                db.commit()
             return result > 0
 
     def delete_all_feedbacks(self, db: Optional[Session] = None) -> bool:
         with get_db_context(db) as db:
-            result = db.query(Feedback).delete()
-            db.commit()
+            with self._lock_model_ratings(db):
+                result = db.query(Feedback).delete()
+                self._mark_model_ratings_stale(db)
+                db.commit()
             return result > 0
 
 
@@ -4,8 +4,9 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 from open_webui.internal.db import Base, JSONField, get_db, get_db_context
+from open_webui.utils.pagination import after_cursor
 from pydantic import BaseModel, ConfigDict, model_validator
-from sqlalchemy import BigInteger, Column, String, Text, JSON
+from sqlalchemy import BigInteger, Column, Index, String, Text, JSON
 
 log = logging.getLogger(__name__)
 
@@ -29,6 +30,13 @@ class File(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (
+        # ORDER BY updated_at DESC, id DESC (keyset pages), for all users
+        Index("file_updated_at_id_idx", "updated_at", "id"),
+        # WHERE user_id = ... ORDER BY updated_at DESC, id DESC
+        Index("file_user_id_updated_at_id_idx", "user_id", "updated_at", "id"),
+    )
+
 
 class FileModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -276,6 +284,7 @@ class FilesTable:
         filename: str = "*",
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
         db: Optional[Session] = None,
     ) -> list[FileModel]:
         """
@@ -286,6 +295,7 @@ class FilesTable:
             filename: Glob pattern to match filenames (e.g., "*.txt"). Default "*" matches all.
             skip: Number of results to skip for pagination.
             limit: Maximum number of results to return.
+            cursor: Cursor of the previous page (see utils.pagination), replaces skip.
             db: Optional database session.
 
         Returns:
@@ -301,13 +311,13 @@ class FilesTable:
             if pattern != "%":
                 query = query.filter(File.filename.ilike(pattern, escape="\\"))
 
-            return [
-                FileModel.model_validate(file)
-                for file in query.order_by(File.updated_at.desc())
-                .offset(skip)
-                .limit(limit)
-                .all()
-            ]
+            query = query.order_by(File.updated_at.desc(), File.id.desc())
+            if cursor:
+                query = query.filter(after_cursor((File.updated_at, File.id), cursor))
+            else:
+                query = query.offset(skip)
+
+            return [FileModel.model_validate(file) for file in query.limit(limit).all()]
 
     def update_file_by_id(
         self, id: str, form_data: FileUpdateForm, db: Optional[Session] = None
@@ -6,6 +6,7 @@ import uuid
 
 from sqlalchemy.orm import Session
 from open_webui.internal.db import Base, JSONField, get_db, get_db_context
+from open_webui.utils.pagination import after_cursor, get_next_cursor
 
 from open_webui.models.files import (
     File,
@@ -23,6 +24,7 @@ from sqlalchemy import (
     BigInteger,
     Column,
     ForeignKey,
+    Index,
     String,
     Text,
     JSON,
@@ -51,6 +53,11 @@ class Knowledge(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (
+        # ORDER BY updated_at DESC, id DESC (keyset pages)
+        Index("knowledge_updated_at_id_idx", "updated_at", "id"),
+    )
+
 
 class KnowledgeModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -130,6 +137,7 @@ class FileUserResponse(FileModelResponse):
 class KnowledgeListResponse(BaseModel):
     items: list[KnowledgeUserModel]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class KnowledgeFileListResponse(BaseModel):
@@ -228,8 +236,16 @@ class KnowledgeTable:
         filter: dict,
         skip: int = 0,
         limit: int = 30,
+        cursor: Optional[str] = None,
         db: Optional[Session] = None,
     ) -> KnowledgeListResponse:
+        # Raised to the caller, unlike query errors
+        keyset_filter = (
+            after_cursor((Knowledge.updated_at, Knowledge.id), cursor)
+            if cursor
+            else None
+        )
+
         try:
             with get_db_context(db) as db:
                 query = db.query(Knowledge, User).outerjoin(
@@ -264,10 +280,12 @@ class KnowledgeTable:
                         permission="read",
                     )
 
-                query = query.order_by(Knowledge.updated_at.desc(), Knowledge.id.asc())
+                query = query.order_by(Knowledge.updated_at.desc(), Knowledge.id.desc())
 
                 total = query.count()
-                if skip:
+                if keyset_filter is not None:
+                    query = query.filter(keyset_filter)
+                elif skip:
                     query = query.offset(skip)
                 if limit:
                     query = query.limit(limit)
@@ -298,7 +316,13 @@ class KnowledgeTable:
                         )
                     )
 
-                return KnowledgeListResponse(items=knowledge_bases, total=total)
+                return KnowledgeListResponse(
+                    items=knowledge_bases,
+                    total=total,
+                    next_cursor=get_next_cursor(
+                        knowledge_bases, limit, "updated_at", "id"
+                    ),
+                )
         except Exception as e:
             print(e)
             return KnowledgeListResponse(items=[], total=0)
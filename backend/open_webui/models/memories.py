@@ -65,6 +65,28 @@ class MemoriesTable:
             else:
                 return None
 
+    def insert_new_memories(
+        self,
+        user_id: str,
+        contents: list[str],
+        db: Optional[Session] = None,
+    ) -> list[MemoryModel]:
+        with get_db_context(db) as db:
+            now = int(time.time())
+            memories = [
+                Memory(
+                    id=str(uuid.uuid4()),
+                    user_id=user_id,
+                    content=content,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for content in contents
+            ]
+            db.add_all(memories)
+            db.commit()
+            return [MemoryModel.model_validate(memory) for memory in memories]
+
     def update_memory_by_id_and_user_id(
         self,
         id: str,
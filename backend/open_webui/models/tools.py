@@ -215,6 +215,16 @@ class ToolsTable:
             )
         ]
 
+    def get_tool_updated_at(
+        self, id: str, db: Optional[Session] = None
+    ) -> Optional[int]:
+        """Returns only the `updated_at` column, to revalidate cached modules cheaply."""
+        try:
+            with get_db_context(db) as db:
+                return db.query(Tool.updated_at).filter_by(id=id).scalar()
+        except Exception:
+            return None
+
     def get_tool_valves_by_id(
         self, id: str, db: Optional[Session] = None
     ) -> Optional[dict]:
@@ -8,10 +8,12 @@ from open_webui.internal.db import Base, JSONField, get_db, get_db_context
 from open_webui.env import DATABASE_USER_ACTIVE_STATUS_UPDATE_INTERVAL
 
 from open_webui.models.chats import Chats
+from open_webui.models.chat_messages import ChatMessages
 from open_webui.models.groups import Groups, GroupMember
 from open_webui.models.channels import ChannelMember
 
 from open_webui.utils.misc import throttle
+from open_webui.utils.pagination import after_cursor, get_next_cursor
 from open_webui.utils.validate import validate_profile_image_url
 
 
@@ -24,6 +26,7 @@ from sqlalchemy import (
     Boolean,
     Text,
     Date,
+    Index,
     exists,
     select,
     cast,
@@ -77,6 +80,11 @@ class User(Base):
     updated_at = Column(BigInteger)
     created_at = Column(BigInteger)
 
+    __table_args__ = (
+        # ORDER BY created_at DESC, id DESC (keyset pages)
+        Index("user_created_at_id_idx", "created_at", "id"),
+    )
+
 
 class UserModel(BaseModel):
     id: str
@@ -180,11 +188,13 @@ class UserModelResponse(UserModel):
 class UserListResponse(BaseModel):
     users: list[UserModelResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class UserGroupIdsListResponse(BaseModel):
     users: list[UserGroupIdsModel]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class UserStatus(BaseModel):
@@ -217,6 +227,7 @@ class UserIdNameStatusResponse(UserStatus):
 class UserInfoListResponse(BaseModel):
     users: list[UserInfoResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class UserIdNameListResponse(BaseModel):
@@ -381,12 +392,18 @@ class UsersTable:
         filter: Optional[dict] = None,
         skip: Optional[int] = None,
         limit: Optional[int] = None,
+        cursor: Optional[str] = None,
         db: Optional[Session] = None,
     ) -> dict:
         with get_db_context(db) as db:
             # Join GroupMember so we can order by group_id when requested
             query = db.query(User).options(defer(User.profile_image_url))
 
+            # Cursors page the default ordering, newest users first
+            keyset = not (filter and filter.get("order_by"))
+            if cursor and not keyset:
+                raise ValueError("Cursors only page the default ordering")
+
             if filter:
                 query_key = filter.get("query")
                 if query_key:
@@ -496,22 +513,29 @@ class UsersTable:
                     else:
                         query = query.order_by(User.role.desc())
 
-            else:
-                query = query.order_by(User.created_at.desc())
+            if keyset:
+                query = query.order_by(User.created_at.desc(), User.id.desc())
 
             # Count BEFORE pagination
             total = query.count()
 
             # correct pagination logic
-            if skip is not None:
+            if cursor:
+                query = query.filter(after_cursor((User.created_at, User.id), cursor))
+            elif skip is not None:
                 query = query.offset(skip)
             if limit is not None:
                 query = query.limit(limit)
 
-            users = query.all()
+            users = [UserModel.model_validate(user) for user in query.all()]
             return {
-                "users": [UserModel.model_validate(user) for user in users],
+                "users": users,
                 "total": total,
+                "next_cursor": (
+                    get_next_cursor(users, limit, "created_at", "id")
+                    if keyset
+                    else None
+                ),
             }
 
     def get_users_by_group_id(
@@ -757,6 +781,9 @@ class UsersTable:
             # Delete User Chats
             result = Chats.delete_chats_by_user_id(id, db=db)
             if result:
+                # Drop what is left of the user's usage rollups
+                ChatMessages.delete_stats_by_user_id(id, db=db)
+
                 with get_db_context(db) as db:
                     # Delete User
                     db.query(User).filter_by(id=id).delete()
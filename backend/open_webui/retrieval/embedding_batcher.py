@@ -0,0 +1,236 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+log = logging.getLogger(__name__)
+
+
+EmbedBatchFunction = Callable[
+    [list[str], Optional[str], Any], Awaitable[Optional[list[list[float]]]]
+]
+
+
+@dataclass
+class _PendingRequest:
+    texts: list[str]
+    future: asyncio.Future
+    enqueued_at: float
+
+
+@dataclass
+class _PendingGroup:
+    user: Any = None
+    requests: list[_PendingRequest] = field(default_factory=list)
+    size: int = 0
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class EmbeddingMicroBatcher:
+    """
+    Collects concurrent embedding calls for the same engine/model over a short
+    window, sends them upstream as a single batched request and scatters the
+    resulting vectors back to each caller.
+
+    Requests are grouped by embedding prefix (and by user when user info headers
+    are forwarded upstream), since both end up in the upstream request. A group
+    is flushed when it reaches `max_batch_size` texts or when its oldest request
+    has waited `max_latency_ms`, whichever happens first.
+
+    Parameters:
+    name (str): Label used for logging and metrics, e.g. "openai:text-embedding-3-small".
+    embed_batch (EmbedBatchFunction): Coroutine function taking (texts, prefix, user)
+        and returning one embedding per text, or None on failure.
+    max_batch_size (int): Maximum number of texts sent in a single upstream request.
+    max_latency_ms (float): Maximum time a request waits for others to join its batch.
+    group_by_user (bool): Keep requests from different users in separate batches.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        embed_batch: EmbedBatchFunction,
+        max_batch_size: int = 64,
+        max_latency_ms: float = 5,
+        group_by_user: bool = False,
+    ):
+        self.name = name
+        self.embed_batch = embed_batch
+        self.max_batch_size = max(int(max_batch_size), 1)
+        self.max_latency = max(float(max_latency_ms), 0) / 1000
+        self.group_by_user = group_by_user
+
+        self._groups: dict[Hashable, _PendingGroup] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        self._metrics = {
+            "requests": 0,
+            "texts": 0,
+            "batches": 0,
+            "batched_texts": 0,
+            "failed_batches": 0,
+            "max_batch_texts": 0,
+            "total_queue_wait": 0.0,
+            "total_batch_time": 0.0,
+        }
+        self._started_at = time.monotonic()
+
+    def accepts(self, texts: Union[str, list[str]]) -> bool:
+        """
+        Only small calls (queries) are batched; bulk document embeddings are
+        already batched by the caller and bypass the batcher.
+        """
+        if isinstance(texts, str):
+            return True
+        return 0 < len(texts) < self.max_batch_size
+
+    async def embed(
+        self,
+        texts: Union[str, list[str]],
+        prefix: Optional[str] = None,
+        user: Any = None,
+    ):
+        """
+        Embeds `texts` as part of a shared batch. Mirrors the return shape of the
+        embedding functions: a single vector for a string, a list for a list, and
+        None if the upstream request failed.
+        """
+        single = isinstance(texts, str)
+        items = [texts] if single else list(texts)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        key = (prefix, getattr(user, "id", None) if self.group_by_user else None)
+        group = self._groups.get(key)
+        if group is not None and group.size + len(items) > self.max_batch_size:
+            # Keep upstream requests within the configured batch size
+            self._flush(key)
+            group = None
+
+        if group is None:
+            group = _PendingGroup(user=user)
+            self._groups[key] = group
+
+        group.requests.append(
+            _PendingRequest(texts=items, future=future, enqueued_at=time.monotonic())
+        )
+        group.size += len(items)
+
+        self._metrics["requests"] += 1
+        self._metrics["texts"] += len(items)
+
+        if group.size >= self.max_batch_size:
+            self._flush(key)
+        elif group.timer is None:
+            group.timer = loop.call_later(self.max_latency, self._flush, key)
+
+        embeddings = await future
+        if embeddings is None:
+            return None
+        return embeddings[0] if single else embeddings
+
+    def _flush(self, key: Hashable) -> None:
+        group = self._groups.pop(key, None)
+        if group is None or not group.requests:
+            return
+
+        if group.timer is not None:
+            group.timer.cancel()
+
+        task = asyncio.create_task(self._run_batch(key[0], group))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, prefix: Optional[str], group: _PendingGroup) -> None:
+        texts = [text for request in group.requests for text in request.texts]
+
+        started_at = time.monotonic()
+        for request in group.requests:
+            self._metrics["total_queue_wait"] += started_at - request.enqueued_at
+
+        log.debug(
+            f"EmbeddingMicroBatcher[{self.name}]: sending {len(texts)} texts "
+            f"from {len(group.requests)} requests"
+        )
+
+        embeddings = None
+        error = None
+        try:
+            embeddings = await self.embed_batch(texts, prefix, group.user)
+            if embeddings is not None and len(embeddings) != len(texts):
+                log.warning(
+                    f"EmbeddingMicroBatcher[{self.name}]: expected {len(texts)} "
+                    f"embeddings, got {len(embeddings)}"
+                )
+                embeddings = None
+        except Exception as e:
+            error = e
+
+        self._metrics["batches"] += 1
+        self._metrics["batched_texts"] += len(texts)
+        self._metrics["max_batch_texts"] = max(
+            self._metrics["max_batch_texts"], len(texts)
+        )
+        self._metrics["total_batch_time"] += time.monotonic() - started_at
+        if embeddings is None:
+            self._metrics["failed_batches"] += 1
+
+        offset = 0
+        for request in group.requests:
+            if request.future.done():
+                # Caller was cancelled while waiting
+                offset += len(request.texts)
+                continue
+
+            if error is not None:
+                request.future.set_exception(error)
+            elif embeddings is None:
+                request.future.set_result(None)
+            else:
+                request.future.set_result(
+                    embeddings[offset : offset + len(request.texts)]
+                )
+            offset += len(request.texts)
+
+    def get_metrics(self) -> dict:
+        metrics = self._metrics
+        batches = metrics["batches"]
+        uptime = time.monotonic() - self._started_at
+
+        return {
+            "name": self.name,
+            "max_batch_size": self.max_batch_size,
+            "max_latency_ms": self.max_latency * 1000,
+            "requests": metrics["requests"],
+            "texts": metrics["texts"],
+            "batches": batches,
+            "failed_batches": metrics["failed_batches"],
+            "pending_requests": sum(len(g.requests) for g in self._groups.values()),
+            "avg_batch_texts": metrics["batched_texts"] / batches if batches else 0,
+            "max_batch_texts": metrics["max_batch_texts"],
+            "avg_queue_wait_ms": (
+                metrics["total_queue_wait"] / metrics["requests"] * 1000
+                if metrics["requests"]
+                else 0
+            ),
+            "avg_batch_time_ms": (
+                metrics["total_batch_time"] / batches * 1000 if batches else 0
+            ),
+            "texts_per_second": metrics["texts"] / uptime if uptime else 0,
+        }
+
+
+# The batcher behind the app-wide embedding function, replaced whenever the
+# embedding function is rebuilt (e.g. after an embedding config update).
+EMBEDDING_BATCHER: Optional[EmbeddingMicroBatcher] = None
+
+
+def set_embedding_batcher(batcher: Optional[EmbeddingMicroBatcher]) -> None:
+    global EMBEDDING_BATCHER
+    EMBEDDING_BATCHER = batcher
+
+
+def get_embedding_batcher_metrics() -> Optional[dict]:
+    return EMBEDDING_BATCHER.get_metrics() if EMBEDDING_BATCHER else None
@@ -4,7 +4,6 @@ import ftfy
 import sys
 import json
 
-from azure.identity import DefaultAzureCredential
 from langchain_community.document_loaders import (
     AzureAIDocumentIntelligenceLoader,
     BSHTMLLoader,
@@ -28,6 +27,7 @@ from open_webui.retrieval.loaders.external_document import ExternalDocumentLoade
 from open_webui.retrieval.loaders.mistral import MistralLoader
 from open_webui.retrieval.loaders.datalab_marker import DatalabMarkerLoader
 from open_webui.retrieval.loaders.mineru import MinerULoader
+from open_webui.retrieval.loaders.process_pool import DOCUMENT_PARSER_POOL
 
 
 from open_webui.env import GLOBAL_LOG_LEVEL, REQUESTS_VERIFY
@@ -191,6 +191,10 @@ class Loader:
         self, filename: str, file_content_type: str, file_path: str
     ) -> list[Document]:
         loader = self._get_loader(filename, file_content_type, file_path)
+        if DOCUMENT_PARSER_POOL.handles(loader):
+            # Parsing and text fixing happen in the worker processes
+            return DOCUMENT_PARSER_POOL.load(loader)
+
         docs = loader.load()
 
         return [
@@ -322,6 +326,8 @@ class Loader:
                     api_model=self.kwargs.get("DOCUMENT_INTELLIGENCE_MODEL"),
                 )
             else:
+                from azure.identity import DefaultAzureCredential
+
                 loader = AzureAIDocumentIntelligenceLoader(
                     file_path=file_path,
                     api_endpoint=self.kwargs.get("DOCUMENT_INTELLIGENCE_ENDPOINT"),
@@ -0,0 +1,308 @@
+import io
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import ftfy
+from langchain_community.document_loaders import (
+    BSHTMLLoader,
+    CSVLoader,
+    Docx2txtLoader,
+    OutlookMessageLoader,
+    PyPDFLoader,
+    TextLoader,
+)
+from langchain_community.document_loaders.unstructured import UnstructuredBaseLoader
+from langchain_core.documents import Document
+
+from open_webui.env import (
+    DOCUMENT_PARSER_MAX_MEMORY_MB,
+    DOCUMENT_PARSER_PDF_PAGES_PER_JOB,
+    DOCUMENT_PARSER_TIMEOUT,
+    DOCUMENT_PARSER_WORKERS,
+)
+
+log = logging.getLogger(__name__)
+
+
+# Loaders parsing the file locally, i.e. CPU bound work worth moving off the
+# request thread. Loaders calling an external service are always run in-process.
+LOCAL_LOADERS = (
+    BSHTMLLoader,
+    CSVLoader,
+    Docx2txtLoader,
+    OutlookMessageLoader,
+    PyPDFLoader,
+    TextLoader,
+    UnstructuredBaseLoader,
+)
+
+
+class DocumentParserTimeout(Exception):
+    pass
+
+
+####################################
+# Worker process side
+####################################
+
+
+def _init_worker(max_memory_bytes: int):
+    if max_memory_bytes > 0:
+        try:
+            import resource
+
+            resource.setrlimit(resource.RLIMIT_AS, (max_memory_bytes, max_memory_bytes))
+        except (ImportError, ValueError, OSError) as e:
+            log.warning(f"Could not limit document parser memory: {e}")
+
+
+def _raise_timeout(signum, frame):
+    raise DocumentParserTimeout("Document parsing timed out")
+
+
+def _fix_text(docs: list[Document]) -> list[Document]:
+    return [
+        Document(page_content=ftfy.fix_text(doc.page_content), metadata=doc.metadata)
+        for doc in docs
+    ]
+
+
+def _load(loader) -> list[Document]:
+    return _fix_text(loader.load())
+
+
+def _load_pdf_pages(loader: PyPDFLoader, start: int, stop: int) -> list[Document]:
+    """
+    Parses pages [start, stop) of the loader's PDF with the loader's own parser,
+    so the documents are the same as the ones of loader.load() for those pages.
+    """
+    import pypdf
+    from langchain_core.documents.base import Blob
+
+    reader = pypdf.PdfReader(loader.file_path, password=loader.parser.password)
+    writer = pypdf.PdfWriter()
+    for page in reader.pages[start:stop]:
+        writer.add_page(page)
+    # Keep the document info (producer, dates, ...) instead of pypdf's own
+    writer.metadata = reader.metadata
+
+    buffer = io.BytesIO()
+    writer.write(buffer)
+
+    docs = []
+    blob = Blob.from_data(buffer.getvalue(), path=loader.file_path)
+    for doc in loader.parser.lazy_parse(blob):
+        page = start + doc.metadata.get("page", 0)
+        doc.metadata.update(
+            page=page,
+            page_label=reader.page_labels[page],
+            total_pages=len(reader.pages),
+        )
+        docs.append(doc)
+    return _fix_text(docs)
+
+
+def _run_job(job, args: tuple, timeout: int) -> tuple[list[Document], float]:
+    # Jobs run on the main thread of the worker, where SIGALRM interrupts them
+    use_alarm = timeout > 0 and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    started_at = time.perf_counter()
+    try:
+        return job(*args), time.perf_counter() - started_at
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+####################################
+# Parent process side
+####################################
+
+
+class DocumentParserPool:
+    """
+    Runs the local document loaders (see LOCAL_LOADERS) and ftfy in a pool of
+    worker processes, so parsing large uploads doesn't hold the GIL of the
+    backend process.
+
+    Every job is aborted after `timeout` seconds and the address space of each
+    worker is capped at `max_memory_mb`. PDFs parsed page by page are split
+    into jobs of `pdf_pages_per_job` pages that run in parallel.
+
+    Workers are spawned on first use, disabled when `workers` is 0.
+    """
+
+    def __init__(
+        self,
+        workers: int = DOCUMENT_PARSER_WORKERS,
+        timeout: int = DOCUMENT_PARSER_TIMEOUT,
+        max_memory_mb: int = DOCUMENT_PARSER_MAX_MEMORY_MB,
+        pdf_pages_per_job: int = DOCUMENT_PARSER_PDF_PAGES_PER_JOB,
+    ):
+        self.workers = max(workers, 0)
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        self.pdf_pages_per_job = pdf_pages_per_job
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self._pending_jobs = 0
+        self._metrics = {
+            "documents": 0,
+            "jobs": 0,
+            "failed_jobs": 0,
+            "timed_out_jobs": 0,
+            "split_pdfs": 0,
+            "max_queue_depth": 0,
+            "total_job_time": 0.0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def handles(self, loader) -> bool:
+        return self.enabled and isinstance(loader, LOCAL_LOADERS)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking the backend would copy its threads, locks and sockets
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.max_memory_mb * 1024 * 1024,),
+                )
+            return self._executor
+
+    def _get_jobs(self, loader) -> list[tuple]:
+        if (
+            isinstance(loader, PyPDFLoader)
+            and loader.parser.mode == "page"
+            and self.pdf_pages_per_job > 0
+        ):
+            try:
+                import pypdf
+
+                pages = len(
+                    pypdf.PdfReader(
+                        loader.file_path, password=loader.parser.password
+                    ).pages
+                )
+            except Exception as e:
+                log.debug(f"Could not count the pages of {loader.file_path}: {e}")
+                pages = 0
+
+            if pages > self.pdf_pages_per_job:
+                with self._lock:
+                    self._metrics["split_pdfs"] += 1
+                return [
+                    (
+                        _load_pdf_pages,
+                        (loader, start, min(start + self.pdf_pages_per_job, pages)),
+                    )
+                    for start in range(0, pages, self.pdf_pages_per_job)
+                ]
+
+        return [(_load, (loader,))]
+
+    def _on_job_done(self, future):
+        with self._lock:
+            self._pending_jobs -= 1
+            if future.cancelled():
+                return
+            self._metrics["jobs"] += 1
+
+            exception = future.exception()
+            if exception is None:
+                self._metrics["total_job_time"] += future.result()[1]
+            elif isinstance(exception, DocumentParserTimeout):
+                self._metrics["timed_out_jobs"] += 1
+            else:
+                self._metrics["failed_jobs"] += 1
+
+    def load(self, loader) -> list[Document]:
+        """Parses the document of `loader` in the pool, blocking until it is done."""
+        executor = self._get_executor()
+        jobs = self._get_jobs(loader)
+
+        futures = []
+        try:
+            for job, args in jobs:
+                future = executor.submit(_run_job, job, args, self.timeout)
+                with self._lock:
+                    self._pending_jobs += 1
+                    self._metrics["max_queue_depth"] = max(
+                        self._metrics["max_queue_depth"], self._queue_depth()
+                    )
+                future.add_done_callback(self._on_job_done)
+                futures.append(future)
+
+            docs = []
+            for future in futures:
+                docs.extend(future.result()[0])
+        except BrokenProcessPool:
+            # A worker died, e.g. killed by the OOM killer, replace the pool
+            self._reset(executor)
+            raise Exception(
+                f"Document parser worker crashed while parsing {getattr(loader, 'file_path', '')}"
+            )
+        finally:
+            for future in futures:
+                future.cancel()
+
+        with self._lock:
+            self._metrics["documents"] += 1
+        return docs
+
+    def _queue_depth(self) -> int:
+        return max(self._pending_jobs - self.workers, 0)
+
+    def _reset(self, executor: ProcessPoolExecutor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_metrics(self) -> dict:
+        metrics = self._metrics
+        completed = metrics["jobs"] - metrics["failed_jobs"] - metrics["timed_out_jobs"]
+
+        return {
+            "enabled": self.enabled,
+            "workers": self.workers,
+            "timeout": self.timeout,
+            "max_memory_mb": self.max_memory_mb,
+            "pdf_pages_per_job": self.pdf_pages_per_job,
+            "documents": metrics["documents"],
+            "jobs": metrics["jobs"],
+            "failed_jobs": metrics["failed_jobs"],
+            "timed_out_jobs": metrics["timed_out_jobs"],
+            "split_pdfs": metrics["split_pdfs"],
+            "running_jobs": min(self._pending_jobs, self.workers),
+            "queue_depth": self._queue_depth(),
+            "max_queue_depth": metrics["max_queue_depth"],
+            "avg_job_time_ms": (
+                metrics["total_job_time"] / completed * 1000 if completed else 0
+            ),
+        }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+DOCUMENT_PARSER_POOL = DocumentParserPool()
@@ -0,0 +1,376 @@
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+
+from open_webui.config import (
+    ENABLE_MEMORY_MULTITENANCY,
+    MEMORY_COLLECTION_NAME,
+    MEMORY_VECTOR_CACHE_MAX_MEMORY_MB,
+)
+from open_webui.models.memories import Memories, MemoryModel
+from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.vector.main import SearchResult, VectorDBBase
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
+
+log = logging.getLogger(__name__)
+
+
+EmbeddingFunction = Callable[..., Awaitable[Any]]
+
+# How many times `limit` rows a search of the shared collection fetches at most
+# from backends that don't filter searches on user_id
+MEMORY_SEARCH_MAX_OVERFETCH = 64
+
+
+def get_memory_metadata(memory: MemoryModel) -> dict:
+    return {
+        "user_id": memory.user_id,
+        "created_at": memory.created_at,
+        "updated_at": memory.updated_at,
+    }
+
+
+class MemoryVectors:
+    """One user's memories with their normalized vectors, searched in process."""
+
+    def __init__(self, memories: list[MemoryModel], vectors: dict[str, list[float]]):
+        memories = [memory for memory in memories if memory.id in vectors]
+        self.ids = [memory.id for memory in memories]
+        self.documents = [memory.content for memory in memories]
+        self.metadatas = [get_memory_metadata(memory) for memory in memories]
+        self.matrix = self._normalize(
+            [vectors[memory.id] for memory in memories]
+        ).reshape(len(memories), -1)
+
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-9)
+
+    def set(self, memory: MemoryModel, vector: list[float]):
+        row = self._normalize(vector)
+        if self.ids and row.shape[-1] != self.matrix.shape[1]:
+            raise ValueError("Embedding dimension changed")
+
+        if memory.id in self.ids:
+            index = self.ids.index(memory.id)
+            self.documents[index] = memory.content
+            self.metadatas[index] = get_memory_metadata(memory)
+            self.matrix[index] = row
+        else:
+            self.ids.append(memory.id)
+            self.documents.append(memory.content)
+            self.metadatas.append(get_memory_metadata(memory))
+            self.matrix = np.vstack([self.matrix.reshape(-1, row.shape[-1]), row])
+
+    def remove(self, ids: list[str]):
+        ids = set(ids)
+        keep = [index for index, id in enumerate(self.ids) if id not in ids]
+        self.ids = [self.ids[index] for index in keep]
+        self.documents = [self.documents[index] for index in keep]
+        self.metadatas = [self.metadatas[index] for index in keep]
+        self.matrix = self.matrix[keep]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the vectors and documents."""
+        return self.matrix.nbytes + sum(len(document) for document in self.documents)
+
+    def search(self, vector: list[float], limit: int) -> SearchResult:
+        query = self._normalize(vector)
+        if self.ids and query.shape[-1] != self.matrix.shape[1]:
+            raise ValueError("Embedding dimension changed")
+
+        similarities = self.matrix @ query if self.ids else np.zeros(0)
+        limit = min(max(limit, 0), len(self.ids))
+        top = np.argpartition(-similarities, limit - 1)[:limit] if limit else []
+        top = sorted(top, key=lambda index: -similarities[index])
+
+        return SearchResult(
+            ids=[[self.ids[index] for index in top]],
+            documents=[[self.documents[index] for index in top]],
+            metadatas=[[self.metadatas[index] for index in top]],
+            # Cosine similarity mapped to 0..1, like the vector backends
+            distances=[[(float(similarities[index]) + 1) / 2 for index in top]],
+        )
+
+
+class MemoryStore:
+    """
+    Users' memory vectors in the vector database, either one collection per
+    user (user-memory-{id}) or, with `multitenant`, a single collection
+    partitioned by the user_id metadata field and searched with a filter.
+
+    Recall is answered from an in-process copy of the vectors of the most
+    recently recalled users, up to `max_bytes` in total, loaded on their first
+    query from the vector database (for backends that can return stored
+    vectors). Writes update the copy of this worker and invalidate the other
+    workers' copies.
+
+    A user's memories missing from their collection, e.g. when switching to
+    `multitenant`, are embedded and stored on their first recall. The
+    user-memory-{id} collections they were copied from are not deleted.
+    """
+
+    def __init__(
+        self,
+        client: VectorDBBase,
+        multitenant: bool = ENABLE_MEMORY_MULTITENANCY,
+        collection_name: str = MEMORY_COLLECTION_NAME,
+        max_bytes: int = MEMORY_VECTOR_CACHE_MAX_MEMORY_MB * 1024 * 1024,
+    ):
+        self.client = client
+        self.multitenant = multitenant
+        self.collection_name = collection_name
+        self.max_bytes = max_bytes
+
+        self._cache: OrderedDict[str, MemoryVectors] = OrderedDict()
+        # Users whose memories were checked against the collection by searches
+        # that don't go through the cache
+        self._indexed: set[str] = set()
+        # Bumped by every write, a load that overlaps one is not cached
+        self._writes = 0
+
+    def get_collection_name(self, user_id: str) -> str:
+        if self.multitenant:
+            return self.collection_name
+        return f"user-memory-{user_id}"
+
+    def invalidate(self, user_id: Optional[str] = None):
+        self._writes += 1
+        if user_id is None:
+            self._cache.clear()
+            self._indexed.clear()
+        else:
+            self._cache.pop(user_id, None)
+            self._indexed.discard(user_id)
+
+    def _publish(self, user_id: str):
+        self._writes += 1
+        CACHE_INVALIDATOR.publish("memories", user_id)
+
+    async def upsert(
+        self,
+        embedding_function: EmbeddingFunction,
+        user,
+        memories: list[MemoryModel],
+    ) -> list[list[float]]:
+        """Embeds `memories` in a single batch and stores them."""
+        if not memories:
+            return []
+
+        vectors = await embedding_function(
+            [memory.content for memory in memories], user=user
+        )
+        await self.client.aupsert(
+            collection_name=self.get_collection_name(user.id),
+            items=[
+                {
+                    "id": memory.id,
+                    "text": memory.content,
+                    "vector": vector,
+                    "metadata": get_memory_metadata(memory),
+                }
+                for memory, vector in zip(memories, vectors)
+            ],
+        )
+
+        self._publish(user.id)
+        entry = self._cache.get(user.id)
+        if entry is not None:
+            try:
+                for memory, vector in zip(memories, vectors):
+                    entry.set(memory, vector)
+                self._evict()
+            except ValueError:
+                self._cache.pop(user.id, None)
+        return vectors
+
+    def _evict(self):
+        """Drops the least recently recalled users until the cache fits max_bytes."""
+        size = sum(entry.nbytes for entry in self._cache.values())
+        while self._cache and size > self.max_bytes:
+            _, entry = self._cache.popitem(last=False)
+            size -= entry.nbytes
+
+    async def delete(self, user_id: str, ids: list[str]):
+        await run_in_threadpool(
+            self.client.delete,
+            collection_name=self.get_collection_name(user_id),
+            ids=ids,
+        )
+
+        self._publish(user_id)
+        entry = self._cache.get(user_id)
+        if entry is not None:
+            entry.remove(ids)
+
+    async def delete_all(self, user_id: str):
+        if self.multitenant:
+            if await run_in_threadpool(
+                self.client.has_collection, self.collection_name
+            ):
+                await run_in_threadpool(
+                    self.client.delete,
+                    collection_name=self.collection_name,
+                    filter={"user_id": user_id},
+                )
+        else:
+            await run_in_threadpool(
+                self.client.delete_collection, self.get_collection_name(user_id)
+            )
+
+        self._publish(user_id)
+        self._cache.pop(user_id, None)
+
+    async def _load(
+        self, embedding_function: EmbeddingFunction, user
+    ) -> Optional[MemoryVectors]:
+        entry = self._cache.get(user.id)
+        if entry is not None:
+            self._cache.move_to_end(user.id)
+            return entry
+
+        writes = self._writes
+        memories = Memories.get_memories_by_user_id(user.id) or []
+        vectors = {}
+        if memories:
+            vectors = await run_in_threadpool(
+                self.client.get_vectors,
+                self.get_collection_name(user.id),
+                [memory.id for memory in memories],
+            )
+            if vectors is None:
+                # The backend can't return stored vectors, search it instead
+                return None
+
+        missing = [memory for memory in memories if memory.id not in vectors]
+        if missing:
+            embeddings = await self._index(embedding_function, user, missing)
+            vectors.update(
+                {memory.id: vector for memory, vector in zip(missing, embeddings)}
+            )
+            writes = self._writes
+
+        entry = MemoryVectors(memories, vectors)
+        if writes == self._writes:
+            self._cache[user.id] = entry
+            self._evict()
+        return entry
+
+    async def _index(
+        self, embedding_function: EmbeddingFunction, user, missing: list[MemoryModel]
+    ) -> list[list[float]]:
+        # Written before the store moved to this collection
+        log.info(f"Indexing {len(missing)} memories of user {user.id}")
+        return await self.upsert(embedding_function, user, missing)
+
+    async def _index_missing(
+        self, embedding_function: EmbeddingFunction, user, memories: list[MemoryModel]
+    ):
+        """
+        Stores the memories missing from the shared collection for searches that
+        don't load them through get_vectors, looking the stored ids up once per
+        user and worker.
+        """
+        if not self.multitenant or user.id in self._indexed:
+            return
+
+        result = await run_in_threadpool(
+            self.client.query,
+            self.collection_name,
+            {"user_id": user.id},
+        )
+        stored = set(result.ids[0]) if result and result.ids else set()
+        missing = [memory for memory in memories if memory.id not in stored]
+        if missing:
+            await self._index(embedding_function, user, missing)
+        self._indexed.add(user.id)
+
+    async def search(
+        self,
+        embedding_function: EmbeddingFunction,
+        user,
+        query: str,
+        limit: int,
+    ) -> Optional[SearchResult]:
+        """The `limit` memories of `user` closest to `query`, None if they have none."""
+        entry = None
+        if self.max_bytes > 0:
+            try:
+                entry = await self._load(embedding_function, user)
+            except Exception as e:
+                log.warning(f"Failed to load memory vectors of user {user.id}: {e}")
+
+        if entry is not None:
+            if not entry.ids:
+                return None
+
+            vector = await embedding_function(query, user=user)
+            try:
+                return entry.search(vector, limit)
+            except ValueError:
+                # The embedding model changed, the stored vectors are stale
+                self._cache.pop(user.id, None)
+        else:
+            memories = Memories.get_memories_by_user_id(user.id)
+            if not memories:
+                return None
+
+            try:
+                await self._index_missing(embedding_function, user, memories)
+            except Exception as e:
+                log.warning(f"Failed to index the memories of user {user.id}: {e}")
+            vector = await embedding_function(query, user=user)
+
+        if not self.multitenant:
+            return await self.client.asearch(
+                collection_name=self.get_collection_name(user.id),
+                vectors=[vector],
+                limit=limit,
+            )
+        return await self._search_shared(user, vector, limit)
+
+    async def _search_shared(self, user, vector: list[float], limit: int):
+        """
+        Searches the shared collection for the user's memories. Not every
+        backend applies filters to searches, so rows of other users are dropped
+        and, while they crowd out the user's own, more rows are fetched.
+        """
+        fetch = limit
+        while True:
+            result = await self.client.asearch(
+                collection_name=self.collection_name,
+                vectors=[vector],
+                filter={"user_id": user.id},
+                limit=fetch,
+            )
+            if result is None:
+                return None
+
+            rows = [
+                index
+                for index, metadata in enumerate(result.metadatas[0])
+                if (metadata or {}).get("user_id") == user.id
+            ][:limit]
+            if (
+                len(rows) >= limit
+                or len(result.ids[0]) < fetch
+                or fetch >= limit * MEMORY_SEARCH_MAX_OVERFETCH
+            ):
+                break
+            fetch *= 4
+
+        return SearchResult(
+            ids=[[result.ids[0][index] for index in rows]],
+            documents=[[result.documents[0][index] for index in rows]],
+            metadatas=[[result.metadatas[0][index] for index in rows]],
+            distances=[[result.distances[0][index] for index in rows]],
+        )
+
+
+MEMORY_STORE = MemoryStore(VECTOR_DB_CLIENT)
@@ -6,3 +6,8 @@ class BaseReranker(ABC):
     @abstractmethod
     def predict(self, sentences: List[Tuple[str, str]]) -> Optional[List[float]]:
         pass
+
+    def predict_batch(
+        self, batches: List[List[Tuple[str, str]]]
+    ) -> List[Optional[List[float]]]:
+        return [self.predict(sentences) for sentences in batches]
@@ -12,6 +12,9 @@ log = logging.getLogger(__name__)
 
 
 class ColBERT(BaseReranker):
+    # Scores are softmax-normalized over the candidate documents
+    scores_depend_on_candidates = True
+
     def __init__(self, name, **kwargs) -> None:
         log.info("ColBERT: Loading model", name)
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -85,3 +88,24 @@ class ColBERT(BaseReranker):
         )
 
         return scores
+
+    def predict_batch(self, batches):
+        # Embed the documents and queries of all concurrent rerank calls at once
+        queries = [sentences[0][0] for sentences in batches]
+        docs = [pair[1] for sentences in batches for pair in sentences]
+
+        embedded_docs = self.ckpt.docFromText(docs, bsize=32)[0]
+        embedded_queries = self.ckpt.queryFromText(queries, bsize=32)
+
+        results = []
+        offset = 0
+        for idx, sentences in enumerate(batches):
+            results.append(
+                self.calculate_similarity_scores(
+                    embedded_queries[idx].unsqueeze(0),
+                    embedded_docs[offset : offset + len(sentences)],
+                )
+            )
+            offset += len(sentences)
+
+        return results
@@ -23,6 +23,8 @@ class ExternalReranker(BaseReranker):
         self.url = url
         self.model = model
         self.timeout = timeout
+        # Reuse connections to the rerank endpoint across calls
+        self.session = requests.Session()
 
     def predict(
         self, sentences: List[Tuple[str, str]], user=None
@@ -49,7 +51,7 @@ class ExternalReranker(BaseReranker):
             if ENABLE_FORWARD_USER_INFO_HEADERS and user:
                 headers = include_user_info_headers(headers, user)
 
-            r = requests.post(
+            r = self.session.post(
                 f"{self.url}",
                 headers=headers,
                 json=payload,
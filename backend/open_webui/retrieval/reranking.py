@@ -0,0 +1,219 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+
+Sentences = list[tuple[str, str]]
+
+
+def _to_list(scores) -> Optional[list[float]]:
+    if scores is None:
+        return None
+    return scores.tolist() if not isinstance(scores, list) else scores
+
+
+class RerankScoreCache:
+    """
+    Thread-safe, size-bounded LRU cache of (query, chunk hash) -> relevance score
+    with a TTL, so follow-up questions and popular queries over the same chunks
+    skip the reranker entirely.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: int = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[tuple[str, str], tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str]) -> Optional[float]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or (self.ttl and time.monotonic() - item[1] > self.ttl):
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key: tuple[str, str], score: float) -> None:
+        with self._lock:
+            self._items[key] = (score, time.monotonic())
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._items),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0,
+            }
+
+
+@dataclass
+class _PendingRerank:
+    sentences: Sentences
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class RerankBatcher:
+    """
+    Coalesces concurrent rerank calls (each running in its own worker thread) into
+    a single model invocation. The first caller becomes the batch leader, waits up
+    to `max_wait_ms` for other queries to join (or until `max_batch_pairs` pairs
+    are pending), runs `predict_batch` once and hands each caller its scores.
+
+    Parameters:
+    predict_batch (Callable): Takes a list of per-query sentence pair lists and
+        returns one score sequence per query.
+    max_batch_pairs (int): Pending (query, document) pairs that trigger an early flush.
+    max_wait_ms (float): Maximum time the leader waits for other queries.
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[list[Sentences]], list],
+        max_batch_pairs: int = 256,
+        max_wait_ms: float = 5,
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch_pairs = max_batch_pairs
+        self.max_wait = max_wait_ms / 1000
+
+        self._lock = threading.Lock()
+        self._pending: list[_PendingRerank] = []
+        self._pending_pairs = 0
+        self._flush_event: Optional[threading.Event] = None
+
+    def predict(self, sentences: Sentences):
+        request = _PendingRerank(sentences=sentences)
+
+        with self._lock:
+            self._pending.append(request)
+            self._pending_pairs += len(sentences)
+
+            is_leader = self._flush_event is None
+            if is_leader:
+                self._flush_event = threading.Event()
+            flush_event = self._flush_event
+
+            if self._pending_pairs >= self.max_batch_pairs:
+                flush_event.set()
+
+        if is_leader:
+            flush_event.wait(self.max_wait)
+            with self._lock:
+                batch = self._pending
+                self._pending = []
+                self._pending_pairs = 0
+                self._flush_event = None
+            self._run(batch)
+        else:
+            request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _run(self, batch: list[_PendingRerank]) -> None:
+        log.debug(
+            f"RerankBatcher: scoring {sum(len(r.sentences) for r in batch)} pairs "
+            f"for {len(batch)} queries"
+        )
+        try:
+            results = self.predict_batch([request.sentences for request in batch])
+            for request, result in zip(batch, results):
+                request.result = result
+        except Exception as e:
+            for request in batch:
+                request.error = e
+        finally:
+            for request in batch:
+                request.done.set()
+
+
+def get_predict_batch(reranker) -> Callable[[list[Sentences]], list]:
+    """
+    Returns a batched scoring function for a local reranker. Rerankers with a
+    native `predict_batch` (e.g. ColBERT) use it; pairwise models such as the
+    sentence-transformers CrossEncoder score the concatenated pairs in one call.
+    """
+    if hasattr(reranker, "predict_batch"):
+        return reranker.predict_batch
+
+    def predict_batch(batches: list[Sentences]) -> list:
+        scores = _to_list(
+            reranker.predict([pair for sentences in batches for pair in sentences])
+        )
+
+        results = []
+        offset = 0
+        for sentences in batches:
+            results.append(scores[offset : offset + len(sentences)])
+            offset += len(sentences)
+        return results
+
+    return predict_batch
+
+
+class RerankingFunction:
+    """
+    Callable returned by `get_reranking_function`, scoring `documents` against
+    `query`. Scores already known for a (query, chunk) pair are served from the
+    cache and only the remaining documents are sent to the reranker.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[..., Any],
+        cache: Optional[RerankScoreCache] = None,
+    ):
+        self.predict = predict
+        self.cache = cache
+
+    def __call__(self, query: str, documents: Sequence, user=None):
+        if self.cache is None:
+            return self.predict(
+                [(query, doc.page_content) for doc in documents], user=user
+            )
+
+        keys = [
+            (query, hashlib.sha256(doc.page_content.encode()).hexdigest())
+            for doc in documents
+        ]
+        scores = [self.cache.get(key) for key in keys]
+
+        missing = [idx for idx, score in enumerate(scores) if score is None]
+        if missing:
+            missing_scores = _to_list(
+                self.predict(
+                    [(query, documents[idx].page_content) for idx in missing],
+                    user=user,
+                )
+            )
+            if missing_scores is None:
+                return None
+
+            for idx, score in zip(missing, missing_scores):
+                score = float(score)
+                scores[idx] = score
+                self.cache.set(keys[idx], score)
+
+        return scores
@@ -1,12 +1,12 @@
 import logging
 import os
+from contextlib import contextmanager
 from typing import Awaitable, Optional, Union
 
 import requests
 import aiohttp
 import asyncio
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
 import time
 import re
 
@@ -31,7 +31,17 @@ from open_webui.models.chats import Chats
 from open_webui.models.notes import Notes
 from open_webui.models.access_grants import AccessGrants
 
-from open_webui.retrieval.vector.main import GetResult
+from open_webui.retrieval.vector.main import GetResult, SearchError
+from open_webui.retrieval.reranking import (
+    RerankBatcher,
+    RerankingFunction,
+    RerankScoreCache,
+    get_predict_batch,
+)
+from open_webui.retrieval.embedding_batcher import (
+    EmbeddingMicroBatcher,
+    set_embedding_batcher,
+)
 from open_webui.utils.headers import include_user_info_headers
 from open_webui.utils.misc import get_message_list
 
@@ -49,6 +59,12 @@ from open_webui.config import (
     RAG_EMBEDDING_QUERY_PREFIX,
     RAG_EMBEDDING_CONTENT_PREFIX,
     RAG_EMBEDDING_PREFIX_FIELD_NAME,
+    RAG_EMBEDDING_MICRO_BATCH_MAX_SIZE,
+    RAG_EMBEDDING_MICRO_BATCH_MAX_LATENCY_MS,
+    RAG_RERANKING_CACHE_SIZE,
+    RAG_RERANKING_CACHE_TTL,
+    RAG_RERANKING_BATCH_WAIT_MS,
+    RAG_RERANKING_MAX_BATCH_PAIRS,
 )
 
 log = logging.getLogger(__name__)
@@ -89,6 +105,7 @@ def get_content_from_url(request, url: str) -> str:
 
 
 CHUNK_HASH_KEY = "_chunk_hash"
+CHUNK_ID_KEY = "_chunk_id"
 
 
 def _content_hash(text: str) -> str:
@@ -122,7 +139,7 @@ class VectorSearchRetriever(BaseRetriever):
         run_manager: CallbackManagerForRetrieverRun,
     ) -> list[Document]:
         embedding = await self.embedding_function(query, RAG_EMBEDDING_QUERY_PREFIX)
-        result = VECTOR_DB_CLIENT.search(
+        result = await VECTOR_DB_CLIENT.asearch(
             collection_name=self.collection_name,
             vectors=[embedding],
             limit=self.top_k,
@@ -136,6 +153,7 @@ class VectorSearchRetriever(BaseRetriever):
         for idx in range(len(ids)):
             metadata = metadatas[idx]
             metadata[CHUNK_HASH_KEY] = _content_hash(documents[idx])
+            metadata[CHUNK_ID_KEY] = ids[idx]
             results.append(
                 Document(
                     metadata=metadata,
@@ -145,24 +163,47 @@ class VectorSearchRetriever(BaseRetriever):
         return results
 
 
+@contextmanager
+def _log_query_doc(collection_name: str, k: int):
+    log.debug(f"query_doc:doc {collection_name}")
+    try:
+        yield
+    except Exception as e:
+        log.exception(f"Error querying doc {collection_name} with limit {k}: {e}")
+        raise e
+
+
+def _query_doc_result(result):
+    if result:
+        log.info(f"query_doc:result {result.ids} {result.metadatas}")
+    return result
+
+
 def query_doc(
     collection_name: str, query_embedding: list[float], k: int, user: UserModel = None
 ):
-    try:
-        log.debug(f"query_doc:doc {collection_name}")
-        result = VECTOR_DB_CLIENT.search(
-            collection_name=collection_name,
-            vectors=[query_embedding],
-            limit=k,
+    with _log_query_doc(collection_name, k):
+        return _query_doc_result(
+            VECTOR_DB_CLIENT.search(
+                collection_name=collection_name,
+                vectors=[query_embedding],
+                limit=k,
+            )
         )
 
-        if result:
-            log.info(f"query_doc:result {result.ids} {result.metadatas}")
 
-        return result
-    except Exception as e:
-        log.exception(f"Error querying doc {collection_name} with limit {k}: {e}")
-        raise e
+async def aquery_doc(
+    collection_name: str, query_embedding: list[float], k: int, user: UserModel = None
+):
+    """Async variant of `query_doc`."""
+    with _log_query_doc(collection_name, k):
+        return _query_doc_result(
+            await VECTOR_DB_CLIENT.asearch(
+                collection_name=collection_name,
+                vectors=[query_embedding],
+                limit=k,
+            )
+        )
 
 
 def get_doc(collection_name: str, user: UserModel = None):
@@ -251,8 +292,13 @@ async def query_doc_with_hybrid_search(
         log.debug(f"query_doc_with_hybrid_search:doc {collection_name}")
 
         original_texts = collection_result.documents[0]
+        original_ids = collection_result.ids[0] if collection_result.ids else None
         bm25_metadatas = [
-            {**meta, CHUNK_HASH_KEY: _content_hash(original_texts[idx])}
+            {
+                **meta,
+                CHUNK_HASH_KEY: _content_hash(original_texts[idx]),
+                **({CHUNK_ID_KEY: original_ids[idx]} if original_ids else {}),
+            }
             for idx, meta in enumerate(collection_result.metadatas[0])
         ]
 
@@ -299,6 +345,7 @@ async def query_doc_with_hybrid_search(
             top_n=k_reranker,
             reranking_function=reranking_function,
             r_score=r,
+            collection_name=collection_name,
         )
 
         compression_retriever = ContextualCompressionRetriever(
@@ -431,22 +478,7 @@ async def query_collection(
     k: int,
 ) -> dict:
     results = []
-    error = False
-
-    def process_query_collection(collection_name, query_embedding):
-        try:
-            if collection_name:
-                result = query_doc(
-                    collection_name=collection_name,
-                    k=k,
-                    query_embedding=query_embedding,
-                )
-                if result is not None:
-                    return result.model_dump(), None
-            return None, None
-        except Exception as e:
-            log.exception(f"Error when querying the collection: {e}")
-            return None, e
+    failed = 0
 
     # Generate all query embeddings (in one call)
     query_embeddings = await embedding_function(
@@ -456,23 +488,40 @@ async def query_collection(
         f"query_collection: processing {len(queries)} queries across {len(collection_names)} collections"
     )
 
-    with ThreadPoolExecutor() as executor:
-        future_results = []
-        for query_embedding in query_embeddings:
-            for collection_name in collection_names:
-                result = executor.submit(
-                    process_query_collection, collection_name, query_embedding
-                )
-                future_results.append(result)
-        task_results = [future.result() for future in future_results]
+    # Search every (query, collection) pair at once, backends that keep all
+    # collections together answer this in a single round trip
+    collection_names = list(dict.fromkeys(filter(None, collection_names)))
+    try:
+        collection_results = await VECTOR_DB_CLIENT.asearch_many(
+            collection_names=collection_names,
+            vectors=query_embeddings,
+            limit=k,
+        )
+    except Exception as e:
+        log.exception(f"Error when querying the collections: {e}")
+        collection_results = {
+            collection_name: SearchError(error=str(e))
+            for collection_name in collection_names
+        }
 
-    for result, err in task_results:
-        if err is not None:
-            error = True
-        elif result is not None:
-            results.append(result)
+    for result in collection_results.values():
+        if isinstance(result, SearchError):
+            failed += 1
+            continue
+        if result is None:
+            continue
 
-    if error and not results:
+        for qid in range(len(result.ids or [])):
+            results.append(
+                {
+                    "ids": [result.ids[qid]],
+                    "distances": [result.distances[qid]],
+                    "documents": [result.documents[qid]],
+                    "metadatas": [result.metadatas[qid]],
+                }
+            )
+
+    if failed and failed == len(collection_results):
         log.warning("All collection queries failed. No results returned.")
 
     return merge_and_sort_query_results(results, k=k)
@@ -491,20 +540,30 @@ async def query_collection_with_hybrid_search(
 ) -> dict:
     results = []
     error = False
-    # Fetch collection data once per collection sequentially
+
+    # Fetch collection data once per collection, concurrently
     # Avoid fetching the same data multiple times later
-    collection_results = {}
-    for collection_name in collection_names:
+    async def fetch_collection(collection_name):
         try:
             log.debug(
-                f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.get:collection {collection_name}"
-            )
-            collection_results[collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=collection_name
+                f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.aget:collection {collection_name}"
             )
+            return await VECTOR_DB_CLIENT.aget(collection_name=collection_name)
         except Exception as e:
             log.exception(f"Failed to fetch collection {collection_name}: {e}")
-            collection_results[collection_name] = None
+            return None
+
+    collection_results = dict(
+        zip(
+            collection_names,
+            await asyncio.gather(
+                *[
+                    fetch_collection(collection_name)
+                    for collection_name in collection_names
+                ]
+            ),
+        )
+    )
 
     log.info(
         f"Starting hybrid search for {len(queries)} queries in {len(collection_names)} collections..."
@@ -826,21 +885,43 @@ def get_embedding_function(
     azure_api_version=None,
     enable_async=True,
     concurrent_requests=0,
+    enable_micro_batching=None,
 ) -> Awaitable:
+    # enable_micro_batching=None builds a one-off function and leaves the shared
+    # batcher alone, False drops a batcher installed by an earlier configuration.
+    # Coalesced batches are never larger than the configured batch size.
+    micro_batch_size = min(
+        RAG_EMBEDDING_MICRO_BATCH_MAX_SIZE, int(embedding_batch_size)
+    )
+
     if embedding_engine == "":
         # Sentence transformers: CPU-bound sync operation
-        async def async_embedding_function(query, prefix=None, user=None):
-            return await asyncio.to_thread(
-                (
-                    lambda query, prefix=None: embedding_function.encode(
-                        query,
-                        batch_size=int(embedding_batch_size),
-                        **({"prompt": prefix} if prefix else {}),
-                    ).tolist()
-                ),
+        def encode(query, prefix=None):
+            return embedding_function.encode(
                 query,
-                prefix,
+                batch_size=int(embedding_batch_size),
+                **({"prompt": prefix} if prefix else {}),
+            ).tolist()
+
+        batcher = None
+        if enable_micro_batching:
+
+            async def embed_batch(texts, prefix=None, user=None):
+                return await asyncio.to_thread(encode, texts, prefix)
+
+            batcher = EmbeddingMicroBatcher(
+                f"sentence_transformers:{embedding_model}",
+                embed_batch,
+                max_batch_size=micro_batch_size,
+                max_latency_ms=RAG_EMBEDDING_MICRO_BATCH_MAX_LATENCY_MS,
             )
+        if enable_micro_batching is not None:
+            set_embedding_batcher(batcher)
+
+        async def async_embedding_function(query, prefix=None, user=None):
+            if batcher and batcher.accepts(query):
+                return await batcher.embed(query, prefix, user)
+            return await asyncio.to_thread(encode, query, prefix)
 
         return async_embedding_function
     elif embedding_engine in ["ollama", "openai", "azure_openai"]:
@@ -855,7 +936,23 @@ def get_embedding_function(
             azure_api_version=azure_api_version,
         )
 
+        batcher = None
+        if enable_micro_batching:
+            batcher = EmbeddingMicroBatcher(
+                f"{embedding_engine}:{embedding_model}",
+                embedding_function,
+                max_batch_size=micro_batch_size,
+                max_latency_ms=RAG_EMBEDDING_MICRO_BATCH_MAX_LATENCY_MS,
+                # User info headers are sent upstream, so batches can't mix users
+                group_by_user=ENABLE_FORWARD_USER_INFO_HEADERS,
+            )
+        if enable_micro_batching is not None:
+            set_embedding_batcher(batcher)
+
         async def async_embedding_function(query, prefix=None, user=None):
+            if batcher and batcher.accepts(query):
+                return await batcher.embed(query, prefix, user)
+
             if isinstance(query, list):
                 # Create batches
                 batches = [
@@ -966,14 +1063,32 @@ async def generate_embeddings(
 def get_reranking_function(reranking_engine, reranking_model, reranking_function):
     if reranking_function is None:
         return None
+
+    cache = None
+    # Scores that depend on the whole candidate set (e.g. ColBERT's softmax)
+    # can't be cached per chunk
+    if RAG_RERANKING_CACHE_SIZE > 0 and not getattr(
+        reranking_function, "scores_depend_on_candidates", False
+    ):
+        cache = RerankScoreCache(RAG_RERANKING_CACHE_SIZE, RAG_RERANKING_CACHE_TTL)
+
     if reranking_engine == "external":
-        return lambda query, documents, user=None: reranking_function.predict(
-            [(query, doc.page_content) for doc in documents], user=user
+        # Rerank APIs take one query per request, concurrent queries already
+        # go out in parallel from their own threads
+        predict = lambda sentences, user=None: reranking_function.predict(
+            sentences, user=user
         )
-    else:
-        return lambda query, documents, user=None: reranking_function.predict(
-            [(query, doc.page_content) for doc in documents]
+    elif RAG_RERANKING_BATCH_WAIT_MS > 0:
+        batcher = RerankBatcher(
+            get_predict_batch(reranking_function),
+            max_batch_pairs=RAG_RERANKING_MAX_BATCH_PAIRS,
+            max_wait_ms=RAG_RERANKING_BATCH_WAIT_MS,
         )
+        predict = lambda sentences, user=None: batcher.predict(sentences)
+    else:
+        predict = lambda sentences, user=None: reranking_function.predict(sentences)
+
+    return RerankingFunction(predict, cache=cache)
 
 
 async def get_sources_from_items(
@@ -1323,6 +1438,7 @@ class RerankCompressor(BaseDocumentCompressor):
     top_n: int
     reranking_function: Any
     r_score: float
+    collection_name: Optional[str] = None
 
     class Config:
         extra = "forbid"
@@ -1364,8 +1480,8 @@ class RerankCompressor(BaseDocumentCompressor):
             query_embedding = await self.embedding_function(
                 query, RAG_EMBEDDING_QUERY_PREFIX
             )
-            document_embedding = await self.embedding_function(
-                [doc.page_content for doc in documents], RAG_EMBEDDING_CONTENT_PREFIX
+            document_embedding = await self._get_document_embeddings(
+                documents, len(query_embedding)
             )
             scores = util.cos_sim(query_embedding, document_embedding)[0]
 
@@ -1397,3 +1513,45 @@ class RerankCompressor(BaseDocumentCompressor):
                 "No valid scores found, check your reranking function. Returning original documents."
             )
             return documents
+
+    async def _get_document_embeddings(
+        self, documents: Sequence[Document], dimension: int
+    ) -> list[list[float]]:
+        """
+        Reuses the chunk vectors already stored in the vector DB where the backend
+        supports it, and only embeds the documents it couldn't find (e.g. chunks
+        from a different collection or an outdated embedding model).
+        """
+        embeddings = [None] * len(documents)
+
+        ids = [doc.metadata.get(CHUNK_ID_KEY) for doc in documents]
+        if self.collection_name and any(ids):
+            stored = await asyncio.to_thread(
+                VECTOR_DB_CLIENT.get_vectors,
+                self.collection_name,
+                [str(id) for id in ids if id],
+            )
+            for idx, id in enumerate(ids):
+                vector = stored.get(str(id)) if stored and id else None
+                if vector is None:
+                    continue
+
+                # pgvector zero-pads vectors to its configured length
+                if len(vector) > dimension and not any(vector[dimension:]):
+                    vector = vector[:dimension]
+                if len(vector) == dimension:
+                    embeddings[idx] = vector
+
+        missing = [idx for idx, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            log.debug(
+                f"RerankCompressor: embedding {len(missing)}/{len(documents)} documents"
+            )
+            missing_embeddings = await self.embedding_function(
+                [documents[idx].page_content for idx in missing],
+                RAG_EMBEDDING_CONTENT_PREFIX,
+            )
+            for idx, embedding in zip(missing, missing_embeddings):
+                embeddings[idx] = embedding
+
+        return embeddings
@@ -140,6 +140,20 @@ class ChromaClient(VectorDBBase):
             )
         return None
 
+    def get_vectors(
+        self, collection_name: str, ids: list[str]
+    ) -> Optional[dict[str, list[float]]]:
+        try:
+            collection = self.client.get_collection(name=collection_name)
+            result = collection.get(ids=ids, include=["embeddings"])
+            return {
+                id: list(embedding)
+                for id, embedding in zip(result["ids"], result["embeddings"])
+            }
+        except Exception as e:
+            log.exception(f"Error getting vectors from {collection_name}: {e}")
+            return None
+
     def insert(self, collection_name: str, items: list[VectorItem]):
         # Insert the items into the collection, if the collection does not exist, it will be created.
         collection = self.client.get_or_create_collection(
@@ -1,7 +1,7 @@
-from elasticsearch import Elasticsearch, BadRequestError
+from elasticsearch import AsyncElasticsearch, Elasticsearch, BadRequestError
 from typing import Optional
 import ssl
-from elasticsearch.helpers import bulk, scan
+from elasticsearch.helpers import async_bulk, async_scan, bulk, scan
 
 from open_webui.retrieval.vector.utils import process_metadata
 from open_webui.retrieval.vector.main import (
@@ -32,18 +32,22 @@ class ElasticsearchClient(VectorDBBase):
 
     def __init__(self):
         self.index_prefix = ELASTICSEARCH_INDEX_PREFIX
-        self.client = Elasticsearch(
-            hosts=[ELASTICSEARCH_URL],
-            ca_certs=ELASTICSEARCH_CA_CERTS,
-            api_key=ELASTICSEARCH_API_KEY,
-            cloud_id=ELASTICSEARCH_CLOUD_ID,
-            basic_auth=(
+        self.client_kwargs = {
+            "hosts": [ELASTICSEARCH_URL],
+            "ca_certs": ELASTICSEARCH_CA_CERTS,
+            "api_key": ELASTICSEARCH_API_KEY,
+            "cloud_id": ELASTICSEARCH_CLOUD_ID,
+            "basic_auth": (
                 (ELASTICSEARCH_USERNAME, ELASTICSEARCH_PASSWORD)
                 if ELASTICSEARCH_USERNAME and ELASTICSEARCH_PASSWORD
                 else None
             ),
-            ssl_assert_fingerprint=SSL_ASSERT_FINGERPRINT,
-        )
+            "ssl_assert_fingerprint": SSL_ASSERT_FINGERPRINT,
+        }
+        self.client = Elasticsearch(**self.client_kwargs)
+
+    def _create_async_client(self):
+        return AsyncElasticsearch(**self.client_kwargs)
 
     # Status: works
     def _get_index_name(self, dimension: int) -> str:
@@ -159,14 +163,48 @@ class ElasticsearchClient(VectorDBBase):
         filter: Optional[dict] = None,
         limit: int = 10,
     ) -> Optional[SearchResult]:
-        query = {
+        result = self.client.search(
+            index=self._get_index_name(len(vectors[0])),
+            body=self._search_query(collection_name, vectors, limit, filter),
+        )
+
+        return self._result_to_search_result(result)
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        result = await self._get_async_client().search(
+            index=self._get_index_name(len(vectors[0])),
+            body=self._search_query(collection_name, vectors, limit, filter),
+        )
+
+        return self._result_to_search_result(result)
+
+    def _search_query(
+        self,
+        collection_name: str,
+        vectors: list[list[float]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> dict:
+        filters = [{"term": {"collection": collection_name}}]
+        for field, value in (filter or {}).items():
+            key = f"metadata.{field}"
+            if isinstance(value, str):
+                # Dynamically mapped strings are analyzed text with a keyword subfield
+                key += ".keyword"
+            filters.append({"term": {key: value}})
+
+        return {
             "size": limit,
             "_source": ["text", "metadata"],
             "query": {
                 "script_score": {
-                    "query": {
-                        "bool": {"filter": [{"term": {"collection": collection_name}}]}
-                    },
+                    "query": {"bool": {"filter": filters}},
                     "script": {
                         "source": "cosineSimilarity(params.vector, 'vector') + 1.0",
                         "params": {
@@ -177,12 +215,6 @@ class ElasticsearchClient(VectorDBBase):
             },
         }
 
-        result = self.client.search(
-            index=self._get_index_name(len(vectors[0])), body=query
-        )
-
-        return self._result_to_search_result(result)
-
     # Status: only tested halfwat
     def query(
         self, collection_name: str, filter: dict, limit: Optional[int] = None
@@ -235,6 +267,20 @@ class ElasticsearchClient(VectorDBBase):
 
         return self._scan_result_to_get_result(results)
 
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        query = {
+            "query": {"bool": {"filter": [{"term": {"collection": collection_name}}]}},
+            "_source": ["text", "metadata"],
+        }
+        results = [
+            hit
+            async for hit in async_scan(
+                self._get_async_client(), index=f"{self.index_prefix}*", query=query
+            )
+        ]
+
+        return self._scan_result_to_get_result(results)
+
     # Status: works
     def insert(self, collection_name: str, items: list[VectorItem]):
         if not self._has_index(dimension=len(items[0]["vector"])):
@@ -261,22 +307,37 @@ class ElasticsearchClient(VectorDBBase):
         if not self._has_index(dimension=len(items[0]["vector"])):
             self._create_index(dimension=len(items[0]["vector"]))
         for batch in self._create_batches(items):
-            actions = [
-                {
-                    "_op_type": "update",
-                    "_index": self._get_index_name(dimension=len(item["vector"])),
-                    "_id": item["id"],
-                    "doc": {
-                        "collection": collection_name,
-                        "vector": item["vector"],
-                        "text": item["text"],
-                        "metadata": process_metadata(item["metadata"]),
-                    },
-                    "doc_as_upsert": True,
-                }
-                for item in batch
-            ]
-            bulk(self.client, actions)
+            bulk(self.client, self._upsert_actions(collection_name, batch))
+
+    async def aupsert(self, collection_name: str, items: list[VectorItem]):
+        client = self._get_async_client()
+        if not await client.indices.exists(
+            index=self._get_index_name(dimension=len(items[0]["vector"]))
+        ):
+            # Index creation is rare, reuse the sync implementation
+            await self._run_in_executor(
+                self.get_or_create_index, dimension=len(items[0]["vector"])
+            )
+
+        for batch in self._create_batches(items):
+            await async_bulk(client, self._upsert_actions(collection_name, batch))
+
+    def _upsert_actions(self, collection_name: str, items: list[VectorItem]):
+        return [
+            {
+                "_op_type": "update",
+                "_index": self._get_index_name(dimension=len(item["vector"])),
+                "_id": item["id"],
+                "doc": {
+                    "collection": collection_name,
+                    "vector": item["vector"],
+                    "text": item["text"],
+                    "metadata": process_metadata(item["metadata"]),
+                },
+                "doc_as_upsert": True,
+            }
+            for item in items
+        ]
 
     # Delete specific documents from a collection by filtering on both collection and document IDs.
     def delete(
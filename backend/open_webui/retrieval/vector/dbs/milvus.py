@@ -1,4 +1,4 @@
-from pymilvus import MilvusClient as Client
+from pymilvus import AsyncMilvusClient, MilvusClient as Client
 from pymilvus import FieldSchema, DataType
 from pymilvus import connections, Collection
 
@@ -37,6 +37,11 @@ class MilvusClient(VectorDBBase):
         else:
             self.client = Client(uri=MILVUS_URI, db_name=MILVUS_DB, token=MILVUS_TOKEN)
 
+    def _create_async_client(self):
+        if MILVUS_TOKEN is None:
+            return AsyncMilvusClient(uri=MILVUS_URI, db_name=MILVUS_DB)
+        return AsyncMilvusClient(uri=MILVUS_URI, db_name=MILVUS_DB, token=MILVUS_TOKEN)
+
     def _result_to_get_result(self, result) -> GetResult:
         ids = []
         documents = []
@@ -178,6 +183,16 @@ class MilvusClient(VectorDBBase):
             collection_name=f"{self.collection_prefix}_{collection_name}"
         )
 
+    def _filter_expression(self, filter: Optional[dict]) -> str:
+        filter_expressions = []
+        for key, value in (filter or {}).items():
+            if isinstance(value, str):
+                filter_expressions.append(f'metadata["{key}"] == "{value}"')
+            else:
+                filter_expressions.append(f'metadata["{key}"] == {value}')
+
+        return " && ".join(filter_expressions)
+
     def search(
         self,
         collection_name: str,
@@ -194,11 +209,29 @@ class MilvusClient(VectorDBBase):
             collection_name=f"{self.collection_prefix}_{collection_name}",
             data=vectors,
             limit=limit,
+            filter=self._filter_expression(filter),
             output_fields=["data", "metadata"],
             # search_params=search_params # Potentially add later if needed
         )
         return self._result_to_search_result(result)
 
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        collection_name = collection_name.replace("-", "_")
+        result = await self._get_async_client().search(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            data=vectors,
+            limit=limit,
+            filter=self._filter_expression(filter),
+            output_fields=["data", "metadata"],
+        )
+        return self._result_to_search_result(result)
+
     def query(self, collection_name: str, filter: dict, limit: int = -1):
         connections.connect(uri=MILVUS_URI, token=MILVUS_TOKEN, db_name=MILVUS_DB)
 
@@ -209,14 +242,7 @@ class MilvusClient(VectorDBBase):
             )
             return None
 
-        filter_expressions = []
-        for key, value in filter.items():
-            if isinstance(value, str):
-                filter_expressions.append(f'metadata["{key}"] == "{value}"')
-            else:
-                filter_expressions.append(f'metadata["{key}"] == {value}')
-
-        filter_string = " && ".join(filter_expressions)
+        filter_string = self._filter_expression(filter)
 
         collection = Collection(f"{self.collection_prefix}_{collection_name}")
         collection.load()
@@ -288,15 +314,7 @@ class MilvusClient(VectorDBBase):
         )
         return self.client.insert(
             collection_name=f"{self.collection_prefix}_{collection_name}",
-            data=[
-                {
-                    "id": item["id"],
-                    "vector": item["vector"],
-                    "data": {"text": item["text"]},
-                    "metadata": process_metadata(item["metadata"]),
-                }
-                for item in items
-            ],
+            data=self._items_to_rows(items),
         )
 
     def upsert(self, collection_name: str, items: list[VectorItem]):
@@ -324,17 +342,36 @@ class MilvusClient(VectorDBBase):
         )
         return self.client.upsert(
             collection_name=f"{self.collection_prefix}_{collection_name}",
-            data=[
-                {
-                    "id": item["id"],
-                    "vector": item["vector"],
-                    "data": {"text": item["text"]},
-                    "metadata": process_metadata(item["metadata"]),
-                }
-                for item in items
-            ],
+            data=self._items_to_rows(items),
         )
 
+    async def aupsert(self, collection_name: str, items: list[VectorItem]):
+        client = self._get_async_client()
+        milvus_collection_name = collection_name.replace("-", "_")
+        if not await client.has_collection(
+            collection_name=f"{self.collection_prefix}_{milvus_collection_name}"
+        ):
+            # Collection creation is rare, reuse the sync implementation
+            return await self._run_in_executor(
+                self.upsert, collection_name=collection_name, items=items
+            )
+
+        return await client.upsert(
+            collection_name=f"{self.collection_prefix}_{milvus_collection_name}",
+            data=self._items_to_rows(items),
+        )
+
+    def _items_to_rows(self, items: list[VectorItem]) -> list[dict]:
+        return [
+            {
+                "id": item["id"],
+                "vector": item["vector"],
+                "data": {"text": item["text"]},
+                "metadata": process_metadata(item["metadata"]),
+            }
+            for item in items
+        ]
+
     def delete(
         self,
         collection_name: str,
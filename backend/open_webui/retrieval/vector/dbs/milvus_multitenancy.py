@@ -156,6 +156,16 @@ class MilvusClient(VectorDBBase):
         ]
         collection.insert(entities)
 
+    def _filter_expression(self, resource_id: str, filter: Optional[Dict]) -> str:
+        expr = [f"{RESOURCE_ID_FIELD} == '{resource_id}'"]
+        if filter:
+            for key, value in filter.items():
+                if isinstance(value, str):
+                    expr.append(f"metadata['{key}'] == '{value}'")
+                else:
+                    expr.append(f"metadata['{key}'] == {value}")
+        return " and ".join(expr)
+
     def search(
         self,
         collection_name: str,
@@ -181,7 +191,7 @@ class MilvusClient(VectorDBBase):
             anns_field="vector",
             param=search_params,
             limit=limit,
-            expr=f"{RESOURCE_ID_FIELD} == '{resource_id}'",
+            expr=self._filter_expression(resource_id, filter),
             output_fields=["id", "text", "metadata"],
         )
 
@@ -256,16 +266,8 @@ class MilvusClient(VectorDBBase):
         collection = Collection(mt_collection)
         collection.load()
 
-        expr = [f"{RESOURCE_ID_FIELD} == '{resource_id}'"]
-        if filter:
-            for key, value in filter.items():
-                if isinstance(value, str):
-                    expr.append(f"metadata['{key}'] == '{value}'")
-                else:
-                    expr.append(f"metadata['{key}'] == {value}")
-
         iterator = collection.query_iterator(
-            expr=" and ".join(expr),
+            expr=self._filter_expression(resource_id, filter),
             output_fields=["id", "text", "metadata"],
             limit=limit if limit else -1,
         )
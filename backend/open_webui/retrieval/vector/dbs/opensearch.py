@@ -1,5 +1,5 @@
-from opensearchpy import OpenSearch
-from opensearchpy.helpers import bulk
+from opensearchpy import AsyncOpenSearch, OpenSearch
+from opensearchpy.helpers import async_bulk, bulk
 from typing import Optional
 
 from open_webui.retrieval.vector.utils import process_metadata
@@ -21,12 +21,16 @@ from open_webui.config import (
 class OpenSearchClient(VectorDBBase):
     def __init__(self):
         self.index_prefix = "open_webui"
-        self.client = OpenSearch(
-            hosts=[OPENSEARCH_URI],
-            use_ssl=OPENSEARCH_SSL,
-            verify_certs=OPENSEARCH_CERT_VERIFY,
-            http_auth=(OPENSEARCH_USERNAME, OPENSEARCH_PASSWORD),
-        )
+        self.client_kwargs = {
+            "hosts": [OPENSEARCH_URI],
+            "use_ssl": OPENSEARCH_SSL,
+            "verify_certs": OPENSEARCH_CERT_VERIFY,
+            "http_auth": (OPENSEARCH_USERNAME, OPENSEARCH_PASSWORD),
+        }
+        self.client = OpenSearch(**self.client_kwargs)
+
+    def _create_async_client(self):
+        return AsyncOpenSearch(**self.client_kwargs)
 
     def _get_index_name(self, collection_name: str) -> str:
         return f"{self.index_prefix}_{collection_name}"
@@ -123,25 +127,9 @@ class OpenSearchClient(VectorDBBase):
             if not self.has_collection(collection_name):
                 return None
 
-            query = {
-                "size": limit,
-                "_source": ["text", "metadata"],
-                "query": {
-                    "script_score": {
-                        "query": {"match_all": {}},
-                        "script": {
-                            "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
-                            "params": {
-                                "field": "vector",
-                                "query_value": vectors[0],
-                            },  # Assuming single query vector
-                        },
-                    }
-                },
-            }
-
             result = self.client.search(
-                index=self._get_index_name(collection_name), body=query
+                index=self._get_index_name(collection_name),
+                body=self._search_query(vectors, limit, filter),
             )
 
             return self._result_to_search_result(result)
@@ -149,6 +137,60 @@ class OpenSearchClient(VectorDBBase):
         except Exception as e:
             return None
 
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        try:
+            client = self._get_async_client()
+            index = self._get_index_name(collection_name)
+            if not await client.indices.exists(index=index):
+                return None
+
+            result = await client.search(
+                index=index, body=self._search_query(vectors, limit, filter)
+            )
+            return self._result_to_search_result(result)
+        except Exception as e:
+            return None
+
+    def _search_query(
+        self,
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> dict:
+        query = {"match_all": {}}
+        if filter:
+            query = {
+                "bool": {
+                    "filter": [
+                        {"term": {"metadata." + str(field) + ".keyword": value}}
+                        for field, value in filter.items()
+                    ]
+                }
+            }
+
+        return {
+            "size": limit,
+            "_source": ["text", "metadata"],
+            "query": {
+                "script_score": {
+                    "query": query,
+                    "script": {
+                        "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
+                        "params": {
+                            "field": "vector",
+                            "query_value": vectors[0],
+                        },  # Assuming single query vector
+                    },
+                }
+            },
+        }
+
     def query(
         self, collection_name: str, filter: dict, limit: Optional[int] = None
     ) -> Optional[GetResult]:
@@ -191,6 +233,14 @@ class OpenSearchClient(VectorDBBase):
         )
         return self._result_to_get_result(result)
 
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        query = {"query": {"match_all": {}}, "_source": ["text", "metadata"]}
+
+        result = await self._get_async_client().search(
+            index=self._get_index_name(collection_name), body=query
+        )
+        return self._result_to_get_result(result)
+
     def insert(self, collection_name: str, items: list[VectorItem]):
         self._create_index_if_not_exists(
             collection_name=collection_name, dimension=len(items[0]["vector"])
@@ -219,23 +269,40 @@ class OpenSearchClient(VectorDBBase):
         )
 
         for batch in self._create_batches(items):
-            actions = [
-                {
-                    "_op_type": "update",
-                    "_index": self._get_index_name(collection_name),
-                    "_id": item["id"],
-                    "doc": {
-                        "vector": item["vector"],
-                        "text": item["text"],
-                        "metadata": process_metadata(item["metadata"]),
-                    },
-                    "doc_as_upsert": True,
-                }
-                for item in batch
-            ]
-            bulk(self.client, actions)
+            bulk(self.client, self._upsert_actions(collection_name, batch))
         self.client.indices.refresh(index=self._get_index_name(collection_name))
 
+    async def aupsert(self, collection_name: str, items: list[VectorItem]):
+        client = self._get_async_client()
+        index = self._get_index_name(collection_name)
+        if not await client.indices.exists(index=index):
+            # Index creation is rare, reuse the sync implementation
+            await self._run_in_executor(
+                self._create_index_if_not_exists,
+                collection_name=collection_name,
+                dimension=len(items[0]["vector"]),
+            )
+
+        for batch in self._create_batches(items):
+            await async_bulk(client, self._upsert_actions(collection_name, batch))
+        await client.indices.refresh(index=index)
+
+    def _upsert_actions(self, collection_name: str, items: list[VectorItem]):
+        return [
+            {
+                "_op_type": "update",
+                "_index": self._get_index_name(collection_name),
+                "_id": item["id"],
+                "doc": {
+                    "vector": item["vector"],
+                    "text": item["text"],
+                    "metadata": process_metadata(item["metadata"]),
+                },
+                "doc_as_upsert": True,
+            }
+            for item in items
+        ]
+
     def delete(
         self,
         collection_name: str,
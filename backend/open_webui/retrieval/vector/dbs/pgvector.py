@@ -1,6 +1,8 @@
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Iterable, Optional, List, Dict, Any, Tuple, Union
+import io
 import logging
 import json
+import struct
 from sqlalchemy import (
     func,
     literal,
@@ -23,8 +25,19 @@ from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
 from sqlalchemy.dialects.postgresql import JSONB, array
 from pgvector.sqlalchemy import Vector, HALFVEC
+from pgvector import HalfVector, Vector as VectorValue
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.exc import NoSuchTableError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+try:
+    # Optional driver for the non-blocking asearch/aget implementations
+    import asyncpg  # noqa: F401
+
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
 
 
 from open_webui.retrieval.vector.utils import process_metadata
@@ -32,6 +45,7 @@ from open_webui.retrieval.vector.main import (
     VectorDBBase,
     VectorItem,
     SearchResult,
+    SearchError,
     GetResult,
 )
 from open_webui.config import (
@@ -49,6 +63,8 @@ from open_webui.config import (
     PGVECTOR_HNSW_EF_CONSTRUCTION,
     PGVECTOR_IVFFLAT_LISTS,
     PGVECTOR_USE_HALFVEC,
+    PGVECTOR_COPY_THRESHOLD,
+    PGVECTOR_DEFER_INDEX_BUILD,
 )
 
 VECTOR_LENGTH = PGVECTOR_INITIALIZE_MAX_VECTOR_LENGTH
@@ -60,6 +76,16 @@ Base = declarative_base()
 
 log = logging.getLogger(__name__)
 
+# Binary COPY framing: signature, flags and header extension length
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+PGCOPY_TRAILER = struct.pack("!h", -1)
+
+
+def pgcopy_field(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return struct.pack("!i", -1)
+    return struct.pack("!i", len(value)) + value
+
 
 def pgcrypto_encrypt(val, key):
     return func.pgp_sym_encrypt(val, literal(key))
@@ -86,13 +112,16 @@ class DocumentChunk(Base):
 
 class PgvectorClient(VectorDBBase):
     def __init__(self) -> None:
+        self.copy_threshold = PGVECTOR_COPY_THRESHOLD
 
         # if no pgvector uri, use the existing database connection
         if not PGVECTOR_DB_URL:
-            from open_webui.internal.db import ScopedSession
+            from open_webui.internal.db import ScopedSession, SQLALCHEMY_DATABASE_URL
 
             self.session = ScopedSession
+            self.async_db_url = self._get_async_db_url(SQLALCHEMY_DATABASE_URL)
         else:
+            self.async_db_url = self._get_async_db_url(PGVECTOR_DB_URL)
             if isinstance(PGVECTOR_POOL_SIZE, int):
                 if PGVECTOR_POOL_SIZE > 0:
                     engine = create_engine(
@@ -171,6 +200,40 @@ class PgvectorClient(VectorDBBase):
             log.exception(f"Error during initialization: {e}")
             raise
 
+    @staticmethod
+    def _get_async_db_url(db_url: str) -> Optional[str]:
+        """Return the asyncpg URL for `db_url`, or None to fall back to the executor."""
+        if not ASYNCPG_AVAILABLE:
+            return None
+
+        url = make_url(db_url)
+        if url.get_backend_name() != "postgresql":
+            return None
+
+        url = url.set(drivername="postgresql+asyncpg")
+        # asyncpg takes `ssl` instead of libpq's `sslmode`
+        if "sslmode" in url.query:
+            url = url.difference_update_query(["sslmode"]).update_query_dict(
+                {"ssl": url.query["sslmode"]}
+            )
+        return url.render_as_string(hide_password=False)
+
+    def _create_async_client(self) -> AsyncEngine:
+        if isinstance(PGVECTOR_POOL_SIZE, int) and PGVECTOR_POOL_SIZE > 0:
+            return create_async_engine(
+                self.async_db_url,
+                pool_size=PGVECTOR_POOL_SIZE,
+                max_overflow=PGVECTOR_POOL_MAX_OVERFLOW,
+                pool_timeout=PGVECTOR_POOL_TIMEOUT,
+                pool_recycle=PGVECTOR_POOL_RECYCLE,
+                pool_pre_ping=True,
+            )
+        elif isinstance(PGVECTOR_POOL_SIZE, int):
+            return create_async_engine(
+                self.async_db_url, pool_pre_ping=True, poolclass=NullPool
+            )
+        return create_async_engine(self.async_db_url, pool_pre_ping=True)
+
     @staticmethod
     def _extract_index_method(index_def: Optional[str]) -> Optional[str]:
         if not index_def:
@@ -290,7 +353,128 @@ class PgvectorClient(VectorDBBase):
             vector = vector[:VECTOR_LENGTH]
         return vector
 
+    def _copy_payload(self, collection_name: str, items: Iterable[VectorItem]):
+        vector_type = HalfVector if USE_HALFVEC else VectorValue
+        encoded_collection_name = collection_name.encode()
+
+        buffer = io.BytesIO()
+        buffer.write(PGCOPY_HEADER)
+        for item in items:
+            vector = self.adjust_vector_length(item["vector"])
+            if PGVECTOR_PGCRYPTO:
+                metadata = json.dumps(item["metadata"])
+            else:
+                metadata = json.dumps(process_metadata(item["metadata"]))
+
+            buffer.write(struct.pack("!h", 5))
+            buffer.write(pgcopy_field(item["id"].encode()))
+            buffer.write(pgcopy_field(vector_type(vector).to_binary()))
+            buffer.write(pgcopy_field(encoded_collection_name))
+            buffer.write(pgcopy_field(item["text"].encode()))
+            # jsonb binary format: version byte followed by the JSON text
+            buffer.write(pgcopy_field(b"\x01" + metadata.encode()))
+        buffer.write(PGCOPY_TRAILER)
+        buffer.seek(0)
+        return buffer
+
+    def bulk_ingest(
+        self, collection_name: str, items: List[VectorItem], upsert: bool = True
+    ) -> None:
+        """
+        Ingest items with a binary COPY into a temporary staging table, followed by
+        a single merge into document_chunk. With upsert=False existing rows are
+        kept, as for `insert`. Used by `insert`/`upsert` for large batches.
+        """
+        # A single INSERT ... ON CONFLICT cannot touch the same row twice, keep the
+        # last occurrence of an id for upserts and the first one for inserts
+        rows = {}
+        for item in items:
+            if upsert or item["id"] not in rows:
+                rows[item["id"]] = item
+
+        if PGVECTOR_PGCRYPTO:
+            text_expr = "pgp_sym_encrypt(text, :key)"
+            metadata_expr = "pgp_sym_encrypt(vmetadata::text, :key)"
+            params = {"key": PGVECTOR_PGCRYPTO_KEY}
+        else:
+            text_expr, metadata_expr, params = "text", "vmetadata", {}
+
+        if upsert:
+            on_conflict = """DO UPDATE SET
+                  vector = EXCLUDED.vector,
+                  collection_name = EXCLUDED.collection_name,
+                  text = EXCLUDED.text,
+                  vmetadata = EXCLUDED.vmetadata"""
+        else:
+            on_conflict = "DO NOTHING"
+
+        try:
+            self.session.execute(text(f"""
+                CREATE TEMP TABLE document_chunk_staging (
+                    id text,
+                    vector {"halfvec" if USE_HALFVEC else "vector"}({VECTOR_LENGTH}),
+                    collection_name text,
+                    text text,
+                    vmetadata jsonb
+                ) ON COMMIT DROP
+            """))
+
+            copy_sql = "COPY document_chunk_staging FROM STDIN WITH (FORMAT binary)"
+            payload = self._copy_payload(collection_name, rows.values())
+            driver_connection = self.session.connection().connection.driver_connection
+            with driver_connection.cursor() as cursor:
+                if hasattr(cursor, "copy_expert"):  # psycopg2
+                    cursor.copy_expert(copy_sql, payload)
+                else:  # psycopg 3
+                    with cursor.copy(copy_sql) as copy:
+                        copy.write(payload.getvalue())
+
+            self.session.execute(
+                text(f"""
+                    INSERT INTO document_chunk
+                    (id, vector, collection_name, text, vmetadata)
+                    SELECT id, vector, collection_name, {text_expr}, {metadata_expr}
+                    FROM document_chunk_staging
+                    ON CONFLICT (id) {on_conflict}
+                """),
+                params,
+            )
+            self.session.commit()
+            log.info(
+                f"Bulk ingested {len(rows)} items into collection '{collection_name}'."
+            )
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error during bulk ingest: {e}")
+            raise
+
+    def start_bulk_load(self) -> None:
+        if not PGVECTOR_DEFER_INDEX_BUILD:
+            return
+        try:
+            self.session.execute(text("DROP INDEX IF EXISTS idx_document_chunk_vector"))
+            self.session.commit()
+            log.info("Dropped vector index for bulk load, it is rebuilt afterwards.")
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error dropping vector index: {e}")
+
+    def finish_bulk_load(self) -> None:
+        if not PGVECTOR_DEFER_INDEX_BUILD:
+            return
+        try:
+            index_method, index_options = self._vector_index_configuration()
+            self._ensure_vector_index(index_method, index_options)
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error rebuilding vector index: {e}")
+            raise
+
     def insert(self, collection_name: str, items: List[VectorItem]) -> None:
+        if 0 < self.copy_threshold <= len(items):
+            return self.bulk_ingest(collection_name, items, upsert=False)
+
         try:
             if PGVECTOR_PGCRYPTO:
                 for item in items:
@@ -344,6 +528,9 @@ class PgvectorClient(VectorDBBase):
             raise
 
     def upsert(self, collection_name: str, items: List[VectorItem]) -> None:
+        if 0 < self.copy_threshold <= len(items):
+            return self.bulk_ingest(collection_name, items, upsert=True)
+
         try:
             if PGVECTOR_PGCRYPTO:
                 for item in items:
@@ -421,142 +608,251 @@ class PgvectorClient(VectorDBBase):
 
             # Adjust query vectors to VECTOR_LENGTH
             vectors = [self.adjust_vector_length(vector) for vector in vectors]
-            num_queries = len(vectors)
-
-            def vector_expr(vector):
-                return cast(array(vector), VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
-
-            # Create the values for query vectors
-            qid_col = column("qid", Integer)
-            q_vector_col = column("q_vector", VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
-            query_vectors = (
-                values(qid_col, q_vector_col)
-                .data(
-                    [(idx, vector_expr(vector)) for idx, vector in enumerate(vectors)]
-                )
-                .alias("query_vectors")
-            )
+            stmt = self._search_statement([collection_name], vectors, filter, limit)
 
-            result_fields = [
-                DocumentChunk.id,
-            ]
-            if PGVECTOR_PGCRYPTO:
-                result_fields.append(
-                    pgcrypto_decrypt(
-                        DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text
-                    ).label("text")
-                )
-                result_fields.append(
-                    pgcrypto_decrypt(
-                        DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
-                    ).label("vmetadata")
-                )
-            else:
-                result_fields.append(DocumentChunk.text)
-                result_fields.append(DocumentChunk.vmetadata)
-            result_fields.append(
-                (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)).label(
-                    "distance"
-                )
-            )
-
-            # Build the lateral subquery for each query vector
-            where_clauses = [DocumentChunk.collection_name == collection_name]
+            results = self.session.execute(stmt).all()
+            self.session.rollback()  # read-only transaction
+            return self._rows_to_search_result(results, len(vectors))
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error during search: {e}")
+            return None
 
-            # Apply metadata filter if provided
-            if filter:
-                for key, value in filter.items():
-                    if isinstance(value, dict) and "$in" in value:
-                        # Handle $in operator: {"field": {"$in": [values]}}
-                        in_values = value["$in"]
-                        if PGVECTOR_PGCRYPTO:
-                            where_clauses.append(
-                                pgcrypto_decrypt(
-                                    DocumentChunk.vmetadata,
-                                    PGVECTOR_PGCRYPTO_KEY,
-                                    JSONB,
-                                )[key].astext.in_([str(v) for v in in_values])
-                            )
-                        else:
-                            where_clauses.append(
-                                DocumentChunk.vmetadata[key].astext.in_(
-                                    [str(v) for v in in_values]
-                                )
-                            )
-                    else:
-                        # Handle simple equality: {"field": "value"}
-                        if PGVECTOR_PGCRYPTO:
-                            where_clauses.append(
-                                pgcrypto_decrypt(
-                                    DocumentChunk.vmetadata,
-                                    PGVECTOR_PGCRYPTO_KEY,
-                                    JSONB,
-                                )[key].astext
-                                == str(value)
-                            )
-                        else:
-                            where_clauses.append(
-                                DocumentChunk.vmetadata[key].astext == str(value)
-                            )
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        if self.async_db_url is None:
+            return await super().asearch(collection_name, vectors, filter, limit)
 
-            subq = (
-                select(*result_fields)
-                .where(*where_clauses)
-                .order_by(
-                    (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector))
-                )
-            )
-            if limit is not None:
-                subq = subq.limit(limit)
-            subq = subq.lateral("result")
-
-            # Build the main query by joining query_vectors and the lateral subquery
-            stmt = (
-                select(
-                    query_vectors.c.qid,
-                    subq.c.id,
-                    subq.c.text,
-                    subq.c.vmetadata,
-                    subq.c.distance,
-                )
-                .select_from(query_vectors)
-                .join(subq, true())
-                .order_by(query_vectors.c.qid, subq.c.distance)
-            )
+        try:
+            if not vectors:
+                return None
 
-            result_proxy = self.session.execute(stmt)
-            results = result_proxy.all()
+            vectors = [self.adjust_vector_length(vector) for vector in vectors]
+            stmt = self._search_statement([collection_name], vectors, filter, limit)
 
-            ids = [[] for _ in range(num_queries)]
-            distances = [[] for _ in range(num_queries)]
-            documents = [[] for _ in range(num_queries)]
-            metadatas = [[] for _ in range(num_queries)]
+            async with self._get_async_client().connect() as conn:
+                results = (await conn.execute(stmt)).all()
+            return self._rows_to_search_result(results, len(vectors))
+        except Exception as e:
+            log.exception(f"Error during search: {e}")
+            return None
 
-            if not results:
-                return SearchResult(
-                    ids=ids,
-                    distances=distances,
-                    documents=documents,
-                    metadatas=metadatas,
-                )
+    def search_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> Dict[str, Union[SearchResult, SearchError, None]]:
+        # All collections share the document_chunk table, so every (collection, vector)
+        # pair is answered by one statement instead of one round trip each
+        try:
+            if not collection_names or not vectors:
+                return {}
 
-            for row in results:
-                qid = int(row.qid)
-                ids[qid].append(row.id)
-                # normalize and re-orders pgvec distance from [2, 0] to [0, 1] score range
-                # https://github.com/pgvector/pgvector?tab=readme-ov-file#querying
-                distances[qid].append((2.0 - row.distance) / 2.0)
-                documents[qid].append(row.text)
-                metadatas[qid].append(row.vmetadata)
+            vectors = [self.adjust_vector_length(vector) for vector in vectors]
+            stmt = self._search_statement(collection_names, vectors, filter, limit)
 
+            results = self.session.execute(stmt).all()
             self.session.rollback()  # read-only transaction
-            return SearchResult(
-                ids=ids, distances=distances, documents=documents, metadatas=metadatas
-            )
+            return self._rows_to_search_results(results, collection_names, len(vectors))
         except Exception as e:
             self.session.rollback()
             log.exception(f"Error during search: {e}")
-            return None
+            return {
+                collection_name: SearchError(error=str(e))
+                for collection_name in collection_names
+            }
+
+    async def asearch_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> Dict[str, Union[SearchResult, SearchError, None]]:
+        if self.async_db_url is None:
+            return await self._run_in_executor(
+                self.search_many,
+                collection_names=collection_names,
+                vectors=vectors,
+                filter=filter,
+                limit=limit,
+            )
+
+        try:
+            if not collection_names or not vectors:
+                return {}
+
+            vectors = [self.adjust_vector_length(vector) for vector in vectors]
+            stmt = self._search_statement(collection_names, vectors, filter, limit)
+
+            async with self._get_async_client().connect() as conn:
+                results = (await conn.execute(stmt)).all()
+            return self._rows_to_search_results(results, collection_names, len(vectors))
+        except Exception as e:
+            log.exception(f"Error during search: {e}")
+            return {
+                collection_name: SearchError(error=str(e))
+                for collection_name in collection_names
+            }
+
+    def _search_statement(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]],
+        limit: Optional[int],
+    ):
+        def vector_expr(vector):
+            return cast(array(vector), VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
+
+        # Create the values for query vectors
+        qid_col = column("qid", Integer)
+        q_vector_col = column("q_vector", VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
+        query_vectors = (
+            values(qid_col, q_vector_col)
+            .data([(idx, vector_expr(vector)) for idx, vector in enumerate(vectors)])
+            .alias("query_vectors")
+        )
+
+        # One row per searched collection, so the limit applies per collection
+        q_collection_col = column("q_collection", Text)
+        query_collections = (
+            values(q_collection_col)
+            .data([(collection_name,) for collection_name in collection_names])
+            .alias("query_collections")
+        )
+
+        result_fields = [
+            DocumentChunk.id,
+        ]
+        if PGVECTOR_PGCRYPTO:
+            result_fields.append(
+                pgcrypto_decrypt(DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text).label(
+                    "text"
+                )
+            )
+            result_fields.append(
+                pgcrypto_decrypt(
+                    DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
+                ).label("vmetadata")
+            )
+        else:
+            result_fields.append(DocumentChunk.text)
+            result_fields.append(DocumentChunk.vmetadata)
+        result_fields.append(
+            (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)).label(
+                "distance"
+            )
+        )
+
+        # Build the lateral subquery for each (query vector, collection) pair
+        where_clauses = [
+            DocumentChunk.collection_name == query_collections.c.q_collection
+        ]
+
+        # Apply metadata filter if provided
+        if filter:
+            for key, value in filter.items():
+                if isinstance(value, dict) and "$in" in value:
+                    # Handle $in operator: {"field": {"$in": [values]}}
+                    in_values = value["$in"]
+                    if PGVECTOR_PGCRYPTO:
+                        where_clauses.append(
+                            pgcrypto_decrypt(
+                                DocumentChunk.vmetadata,
+                                PGVECTOR_PGCRYPTO_KEY,
+                                JSONB,
+                            )[key].astext.in_([str(v) for v in in_values])
+                        )
+                    else:
+                        where_clauses.append(
+                            DocumentChunk.vmetadata[key].astext.in_(
+                                [str(v) for v in in_values]
+                            )
+                        )
+                else:
+                    # Handle simple equality: {"field": "value"}
+                    if PGVECTOR_PGCRYPTO:
+                        where_clauses.append(
+                            pgcrypto_decrypt(
+                                DocumentChunk.vmetadata,
+                                PGVECTOR_PGCRYPTO_KEY,
+                                JSONB,
+                            )[key].astext
+                            == str(value)
+                        )
+                    else:
+                        where_clauses.append(
+                            DocumentChunk.vmetadata[key].astext == str(value)
+                        )
+
+        subq = (
+            select(*result_fields)
+            .where(*where_clauses)
+            .order_by((DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)))
+        )
+        if limit is not None:
+            subq = subq.limit(limit)
+        subq = subq.lateral("result")
+
+        # Build the main query by joining the query values and the lateral subquery
+        stmt = (
+            select(
+                query_vectors.c.qid,
+                query_collections.c.q_collection,
+                subq.c.id,
+                subq.c.text,
+                subq.c.vmetadata,
+                subq.c.distance,
+            )
+            .select_from(query_vectors)
+            .join(query_collections, true())
+            .join(subq, true())
+            .order_by(
+                query_vectors.c.qid, query_collections.c.q_collection, subq.c.distance
+            )
+        )
+        return stmt
+
+    def _rows_to_search_results(
+        self, results, collection_names: List[str], num_queries: int
+    ) -> Dict[str, SearchResult]:
+        rows_by_collection = {
+            collection_name: [] for collection_name in collection_names
+        }
+        for row in results:
+            rows_by_collection[row.q_collection].append(row)
+
+        return {
+            collection_name: self._rows_to_search_result(rows, num_queries)
+            for collection_name, rows in rows_by_collection.items()
+        }
+
+    def _rows_to_search_result(self, results, num_queries: int) -> SearchResult:
+        ids = [[] for _ in range(num_queries)]
+        distances = [[] for _ in range(num_queries)]
+        documents = [[] for _ in range(num_queries)]
+        metadatas = [[] for _ in range(num_queries)]
+
+        for row in results:
+            qid = int(row.qid)
+            ids[qid].append(row.id)
+            # normalize and re-orders pgvec distance from [2, 0] to [0, 1] score range
+            # https://github.com/pgvector/pgvector?tab=readme-ov-file#querying
+            distances[qid].append((2.0 - row.distance) / 2.0)
+            documents[qid].append(row.text)
+            metadatas[qid].append(row.vmetadata)
+
+        return SearchResult(
+            ids=ids, distances=distances, documents=documents, metadatas=metadatas
+        )
 
     def query(
         self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
@@ -662,6 +958,73 @@ class PgvectorClient(VectorDBBase):
             log.exception(f"Error during get: {e}")
             return None
 
+    async def aget(
+        self, collection_name: str, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        if self.async_db_url is None:
+            return await self._run_in_executor(self.get, collection_name, limit)
+
+        try:
+            if PGVECTOR_PGCRYPTO:
+                text_field = pgcrypto_decrypt(
+                    DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text
+                ).label("text")
+                vmetadata_field = pgcrypto_decrypt(
+                    DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
+                ).label("vmetadata")
+            else:
+                text_field = DocumentChunk.text
+                vmetadata_field = DocumentChunk.vmetadata
+
+            stmt = select(DocumentChunk.id, text_field, vmetadata_field).where(
+                DocumentChunk.collection_name == collection_name
+            )
+            if limit is not None:
+                stmt = stmt.limit(limit)
+
+            async with self._get_async_client().connect() as conn:
+                results = (await conn.execute(stmt)).all()
+
+            if not results and not PGVECTOR_PGCRYPTO:
+                return None
+
+            return GetResult(
+                ids=[[row.id for row in results]],
+                documents=[[row.text for row in results]],
+                metadatas=[[row.vmetadata for row in results]],
+            )
+        except Exception as e:
+            log.exception(f"Error during get: {e}")
+            return None
+
+    def get_vectors(
+        self, collection_name: str, ids: List[str]
+    ) -> Optional[Dict[str, List[float]]]:
+        try:
+            stmt = select(DocumentChunk.id, DocumentChunk.vector).where(
+                DocumentChunk.collection_name == collection_name,
+                DocumentChunk.id.in_(ids),
+            )
+            results = self.session.execute(stmt).all()
+            self.session.rollback()  # read-only transaction
+            # halfvec columns come back as HalfVector, vector columns as arrays
+            return {
+                row.id: [
+                    float(x)
+                    for x in (
+                        row.vector.to_list()
+                        if hasattr(row.vector, "to_list")
+                        else row.vector
+                    )
+                ]
+                for row in results
+                if row.vector is not None
+            }
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error getting vectors from {collection_name}: {e}")
+            return None
+
     def delete(
         self,
         collection_name: str,
@@ -2,7 +2,7 @@ from typing import Optional
 import logging
 from urllib.parse import urlparse
 
-from qdrant_client import QdrantClient as Qclient
+from qdrant_client import AsyncQdrantClient, QdrantClient as Qclient
 from qdrant_client.http.models import PointStruct
 from qdrant_client.models import models
 
@@ -49,20 +49,24 @@ class QdrantClient(VectorDBBase):
         http_port = parsed.port or 6333  # default REST port
 
         if self.PREFER_GRPC:
-            self.client = Qclient(
-                host=host,
-                port=http_port,
-                grpc_port=self.GRPC_PORT,
-                prefer_grpc=self.PREFER_GRPC,
-                api_key=self.QDRANT_API_KEY,
-                timeout=self.QDRANT_TIMEOUT,
-            )
+            self.client_kwargs = {
+                "host": host,
+                "port": http_port,
+                "grpc_port": self.GRPC_PORT,
+                "prefer_grpc": self.PREFER_GRPC,
+                "api_key": self.QDRANT_API_KEY,
+                "timeout": self.QDRANT_TIMEOUT,
+            }
         else:
-            self.client = Qclient(
-                url=self.QDRANT_URI,
-                api_key=self.QDRANT_API_KEY,
-                timeout=QDRANT_TIMEOUT,
-            )
+            self.client_kwargs = {
+                "url": self.QDRANT_URI,
+                "api_key": self.QDRANT_API_KEY,
+                "timeout": QDRANT_TIMEOUT,
+            }
+        self.client = Qclient(**self.client_kwargs)
+
+    def _create_async_client(self):
+        return AsyncQdrantClient(**self.client_kwargs)
 
     def _result_to_get_result(self, points) -> GetResult:
         ids = []
@@ -83,6 +87,16 @@ class QdrantClient(VectorDBBase):
             }
         )
 
+    def _points_to_search_result(self, points) -> SearchResult:
+        get_result = self._result_to_get_result(points)
+        return SearchResult(
+            ids=get_result.ids,
+            documents=get_result.documents,
+            metadatas=get_result.metadatas,
+            # qdrant distance is [-1, 1], normalize to [0, 1]
+            distances=[[(point.score + 1.0) / 2.0 for point in points]],
+        )
+
     def _create_collection(self, collection_name: str, dimension: int):
         collection_name_with_prefix = f"{self.collection_prefix}_{collection_name}"
         self.client.create_collection(
@@ -144,6 +158,18 @@ class QdrantClient(VectorDBBase):
             collection_name=f"{self.collection_prefix}_{collection_name}"
         )
 
+    def _search_filter(self, filter: Optional[dict]) -> Optional[models.Filter]:
+        if not filter:
+            return None
+        return models.Filter(
+            must=[
+                models.FieldCondition(
+                    key=f"metadata.{key}", match=models.MatchValue(value=value)
+                )
+                for key, value in filter.items()
+            ]
+        )
+
     def search(
         self,
         collection_name: str,
@@ -159,15 +185,27 @@ class QdrantClient(VectorDBBase):
             collection_name=f"{self.collection_prefix}_{collection_name}",
             query=vectors[0],
             limit=limit,
+            query_filter=self._search_filter(filter),
         )
-        get_result = self._result_to_get_result(query_response.points)
-        return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
-            # qdrant distance is [-1, 1], normalize to [0, 1]
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+        return self._points_to_search_result(query_response.points)
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        if limit is None:
+            limit = NO_LIMIT
+
+        query_response = await self._get_async_client().query_points(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            query=vectors[0],
+            limit=limit,
+            query_filter=self._search_filter(filter),
         )
+        return self._points_to_search_result(query_response.points)
 
     def query(self, collection_name: str, filter: dict, limit: Optional[int] = None):
         # Construct the filter string for querying
@@ -203,6 +241,28 @@ class QdrantClient(VectorDBBase):
         )
         return self._result_to_get_result(points[0])
 
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        points = await self._get_async_client().scroll(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            limit=NO_LIMIT,
+        )
+        return self._result_to_get_result(points[0])
+
+    def get_vectors(
+        self, collection_name: str, ids: list[str]
+    ) -> Optional[dict[str, list[float]]]:
+        try:
+            points = self.client.retrieve(
+                collection_name=f"{self.collection_prefix}_{collection_name}",
+                ids=ids,
+                with_payload=False,
+                with_vectors=True,
+            )
+            return {str(point.id): point.vector for point in points}
+        except Exception as e:
+            log.exception(f"Error getting vectors from {collection_name}: {e}")
+            return None
+
     def insert(self, collection_name: str, items: list[VectorItem]):
         # Insert the items into the collection, if the collection does not exist, it will be created.
         self._create_collection_if_not_exists(collection_name, len(items[0]["vector"]))
@@ -215,6 +275,22 @@ class QdrantClient(VectorDBBase):
         points = self._create_points(items)
         return self.client.upsert(f"{self.collection_prefix}_{collection_name}", points)
 
+    async def aupsert(self, collection_name: str, items: list[VectorItem]):
+        client = self._get_async_client()
+        if not await client.collection_exists(
+            f"{self.collection_prefix}_{collection_name}"
+        ):
+            # Collection creation is rare, reuse the sync implementation
+            await self._run_in_executor(
+                self._create_collection_if_not_exists,
+                collection_name,
+                len(items[0]["vector"]),
+            )
+        points = self._create_points(items)
+        return await client.upsert(
+            f"{self.collection_prefix}_{collection_name}", points
+        )
+
     def delete(
         self,
         collection_name: str,
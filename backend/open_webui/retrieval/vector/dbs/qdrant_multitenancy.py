@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Union
 from urllib.parse import urlparse
 
 import grpc
@@ -15,9 +15,11 @@ from open_webui.config import (
 )
 from open_webui.retrieval.vector.main import (
     GetResult,
+    SearchError,
     SearchResult,
     VectorDBBase,
     VectorItem,
+    stack_search_results,
 )
 from qdrant_client import QdrantClient as Qclient
 from qdrant_client.http.exceptions import UnexpectedResponse
@@ -97,6 +99,15 @@ class QdrantClient(VectorDBBase):
             metadatas.append(payload["metadata"])
         return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
 
+    def _points_to_search_result(self, points) -> SearchResult:
+        get_result = self._result_to_get_result(points)
+        return SearchResult(
+            ids=get_result.ids,
+            documents=get_result.documents,
+            metadatas=get_result.metadatas,
+            distances=[[(point.score + 1.0) / 2.0 for point in points]],
+        )
+
     def _get_collection_and_tenant_id(self, collection_name: str) -> Tuple[str, str]:
         """
         Maps the traditional collection name to multi-tenant collection and tenant ID.
@@ -270,19 +281,106 @@ class QdrantClient(VectorDBBase):
             log.debug(f"Collection {mt_collection} doesn't exist, search returns None")
             return None
 
-        tenant_filter = _tenant_filter(tenant_id)
+        if limit is None:
+            limit = NO_LIMIT
+        field_conditions = [_metadata_filter(k, v) for k, v in (filter or {}).items()]
         query_response = self.client.query_points(
             collection_name=mt_collection,
             query=vectors[0],
             limit=limit,
-            query_filter=models.Filter(must=[tenant_filter]),
+            query_filter=models.Filter(
+                must=[_tenant_filter(tenant_id), *field_conditions]
+            ),
         )
-        get_result = self._result_to_get_result(query_response.points)
-        return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+        return self._points_to_search_result(query_response.points)
+
+    def search_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float | int]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+    ) -> Dict[str, Union[SearchResult, SearchError, None]]:
+        """
+        Search several collections with one batched request per multi-tenant collection.
+
+        Collections are tenants of a few shared collections, so all (tenant, vector)
+        pairs of a shared collection are sent as a single query batch, each filtered
+        on its tenant so that `limit` still applies per collection.
+        """
+        if not self.client or not vectors:
+            return {}
+        if limit is None:
+            limit = NO_LIMIT
+
+        tenants_by_collection: Dict[str, List[Tuple[str, str]]] = {}
+        for collection_name in collection_names:
+            mt_collection, tenant_id = self._get_collection_and_tenant_id(
+                collection_name
+            )
+            tenants_by_collection.setdefault(mt_collection, []).append(
+                (collection_name, tenant_id)
+            )
+
+        results = {collection_name: None for collection_name in collection_names}
+        for mt_collection, tenants in tenants_by_collection.items():
+            if not self.client.collection_exists(collection_name=mt_collection):
+                log.debug(
+                    f"Collection {mt_collection} doesn't exist, search returns None"
+                )
+                continue
+
+            try:
+                responses = self.client.query_batch_points(
+                    collection_name=mt_collection,
+                    requests=[
+                        models.QueryRequest(
+                            query=vector,
+                            limit=limit,
+                            filter=models.Filter(
+                                must=[
+                                    _tenant_filter(tenant_id),
+                                    *(
+                                        _metadata_filter(k, v)
+                                        for k, v in (filter or {}).items()
+                                    ),
+                                ]
+                            ),
+                            with_payload=True,
+                        )
+                        for _, tenant_id in tenants
+                        for vector in vectors
+                    ],
+                )
+            except Exception as e:
+                log.exception(f"Error searching collection {mt_collection}: {e}")
+                for collection_name, _ in tenants:
+                    results[collection_name] = SearchError(error=str(e))
+                continue
+            for idx, (collection_name, _) in enumerate(tenants):
+                results[collection_name] = stack_search_results(
+                    [
+                        self._points_to_search_result(response.points)
+                        for response in responses[
+                            idx * len(vectors) : (idx + 1) * len(vectors)
+                        ]
+                    ]
+                )
+        return results
+
+    async def asearch_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float | int]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+    ) -> Dict[str, Union[SearchResult, SearchError, None]]:
+        return await self._run_in_executor(
+            self.search_many,
+            collection_names=collection_names,
+            vectors=vectors,
+            filter=filter,
+            limit=limit,
         )
 
     def query(
@@ -1,5 +1,7 @@
 from open_webui.retrieval.vector.main import VectorDBBase
 from open_webui.retrieval.vector.type import VectorType
+from open_webui.env import ENABLE_DEFERRED_STARTUP
+from open_webui.utils.lazy import LazyObject
 from open_webui.config import (
     VECTOR_DB,
     ENABLE_QDRANT_MULTITENANCY_MODE,
@@ -79,4 +81,10 @@ class Vector:
                 raise ValueError(f"Unsupported vector type: {vector_type}")
 
 
-VECTOR_DB_CLIENT = Vector.get_vector(VECTOR_DB)
+if ENABLE_DEFERRED_STARTUP:
+    # Import and connect to the vector DB on first use
+    VECTOR_DB_CLIENT = LazyObject(
+        lambda: Vector.get_vector(VECTOR_DB), name=f"vector DB client ({VECTOR_DB})"
+    )
+else:
+    VECTOR_DB_CLIENT = Vector.get_vector(VECTOR_DB)
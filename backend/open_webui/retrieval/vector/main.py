@@ -1,6 +1,22 @@
+import asyncio
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from open_webui.config import VECTOR_DB_EXECUTOR_MAX_WORKERS
+
+log = logging.getLogger(__name__)
+
+# Bounded pool shared by all backends without a native async client, so that
+# concurrent retrievals neither block the event loop nor create a pool per request
+VECTOR_DB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=VECTOR_DB_EXECUTOR_MAX_WORKERS, thread_name_prefix="vector-db"
+)
 
 
 class VectorItem(BaseModel):
@@ -20,6 +36,34 @@ class SearchResult(GetResult):
     distances: Optional[List[List[float | int]]]
 
 
+class SearchError(BaseModel):
+    """Result of a collection whose search failed in `search_many`, unlike None
+    (no such collection or nothing found)."""
+
+    error: str
+
+
+def stack_search_results(
+    results: List[Optional[SearchResult]],
+) -> Optional[SearchResult]:
+    """Combine single-query search results into one result with a row per query."""
+    if all(result is None for result in results):
+        return None
+
+    def rows(field):
+        return [
+            (getattr(result, field) or [[]])[0] if result is not None else []
+            for result in results
+        ]
+
+    return SearchResult(
+        ids=rows("ids"),
+        documents=rows("documents"),
+        metadatas=rows("metadatas"),
+        distances=rows("distances"),
+    )
+
+
 class VectorDBBase(ABC):
     """
     Abstract base class for all vector database backends.
@@ -29,8 +73,78 @@ class VectorDBBase(ABC):
 
     Any custom vector database integration must inherit from this class and
     implement all abstract methods.
+
+    The async methods (`asearch`, `aget`, `aupsert`) run the sync methods on a
+    shared bounded executor by default; backends with an async client override
+    them with native implementations.
     """
 
+    _async_client = None
+    _async_client_loop = None
+
+    def _create_async_client(self) -> Any:
+        """Create the backend's native async client.
+
+        Only backends that override the async methods with native ones call
+        `_get_async_client`, and they must override this.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} has no native async client, its async methods "
+            "run the sync ones on the shared executor"
+        )
+
+    def _get_async_client(self) -> Any:
+        """Return the async client, created lazily for the running event loop.
+
+        Async clients are bound to the loop they were first used on, so a new one
+        is created if the methods are awaited from a different loop, and the
+        previous one is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            if self._async_client is not None:
+                self._close_async_client_later(
+                    self._async_client, self._async_client_loop
+                )
+            self._async_client = self._create_async_client()
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _close_async_client_later(self, client: Any, client_loop) -> None:
+        """Close `client` on the loop it was bound to, or here if that one is gone."""
+        if client_loop is not None and client_loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(
+                self._close_async_client(client), client_loop
+            )
+        else:
+            future = asyncio.ensure_future(self._close_async_client(client))
+        future.add_done_callback(self._log_close_error)
+
+    @staticmethod
+    def _log_close_error(future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            log.warning(f"Failed to close vector DB async client: {future.exception()}")
+
+    async def _close_async_client(self, client: Any) -> None:
+        """Release the connections of an async client (`close`, or `dispose` for engines)."""
+        close = getattr(client, "close", None) or getattr(client, "dispose", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+    async def aclose(self) -> None:
+        """Close the async client of the running loop, e.g. on shutdown."""
+        client, self._async_client = self._async_client, None
+        self._async_client_loop = None
+        if client is not None:
+            await self._close_async_client(client)
+
+    async def _run_in_executor(self, func: Callable, *args, **kwargs) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            VECTOR_DB_EXECUTOR, partial(func, *args, **kwargs)
+        )
+
     @abstractmethod
     def has_collection(self, collection_name: str) -> bool:
         """Check if the collection exists in the vector DB."""
@@ -51,6 +165,20 @@ class VectorDBBase(ABC):
         """Insert or update vector items in a collection."""
         pass
 
+    async def aupsert(self, collection_name: str, items: List[VectorItem]) -> None:
+        """Async variant of `upsert`."""
+        return await self._run_in_executor(
+            self.upsert, collection_name=collection_name, items=items
+        )
+
+    def start_bulk_load(self) -> None:
+        """Called before a large ingest (e.g. reindexing); backends may defer index maintenance."""
+        pass
+
+    def finish_bulk_load(self) -> None:
+        """Called after a large ingest to restore anything deferred by `start_bulk_load`."""
+        pass
+
     @abstractmethod
     def search(
         self,
@@ -62,6 +190,105 @@ class VectorDBBase(ABC):
         """Search for similar vectors in a collection."""
         pass
 
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        """Async variant of `search`."""
+        return await self._run_in_executor(
+            self.search,
+            collection_name=collection_name,
+            vectors=vectors,
+            filter=filter,
+            limit=limit,
+        )
+
+    def search_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+    ) -> Dict[str, Union[SearchResult, SearchError, None]]:
+        """Search several collections with several query vectors.
+
+        Returns a result per collection, holding the top `limit` items for each
+        query vector (one row per vector), or a SearchError if its searches
+        failed. The default issues one `search` per collection and vector;
+        backends that can answer all of them in a single round trip override it.
+        """
+        results = {}
+        for collection_name in collection_names:
+            per_vector = []
+            for vector in vectors:
+                try:
+                    per_vector.append(
+                        self.search(
+                            collection_name=collection_name,
+                            vectors=[vector],
+                            filter=filter,
+                            limit=limit,
+                        )
+                    )
+                except Exception as e:
+                    log.exception(f"Error searching collection {collection_name}: {e}")
+                    per_vector.append(SearchError(error=str(e)))
+            results[collection_name] = self._stack_search_results(per_vector)
+        return results
+
+    @staticmethod
+    def _stack_search_results(
+        per_vector: List[Union[SearchResult, SearchError, None]],
+    ) -> Union[SearchResult, SearchError, None]:
+        errors = [result for result in per_vector if isinstance(result, SearchError)]
+        if errors and len(errors) == len(per_vector):
+            return errors[0]
+        # Rows of the vectors whose search failed are left empty
+        return stack_search_results(
+            [
+                None if isinstance(result, SearchError) else result
+                for result in per_vector
+            ]
+        )
+
+    async def asearch_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+    ) -> Dict[str, Union[SearchResult, SearchError, None]]:
+        """Async variant of `search_many`, running the searches concurrently."""
+
+        async def search_one(collection_name, vector):
+            try:
+                return await self.asearch(
+                    collection_name=collection_name,
+                    vectors=[vector],
+                    filter=filter,
+                    limit=limit,
+                )
+            except Exception as e:
+                log.exception(f"Error searching collection {collection_name}: {e}")
+                return SearchError(error=str(e))
+
+        results = await asyncio.gather(
+            *[
+                search_one(collection_name, vector)
+                for collection_name in collection_names
+                for vector in vectors
+            ]
+        )
+        return {
+            collection_name: self._stack_search_results(
+                results[idx * len(vectors) : (idx + 1) * len(vectors)]
+            )
+            for idx, collection_name in enumerate(collection_names)
+        }
+
     @abstractmethod
     def query(
         self, collection_name: str, filter: Dict, limit: Optional[int] = None
@@ -74,6 +301,20 @@ class VectorDBBase(ABC):
         """Retrieve all vectors from a collection."""
         pass
 
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        """Async variant of `get`."""
+        return await self._run_in_executor(self.get, collection_name=collection_name)
+
+    def get_vectors(
+        self, collection_name: str, ids: List[str]
+    ) -> Optional[Dict[str, List[float]]]:
+        """Retrieve the stored vectors for the given ids, keyed by id.
+
+        Optional capability: backends that cannot return stored vectors return
+        None and callers fall back to re-embedding the documents.
+        """
+        return None
+
     @abstractmethod
     def delete(
         self,
@@ -3,7 +3,12 @@ from typing import Optional
 
 import requests
 import json
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -61,3 +66,32 @@ def search_bocha(
         )
         for result in results[:count]
     ]
+
+
+async def asearch_bocha(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Async version of search_bocha."""
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "bocha",
+        "POST",
+        "https://api.bochaai.com/v1/web-search?utm_source=ollama",
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        data=json.dumps(
+            {"query": query, "summary": True, "freshness": "noLimit", "count": count}
+        ),
+        timeout=5,
+    )
+
+    results = _parse_response(json_response)
+    results = await aget_filtered_results(results, filter_list)
+
+    return [
+        SearchResult(
+            link=result["url"], title=result.get("name"), snippet=result.get("summary")
+        )
+        for result in results[:count]
+    ]
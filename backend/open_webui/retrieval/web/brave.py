@@ -3,7 +3,12 @@ import time
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -49,3 +54,32 @@ def search_brave(
         )
         for result in results[:count]
     ]
+
+
+async def asearch_brave(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Async version of search_brave, 429s are retried by the shared client."""
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "brave",
+        "GET",
+        "https://api.search.brave.com/res/v1/web/search",
+        headers={
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+            "X-Subscription-Token": api_key,
+        },
+        params={"q": query, "count": count},
+    )
+
+    results = json_response.get("web", {}).get("results", [])
+    results = await aget_filtered_results(results, filter_list)
+
+    return [
+        SearchResult(
+            link=result["url"],
+            title=result.get("title"),
+            snippet=result.get("description"),
+        )
+        for result in results[:count]
+    ]
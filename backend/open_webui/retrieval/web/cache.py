@@ -0,0 +1,244 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from open_webui.config import (
+    CACHE_DIR,
+    WEB_CACHE_BACKEND,
+    WEB_CACHE_MAX_ENTRIES,
+    WEB_FETCH_CACHE_TTL,
+    WEB_SEARCH_CACHE_TTL,
+)
+from open_webui.env import REDIS_KEY_PREFIX
+from open_webui.utils.redis import get_redis_client
+
+log = logging.getLogger(__name__)
+
+
+def get_cache_control_ttl(cache_control: Optional[str], ttl: int) -> int:
+    """
+    Returns how long a response may be cached given its Cache-Control header,
+    capped at `ttl`. We are a cache shared by all users, so private responses
+    are not stored.
+    """
+    if not cache_control:
+        return ttl
+
+    directives = {}
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name] = value.strip('" ')
+
+    if directives.keys() & {"no-store", "no-cache", "private"}:
+        return 0
+
+    max_age = directives.get("s-maxage") or directives.get("max-age")
+    if max_age and max_age.isdigit():
+        return min(ttl, int(max_age))
+    return ttl
+
+
+class WebCache:
+    """
+    TTL and size bounded cache for web search results and fetched pages.
+
+    Entries are always kept in worker memory (LRU, `max_entries`) and, with the
+    "redis" or "disk" backend, also written to Redis or CACHE_DIR/web so they are
+    shared by all workers and survive restarts. Values must be JSON serializable.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int,
+        max_entries: int = WEB_CACHE_MAX_ENTRIES,
+        backend: str = WEB_CACHE_BACKEND,
+        cache_dir: Path = CACHE_DIR / "web",
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.backend = backend
+
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._redis = None
+        if backend == "redis":
+            self._redis = get_redis_client()
+            if self._redis is None:
+                log.warning(
+                    "WEB_CACHE_BACKEND is redis but Redis is not configured, "
+                    "caching web results in memory only"
+                )
+
+        self._dir = None
+        if backend == "disk":
+            self._dir = cache_dir / namespace
+            self._dir.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    @staticmethod
+    def get_key(*parts: Any) -> str:
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _redis_key(self, key: str) -> str:
+        return f"{REDIS_KEY_PREFIX}:web_cache:{self.namespace}:{key}"
+
+    def _remember(self, key: str, expires_at: float, value: Any):
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[tuple[float, Any]]:
+        try:
+            if self._redis is not None:
+                data = self._redis.get(self._redis_key(key))
+            elif self._dir is not None:
+                path = self._dir / f"{key}.json"
+                data = path.read_text() if path.exists() else None
+            else:
+                return None
+
+            if data:
+                entry = json.loads(data)
+                return entry["expires_at"], entry["value"]
+        except Exception as e:
+            log.debug(f"Error reading {self.namespace} cache entry: {e}")
+        return None
+
+    def _store(self, key: str, expires_at: float, value: Any, ttl: int):
+        try:
+            data = json.dumps({"expires_at": expires_at, "value": value})
+            if self._redis is not None:
+                self._redis.set(self._redis_key(key), data, ex=ttl)
+            elif self._dir is not None:
+                (self._dir / f"{key}.json").write_text(data)
+                self._prune_dir()
+        except Exception as e:
+            log.debug(f"Error writing {self.namespace} cache entry: {e}")
+
+    def _prune_dir(self):
+        paths = list(self._dir.glob("*.json"))
+        if len(paths) <= self.max_entries:
+            return
+
+        # Drop the oldest files, the disk cache holds at most max_entries entries
+        paths.sort(key=lambda path: path.stat().st_mtime)
+        for path in paths[: len(paths) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+    @property
+    def _shared(self) -> bool:
+        return self._redis is not None or self._dir is not None
+
+    def _get_remembered(self, key: str, now: float) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+        return None
+
+    def _get_loaded(
+        self, key: str, entry: Optional[tuple[float, Any]], now: float
+    ) -> Optional[Any]:
+        if entry is not None and entry[0] > now:
+            self._remember(key, *entry)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        value = self._get_remembered(key, now)
+        if value is None:
+            value = self._get_loaded(key, self._load(key), now)
+        return value
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get() for the event loop, reading Redis or the disk in the thread pool."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        value = self._get_remembered(key, now)
+        if value is None:
+            entry = await run_in_threadpool(self._load, key) if self._shared else None
+            value = self._get_loaded(key, entry, now)
+        return value
+
+    def _set_remembered(
+        self, key: str, value: Any, ttl: Optional[int]
+    ) -> Optional[tuple[float, int]]:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if not self.enabled or ttl <= 0:
+            return None
+
+        expires_at = time.time() + ttl
+        self._remember(key, expires_at, value)
+        return expires_at, ttl
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        expiry = self._set_remembered(key, value, ttl)
+        if expiry is not None:
+            self._store(key, expiry[0], value, expiry[1])
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None):
+        """set() for the event loop, writing Redis or the disk in the thread pool."""
+        expiry = self._set_remembered(key, value, ttl)
+        if expiry is not None and self._shared:
+            await run_in_threadpool(self._store, key, expiry[0], value, expiry[1])
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drops the in-memory copy of `key`, or of every entry."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        self.invalidate()
+
+        try:
+            if self._redis is not None:
+                for redis_key in self._redis.scan_iter(self._redis_key("*")):
+                    self._redis.delete(redis_key)
+            elif self._dir is not None:
+                for path in self._dir.glob("*.json"):
+                    path.unlink(missing_ok=True)
+        except Exception as e:
+            log.debug(f"Error clearing {self.namespace} cache: {e}")
+
+
+# Search engine results, keyed by engine, query and engine settings
+WEB_SEARCH_CACHE = WebCache("search", WEB_SEARCH_CACHE_TTL)
+
+# Extracted page text and metadata, keyed by URL
+WEB_FETCH_CACHE = WebCache("fetch", WEB_FETCH_CACHE_TTL)
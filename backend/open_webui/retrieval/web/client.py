@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from typing import Any, Optional
+
+import aiohttp
+
+from open_webui.config import WEB_SEARCH_RATE_LIMITS, WEB_SEARCH_TIMEOUT
+from open_webui.retrieval.web.utils import RateLimitMixin
+
+log = logging.getLogger(__name__)
+
+
+# Longest Retry-After we are willing to wait for before retrying a 429 once
+MAX_RETRY_AFTER = 10
+
+
+class ProviderRateLimiter(RateLimitMixin):
+    """Spaces the requests to one provider at least 1 / requests_per_second apart."""
+
+    def __init__(self, requests_per_second: Optional[float]):
+        self.requests_per_second = requests_per_second
+        self.last_request_time = None
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        # Serialize the waits so concurrent searches queue up instead of all
+        # seeing the same last_request_time
+        async with self._lock:
+            await self._wait_for_rate_limit()
+
+
+class WebSearchClient:
+    """
+    Pooled HTTP client of the async search providers (`asearch_*` functions in
+    retrieval/web). All searches share one connection pool per event loop, every
+    request is bounded by `timeout`, requests are throttled per provider as
+    configured in WEB_SEARCH_RATE_LIMITS, and a 429 is retried once after the
+    provider's Retry-After.
+
+    Like requests, the session honours the HTTP(S)_PROXY environment variables.
+    """
+
+    def __init__(
+        self,
+        timeout: int = WEB_SEARCH_TIMEOUT,
+        rate_limits: Optional[dict] = None,
+    ):
+        self.timeout = timeout
+        self.rate_limits = (
+            WEB_SEARCH_RATE_LIMITS if rate_limits is None else rate_limits
+        )
+
+        # Sessions and locks are bound to the event loop they were created on
+        self._sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._limiters: dict[tuple, ProviderRateLimiter] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            for stale_loop in [l for l in self._sessions if l.is_closed()]:
+                del self._sessions[stale_loop]
+            self._limiters = {
+                key: limiter
+                for key, limiter in self._limiters.items()
+                if not key[0].is_closed()
+            }
+
+            session = aiohttp.ClientSession(trust_env=True)
+            self._sessions[loop] = session
+        return session
+
+    def _get_rate_limiter(self, provider: str) -> ProviderRateLimiter:
+        key = (asyncio.get_running_loop(), provider)
+        if key not in self._limiters:
+            self._limiters[key] = ProviderRateLimiter(self.rate_limits.get(provider))
+        return self._limiters[key]
+
+    async def request(
+        self,
+        provider: str,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: Optional[float] = None,
+        raise_for_status: bool = True,
+    ) -> Any:
+        """Sends a request on behalf of `provider` and returns the decoded JSON response."""
+        session = self._get_session()
+        limiter = self._get_rate_limiter(provider)
+
+        for attempt in range(2):
+            await limiter.wait()
+            async with session.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                json=json,
+                data=data,
+                timeout=aiohttp.ClientTimeout(total=timeout or self.timeout),
+            ) as response:
+                if response.status == 429 and attempt == 0:
+                    try:
+                        delay = float(response.headers.get("Retry-After", 1))
+                    except ValueError:
+                        delay = 1
+                    if delay <= MAX_RETRY_AFTER:
+                        log.info(
+                            f"{provider} search rate limited (429), "
+                            f"retrying after {delay} second(s)..."
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+
+                if raise_for_status:
+                    response.raise_for_status()
+                return await response.json(content_type=None)
+
+    async def close(self):
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+        self._limiters.clear()
+
+
+WEB_SEARCH_CLIENT = WebSearchClient()
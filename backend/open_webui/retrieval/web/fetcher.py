@@ -0,0 +1,214 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+import aiohttp
+from multidict import CIMultiDictProxy
+
+from open_webui.config import (
+    WEB_EXTRACT_WORKERS,
+    WEB_FETCH_MAX_BYTES,
+    WEB_FETCH_MAX_CONNECTIONS,
+    WEB_FETCH_MAX_CONNECTIONS_PER_HOST,
+    WEB_FETCH_TIMEOUT,
+)
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+log = logging.getLogger(__name__)
+
+
+CHUNK_SIZE = 64 * 1024
+
+# lxml parsers must not be shared between threads
+_parsers = threading.local()
+
+# Elements whose text is not part of the readable page
+NON_CONTENT_TAGS = ("script", "style", "noscript", "template")
+
+
+@dataclass
+class FetchedPage:
+    url: str
+    status: int
+    text: str
+    headers: CIMultiDictProxy = field(repr=False)
+    # True when the body was cut at max_bytes
+    truncated: bool = False
+
+
+class WebFetcher:
+    """
+    Fetches web pages over shared, pooled aiohttp sessions.
+
+    Connections are reused across loaders and requests, with at most
+    `max_connections` open connections (`max_connections_per_host` per host).
+    Bodies are streamed and cut at `max_bytes`, so a huge or never ending
+    response can't exhaust memory, and every request is bounded by `timeout`.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = WEB_FETCH_MAX_CONNECTIONS,
+        max_connections_per_host: int = WEB_FETCH_MAX_CONNECTIONS_PER_HOST,
+        max_bytes: int = WEB_FETCH_MAX_BYTES,
+        timeout: int = WEB_FETCH_TIMEOUT,
+    ):
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+
+        # (event loop, trust_env) -> session, sessions can't be shared across loops
+        self._sessions: dict[tuple, aiohttp.ClientSession] = {}
+
+    def _get_session(self, trust_env: bool) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        key = (loop, trust_env)
+
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            # Drop the sessions of loops that are gone (e.g. asyncio.run in a thread)
+            for stale_key in [k for k in self._sessions if k[0].is_closed()]:
+                del self._sessions[stale_key]
+
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                ),
+                trust_env=trust_env,
+            )
+            self._sessions[key] = session
+        return session
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        cookies: Optional[dict] = None,
+        ssl: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        trust_env: bool = False,
+        allow_redirects: bool = False,
+        raise_for_status: bool = False,
+    ) -> FetchedPage:
+        session = self._get_session(trust_env)
+        kwargs = {} if ssl is None else {"ssl": ssl}
+
+        async with session.get(
+            url,
+            headers=headers,
+            cookies=cookies,
+            timeout=aiohttp.ClientTimeout(total=timeout or self.timeout),
+            allow_redirects=allow_redirects,
+            **kwargs,
+        ) as response:
+            if raise_for_status:
+                response.raise_for_status()
+
+            body = bytearray()
+            truncated = False
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                body.extend(chunk)
+                if len(body) > self.max_bytes:
+                    log.info(f"Truncating {url} at {self.max_bytes} bytes")
+                    del body[self.max_bytes :]
+                    truncated = True
+                    break
+
+            try:
+                text = bytes(body).decode(response.charset or "utf-8", "replace")
+            except LookupError:
+                # Unknown charset announced by the server
+                text = bytes(body).decode("utf-8", "replace")
+
+            return FetchedPage(
+                url=url,
+                status=response.status,
+                text=text,
+                headers=response.headers,
+                truncated=truncated,
+            )
+
+    async def close(self):
+        for session in self._sessions.values():
+            if not session.closed:
+                try:
+                    await session.close()
+                except Exception as e:
+                    log.debug(f"Error closing web fetcher session: {e}")
+        self._sessions.clear()
+
+
+def _extract_with_bs4(html: str, url: str, parser: str) -> tuple[str, dict]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, parser)
+    metadata = {"source": url}
+    if title := soup.find("title"):
+        metadata["title"] = title.get_text()
+    if description := soup.find("meta", attrs={"name": "description"}):
+        metadata["description"] = description.get("content", "No description found.")
+    if html_tag := soup.find("html"):
+        metadata["language"] = html_tag.get("lang", "No language found.")
+    return soup.get_text(), metadata
+
+
+def extract_html(html: str, url: str) -> tuple[str, dict]:
+    """
+    Returns the text and metadata (source, title, description, language) of a
+    page. Uses lxml, which is much faster than BeautifulSoup's html.parser and
+    releases the GIL while parsing; XML documents and installs without lxml
+    fall back to BeautifulSoup.
+    """
+    if url.endswith(".xml"):
+        return _extract_with_bs4(html, url, "xml")
+    if lxml_html is None:
+        return _extract_with_bs4(html, url, "html.parser")
+
+    parser = getattr(_parsers, "html", None)
+    if parser is None:
+        parser = _parsers.html = lxml_html.HTMLParser(encoding="utf-8")
+
+    metadata = {"source": url}
+    try:
+        root = lxml_html.document_fromstring(
+            html.encode("utf-8", errors="replace"), parser=parser
+        )
+    except etree.ParserError:
+        # Empty document
+        return "", metadata
+
+    etree.strip_elements(root, etree.Comment, *NON_CONTENT_TAGS, with_tail=False)
+
+    if (title := root.find(".//title")) is not None:
+        metadata["title"] = title.text_content()
+    if descriptions := root.xpath("//meta[@name='description']"):
+        metadata["description"] = descriptions[0].get(
+            "content", "No description found."
+        )
+    metadata["language"] = root.get("lang", "No language found.")
+
+    return "".join(root.itertext()), metadata
+
+
+async def aextract_html(html: str, url: str) -> tuple[str, dict]:
+    """extract_html on WEB_EXTRACT_EXECUTOR, keeping parsing off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        WEB_EXTRACT_EXECUTOR, extract_html, html, url
+    )
+
+
+WEB_FETCHER = WebFetcher()
+
+WEB_EXTRACT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(WEB_EXTRACT_WORKERS, 1), thread_name_prefix="web_extract"
+)
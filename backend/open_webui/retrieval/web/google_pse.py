@@ -2,7 +2,12 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -70,3 +75,53 @@ def search_google_pse(
         )
         for result in all_results
     ]
+
+
+async def asearch_google_pse(
+    api_key: str,
+    search_engine_id: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    referer: Optional[str] = None,
+) -> list[SearchResult]:
+    """Async version of search_google_pse, pages are still fetched one after the other."""
+    headers = {"Content-Type": "application/json"}
+    if referer:
+        headers["Referer"] = referer
+
+    all_results = []
+    start_index = 1
+
+    while count > 0:
+        json_response = await WEB_SEARCH_CLIENT.request(
+            "google_pse",
+            "GET",
+            "https://www.googleapis.com/customsearch/v1",
+            headers=headers,
+            params={
+                "cx": search_engine_id,
+                "q": query,
+                "key": api_key,
+                "num": min(count, 10),
+                "start": start_index,
+            },
+        )
+        results = json_response.get("items", [])
+        if not results:
+            break
+
+        all_results.extend(results)
+        count -= len(results)
+        start_index += 10
+
+    all_results = await aget_filtered_results(all_results, filter_list)
+
+    return [
+        SearchResult(
+            link=result["link"],
+            title=result.get("title"),
+            snippet=result.get("snippet"),
+        )
+        for result in all_results
+    ]
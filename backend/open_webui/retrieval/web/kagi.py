@@ -2,7 +2,12 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -44,3 +49,26 @@ def search_kagi(
         results = get_filtered_results(results, filter_list)
 
     return results
+
+
+async def asearch_kagi(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Async version of search_kagi."""
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "kagi",
+        "GET",
+        "https://kagi.com/api/v0/search",
+        headers={"Authorization": f"Bot {api_key}"},
+        params={"q": query, "limit": count},
+    )
+
+    results = [
+        SearchResult(
+            link=result["url"], title=result["title"], snippet=result.get("snippet")
+        )
+        for result in json_response.get("data", [])
+        if result["t"] == 0
+    ]
+
+    return await aget_filtered_results(results, filter_list)
@@ -1,3 +1,4 @@
+import asyncio
 import validators
 
 from typing import Optional
@@ -40,6 +41,13 @@ def get_filtered_results(results, filter_list):
     return filtered_results
 
 
+async def aget_filtered_results(results, filter_list):
+    """get_filtered_results in a thread, filtering resolves the result hostnames."""
+    if not filter_list:
+        return results
+    return await asyncio.to_thread(get_filtered_results, results, filter_list)
+
+
 class SearchResult(BaseModel):
     link: str
     title: Optional[str]
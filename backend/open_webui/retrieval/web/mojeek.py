@@ -2,7 +2,12 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -36,3 +41,26 @@ def search_mojeek(
         )
         for result in results
     ]
+
+
+async def asearch_mojeek(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Async version of search_mojeek."""
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "mojeek",
+        "GET",
+        "https://api.mojeek.com/search",
+        headers={"Accept": "application/json"},
+        params={"q": query, "api_key": api_key, "fmt": "json", "t": count},
+    )
+
+    results = json_response.get("response", {}).get("results", [])
+    results = await aget_filtered_results(results, filter_list)
+
+    return [
+        SearchResult(
+            link=result["url"], title=result.get("title"), snippet=result.get("desc")
+        )
+        for result in results
+    ]
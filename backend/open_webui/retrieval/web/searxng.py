@@ -2,7 +2,12 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -87,3 +92,55 @@ def search_searxng(
         )
         for result in sorted_results[:count]
     ]
+
+
+async def asearch_searxng(
+    query_url: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    **kwargs,
+) -> list[SearchResult]:
+    """Async version of search_searxng."""
+    params = {
+        "q": query,
+        "format": "json",
+        "pageno": 1,
+        "safesearch": kwargs.get("safesearch", "1"),
+        "language": kwargs.get("language", "all"),
+        "time_range": kwargs.get("time_range", ""),
+        "categories": "".join(kwargs.get("categories", [])),
+        "theme": "simple",
+        "image_proxy": 0,
+    }
+
+    # Legacy query format
+    if "<query>" in query_url:
+        query_url = query_url.split("?")[0]
+
+    log.debug(f"searching {query_url}")
+
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "searxng",
+        "GET",
+        query_url,
+        headers={
+            "User-Agent": "Open WebUI (https://github.com/open-webui/open-webui) RAG Bot",
+            "Accept": "text/html",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept-Language": "en-US,en;q=0.5",
+        },
+        # aiohttp only takes str and int query values
+        params={key: str(value) for key, value in params.items()},
+    )
+
+    results = sorted(
+        json_response.get("results", []), key=lambda x: x.get("score", 0), reverse=True
+    )
+    results = await aget_filtered_results(results, filter_list)
+    return [
+        SearchResult(
+            link=result["url"], title=result.get("title"), snippet=result.get("content")
+        )
+        for result in results[:count]
+    ]
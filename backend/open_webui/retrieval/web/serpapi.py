@@ -3,7 +3,12 @@ from typing import Optional
 from urllib.parse import urlencode
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -46,3 +51,33 @@ def search_serpapi(
         )
         for result in results[:count]
     ]
+
+
+async def asearch_serpapi(
+    api_key: str,
+    engine: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Async version of search_serpapi."""
+    payload = {"engine": engine or "google", "q": query, "api_key": api_key}
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "serpapi",
+        "GET",
+        f"https://serpapi.com/search?{urlencode(payload)}",
+        raise_for_status=False,
+    )
+
+    results = sorted(
+        json_response.get("organic_results", []), key=lambda x: x.get("position", 0)
+    )
+    results = await aget_filtered_results(results, filter_list)
+    return [
+        SearchResult(
+            link=result["link"],
+            title=result.get("title"),
+            snippet=result.get("snippet"),
+        )
+        for result in results[:count]
+    ]
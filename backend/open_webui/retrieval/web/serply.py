@@ -3,7 +3,12 @@ from typing import Optional
 from urllib.parse import urlencode
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -65,3 +70,48 @@ def search_serply(
         )
         for result in results[:count]
     ]
+
+
+async def asearch_serply(
+    api_key: str,
+    query: str,
+    count: int,
+    hl: str = "us",
+    limit: int = 10,
+    device_type: str = "desktop",
+    proxy_location: str = "US",
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Async version of search_serply."""
+    query_payload = {
+        "q": query,
+        "language": "en",
+        "num": limit,
+        "gl": proxy_location.upper(),
+        "hl": hl.lower(),
+    }
+
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "serply",
+        "GET",
+        f"https://api.serply.io/v1/search/{urlencode(query_payload)}",
+        headers={
+            "X-API-KEY": api_key,
+            "X-User-Agent": device_type,
+            "User-Agent": "open-webui",
+            "X-Proxy-Location": proxy_location,
+        },
+    )
+
+    results = sorted(
+        json_response.get("results", []), key=lambda x: x.get("realPosition", 0)
+    )
+    results = await aget_filtered_results(results, filter_list)
+    return [
+        SearchResult(
+            link=result["link"],
+            title=result.get("title"),
+            snippet=result.get("description"),
+        )
+        for result in results[:count]
+    ]
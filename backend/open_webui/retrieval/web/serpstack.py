@@ -2,7 +2,12 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -44,3 +49,31 @@ def search_serpstack(
         )
         for result in results[:count]
     ]
+
+
+async def asearch_serpstack(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    https_enabled: bool = True,
+) -> list[SearchResult]:
+    """Async version of search_serpstack."""
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "serpstack",
+        "POST",
+        f"{'https' if https_enabled else 'http'}://api.serpstack.com/search",
+        headers={"Content-Type": "application/json"},
+        params={"access_key": api_key, "query": query},
+    )
+
+    results = sorted(
+        json_response.get("organic_results", []), key=lambda x: x.get("position", 0)
+    )
+    results = await aget_filtered_results(results, filter_list)
+    return [
+        SearchResult(
+            link=result["url"], title=result.get("title"), snippet=result.get("snippet")
+        )
+        for result in results[:count]
+    ]
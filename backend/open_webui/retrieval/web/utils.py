@@ -27,6 +27,8 @@ from langchain_core.documents import Document
 
 from open_webui.retrieval.loaders.tavily import TavilyLoader
 from open_webui.retrieval.loaders.external_web import ExternalWebLoader
+from open_webui.retrieval.web.cache import WEB_FETCH_CACHE, get_cache_control_ttl
+from open_webui.retrieval.web.fetcher import WEB_FETCHER, aextract_html
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.config import (
     ENABLE_RAG_LOCAL_WEB_FETCH,
@@ -549,7 +551,14 @@ class SafePlaywrightURLLoader(PlaywrightURLLoader, RateLimitMixin, URLProcessing
 
 
 class SafeWebBaseLoader(WebBaseLoader):
-    """WebBaseLoader with enhanced error handling for URLs."""
+    """
+    WebBaseLoader with enhanced error handling for URLs.
+
+    Pages are fetched through the pooled WEB_FETCHER and their text is extracted
+    on a worker thread (see retrieval/web/fetcher.py). Extracted pages are cached
+    per URL in WEB_FETCH_CACHE, for at most as long as the response's
+    Cache-Control allows.
+    """
 
     def __init__(self, trust_env: bool = False, *args, **kwargs):
         """Initialize SafeWebBaseLoader
@@ -559,39 +568,107 @@ class SafeWebBaseLoader(WebBaseLoader):
         """
         super().__init__(*args, **kwargs)
         self.trust_env = trust_env
+        # url -> seconds the fetched page may be cached for
+        self.cache_ttls: Dict[str, int] = {}
+
+    @staticmethod
+    def _get_cache_key(url: str) -> str:
+        return WEB_FETCH_CACHE.get_key("safe_web", url)
+
+    @staticmethod
+    def _to_document(cached: Optional[dict]) -> Optional[Document]:
+        if cached is None:
+            return None
+        return Document(
+            page_content=cached["page_content"], metadata=cached["metadata"]
+        )
+
+    def _get_cached_document(self, url: str) -> Optional[Document]:
+        return self._to_document(WEB_FETCH_CACHE.get(self._get_cache_key(url)))
+
+    async def _aget_cached_document(self, url: str) -> Optional[Document]:
+        return self._to_document(await WEB_FETCH_CACHE.aget(self._get_cache_key(url)))
+
+    def _cache_document(self, url: str, document: Document):
+        # Only pages fetched successfully have a TTL
+        if url in self.cache_ttls:
+            WEB_FETCH_CACHE.set(
+                self._get_cache_key(url),
+                {"page_content": document.page_content, "metadata": document.metadata},
+                ttl=self.cache_ttls[url],
+            )
+
+    async def _acache_document(self, url: str, document: Document):
+        if url in self.cache_ttls:
+            await WEB_FETCH_CACHE.aset(
+                self._get_cache_key(url),
+                {"page_content": document.page_content, "metadata": document.metadata},
+                ttl=self.cache_ttls[url],
+            )
+
+    def _record_cache_ttl(self, url: str, status: int, cache_control: Optional[str]):
+        if status == 200:
+            self.cache_ttls[url] = get_cache_control_ttl(
+                cache_control, WEB_FETCH_CACHE.ttl
+            )
+        else:
+            self.cache_ttls.pop(url, None)
 
     async def _fetch(
         self, url: str, retries: int = 3, cooldown: int = 2, backoff: float = 1.5
     ) -> str:
-        async with aiohttp.ClientSession(trust_env=self.trust_env) as session:
-            for i in range(retries):
-                try:
-                    kwargs: Dict = dict(
-                        headers=self.session.headers,
-                        cookies=self.session.cookies.get_dict(),
+        for i in range(retries):
+            try:
+                page = await WEB_FETCHER.fetch(
+                    url,
+                    headers=dict(self.session.headers),
+                    cookies=self.session.cookies.get_dict(),
+                    ssl=None if self.session.verify else False,
+                    timeout=self.requests_kwargs.get("timeout"),
+                    trust_env=self.trust_env,
+                    raise_for_status=self.raise_for_status,
+                )
+                self._record_cache_ttl(
+                    url, page.status, page.headers.get("Cache-Control")
+                )
+                return page.text
+            except aiohttp.ClientConnectionError as e:
+                if i == retries - 1:
+                    raise
+                else:
+                    log.warning(
+                        f"Error fetching {url} with attempt "
+                        f"{i + 1}/{retries}: {e}. Retrying..."
                     )
-                    if not self.session.verify:
-                        kwargs["ssl"] = False
-
-                    async with session.get(
-                        url,
-                        **(self.requests_kwargs | kwargs),
-                        allow_redirects=False,
-                    ) as response:
-                        if self.raise_for_status:
-                            response.raise_for_status()
-                        return await response.text()
-                except aiohttp.ClientConnectionError as e:
-                    if i == retries - 1:
-                        raise
-                    else:
-                        log.warning(
-                            f"Error fetching {url} with attempt "
-                            f"{i + 1}/{retries}: {e}. Retrying..."
-                        )
-                        await asyncio.sleep(cooldown * backoff**i)
+                    await asyncio.sleep(cooldown * backoff**i)
         raise ValueError("retry count exceeded")
 
+    def _scrape(
+        self,
+        url: str,
+        parser: Union[str, None] = None,
+        bs_kwargs: Optional[dict] = None,
+    ) -> Any:
+        """WebBaseLoader._scrape, also recording how long the page may be cached."""
+        from bs4 import BeautifulSoup
+
+        if parser is None:
+            parser = "xml" if url.endswith(".xml") else self.default_parser
+        self._check_parser(parser)
+
+        response = self.session.get(url, **self.requests_kwargs)
+        if self.raise_for_status:
+            response.raise_for_status()
+        self._record_cache_ttl(
+            url, response.status_code, response.headers.get("Cache-Control")
+        )
+
+        if self.encoding is not None:
+            response.encoding = self.encoding
+        elif self.autoset_encoding:
+            response.encoding = response.apparent_encoding
+        return BeautifulSoup(response.text, parser, **(bs_kwargs or {}))
+
     def _unpack_fetch_results(
         self, results: Any, urls: List[str], parser: Union[str, None] = None
     ) -> List[Any]:
@@ -621,32 +698,46 @@ class SafeWebBaseLoader(WebBaseLoader):
         """Lazy load text from the url(s) in web_path with error handling."""
         for path in self.web_paths:
             try:
-                soup = self._scrape(path, bs_kwargs=self.bs_kwargs)
-                text = soup.get_text(**self.bs_get_text_kwargs)
+                document = self._get_cached_document(path)
+                if document is None:
+                    soup = self._scrape(path, bs_kwargs=self.bs_kwargs)
+                    text = soup.get_text(**self.bs_get_text_kwargs)
 
-                # Build metadata
-                metadata = extract_metadata(soup, path)
+                    # Build metadata
+                    metadata = extract_metadata(soup, path)
 
-                yield Document(page_content=text, metadata=metadata)
+                    document = Document(page_content=text, metadata=metadata)
+                    self._cache_document(path, document)
+
+                yield document
             except Exception as e:
                 # Log the error and continue with the next URL
                 log.exception(f"Error loading {path}: {e}")
 
     async def alazy_load(self) -> AsyncIterator[Document]:
         """Async lazy load text from the url(s) in web_path."""
-        results = await self.ascrape_all(self.web_paths)
-        for path, soup in zip(self.web_paths, results):
-            text = soup.get_text(**self.bs_get_text_kwargs)
-            metadata = {"source": path}
-            if title := soup.find("title"):
-                metadata["title"] = title.get_text()
-            if description := soup.find("meta", attrs={"name": "description"}):
-                metadata["description"] = description.get(
-                    "content", "No description found."
-                )
-            if html := soup.find("html"):
-                metadata["language"] = html.get("lang", "No language found.")
-            yield Document(page_content=text, metadata=metadata)
+        documents = {}
+        for path in self.web_paths:
+            if (document := await self._aget_cached_document(path)) is not None:
+                documents[path] = document
+
+        uncached_paths = [path for path in self.web_paths if path not in documents]
+        if uncached_paths:
+            results = await self.fetch_all(uncached_paths)
+            extracted = await asyncio.gather(
+                *[
+                    aextract_html(html, path)
+                    for html, path in zip(results, uncached_paths)
+                ]
+            )
+            for path, (text, metadata) in zip(uncached_paths, extracted):
+                documents[path] = Document(page_content=text, metadata=metadata)
+                # Failed fetches are returned as empty pages and not cached
+                await self._acache_document(path, documents[path])
+
+        for path in self.web_paths:
+            if path in documents:
+                yield documents[path]
 
     async def aload(self) -> list[Document]:
         """Load data into Document objects."""
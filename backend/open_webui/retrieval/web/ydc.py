@@ -2,7 +2,12 @@ import logging
 from typing import Optional, List
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    aget_filtered_results,
+    get_filtered_results,
+)
 
 log = logging.getLogger(__name__)
 
@@ -71,3 +76,32 @@ def _build_snippet(result: dict) -> str:
         parts.extend(snippets)
 
     return "\n\n".join(parts)
+
+
+async def asearch_youcom(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[List[str]] = None,
+    language: str = "EN",
+) -> List[SearchResult]:
+    """Async version of search_youcom."""
+    json_response = await WEB_SEARCH_CLIENT.request(
+        "youcom",
+        "GET",
+        "https://ydc-index.io/v1/search",
+        headers={"Accept": "application/json", "X-API-KEY": api_key},
+        params={"query": query, "count": count, "language": language},
+    )
+
+    results = json_response.get("results", {}).get("web", [])
+    results = await aget_filtered_results(results, filter_list)
+
+    return [
+        SearchResult(
+            link=result["url"],
+            title=result.get("title"),
+            snippet=_build_snippet(result),
+        )
+        for result in results[:count]
+    ]
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import logging
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from open_webui.models.chat_messages import ChatMessages, ChatMessageModel
@@ -86,7 +87,7 @@ async def get_user_analytics(
         start_date=start_date, end_date=end_date, group_id=group_id, db=db
     )
     token_usage = ChatMessages.get_token_usage_by_user(
-        start_date=start_date, end_date=end_date, db=db
+        start_date=start_date, end_date=end_date, group_id=group_id, db=db
     )
 
     # Get user info for top users
@@ -169,13 +170,13 @@ async def get_summary(
     user_counts = ChatMessages.get_message_count_by_user(
         start_date=start_date, end_date=end_date, group_id=group_id, db=db
     )
-    chat_counts = ChatMessages.get_message_count_by_chat(
+    chat_count = ChatMessages.get_chat_count(
         start_date=start_date, end_date=end_date, group_id=group_id, db=db
     )
 
     return SummaryResponse(
         total_messages=sum(model_counts.values()),
-        total_chats=len(chat_counts),
+        total_chats=chat_count,
         total_models=len(model_counts),
         total_users=len(user_counts),
     )
@@ -202,7 +203,7 @@ async def get_daily_stats(
     """Get message counts grouped by model for time-series chart."""
     if granularity == "hourly":
         counts = ChatMessages.get_hourly_message_counts_by_model(
-            start_date=start_date, end_date=end_date, db=db
+            start_date=start_date, end_date=end_date, group_id=group_id, db=db
         )
     else:
         counts = ChatMessages.get_daily_message_counts_by_model(
@@ -260,6 +261,17 @@ async def get_token_usage(
     )
 
 
+class RebuildStatsResponse(BaseModel):
+    messages: int
+
+
+@router.post("/rebuild", response_model=RebuildStatsResponse)
+async def rebuild_stats(user=Depends(get_admin_user)):
+    """Recompute the analytics rollups from all stored messages."""
+    messages = await run_in_threadpool(ChatMessages.rebuild_stats)
+    return RebuildStatsResponse(messages=messages)
+
+
 ####################
 # Model Chats Browser
 ####################
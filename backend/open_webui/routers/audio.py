@@ -2,6 +2,7 @@ import hashlib
 import json
 import logging
 import os
+import socket
 import uuid
 import html
 import base64
@@ -28,16 +29,28 @@ from fastapi import (
     status,
     APIRouter,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 
 
-from open_webui.utils.misc import strict_match_mime_type
+from open_webui.utils.misc import cleanup_response, strict_match_mime_type
+from open_webui.utils.audio import decode_audio, split_on_silence, transcribe_chunks
+from open_webui.utils.whisper_service import (
+    WhisperService,
+    load_faster_whisper_model,
+)
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_permission
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.speech_cache import SPEECH_CACHE, get_speech_response
 from open_webui.config import (
+    AUDIO_STT_STREAM_CHUNK_SECONDS,
+    AUDIO_STT_STREAM_WORKERS,
+    ENABLE_WHISPER_SERVICE,
+    WHISPER_SERVICE_BATCH_SIZE,
+    WHISPER_SERVICE_SOCKET,
     WHISPER_MODEL_AUTO_UPDATE,
     WHISPER_COMPUTE_TYPE,
     WHISPER_MODEL_DIR,
@@ -56,6 +69,7 @@ from open_webui.env import (
     AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST,
     DEVICE_TYPE,
     ENABLE_FORWARD_USER_INFO_HEADERS,
+    WEBUI_SECRET_KEY,
 )
 
 router = APIRouter()
@@ -68,8 +82,17 @@ AZURE_MAX_FILE_SIZE = AZURE_MAX_FILE_SIZE_MB * 1024 * 1024  # Convert MB to byte
 
 log = logging.getLogger(__name__)
 
-SPEECH_CACHE_DIR = CACHE_DIR / "audio" / "speech"
-SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Local Whisper model shared by the workers of the node, see utils/whisper_service.py
+WHISPER_SERVICE = None
+if ENABLE_WHISPER_SERVICE:
+    if hasattr(socket, "AF_UNIX"):
+        WHISPER_SERVICE = WhisperService(
+            WHISPER_SERVICE_SOCKET,
+            hashlib.sha256(f"whisper:{WEBUI_SECRET_KEY}".encode()).digest(),
+            WHISPER_SERVICE_BATCH_SIZE,
+        )
+    else:
+        log.warning("ENABLE_WHISPER_SERVICE requires Unix sockets, ignoring it")
 
 
 ##########################################
@@ -125,27 +148,23 @@ def convert_audio_to_mp3(file_path):
         return None
 
 
+def get_faster_whisper_kwargs(model: str, auto_update: bool = False) -> dict:
+    return {
+        "model_size_or_path": model,
+        "device": DEVICE_TYPE if DEVICE_TYPE and DEVICE_TYPE == "cuda" else "cpu",
+        "compute_type": WHISPER_COMPUTE_TYPE,
+        "download_root": WHISPER_MODEL_DIR,
+        "local_files_only": not auto_update,
+    }
+
+
 def set_faster_whisper_model(model: str, auto_update: bool = False):
     whisper_model = None
-    if model:
-        from faster_whisper import WhisperModel
-
-        faster_whisper_kwargs = {
-            "model_size_or_path": model,
-            "device": DEVICE_TYPE if DEVICE_TYPE and DEVICE_TYPE == "cuda" else "cpu",
-            "compute_type": WHISPER_COMPUTE_TYPE,
-            "download_root": WHISPER_MODEL_DIR,
-            "local_files_only": not auto_update,
-        }
-
-        try:
-            whisper_model = WhisperModel(**faster_whisper_kwargs)
-        except Exception:
-            log.warning(
-                "WhisperModel initialization failed, attempting download with local_files_only=False"
-            )
-            faster_whisper_kwargs["local_files_only"] = False
-            whisper_model = WhisperModel(**faster_whisper_kwargs)
+    # With the whisper service, workers don't hold a copy of the model
+    if model and not WHISPER_SERVICE:
+        whisper_model = load_faster_whisper_model(
+            get_faster_whisper_kwargs(model, auto_update)
+        )
     return whisper_model
 
 
@@ -353,11 +372,9 @@ async def speech(request: Request, user=Depends(get_verified_user)):
         + str(request.app.state.config.TTS_MODEL).encode("utf-8")
     ).hexdigest()
 
-    file_path = SPEECH_CACHE_DIR.joinpath(f"{name}.mp3")
-    file_body_path = SPEECH_CACHE_DIR.joinpath(f"{name}.json")
-
     # Check if the file already exists in the cache
-    if file_path.is_file():
+    file_path = SPEECH_CACHE.get(name)
+    if file_path:
         return FileResponse(file_path)
 
     payload = None
@@ -368,42 +385,36 @@ async def speech(request: Request, user=Depends(get_verified_user)):
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
     r = None
+    session = None
     if request.app.state.config.TTS_ENGINE == "openai":
         payload["model"] = request.app.state.config.TTS_MODEL
 
         try:
             timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
-            async with aiohttp.ClientSession(
-                timeout=timeout, trust_env=True
-            ) as session:
-                payload = {
-                    **payload,
-                    **(request.app.state.config.TTS_OPENAI_PARAMS or {}),
-                }
+            session = aiohttp.ClientSession(timeout=timeout, trust_env=True)
 
-                headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {request.app.state.config.TTS_OPENAI_API_KEY}",
-                }
-                if ENABLE_FORWARD_USER_INFO_HEADERS:
-                    headers = include_user_info_headers(headers, user)
-
-                r = await session.post(
-                    url=f"{request.app.state.config.TTS_OPENAI_API_BASE_URL}/audio/speech",
-                    json=payload,
-                    headers=headers,
-                    ssl=AIOHTTP_CLIENT_SESSION_SSL,
-                )
-
-                r.raise_for_status()
+            payload = {
+                **payload,
+                **(request.app.state.config.TTS_OPENAI_PARAMS or {}),
+            }
 
-                async with aiofiles.open(file_path, "wb") as f:
-                    await f.write(await r.read())
+            headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {request.app.state.config.TTS_OPENAI_API_KEY}",
+            }
+            if ENABLE_FORWARD_USER_INFO_HEADERS:
+                headers = include_user_info_headers(headers, user)
+
+            r = await session.post(
+                url=f"{request.app.state.config.TTS_OPENAI_API_BASE_URL}/audio/speech",
+                json=payload,
+                headers=headers,
+                ssl=AIOHTTP_CLIENT_SESSION_SSL,
+            )
 
-                async with aiofiles.open(file_body_path, "w") as f:
-                    await f.write(json.dumps(payload))
+            r.raise_for_status()
 
-            return FileResponse(file_path)
+            return get_speech_response(name, r, session, payload)
 
         except Exception as e:
             log.exception(e)
@@ -422,6 +433,7 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                 except Exception:
                     detail = f"External: {e}"
 
+            await cleanup_response(r, session)
             raise HTTPException(
                 status_code=status_code,
                 detail=detail,
@@ -438,32 +450,26 @@ async def speech(request: Request, user=Depends(get_verified_user)):
 
         try:
             timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
-            async with aiohttp.ClientSession(
-                timeout=timeout, trust_env=True
-            ) as session:
-                async with session.post(
-                    f"{ELEVENLABS_API_BASE_URL}/v1/text-to-speech/{voice_id}",
-                    json={
-                        "text": payload["input"],
-                        "model_id": request.app.state.config.TTS_MODEL,
-                        "voice_settings": {"stability": 0.5, "similarity_boost": 0.5},
-                    },
-                    headers={
-                        "Accept": "audio/mpeg",
-                        "Content-Type": "application/json",
-                        "xi-api-key": request.app.state.config.TTS_API_KEY,
-                    },
-                    ssl=AIOHTTP_CLIENT_SESSION_SSL,
-                ) as r:
-                    r.raise_for_status()
-
-                    async with aiofiles.open(file_path, "wb") as f:
-                        await f.write(await r.read())
-
-                    async with aiofiles.open(file_body_path, "w") as f:
-                        await f.write(json.dumps(payload))
+            session = aiohttp.ClientSession(timeout=timeout, trust_env=True)
+
+            # The streaming endpoint sends audio as soon as it is synthesized
+            r = await session.post(
+                f"{ELEVENLABS_API_BASE_URL}/v1/text-to-speech/{voice_id}/stream",
+                json={
+                    "text": payload["input"],
+                    "model_id": request.app.state.config.TTS_MODEL,
+                    "voice_settings": {"stability": 0.5, "similarity_boost": 0.5},
+                },
+                headers={
+                    "Accept": "audio/mpeg",
+                    "Content-Type": "application/json",
+                    "xi-api-key": request.app.state.config.TTS_API_KEY,
+                },
+                ssl=AIOHTTP_CLIENT_SESSION_SSL,
+            )
+            r.raise_for_status()
 
-            return FileResponse(file_path)
+            return get_speech_response(name, r, session, payload)
 
         except Exception as e:
             log.exception(e)
@@ -477,18 +483,13 @@ async def speech(request: Request, user=Depends(get_verified_user)):
             except Exception:
                 detail = f"External: {e}"
 
+            await cleanup_response(r, session)
             raise HTTPException(
                 status_code=getattr(r, "status", 500) if r else 500,
                 detail=detail if detail else "Open WebUI: Server Connection Error",
             )
 
     elif request.app.state.config.TTS_ENGINE == "azure":
-        try:
-            payload = json.loads(body.decode("utf-8"))
-        except Exception as e:
-            log.exception(e)
-            raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
         region = request.app.state.config.TTS_AZURE_SPEECH_REGION or "eastus"
         base_url = request.app.state.config.TTS_AZURE_SPEECH_BASE_URL
         language = request.app.state.config.TTS_VOICE
@@ -500,29 +501,22 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                 <voice name="{language}">{html.escape(payload["input"])}</voice>
             </speak>"""
             timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
-            async with aiohttp.ClientSession(
-                timeout=timeout, trust_env=True
-            ) as session:
-                async with session.post(
-                    (base_url or f"https://{region}.tts.speech.microsoft.com")
-                    + "/cognitiveservices/v1",
-                    headers={
-                        "Ocp-Apim-Subscription-Key": request.app.state.config.TTS_API_KEY,
-                        "Content-Type": "application/ssml+xml",
-                        "X-Microsoft-OutputFormat": output_format,
-                    },
-                    data=data,
-                    ssl=AIOHTTP_CLIENT_SESSION_SSL,
-                ) as r:
-                    r.raise_for_status()
+            session = aiohttp.ClientSession(timeout=timeout, trust_env=True)
 
-                    async with aiofiles.open(file_path, "wb") as f:
-                        await f.write(await r.read())
-
-                    async with aiofiles.open(file_body_path, "w") as f:
-                        await f.write(json.dumps(payload))
+            r = await session.post(
+                (base_url or f"https://{region}.tts.speech.microsoft.com")
+                + "/cognitiveservices/v1",
+                headers={
+                    "Ocp-Apim-Subscription-Key": request.app.state.config.TTS_API_KEY,
+                    "Content-Type": "application/ssml+xml",
+                    "X-Microsoft-OutputFormat": output_format,
+                },
+                data=data,
+                ssl=AIOHTTP_CLIENT_SESSION_SSL,
+            )
+            r.raise_for_status()
 
-                    return FileResponse(file_path)
+            return get_speech_response(name, r, session, payload)
 
         except Exception as e:
             log.exception(e)
@@ -536,19 +530,13 @@ async def speech(request: Request, user=Depends(get_verified_user)):
             except Exception:
                 detail = f"External: {e}"
 
+            await cleanup_response(r, session)
             raise HTTPException(
                 status_code=getattr(r, "status", 500) if r else 500,
                 detail=detail if detail else "Open WebUI: Server Connection Error",
             )
 
     elif request.app.state.config.TTS_ENGINE == "transformers":
-        payload = None
-        try:
-            payload = json.loads(body.decode("utf-8"))
-        except Exception as e:
-            log.exception(e)
-            raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
         import torch
         import soundfile as sf
 
@@ -573,14 +561,26 @@ async def speech(request: Request, user=Depends(get_verified_user)):
             forward_params={"speaker_embeddings": speaker_embedding},
         )
 
+        # Synthesized locally in one go, there is nothing to stream
+        file_path = SPEECH_CACHE.get_path(name)
         sf.write(file_path, speech["audio"], samplerate=speech["sampling_rate"])
-
-        async with aiofiles.open(file_body_path, "w") as f:
-            await f.write(json.dumps(payload))
+        SPEECH_CACHE.add(name, payload)
 
         return FileResponse(file_path)
 
 
+@router.get("/transcriptions/metrics")
+async def get_transcription_metrics(request: Request, user=Depends(get_admin_user)):
+    if WHISPER_SERVICE is None:
+        return {"enabled": False}
+    return {"enabled": True, **(await run_in_threadpool(WHISPER_SERVICE.get_metrics))}
+
+
+@router.get("/speech/cache/metrics")
+async def get_speech_cache_metrics(request: Request, user=Depends(get_admin_user)):
+    return SPEECH_CACHE.get_metrics()
+
+
 def transcription_handler(request, file_path, metadata, user=None):
     filename = os.path.basename(file_path)
     file_dir = os.path.dirname(file_path)
@@ -594,25 +594,37 @@ def transcription_handler(request, file_path, metadata, user=None):
     ]
 
     if request.app.state.config.STT_ENGINE == "":
-        if request.app.state.faster_whisper_model is None:
-            request.app.state.faster_whisper_model = set_faster_whisper_model(
-                request.app.state.config.WHISPER_MODEL
+        transcribe_kwargs = {
+            "beam_size": 5,
+            "vad_filter": WHISPER_VAD_FILTER,
+            "language": languages[0],
+            "multilingual": WHISPER_MULTILINGUAL,
+        }
+        if WHISPER_SERVICE:
+            result = WHISPER_SERVICE.transcribe(
+                file_path,
+                get_faster_whisper_kwargs(request.app.state.config.WHISPER_MODEL),
+                **transcribe_kwargs,
             )
+            transcript = result["text"]
+            language = result["language"]
+            language_probability = result["language_probability"]
+        else:
+            if request.app.state.faster_whisper_model is None:
+                request.app.state.faster_whisper_model = set_faster_whisper_model(
+                    request.app.state.config.WHISPER_MODEL
+                )
+
+            model = request.app.state.faster_whisper_model
+            segments, info = model.transcribe(file_path, **transcribe_kwargs)
+            transcript = "".join([segment.text for segment in list(segments)])
+            language, language_probability = info.language, info.language_probability
 
-        model = request.app.state.faster_whisper_model
-        segments, info = model.transcribe(
-            file_path,
-            beam_size=5,
-            vad_filter=WHISPER_VAD_FILTER,
-            language=languages[0],
-            multilingual=WHISPER_MULTILINGUAL,
-        )
         log.info(
             "Detected language '%s' with probability %f"
-            % (info.language, info.language_probability)
+            % (language, language_probability)
         )
 
-        transcript = "".join([segment.text for segment in list(segments)])
         data = {"text": transcript.strip()}
 
         # save the transcript to a json file
@@ -1106,6 +1118,46 @@ def transcribe(
     }
 
 
+async def stream_transcribe(
+    request: Request, file_path: str, metadata: Optional[dict] = None, user=None
+):
+    """
+    Transcribes `file_path` chunk by chunk as it is decoded, streaming each
+    chunk's transcript as a server-sent event ({"index", "start", "end",
+    "text"}) followed by {"done": true, "text"} with the full transcript.
+    """
+    log.info(f"stream_transcribe: {file_path} {metadata}")
+
+    texts = []
+    try:
+        chunks = split_on_silence(
+            decode_audio(file_path),
+            AUDIO_STT_STREAM_CHUNK_SECONDS,
+            AUDIO_STT_STREAM_CHUNK_SECONDS * 2,
+        )
+        async for segment in transcribe_chunks(
+            chunks,
+            lambda chunk_path: transcription_handler(
+                request, chunk_path, metadata, user
+            ),
+            os.path.splitext(file_path)[0],
+            AUDIO_STT_STREAM_WORKERS,
+        ):
+            if segment["text"]:
+                texts.append(segment["text"])
+            yield f"data: {json.dumps(segment)}\n\n"
+
+        done = {
+            "done": True,
+            "text": " ".join(texts),
+            "filename": os.path.basename(file_path),
+        }
+        yield f"data: {json.dumps(done)}\n\n"
+    except Exception as e:
+        log.exception(e)
+        yield f"data: {json.dumps({'error': f'Error transcribing chunk: {e}'})}\n\n"
+
+
 def compress_audio(file_path):
     if os.path.getsize(file_path) > MAX_FILE_SIZE:
         id = os.path.splitext(os.path.basename(file_path))[
@@ -1173,6 +1225,7 @@ def transcription(
     request: Request,
     file: UploadFile = File(...),
     language: Optional[str] = Form(None),
+    stream: bool = Form(False),
     user=Depends(get_verified_user),
 ):
     if user.role != "admin" and not has_permission(
@@ -1219,6 +1272,12 @@ def transcription(
             if language:
                 metadata = {"language": language}
 
+            if stream:
+                return StreamingResponse(
+                    stream_transcribe(request, file_path, metadata, user),
+                    media_type="text/event-stream",
+                )
+
             result = transcribe(request, file_path, metadata, user)
 
             return {
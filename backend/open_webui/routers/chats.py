@@ -1,5 +1,7 @@
 import json
 import logging
+import time
+import zipfile
 from typing import Optional
 from sqlalchemy.orm import Session
 import asyncio
@@ -29,12 +31,13 @@ from open_webui.internal.db import get_session
 
 from open_webui.config import ENABLE_ADMIN_CHAT_ACCESS, ENABLE_ADMIN_EXPORT
 from open_webui.constants import ERROR_MESSAGES
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
 
 
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_permission
+from open_webui.utils.pagination import get_next_cursor, set_next_cursor
 
 log = logging.getLogger(__name__)
 
@@ -48,25 +51,30 @@ router = APIRouter()
 @router.get("/", response_model=list[ChatTitleIdResponse])
 @router.get("/list", response_model=list[ChatTitleIdResponse])
 def get_session_user_chat_list(
+    response: Response,
     user=Depends(get_verified_user),
     page: Optional[int] = None,
+    cursor: Optional[str] = None,
     include_pinned: Optional[bool] = False,
     include_folders: Optional[bool] = False,
     db: Session = Depends(get_session),
 ):
     try:
-        if page is not None:
+        if page is not None or cursor:
             limit = 60
-            skip = (page - 1) * limit
+            skip = ((page or 1) - 1) * limit
 
-            return Chats.get_chat_title_id_list_by_user_id(
+            chats = Chats.get_chat_title_id_list_by_user_id(
                 user.id,
                 include_folders=include_folders,
                 include_pinned=include_pinned,
                 skip=skip,
                 limit=limit,
+                cursor=cursor,
                 db=db,
             )
+            set_next_cursor(response, get_next_cursor(chats, limit, "updated_at", "id"))
+            return chats
         else:
             return Chats.get_chat_title_id_list_by_user_id(
                 user.id,
@@ -554,7 +562,9 @@ async def delete_all_user_chats(
 @router.get("/list/user/{user_id}", response_model=list[ChatTitleIdResponse])
 async def get_user_chat_list_by_user_id(
     user_id: str,
+    response: Response,
     page: Optional[int] = None,
+    cursor: Optional[str] = None,
     query: Optional[str] = None,
     order_by: Optional[str] = None,
     direction: Optional[str] = None,
@@ -581,9 +591,22 @@ async def get_user_chat_list_by_user_id(
     if direction:
         filter["direction"] = direction
 
-    return Chats.get_chat_list_by_user_id(
-        user_id, include_archived=True, filter=filter, skip=skip, limit=limit, db=db
-    )
+    try:
+        chats = Chats.get_chat_list_by_user_id(
+            user_id,
+            include_archived=True,
+            filter=filter,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            db=db,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not order_by:
+        set_next_cursor(response, get_next_cursor(chats, limit, "updated_at", "id"))
+    return chats
 
 
 ############################
@@ -731,12 +754,89 @@ async def get_user_pinned_chats(
 ############################
 
 
+CHAT_EXPORT_BATCH_SIZE = 100
+CHAT_EXPORT_FORMATS = {
+    "json": ("application/json", "json"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "zip": ("application/zip", "zip"),
+}
+
+
+class _ZipStream:
+    """Write-only file object handing what zipfile wrote so far to a generator."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def read(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def generate_chats_export(user_id: Optional[str], format: str):
+    """
+    Streams the chats of `user_id` (of every user when None) as a JSON array,
+    JSON Lines or a zip archive with one JSON file per chat, holding a single
+    batch of chats in memory at a time.
+    """
+    chats = (
+        ChatResponse(**chat.model_dump())
+        for chat in Chats.iter_chats(user_id, batch_size=CHAT_EXPORT_BATCH_SIZE)
+    )
+
+    try:
+        if format == "jsonl":
+            for chat in chats:
+                yield chat.model_dump_json() + "\n"
+        elif format == "zip":
+            stream = _ZipStream()
+            # zipfile writes to unseekable streams with data descriptors
+            with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+                for chat in chats:
+                    name = f"{chat.id}.json"
+                    if user_id is None:
+                        name = f"{chat.user_id}/{name}"
+                    archive.writestr(name, chat.model_dump_json())
+                    yield stream.read()
+            yield stream.read()
+        else:
+            yield "["
+            for index, chat in enumerate(chats):
+                yield ("," if index else "") + chat.model_dump_json()
+            yield "]"
+    except Exception as e:
+        # The response has started, the client sees a truncated download
+        log.exception(f"Error exporting chats: {e}")
+        raise
+
+
+def export_chats(user_id: Optional[str], format: str) -> StreamingResponse:
+    if format not in CHAT_EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format: {format}",
+        )
+
+    media_type, extension = CHAT_EXPORT_FORMATS[format]
+    filename = f"chat-export-{user_id or 'all'}-{int(time.time())}.{extension}"
+    return StreamingResponse(
+        generate_chats_export(user_id, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 @router.get("/all", response_model=list[ChatResponse])
-async def get_user_chats(
-    user=Depends(get_verified_user), db: Session = Depends(get_session)
-):
-    result = Chats.get_chats_by_user_id(user.id, db=db)
-    return [ChatResponse(**chat.model_dump()) for chat in result.items]
+async def get_user_chats(format: str = "json", user=Depends(get_verified_user)):
+    return export_chats(user.id, format)
 
 
 ############################
@@ -779,15 +879,13 @@ async def get_all_user_tags(
 
 
 @router.get("/all/db", response_model=list[ChatResponse])
-async def get_all_user_chats_in_db(
-    user=Depends(get_admin_user), db: Session = Depends(get_session)
-):
+async def get_all_user_chats_in_db(format: str = "json", user=Depends(get_admin_user)):
     if not ENABLE_ADMIN_EXPORT:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
         )
-    return [ChatResponse(**chat.model_dump()) for chat in Chats.get_chats(db=db)]
+    return export_chats(None, format)
 
 
 ############################
@@ -6,7 +6,7 @@ import aiohttp
 
 from typing import Optional
 
-from open_webui.env import AIOHTTP_CLIENT_TIMEOUT
+from open_webui.env import AIOHTTP_CLIENT_TIMEOUT, ENABLE_MCP_SESSION_POOL
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.config import get_config, save_config
 from open_webui.config import BannerModel
@@ -18,6 +18,7 @@ from open_webui.utils.tools import (
     set_terminal_servers,
 )
 from open_webui.utils.mcp.client import MCPClient
+from open_webui.utils.mcp.pool import MCP_SESSION_POOL
 from open_webui.models.oauth_sessions import OAuthSessions
 
 
@@ -188,6 +189,8 @@ async def set_tool_servers_config(
     ]
 
     await set_tool_servers(request)
+    # Drop sessions opened with the previous connection settings
+    await MCP_SESSION_POOL.clear()
 
     for connection in request.app.state.config.TOOL_SERVER_CONNECTIONS:
         server_type = connection.get("type", "openapi")
@@ -215,6 +218,14 @@ async def set_tool_servers_config(
     }
 
 
+@router.get("/tool_servers/mcp/metrics")
+async def get_mcp_session_metrics(request: Request, user=Depends(get_admin_user)):
+    return {
+        "ENABLE_MCP_SESSION_POOL": ENABLE_MCP_SESSION_POOL,
+        "pool": MCP_SESSION_POOL.get_stats(),
+    }
+
+
 class TerminalServerConnection(BaseModel):
     id: Optional[str] = ""
     name: Optional[str] = ""
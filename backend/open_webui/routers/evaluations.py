@@ -15,7 +15,10 @@ from open_webui.models.feedbacks import (
     LeaderboardFeedbackData,
     ModelHistoryEntry,
     ModelHistoryResponse,
+    ModelRatingModel,
     Feedbacks,
+    apply_elo_match,
+    get_feedback_matches,
 )
 
 from open_webui.constants import ERROR_MESSAGES
@@ -39,6 +42,8 @@ router = APIRouter()
 # 3. The Elo formula: new_rating = old_rating + K * (actual - expected)
 #    - K=32 controls how much ratings can change per match
 #    - expected = probability of winning based on current ratings
+# 4. Ratings are stored per model and updated as feedback comes in (see
+#    Feedbacks.get_model_ratings), so the plain leaderboard reads no feedback
 #
 # Query-based re-ranking (optional):
 #    When a user searches for a topic (e.g., "coding"), we want to show
@@ -48,14 +53,22 @@ router = APIRouter()
 #    3. Feedbacks about "coding" contribute more to the final ranking
 #    4. Feedbacks about unrelated topics (e.g., "cooking") contribute less
 #    This gives topic-specific leaderboards without needing separate data.
+#    Only these replay all feedback, with the tag embeddings cached.
 
 import os
+import threading
+from collections import OrderedDict
 
 EMBEDDING_MODEL_NAME = os.environ.get(
     "AUXILIARY_EMBEDDING_MODEL", "TaylorAI/bge-micro-v2"
 )
 _embedding_model = None
 
+# Embeddings of tags (and queries) by text, tags rarely change
+TAG_EMBEDDING_CACHE_SIZE = 10000
+_tag_embeddings = OrderedDict()
+_tag_embeddings_lock = threading.Lock()
+
 
 def _get_embedding_model():
     global _embedding_model
@@ -69,9 +82,32 @@ def _get_embedding_model():
     return _embedding_model
 
 
-def _calculate_elo(
-    feedbacks: list[LeaderboardFeedbackData], similarities: dict = None
-) -> dict:
+def _get_embeddings(embedding_model, texts: list[str]):
+    """Embeddings of `texts` as one matrix, only encoding the uncached ones."""
+    import numpy as np
+
+    with _tag_embeddings_lock:
+        embeddings = {}
+        for text in texts:
+            if text in _tag_embeddings:
+                _tag_embeddings.move_to_end(text)
+                embeddings[text] = _tag_embeddings[text]
+
+    missing = [text for text in texts if text not in embeddings]
+    if missing:
+        for text, embedding in zip(missing, embedding_model.encode(missing)):
+            embeddings[text] = np.asarray(embedding)
+
+        with _tag_embeddings_lock:
+            for text in missing:
+                _tag_embeddings[text] = embeddings[text]
+            while len(_tag_embeddings) > TAG_EMBEDDING_CACHE_SIZE:
+                _tag_embeddings.popitem(last=False)
+
+    return np.stack([embeddings[text] for text in texts])
+
+
+def _calculate_elo(feedbacks: list[LeaderboardFeedbackData], weights=None) -> dict:
     """
     Calculate Elo ratings for models based on user feedback.
 
@@ -81,79 +117,42 @@ def _calculate_elo(
 
     The Elo system adjusts ratings based on:
     - Current rating difference (upsets cause bigger swings)
-    - Optional similarity weights (for query-based filtering)
+    - Optional per-feedback weights (for query-based filtering)
 
     Returns: {model_id: {"rating": float, "won": int, "lost": int}}
     """
-    K_FACTOR = 32  # Standard Elo K-factor for rating volatility
     model_stats = {}
 
-    def get_or_create_stats(model_id):
-        if model_id not in model_stats:
-            model_stats[model_id] = {"rating": 1000.0, "won": 0, "lost": 0}
-        return model_stats[model_id]
-
-    for feedback in feedbacks:
-        data = feedback.data or {}
-        winner_id = data.get("model_id")
-        rating_value = str(data.get("rating", ""))
-        if not winner_id or rating_value not in ("1", "-1"):
-            continue
-
-        won = rating_value == "1"
-        weight = similarities.get(feedback.id, 1.0) if similarities else 1.0
-
-        for opponent_id in data.get("sibling_model_ids") or []:
-            winner = get_or_create_stats(winner_id)
-            opponent = get_or_create_stats(opponent_id)
-            expected = 1 / (1 + 10 ** ((opponent["rating"] - winner["rating"]) / 400))
-
-            winner["rating"] += K_FACTOR * ((1 if won else 0) - expected) * weight
-            opponent["rating"] += (
-                K_FACTOR * ((0 if won else 1) - (1 - expected)) * weight
-            )
-
-            if won:
-                winner["won"] += 1
-                opponent["lost"] += 1
-            else:
-                winner["lost"] += 1
-                opponent["won"] += 1
+    for index, feedback in enumerate(feedbacks):
+        weight = float(weights[index]) if weights is not None else 1.0
+        for model_id, opponent_id, won in get_feedback_matches(feedback.data):
+            apply_elo_match(model_stats, model_id, opponent_id, won, weight)
 
     return model_stats
 
 
-def _get_top_tags(feedbacks: list[LeaderboardFeedbackData], limit: int = 5) -> dict:
+def _get_top_tags(ratings: list[ModelRatingModel], limit: int = 5) -> dict:
     """
-    Count tag occurrences per model and return the most frequent ones.
+    Return the most frequent tags of each model.
 
-    Each feedback can have tags describing the conversation topic.
-    This aggregates those tags per model to show what topics each model
+    Each feedback can have tags describing the conversation topic, counted
+    per model as the feedback comes in. This shows what topics each model
     is commonly used for.
 
     Returns: {model_id: [{"tag": str, "count": int}, ...]}
     """
-    from collections import defaultdict
-
-    tag_counts = defaultdict(lambda: defaultdict(int))
-
-    for feedback in feedbacks:
-        data = feedback.data or {}
-        model_id = data.get("model_id")
-        if model_id:
-            for tag in data.get("tags", []):
-                tag_counts[model_id][tag] += 1
-
     return {
-        model_id: [
+        rating.model_id: [
             {"tag": tag, "count": count}
-            for tag, count in sorted(tags.items(), key=lambda x: -x[1])[:limit]
+            for tag, count in sorted((rating.tags or {}).items(), key=lambda x: -x[1])[
+                :limit
+            ]
         ]
-        for model_id, tags in tag_counts.items()
+        for rating in ratings
     }
 
 
-def _compute_similarities(feedbacks: list[LeaderboardFeedbackData], query: str) -> dict:
+def _compute_similarities(feedbacks: list[LeaderboardFeedbackData], query: str):
     """
     Compute how relevant each feedback is to a search query.
 
@@ -164,31 +163,31 @@ def _compute_similarities(feedbacks: list[LeaderboardFeedbackData], query: str)
     This is used to weight Elo calculations - feedbacks matching the
     query have more influence on the final rankings.
 
-    Returns: {feedback_id: similarity_score (0-1)}
+    Returns: array of the similarity of each feedback (its best matching
+    tag, 0 without tags), or None if there is nothing to compare.
     """
     import numpy as np
 
     embedding_model = _get_embedding_model()
     if not embedding_model:
-        return {}
-
-    all_tags = list(
-        {
-            tag
-            for feedback in feedbacks
-            if feedback.data
-            for tag in feedback.data.get("tags", [])
-        }
-    )
-    if not all_tags:
-        return {}
+        return None
+
+    tag_indexes = {}
+    feedback_indexes = []
+    tag_positions = []
+    for index, feedback in enumerate(feedbacks):
+        for tag in (feedback.data or {}).get("tags", []):
+            feedback_indexes.append(index)
+            tag_positions.append(tag_indexes.setdefault(tag, len(tag_indexes)))
+    if not tag_indexes:
+        return None
 
     try:
-        tag_embeddings = embedding_model.encode(all_tags)
-        query_embedding = embedding_model.encode([query])[0]
+        tag_embeddings = _get_embeddings(embedding_model, list(tag_indexes))
+        query_embedding = _get_embeddings(embedding_model, [query])[0]
     except Exception as e:
         log.error(f"Embedding error: {e}")
-        return {}
+        return None
 
     # Vectorized cosine similarity
     tag_norms = np.linalg.norm(tag_embeddings, axis=1)
@@ -196,18 +195,12 @@ def _compute_similarities(feedbacks: list[LeaderboardFeedbackData], query: str)
     similarities = np.dot(tag_embeddings, query_embedding) / (
         tag_norms * query_norm + 1e-9
     )
-    tag_similarity_map = dict(zip(all_tags, similarities.tolist()))
 
-    return {
-        feedback.id: max(
-            (
-                tag_similarity_map.get(tag, 0)
-                for tag in (feedback.data or {}).get("tags", [])
-            ),
-            default=0,
-        )
-        for feedback in feedbacks
-    }
+    # Best matching tag of each feedback
+    weights = np.full(len(feedbacks), -np.inf)
+    np.maximum.at(weights, feedback_indexes, similarities[tag_positions])
+    weights[np.isinf(weights)] = 0
+    return weights
 
 
 class LeaderboardEntry(BaseModel):
@@ -230,16 +223,25 @@ async def get_leaderboard(
     db: Session = Depends(get_session),
 ):
     """Get model leaderboard with Elo ratings. Query filters by tag similarity."""
-    feedbacks = Feedbacks.get_feedbacks_for_leaderboard(db=db)
+    ratings = Feedbacks.get_model_ratings(db=db)
+    tags_by_model = _get_top_tags(ratings)
+    elo_stats = {
+        rating.model_id: {
+            "rating": rating.rating,
+            "won": rating.won,
+            "lost": rating.lost,
+        }
+        for rating in ratings
+        if rating.won + rating.lost
+    }
 
-    similarities = None
     if query and query.strip():
-        similarities = await run_in_threadpool(
+        feedbacks = Feedbacks.get_feedbacks_for_leaderboard(db=db)
+        weights = await run_in_threadpool(
             _compute_similarities, feedbacks, query.strip()
         )
-
-    elo_stats = _calculate_elo(feedbacks, similarities)
-    tags_by_model = _get_top_tags(feedbacks)
+        if weights is not None:
+            elo_stats = _calculate_elo(feedbacks, weights)
 
     entries = sorted(
         [
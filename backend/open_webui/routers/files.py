@@ -15,6 +15,7 @@ from fastapi import (
     Form,
     HTTPException,
     Request,
+    Response,
     UploadFile,
     status,
     Query,
@@ -50,6 +51,11 @@ from open_webui.storage.provider import Storage
 from open_webui.config import BYPASS_ADMIN_ACCESS_CONTROL
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.misc import strict_match_mime_type
+from open_webui.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    get_next_cursor,
+    set_next_cursor,
+)
 from pydantic import BaseModel
 
 log = logging.getLogger(__name__)
@@ -352,6 +358,7 @@ async def list_files(
 
 @router.get("/search", response_model=list[FileModelResponse])
 async def search_files(
+    response: Response,
     filename: str = Query(
         ...,
         description="Filename pattern to search for. Supports wildcards such as '*.txt'",
@@ -361,6 +368,10 @@ async def search_files(
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of files to return"
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description=f"Continue after the previous page, from its {NEXT_CURSOR_HEADER} header",
+    ),
     user=Depends(get_verified_user),
     db: Session = Depends(get_session),
 ):
@@ -374,13 +385,17 @@ async def search_files(
     )
 
     # Use optimized database query with pagination
-    files = Files.search_files(
-        user_id=user_id,
-        filename=filename,
-        skip=skip,
-        limit=limit,
-        db=db,
-    )
+    try:
+        files = Files.search_files(
+            user_id=user_id,
+            filename=filename,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            db=db,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     if not files:
         raise HTTPException(
@@ -393,6 +408,7 @@ async def search_files(
             if file.data and "content" in file.data:
                 del file.data["content"]
 
+    set_next_cursor(response, get_next_cursor(files, limit, "updated_at", "id"))
     return files
 
 
@@ -18,13 +18,17 @@ from open_webui.models.functions import (
 from open_webui.utils.plugin import (
     load_function_module_by_id,
     replace_imports,
+    get_function_cache,
     get_function_module_from_cache,
+    invalidate_function_cache,
+    invalidate_function_valves,
     resolve_valves_schema_options,
 )
 from open_webui.config import CACHE_DIR
 from open_webui.constants import ERROR_MESSAGES
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
 from pydantic import BaseModel, HttpUrl
 from open_webui.internal.db import get_session
 from sqlalchemy.orm import Session
@@ -180,7 +184,12 @@ async def sync_functions(
                     )
                     raise e
 
-        return Functions.sync_functions(user.id, form_data.functions, db=db)
+        functions = Functions.sync_functions(user.id, form_data.functions, db=db)
+        for function in form_data.functions:
+            invalidate_function_cache(request.app.state, function.id)
+            CACHE_INVALIDATOR.publish("functions", function.id)
+        CACHE_INVALIDATOR.publish("models")
+        return functions
     except Exception as e:
         log.exception(f"Failed to load a function: {e}")
         raise HTTPException(
@@ -235,6 +244,7 @@ async def create_new_function(
                 )
 
             if function:
+                CACHE_INVALIDATOR.publish("models")
                 return function
             else:
                 raise HTTPException(
@@ -290,6 +300,7 @@ async def toggle_function_by_id(
         )
 
         if function:
+            CACHE_INVALIDATOR.publish("models")
             return function
         else:
             raise HTTPException(
@@ -319,6 +330,7 @@ async def toggle_global_by_id(
         )
 
         if function:
+            CACHE_INVALIDATOR.publish("models")
             return function
         else:
             raise HTTPException(
@@ -364,6 +376,12 @@ async def update_function_by_id(
             Functions.update_function_metadata_by_id(id, {"toggle": True}, db=db)
 
         if function:
+            # The module loaded above is the current version
+            get_function_cache(request.app.state).set(
+                id, function.updated_at, form_data.content
+            )
+            CACHE_INVALIDATOR.publish("functions", id)
+            CACHE_INVALIDATOR.publish("models")
             return function
         else:
             raise HTTPException(
@@ -393,9 +411,9 @@ async def delete_function_by_id(
     result = Functions.delete_function_by_id(id, db=db)
 
     if result:
-        FUNCTIONS = request.app.state.FUNCTIONS
-        if id in FUNCTIONS:
-            del FUNCTIONS[id]
+        invalidate_function_cache(request.app.state, id)
+        CACHE_INVALIDATOR.publish("functions", id)
+        CACHE_INVALIDATOR.publish("models")
 
     return result
 
@@ -486,6 +504,8 @@ async def update_function_valves_by_id(
 
                 valves_dict = valves.model_dump(exclude_unset=True)
                 Functions.update_function_valves_by_id(id, valves_dict, db=db)
+                invalidate_function_valves(request.app.state, id)
+                CACHE_INVALIDATOR.publish("function_valves", id)
                 return valves_dict
             except Exception as e:
                 log.exception(f"Error updating function values by id {id}: {e}")
@@ -28,6 +28,7 @@ from open_webui.routers.files import upload_file_handler, get_file_content_by_id
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_permission
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.image_cache import IMAGE_CACHE
 from open_webui.internal.db import get_session
 from sqlalchemy.orm import Session
 from open_webui.utils.images.comfyui import (
@@ -380,6 +381,12 @@ async def verify_url(request: Request, user=Depends(get_admin_user)):
         return True
 
 
+@router.get("/cache/metrics")
+async def get_cache_metrics(request: Request, user=Depends(get_admin_user)):
+    # Encoded chat images sent to models, see utils/image_cache.py
+    return IMAGE_CACHE.get_metrics()
+
+
 @router.get("/models")
 def get_models(request: Request, user=Depends(get_verified_user)):
     try:
@@ -102,11 +102,13 @@ class KnowledgeAccessResponse(KnowledgeUserResponse):
 class KnowledgeAccessListResponse(BaseModel):
     items: list[KnowledgeAccessResponse]
     total: int
+    next_cursor: Optional[str] = None
 
 
 @router.get("/", response_model=KnowledgeAccessListResponse)
 async def get_knowledge_bases(
     page: Optional[int] = 1,
+    cursor: Optional[str] = None,
     user=Depends(get_verified_user),
     db: Session = Depends(get_session),
 ):
@@ -124,9 +126,12 @@ async def get_knowledge_bases(
 
         filter["user_id"] = user.id
 
-    result = Knowledges.search_knowledge_bases(
-        user.id, filter=filter, skip=skip, limit=limit, db=db
-    )
+    try:
+        result = Knowledges.search_knowledge_bases(
+            user.id, filter=filter, skip=skip, limit=limit, cursor=cursor, db=db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     # Batch-fetch writable knowledge IDs in a single query instead of N has_access calls
     knowledge_base_ids = [knowledge_base.id for knowledge_base in result.items]
@@ -152,6 +157,7 @@ async def get_knowledge_bases(
             for knowledge_base in result.items
         ],
         total=result.total,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -160,6 +166,7 @@ async def search_knowledge_bases(
     query: Optional[str] = None,
     view_option: Optional[str] = None,
     page: Optional[int] = 1,
+    cursor: Optional[str] = None,
     user=Depends(get_verified_user),
     db: Session = Depends(get_session),
 ):
@@ -182,9 +189,12 @@ async def search_knowledge_bases(
 
         filter["user_id"] = user.id
 
-    result = Knowledges.search_knowledge_bases(
-        user.id, filter=filter, skip=skip, limit=limit, db=db
-    )
+    try:
+        result = Knowledges.search_knowledge_bases(
+            user.id, filter=filter, skip=skip, limit=limit, cursor=cursor, db=db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     # Batch-fetch writable knowledge IDs in a single query instead of N has_access calls
     knowledge_base_ids = [knowledge_base.id for knowledge_base in result.items]
@@ -210,6 +220,7 @@ async def search_knowledge_bases(
             for knowledge_base in result.items
         ],
         total=result.total,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -309,48 +320,60 @@ async def reindex_knowledge_files(
 
     log.info(f"Starting reindexing for {len(knowledge_bases)} knowledge bases")
 
-    for knowledge_base in knowledge_bases:
-        try:
-            files = Knowledges.get_files_by_id(knowledge_base.id, db=db)
+    await run_in_threadpool(VECTOR_DB_CLIENT.start_bulk_load)
+    try:
+        for knowledge_base in knowledge_bases:
             try:
-                if VECTOR_DB_CLIENT.has_collection(collection_name=knowledge_base.id):
-                    VECTOR_DB_CLIENT.delete_collection(
-                        collection_name=knowledge_base.id
-                    )
-            except Exception as e:
-                log.error(f"Error deleting collection {knowledge_base.id}: {str(e)}")
-                continue  # Skip, don't raise
-
-            failed_files = []
-            for file in files:
+                files = Knowledges.get_files_by_id(knowledge_base.id, db=db)
                 try:
-                    await run_in_threadpool(
-                        process_file,
-                        request,
-                        ProcessFileForm(
-                            file_id=file.id, collection_name=knowledge_base.id
-                        ),
-                        user=user,
-                        db=db,
-                    )
+                    if VECTOR_DB_CLIENT.has_collection(
+                        collection_name=knowledge_base.id
+                    ):
+                        VECTOR_DB_CLIENT.delete_collection(
+                            collection_name=knowledge_base.id
+                        )
                 except Exception as e:
                     log.error(
-                        f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
+                        f"Error deleting collection {knowledge_base.id}: {str(e)}"
                     )
-                    failed_files.append({"file_id": file.id, "error": str(e)})
-                    continue
+                    continue  # Skip, don't raise
+
+                failed_files = []
+                for file in files:
+                    try:
+                        await run_in_threadpool(
+                            process_file,
+                            request,
+                            ProcessFileForm(
+                                file_id=file.id, collection_name=knowledge_base.id
+                            ),
+                            user=user,
+                            db=db,
+                        )
+                    except Exception as e:
+                        log.error(
+                            f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
+                        )
+                        failed_files.append({"file_id": file.id, "error": str(e)})
+                        continue
 
-        except Exception as e:
-            log.error(f"Error processing knowledge base {knowledge_base.id}: {str(e)}")
-            # Don't raise, just continue
-            continue
+            except Exception as e:
+                log.error(
+                    f"Error processing knowledge base {knowledge_base.id}: {str(e)}"
+                )
+                # Don't raise, just continue
+                continue
 
-        if failed_files:
-            log.warning(
-                f"Failed to process {len(failed_files)} files in knowledge base {knowledge_base.id}"
-            )
-            for failed in failed_files:
-                log.warning(f"File ID: {failed['file_id']}, Error: {failed['error']}")
+            if failed_files:
+                log.warning(
+                    f"Failed to process {len(failed_files)} files in knowledge base {knowledge_base.id}"
+                )
+                for failed in failed_files:
+                    log.warning(
+                        f"File ID: {failed['file_id']}, Error: {failed['error']}"
+                    )
+    finally:
+        await run_in_threadpool(VECTOR_DB_CLIENT.finish_bulk_load)
 
     log.info(f"Reindexing completed.")
     return True
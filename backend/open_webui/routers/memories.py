@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
 import logging
-import asyncio
 from typing import Optional
 
 from open_webui.models.memories import Memories, MemoryModel
-from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.memory import MEMORY_STORE
 from open_webui.utils.auth import get_verified_user
 from open_webui.internal.db import get_session
 from sqlalchemy.orm import Session
@@ -85,23 +84,44 @@ async def add_memory(
 
     memory = Memories.insert_new_memory(user.id, form_data.content)
 
-    vector = await request.app.state.EMBEDDING_FUNCTION(memory.content, user=user)
-
-    VECTOR_DB_CLIENT.upsert(
-        collection_name=f"user-memory-{user.id}",
-        items=[
-            {
-                "id": memory.id,
-                "text": memory.content,
-                "vector": vector,
-                "metadata": {"created_at": memory.created_at},
-            }
-        ],
-    )
+    await MEMORY_STORE.upsert(request.app.state.EMBEDDING_FUNCTION, user, [memory])
 
     return memory
 
 
+class AddMemoriesForm(BaseModel):
+    contents: list[str]
+
+
+@router.post("/add/batch", response_model=list[MemoryModel])
+async def add_memories(
+    request: Request,
+    form_data: AddMemoriesForm,
+    user=Depends(get_verified_user),
+):
+    # NOTE: We intentionally do NOT use Depends(get_session) here, see add_memory.
+    if not request.app.state.config.ENABLE_MEMORIES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ERROR_MESSAGES.NOT_FOUND,
+        )
+
+    if not has_permission(
+        user.id, "features.memories", request.app.state.config.USER_PERMISSIONS
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
+        )
+
+    memories = Memories.insert_new_memories(user.id, form_data.contents)
+
+    # All the memories are embedded in one request
+    await MEMORY_STORE.upsert(request.app.state.EMBEDDING_FUNCTION, user, memories)
+
+    return memories
+
+
 ############################
 # QueryMemory
 ############################
@@ -136,17 +156,14 @@ async def query_memory(
             detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
         )
 
-    memories = Memories.get_memories_by_user_id(user.id)
-    if not memories:
-        raise HTTPException(status_code=404, detail="No memories found for user")
-
-    vector = await request.app.state.EMBEDDING_FUNCTION(form_data.content, user=user)
-
-    results = VECTOR_DB_CLIENT.search(
-        collection_name=f"user-memory-{user.id}",
-        vectors=[vector],
+    results = await MEMORY_STORE.search(
+        request.app.state.EMBEDDING_FUNCTION,
+        user,
+        form_data.content,
         limit=form_data.k,
     )
+    if results is None:
+        raise HTTPException(status_code=404, detail="No memories found for user")
 
     return results
 
@@ -162,10 +179,10 @@ async def reset_memory_from_vector_db(
     """Reset user's memory vector embeddings.
 
     CRITICAL: We intentionally do NOT use Depends(get_session) here.
-    This endpoint generates embeddings for ALL user memories in parallel using
-    asyncio.gather(). A user with 100 memories would trigger 100 embedding API
-    calls simultaneously. With a session held, this could block a connection
-    for MINUTES, completely exhausting the connection pool.
+    This endpoint generates embeddings for ALL user memories in one batched
+    call, which for a user with many memories can take a long time. With a
+    session held, this could block a connection for MINUTES, completely
+    exhausting the connection pool.
     """
     if not request.app.state.config.ENABLE_MEMORIES:
         raise HTTPException(
@@ -181,33 +198,10 @@ async def reset_memory_from_vector_db(
             detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
         )
 
-    VECTOR_DB_CLIENT.delete_collection(f"user-memory-{user.id}")
+    await MEMORY_STORE.delete_all(user.id)
 
     memories = Memories.get_memories_by_user_id(user.id)
-
-    # Generate vectors in parallel
-    vectors = await asyncio.gather(
-        *[
-            request.app.state.EMBEDDING_FUNCTION(memory.content, user=user)
-            for memory in memories
-        ]
-    )
-
-    VECTOR_DB_CLIENT.upsert(
-        collection_name=f"user-memory-{user.id}",
-        items=[
-            {
-                "id": memory.id,
-                "text": memory.content,
-                "vector": vectors[idx],
-                "metadata": {
-                    "created_at": memory.created_at,
-                    "updated_at": memory.updated_at,
-                },
-            }
-            for idx, memory in enumerate(memories)
-        ],
-    )
+    await MEMORY_STORE.upsert(request.app.state.EMBEDDING_FUNCTION, user, memories)
 
     return True
 
@@ -241,7 +235,7 @@ async def delete_memory_by_user_id(
 
     if result:
         try:
-            VECTOR_DB_CLIENT.delete_collection(f"user-memory-{user.id}")
+            await MEMORY_STORE.delete_all(user.id)
         except Exception as e:
             log.error(e)
         return True
@@ -286,22 +280,7 @@ async def update_memory_by_id(
         raise HTTPException(status_code=404, detail="Memory not found")
 
     if form_data.content is not None:
-        vector = await request.app.state.EMBEDDING_FUNCTION(memory.content, user=user)
-
-        VECTOR_DB_CLIENT.upsert(
-            collection_name=f"user-memory-{user.id}",
-            items=[
-                {
-                    "id": memory.id,
-                    "text": memory.content,
-                    "vector": vector,
-                    "metadata": {
-                        "created_at": memory.created_at,
-                        "updated_at": memory.updated_at,
-                    },
-                }
-            ],
-        )
+        await MEMORY_STORE.upsert(request.app.state.EMBEDDING_FUNCTION, user, [memory])
 
     return memory
 
@@ -335,9 +314,7 @@ async def delete_memory_by_id(
     result = Memories.delete_memory_by_id_and_user_id(memory_id, user.id, db=db)
 
     if result:
-        VECTOR_DB_CLIENT.delete(
-            collection_name=f"user-memory-{user.id}", ids=[memory_id]
-        )
+        await MEMORY_STORE.delete(user.id, [memory_id])
         return True
 
     return False
@@ -34,6 +34,7 @@ from fastapi.responses import FileResponse, StreamingResponse
 
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_permission, filter_allowed_access_grants
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
 from open_webui.config import BYPASS_ADMIN_ACCESS_CONTROL, STATIC_DIR
 from open_webui.internal.db import get_session
 from sqlalchemy.orm import Session
@@ -199,6 +200,7 @@ async def create_new_model(
     else:
         model = Models.insert_new_model(form_data, user.id, db=db)
         if model:
+            CACHE_INVALIDATOR.publish("models")
             return model
         else:
             raise HTTPException(
@@ -300,6 +302,7 @@ async def import_models(
                         Models.insert_new_model(
                             user_id=user.id, form_data=new_model, db=db
                         )
+            CACHE_INVALIDATOR.publish("models")
             return True
         else:
             raise HTTPException(status_code=400, detail="Invalid JSON format")
@@ -324,7 +327,9 @@ async def sync_models(
     user=Depends(get_admin_user),
     db: Session = Depends(get_session),
 ):
-    return Models.sync_models(user.id, form_data.models, db=db)
+    models = Models.sync_models(user.id, form_data.models, db=db)
+    CACHE_INVALIDATOR.publish("models")
+    return models
 
 
 ###########################
@@ -447,6 +452,7 @@ async def toggle_model_by_id(
             model = Models.toggle_model_by_id(id, db=db)
 
             if model:
+                CACHE_INVALIDATOR.publish("models")
                 return model
             else:
                 raise HTTPException(
@@ -502,6 +508,7 @@ async def update_model_by_id(
     model = Models.update_model_by_id(
         form_data.id, ModelForm(**form_data.model_dump()), db=db
     )
+    CACHE_INVALIDATOR.publish("models")
     return model
 
 
@@ -615,6 +622,7 @@ async def delete_model_by_id(
         )
 
     result = Models.delete_model_by_id(form_data.id, db=db)
+    CACHE_INVALIDATOR.publish("models")
     return result
 
 
@@ -623,4 +631,5 @@ async def delete_all_models(
     user=Depends(get_admin_user), db: Session = Depends(get_session)
 ):
     result = Models.delete_all_models(db=db)
+    CACHE_INVALIDATOR.publish("models")
     return result
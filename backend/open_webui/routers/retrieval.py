@@ -4,12 +4,14 @@ import mimetypes
 import os
 import shutil
 import asyncio
+import importlib
 
 import re
 import uuid
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Iterator, List, Optional, Sequence, Union
+from typing import Callable, Iterator, List, Optional, Sequence, Union
 
 from fastapi import (
     Depends,
@@ -48,37 +50,14 @@ from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
 
 # Document loaders
 from open_webui.retrieval.loaders.main import Loader
+from open_webui.retrieval.loaders.process_pool import DOCUMENT_PARSER_POOL
 from open_webui.retrieval.loaders.youtube import YoutubeLoader
 
-# Web search engines
+# Web search engines (providers are imported on first use in get_web_search_call)
 from open_webui.retrieval.web.main import SearchResult
 from open_webui.retrieval.web.utils import get_web_loader
-from open_webui.retrieval.web.ollama import search_ollama_cloud
-from open_webui.retrieval.web.perplexity_search import search_perplexity_search
-from open_webui.retrieval.web.brave import search_brave
-from open_webui.retrieval.web.kagi import search_kagi
-from open_webui.retrieval.web.mojeek import search_mojeek
-from open_webui.retrieval.web.bocha import search_bocha
-from open_webui.retrieval.web.duckduckgo import search_duckduckgo
-from open_webui.retrieval.web.google_pse import search_google_pse
-from open_webui.retrieval.web.jina_search import search_jina
-from open_webui.retrieval.web.searchapi import search_searchapi
-from open_webui.retrieval.web.serpapi import search_serpapi
-from open_webui.retrieval.web.searxng import search_searxng
-from open_webui.retrieval.web.yacy import search_yacy
-from open_webui.retrieval.web.serper import search_serper
-from open_webui.retrieval.web.serply import search_serply
-from open_webui.retrieval.web.serpstack import search_serpstack
-from open_webui.retrieval.web.tavily import search_tavily
-from open_webui.retrieval.web.bing import search_bing
-from open_webui.retrieval.web.azure import search_azure
-from open_webui.retrieval.web.exa import search_exa
-from open_webui.retrieval.web.perplexity import search_perplexity
-from open_webui.retrieval.web.sougou import search_sougou
-from open_webui.retrieval.web.firecrawl import search_firecrawl
-from open_webui.retrieval.web.external import search_external
-from open_webui.retrieval.web.yandex import search_yandex
-from open_webui.retrieval.web.ydc import search_youcom
+from open_webui.retrieval.web.cache import WEB_SEARCH_CACHE
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
 
 from open_webui.retrieval.utils import (
     get_content_from_url,
@@ -87,9 +66,10 @@ from open_webui.retrieval.utils import (
     get_model_path,
     query_collection,
     query_collection_with_hybrid_search,
-    query_doc,
+    aquery_doc,
     query_doc_with_hybrid_search,
 )
+from open_webui.retrieval.embedding_batcher import get_embedding_batcher_metrics
 from open_webui.retrieval.vector.utils import filter_metadata
 from open_webui.utils.misc import (
     calculate_sha256_string,
@@ -100,6 +80,7 @@ from open_webui.utils.access_control import has_permission
 
 from open_webui.config import (
     ENV,
+    MEMORY_COLLECTION_NAME,
     RAG_EMBEDDING_MODEL_AUTO_UPDATE,
     RAG_EMBEDDING_MODEL_TRUST_REMOTE_CODE,
     RAG_RERANKING_MODEL_AUTO_UPDATE,
@@ -108,6 +89,7 @@ from open_webui.config import (
     DEFAULT_LOCALE,
     RAG_EMBEDDING_CONTENT_PREFIX,
     RAG_EMBEDDING_QUERY_PREFIX,
+    ENABLE_RAG_EMBEDDING_MICRO_BATCHING,
 )
 from open_webui.env import (
     DEVICE_TYPE,
@@ -301,6 +283,19 @@ async def get_embedding_config(request: Request, user=Depends(get_admin_user)):
     }
 
 
+@router.get("/embedding/metrics")
+async def get_embedding_metrics(request: Request, user=Depends(get_admin_user)):
+    return {
+        "ENABLE_RAG_EMBEDDING_MICRO_BATCHING": ENABLE_RAG_EMBEDDING_MICRO_BATCHING,
+        "batcher": get_embedding_batcher_metrics(),
+    }
+
+
+@router.get("/loader/metrics")
+async def get_loader_metrics(request: Request, user=Depends(get_admin_user)):
+    return DOCUMENT_PARSER_POOL.get_metrics()
+
+
 class OpenAIConfigForm(BaseModel):
     url: str
     key: str
@@ -431,6 +426,7 @@ async def update_embedding_config(
             ),
             enable_async=request.app.state.config.ENABLE_ASYNC_EMBEDDING,
             concurrent_requests=request.app.state.config.RAG_EMBEDDING_CONCURRENT_REQUESTS,
+            enable_micro_batching=ENABLE_RAG_EMBEDDING_MICRO_BATCHING,
         )
 
         return {
@@ -1094,6 +1090,11 @@ async def update_rag_config(
     )
 
     if form_data.web is not None:
+        # Results of the previous engine settings must not be served anymore,
+        # by this worker or any other
+        WEB_SEARCH_CACHE.clear()
+        CACHE_INVALIDATOR.publish("web_search")
+
         # Web search settings
         request.app.state.config.ENABLE_WEB_SEARCH = form_data.web.ENABLE_WEB_SEARCH
         request.app.state.config.WEB_SEARCH_ENGINE = form_data.web.WEB_SEARCH_ENGINE
@@ -2005,10 +2006,154 @@ async def process_web(
         )
 
 
+# Engines that forward the user to the search backend, their results are cached per user
+USER_SCOPED_WEB_SEARCH_ENGINES = {"perplexity_search", "external", "yandex"}
+
+
+def get_web_search_cache_key(
+    request: Request, engine: str, call: partial, user=None
+) -> str:
+    """
+    The key of the results of `call`, which covers the configuration bound to
+    it (engine URL, API key, result count, domain filters, ...) so results of
+    other settings are never served.
+    """
+    return WEB_SEARCH_CACHE.get_key(
+        engine,
+        [arg for arg in call.args if not is_web_search_caller(arg, request, user)],
+        {
+            name: value
+            for name, value in call.keywords.items()
+            if not is_web_search_caller(value, request, user)
+        },
+        (
+            getattr(user, "id", None)
+            if engine in USER_SCOPED_WEB_SEARCH_ENGINES
+            else None
+        ),
+    )
+
+
+def is_web_search_caller(value, request: Request, user=None) -> bool:
+    return value is request or (user is not None and value is user)
+
+
+def is_cacheable_web_search_results(results) -> bool:
+    return bool(results) and all(isinstance(result, SearchResult) for result in results)
+
+
+def cache_web_search_results(cache_key: str, results):
+    if is_cacheable_web_search_results(results):
+        WEB_SEARCH_CACHE.set(cache_key, [result.model_dump() for result in results])
+
+
+async def acache_web_search_results(cache_key: str, results):
+    if is_cacheable_web_search_results(results):
+        await WEB_SEARCH_CACHE.aset(
+            cache_key, [result.model_dump() for result in results]
+        )
+
+
 def search_web(
     request: Request, engine: str, query: str, user=None
 ) -> list[SearchResult]:
-    """Search the web using a search engine and return the results as a list of SearchResult objects.
+    """
+    Search the web with `engine`, serving repeated searches from WEB_SEARCH_CACHE
+    so they don't use provider quota again. See search_web_engine.
+    """
+    call = get_web_search_call(request, engine, query, user)
+    cache_key = get_web_search_cache_key(request, engine, call, user)
+
+    cached = WEB_SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        log.debug(f"Serving cached {engine} results for {query}")
+        return [SearchResult(**item) for item in cached]
+
+    results = call()
+    cache_web_search_results(cache_key, results)
+    return results
+
+
+async def asearch_web(
+    request: Request, engine: str, query: str, user=None
+) -> list[SearchResult]:
+    """Async version of search_web, see asearch_web_engine."""
+    call = get_web_search_call(request, engine, query, user)
+    cache_key = get_web_search_cache_key(request, engine, call, user)
+
+    cached = await WEB_SEARCH_CACHE.aget(cache_key)
+    if cached is not None:
+        log.debug(f"Serving cached {engine} results for {query}")
+        return [SearchResult(**item) for item in cached]
+
+    results = await arun_web_search_call(engine, call)
+    await acache_web_search_results(cache_key, results)
+    return results
+
+
+def search_web_engine(
+    request: Request, engine: str, query: str, user=None
+) -> list[SearchResult]:
+    """Search the web using a search engine and return the results as a list of SearchResult objects."""
+    return get_web_search_call(request, engine, query, user)()
+
+
+# Async variants of the engines' search functions, called with the arguments
+# get_web_search_call binds for the sync ones. Like those, they are imported on
+# first use.
+ASYNC_WEB_SEARCH_ENGINES = {
+    "searxng": "searxng",
+    "google_pse": "google_pse",
+    "brave": "brave",
+    "kagi": "kagi",
+    "mojeek": "mojeek",
+    "bocha": "bocha",
+    "serpstack": "serpstack",
+    "serper": "serper",
+    "serply": "serply",
+    "tavily": "tavily",
+    "searchapi": "searchapi",
+    "serpapi": "serpapi",
+    "youcom": "ydc",
+}
+
+
+def get_async_web_search(engine: str) -> Optional[Callable]:
+    """The async search function of `engine`, None if it only has a sync one."""
+    module = ASYNC_WEB_SEARCH_ENGINES.get(engine)
+    if module is None:
+        return None
+    return getattr(
+        importlib.import_module(f"open_webui.retrieval.web.{module}"),
+        f"asearch_{engine}",
+    )
+
+
+async def asearch_web_engine(
+    request: Request, engine: str, query: str, user=None
+) -> list[SearchResult]:
+    """
+    Search the web on the event loop with the engine's async search function
+    (see ASYNC_WEB_SEARCH_ENGINES), sharing the pooled WEB_SEARCH_CLIENT; other
+    engines are searched in the thread pool.
+    """
+    return await arun_web_search_call(
+        engine, get_web_search_call(request, engine, query, user)
+    )
+
+
+async def arun_web_search_call(engine: str, call: partial) -> list[SearchResult]:
+    """Runs a call of get_web_search_call, with the engine's async function if it has one."""
+    async_search = get_async_web_search(engine)
+    if async_search is None:
+        return await run_in_threadpool(call)
+    return await async_search(*call.args, **call.keywords)
+
+
+def get_web_search_call(
+    request: Request, engine: str, query: str, user=None
+) -> partial:
+    """Returns the call searching the web with `engine`, bound to its configured arguments.
     Will look for a search engine API key in environment variables in the following order:
     - SEARXNG_QUERY_URL
     - YACY_QUERY_URL + YACY_USERNAME + YACY_PASSWORD
@@ -2032,7 +2177,10 @@ def search_web(
 
     # TODO: add playwright to search the web
     if engine == "ollama_cloud":
-        return search_ollama_cloud(
+        from open_webui.retrieval.web.ollama import search_ollama_cloud
+
+        return partial(
+            search_ollama_cloud,
             "https://ollama.com",
             request.app.state.config.OLLAMA_CLOUD_WEB_SEARCH_API_KEY,
             query,
@@ -2041,7 +2189,12 @@ def search_web(
         )
     elif engine == "perplexity_search":
         if request.app.state.config.PERPLEXITY_API_KEY:
-            return search_perplexity_search(
+            from open_webui.retrieval.web.perplexity_search import (
+                search_perplexity_search,
+            )
+
+            return partial(
+                search_perplexity_search,
                 request.app.state.config.PERPLEXITY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2054,7 +2207,10 @@ def search_web(
     elif engine == "searxng":
         if request.app.state.config.SEARXNG_QUERY_URL:
             searxng_kwargs = {"language": request.app.state.config.SEARXNG_LANGUAGE}
-            return search_searxng(
+            from open_webui.retrieval.web.searxng import search_searxng
+
+            return partial(
+                search_searxng,
                 request.app.state.config.SEARXNG_QUERY_URL,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2065,7 +2221,10 @@ def search_web(
             raise Exception("No SEARXNG_QUERY_URL found in environment variables")
     elif engine == "yacy":
         if request.app.state.config.YACY_QUERY_URL:
-            return search_yacy(
+            from open_webui.retrieval.web.yacy import search_yacy
+
+            return partial(
+                search_yacy,
                 request.app.state.config.YACY_QUERY_URL,
                 request.app.state.config.YACY_USERNAME,
                 request.app.state.config.YACY_PASSWORD,
@@ -2080,7 +2239,10 @@ def search_web(
             request.app.state.config.GOOGLE_PSE_API_KEY
             and request.app.state.config.GOOGLE_PSE_ENGINE_ID
         ):
-            return search_google_pse(
+            from open_webui.retrieval.web.google_pse import search_google_pse
+
+            return partial(
+                search_google_pse,
                 request.app.state.config.GOOGLE_PSE_API_KEY,
                 request.app.state.config.GOOGLE_PSE_ENGINE_ID,
                 query,
@@ -2094,7 +2256,10 @@ def search_web(
             )
     elif engine == "brave":
         if request.app.state.config.BRAVE_SEARCH_API_KEY:
-            return search_brave(
+            from open_webui.retrieval.web.brave import search_brave
+
+            return partial(
+                search_brave,
                 request.app.state.config.BRAVE_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2104,7 +2269,10 @@ def search_web(
             raise Exception("No BRAVE_SEARCH_API_KEY found in environment variables")
     elif engine == "kagi":
         if request.app.state.config.KAGI_SEARCH_API_KEY:
-            return search_kagi(
+            from open_webui.retrieval.web.kagi import search_kagi
+
+            return partial(
+                search_kagi,
                 request.app.state.config.KAGI_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2114,7 +2282,10 @@ def search_web(
             raise Exception("No KAGI_SEARCH_API_KEY found in environment variables")
     elif engine == "mojeek":
         if request.app.state.config.MOJEEK_SEARCH_API_KEY:
-            return search_mojeek(
+            from open_webui.retrieval.web.mojeek import search_mojeek
+
+            return partial(
+                search_mojeek,
                 request.app.state.config.MOJEEK_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2124,7 +2295,10 @@ def search_web(
             raise Exception("No MOJEEK_SEARCH_API_KEY found in environment variables")
     elif engine == "bocha":
         if request.app.state.config.BOCHA_SEARCH_API_KEY:
-            return search_bocha(
+            from open_webui.retrieval.web.bocha import search_bocha
+
+            return partial(
+                search_bocha,
                 request.app.state.config.BOCHA_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2134,7 +2308,10 @@ def search_web(
             raise Exception("No BOCHA_SEARCH_API_KEY found in environment variables")
     elif engine == "serpstack":
         if request.app.state.config.SERPSTACK_API_KEY:
-            return search_serpstack(
+            from open_webui.retrieval.web.serpstack import search_serpstack
+
+            return partial(
+                search_serpstack,
                 request.app.state.config.SERPSTACK_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2145,7 +2322,10 @@ def search_web(
             raise Exception("No SERPSTACK_API_KEY found in environment variables")
     elif engine == "serper":
         if request.app.state.config.SERPER_API_KEY:
-            return search_serper(
+            from open_webui.retrieval.web.serper import search_serper
+
+            return partial(
+                search_serper,
                 request.app.state.config.SERPER_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2155,7 +2335,10 @@ def search_web(
             raise Exception("No SERPER_API_KEY found in environment variables")
     elif engine == "serply":
         if request.app.state.config.SERPLY_API_KEY:
-            return search_serply(
+            from open_webui.retrieval.web.serply import search_serply
+
+            return partial(
+                search_serply,
                 request.app.state.config.SERPLY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2164,7 +2347,10 @@ def search_web(
         else:
             raise Exception("No SERPLY_API_KEY found in environment variables")
     elif engine == "duckduckgo":
-        return search_duckduckgo(
+        from open_webui.retrieval.web.duckduckgo import search_duckduckgo
+
+        return partial(
+            search_duckduckgo,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
@@ -2173,7 +2359,10 @@ def search_web(
         )
     elif engine == "tavily":
         if request.app.state.config.TAVILY_API_KEY:
-            return search_tavily(
+            from open_webui.retrieval.web.tavily import search_tavily
+
+            return partial(
+                search_tavily,
                 request.app.state.config.TAVILY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2183,7 +2372,10 @@ def search_web(
             raise Exception("No TAVILY_API_KEY found in environment variables")
     elif engine == "exa":
         if request.app.state.config.EXA_API_KEY:
-            return search_exa(
+            from open_webui.retrieval.web.exa import search_exa
+
+            return partial(
+                search_exa,
                 request.app.state.config.EXA_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2193,7 +2385,10 @@ def search_web(
             raise Exception("No EXA_API_KEY found in environment variables")
     elif engine == "searchapi":
         if request.app.state.config.SEARCHAPI_API_KEY:
-            return search_searchapi(
+            from open_webui.retrieval.web.searchapi import search_searchapi
+
+            return partial(
+                search_searchapi,
                 request.app.state.config.SEARCHAPI_API_KEY,
                 request.app.state.config.SEARCHAPI_ENGINE,
                 query,
@@ -2204,7 +2399,10 @@ def search_web(
             raise Exception("No SEARCHAPI_API_KEY found in environment variables")
     elif engine == "serpapi":
         if request.app.state.config.SERPAPI_API_KEY:
-            return search_serpapi(
+            from open_webui.retrieval.web.serpapi import search_serpapi
+
+            return partial(
+                search_serpapi,
                 request.app.state.config.SERPAPI_API_KEY,
                 request.app.state.config.SERPAPI_ENGINE,
                 query,
@@ -2214,14 +2412,20 @@ def search_web(
         else:
             raise Exception("No SERPAPI_API_KEY found in environment variables")
     elif engine == "jina":
-        return search_jina(
+        from open_webui.retrieval.web.jina_search import search_jina
+
+        return partial(
+            search_jina,
             request.app.state.config.JINA_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
             request.app.state.config.JINA_API_BASE_URL,
         )
     elif engine == "bing":
-        return search_bing(
+        from open_webui.retrieval.web.bing import search_bing
+
+        return partial(
+            search_bing,
             request.app.state.config.BING_SEARCH_V7_SUBSCRIPTION_KEY,
             request.app.state.config.BING_SEARCH_V7_ENDPOINT,
             str(DEFAULT_LOCALE),
@@ -2235,7 +2439,10 @@ def search_web(
             and request.app.state.config.AZURE_AI_SEARCH_ENDPOINT
             and request.app.state.config.AZURE_AI_SEARCH_INDEX_NAME
         ):
-            return search_azure(
+            from open_webui.retrieval.web.azure import search_azure
+
+            return partial(
+                search_azure,
                 request.app.state.config.AZURE_AI_SEARCH_API_KEY,
                 request.app.state.config.AZURE_AI_SEARCH_ENDPOINT,
                 request.app.state.config.AZURE_AI_SEARCH_INDEX_NAME,
@@ -2248,14 +2455,20 @@ def search_web(
                 "AZURE_AI_SEARCH_API_KEY, AZURE_AI_SEARCH_ENDPOINT, and AZURE_AI_SEARCH_INDEX_NAME are required for Azure AI Search"
             )
     elif engine == "exa":
-        return search_exa(
+        from open_webui.retrieval.web.exa import search_exa
+
+        return partial(
+            search_exa,
             request.app.state.config.EXA_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
         )
     elif engine == "perplexity":
-        return search_perplexity(
+        from open_webui.retrieval.web.perplexity import search_perplexity
+
+        return partial(
+            search_perplexity,
             request.app.state.config.PERPLEXITY_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2268,7 +2481,10 @@ def search_web(
             request.app.state.config.SOUGOU_API_SID
             and request.app.state.config.SOUGOU_API_SK
         ):
-            return search_sougou(
+            from open_webui.retrieval.web.sougou import search_sougou
+
+            return partial(
+                search_sougou,
                 request.app.state.config.SOUGOU_API_SID,
                 request.app.state.config.SOUGOU_API_SK,
                 query,
@@ -2280,7 +2496,10 @@ def search_web(
                 "No SOUGOU_API_SID or SOUGOU_API_SK found in environment variables"
             )
     elif engine == "firecrawl":
-        return search_firecrawl(
+        from open_webui.retrieval.web.firecrawl import search_firecrawl
+
+        return partial(
+            search_firecrawl,
             request.app.state.config.FIRECRAWL_API_BASE_URL,
             request.app.state.config.FIRECRAWL_API_KEY,
             query,
@@ -2288,7 +2507,10 @@ def search_web(
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
         )
     elif engine == "external":
-        return search_external(
+        from open_webui.retrieval.web.external import search_external
+
+        return partial(
+            search_external,
             request,
             request.app.state.config.EXTERNAL_WEB_SEARCH_URL,
             request.app.state.config.EXTERNAL_WEB_SEARCH_API_KEY,
@@ -2298,7 +2520,10 @@ def search_web(
             user=user,
         )
     elif engine == "yandex":
-        return search_yandex(
+        from open_webui.retrieval.web.yandex import search_yandex
+
+        return partial(
+            search_yandex,
             request,
             request.app.state.config.YANDEX_WEB_SEARCH_URL,
             request.app.state.config.YANDEX_WEB_SEARCH_API_KEY,
@@ -2309,7 +2534,10 @@ def search_web(
             user=user,
         )
     elif engine == "youcom":
-        return search_youcom(
+        from open_webui.retrieval.web.ydc import search_youcom
+
+        return partial(
+            search_youcom,
             request.app.state.config.YOUCOM_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2356,8 +2584,7 @@ async def process_web_search(
 
             async def search_query_with_semaphore(query):
                 async with semaphore:
-                    return await run_in_threadpool(
-                        search_web,
+                    return await asearch_web(
                         request,
                         request.app.state.config.WEB_SEARCH_ENGINE,
                         query,
@@ -2370,8 +2597,7 @@ async def process_web_search(
         else:
             # Unlimited parallel execution (previous behavior)
             search_tasks = [
-                run_in_threadpool(
-                    search_web,
+                asearch_web(
                     request,
                     request.app.state.config.WEB_SEARCH_ENGINE,
                     query,
@@ -2494,14 +2720,17 @@ async def process_web_search(
 def _validate_collection_access(collection_names: list[str], user) -> None:
     """
     Prevent users from querying collections they don't own.
-    Enforces ownership on user-memory-* and file-* collections.
+    Enforces ownership on user-memory-* and file-* collections, and keeps the
+    shared memory collection for the memories API.
     Admins bypass this check.
     """
     if user.role == "admin":
         return
 
     for name in collection_names:
-        if name.startswith("user-memory-") and name != f"user-memory-{user.id}":
+        if (
+            name.startswith("user-memory-") and name != f"user-memory-{user.id}"
+        ) or name == MEMORY_COLLECTION_NAME:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
@@ -2541,7 +2770,7 @@ async def query_doc_handler(
             form_data.hybrid is None or form_data.hybrid
         ):
             collection_results = {}
-            collection_results[form_data.collection_name] = VECTOR_DB_CLIENT.get(
+            collection_results[form_data.collection_name] = await VECTOR_DB_CLIENT.aget(
                 collection_name=form_data.collection_name
             )
             return await query_doc_with_hybrid_search(
@@ -2558,7 +2787,7 @@ async def query_doc_handler(
                             query, documents, user=user
                         )
                     )
-                    if request.app.state.RERANKING_FUNCTION
+                    if request.app.state.RERANKING_FUNCTION is not None
                     else None
                 ),
                 k_reranker=form_data.k_reranker
@@ -2579,7 +2808,7 @@ async def query_doc_handler(
             query_embedding = await request.app.state.EMBEDDING_FUNCTION(
                 form_data.query, prefix=RAG_EMBEDDING_QUERY_PREFIX, user=user
             )
-            return query_doc(
+            return await aquery_doc(
                 collection_name=form_data.collection_name,
                 query_embedding=query_embedding,
                 k=form_data.k if form_data.k else request.app.state.config.TOP_K,
@@ -2629,7 +2858,7 @@ async def query_collection_handler(
                             query, documents, user=user
                         )
                     )
-                    if request.app.state.RERANKING_FUNCTION
+                    if request.app.state.RERANKING_FUNCTION is not None
                     else None
                 ),
                 k_reranker=form_data.k_reranker
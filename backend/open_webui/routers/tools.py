@@ -25,11 +25,15 @@ from open_webui.models.access_grants import AccessGrants
 from open_webui.utils.plugin import (
     load_tool_module_by_id,
     replace_imports,
+    get_tool_cache,
     get_tool_module_from_cache,
+    invalidate_tool_cache,
+    invalidate_tool_valves,
     resolve_valves_schema_options,
 )
 from open_webui.utils.tools import get_tool_specs
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
 from open_webui.utils.access_control import has_access, has_permission
 from open_webui.utils.tools import get_tool_servers
 
@@ -522,6 +526,11 @@ async def update_tools_by_id(
         tools = Tools.update_tool_by_id(id, updated, db=db)
 
         if tools:
+            # The module loaded above is the current version
+            get_tool_cache(request.app.state).set(
+                id, tools.updated_at, form_data.content
+            )
+            CACHE_INVALIDATOR.publish("tools", id)
             return tools
         else:
             raise HTTPException(
@@ -626,9 +635,8 @@ async def delete_tools_by_id(
 
     result = Tools.delete_tool_by_id(id, db=db)
     if result:
-        TOOLS = request.app.state.TOOLS
-        if id in TOOLS:
-            del TOOLS[id]
+        invalidate_tool_cache(request.app.state, id)
+        CACHE_INVALIDATOR.publish("tools", id)
 
     return result
 
@@ -747,6 +755,8 @@ async def update_tools_valves_by_id(
         valves = Valves(**form_data)
         valves_dict = valves.model_dump(exclude_unset=True)
         Tools.update_tool_valves_by_id(id, valves_dict, db=db)
+        invalidate_tool_valves(request.app.state, id)
+        CACHE_INVALIDATOR.publish("tool_valves", id)
         return valves_dict
     except Exception as e:
         log.exception(f"Failed to update tool valves by id {id}: {e}")
@@ -54,12 +54,24 @@ router = APIRouter()
 PAGE_ITEM_COUNT = 30
 
 
+def get_users_page(
+    filter: dict, skip: int, limit: int, cursor: Optional[str], db: Session
+) -> dict:
+    try:
+        return Users.get_users(
+            filter=filter, skip=skip, limit=limit, cursor=cursor, db=db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get("/", response_model=UserGroupIdsListResponse)
 async def get_users(
     query: Optional[str] = None,
     order_by: Optional[str] = None,
     direction: Optional[str] = None,
     page: Optional[int] = 1,
+    cursor: Optional[str] = None,
     user=Depends(get_admin_user),
     db: Session = Depends(get_session),
 ):
@@ -78,7 +90,7 @@ async def get_users(
 
     filter["direction"] = direction
 
-    result = Users.get_users(filter=filter, skip=skip, limit=limit, db=db)
+    result = get_users_page(filter, skip, limit, cursor, db)
 
     users = result["users"]
     total = result["total"]
@@ -98,6 +110,7 @@ async def get_users(
             for user in users
         ],
         "total": total,
+        "next_cursor": result["next_cursor"],
     }
 
 
@@ -115,6 +128,7 @@ async def search_users(
     order_by: Optional[str] = None,
     direction: Optional[str] = None,
     page: Optional[int] = 1,
+    cursor: Optional[str] = None,
     user=Depends(get_verified_user),
     db: Session = Depends(get_session),
 ):
@@ -131,7 +145,7 @@ async def search_users(
     if direction:
         filter["direction"] = direction
 
-    return Users.get_users(filter=filter, skip=skip, limit=limit, db=db)
+    return get_users_page(filter, skip, limit, cursor, db)
 
 
 ############################
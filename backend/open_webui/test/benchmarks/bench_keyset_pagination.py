@@ -0,0 +1,115 @@
+"""
+Pagination benchmark for the chat list.
+
+Generates a chat table (1M chats by default, most of them owned by a single
+user) in a separate SQLite or Postgres database and times the pages of
+`Chats.get_chat_title_id_list_by_user_id` at increasing depths, paged with
+OFFSET and with a cursor. OFFSET pages get slower with depth as the database
+counts past every skipped row, cursor pages stay flat.
+
+The database is taken from BENCH_DATABASE_URL and defaults to a SQLite file in
+the working directory. A database already holding the requested number of chats
+is reused, so the data is generated only once.
+
+Usage (from the `backend` directory):
+    python -m open_webui.test.benchmarks.bench_keyset_pagination [--chats N] [--limit N] [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+import open_webui.internal.db
+from open_webui.internal.db import Base
+from open_webui.models.chats import Chat, Chats
+from open_webui.utils.pagination import encode_cursor
+
+BATCH_SIZE = 10000
+USER_ID = "bench-user"
+
+
+def populate(engine, count: int):
+    Base.metadata.create_all(engine, tables=[Chat.__table__])
+    with engine.begin() as conn:
+        existing = conn.execute(select(func.count()).select_from(Chat)).scalar()
+        if existing >= count:
+            return
+        print(f"Generating {count - existing} chats")
+
+        now = int(time.time())
+        for start in range(existing, count, BATCH_SIZE):
+            conn.execute(
+                insert(Chat),
+                [
+                    {
+                        "id": f"chat-{index:09d}",
+                        # One heavy user, the others share the rest
+                        "user_id": USER_ID if index % 10 else f"user-{index % 1000}",
+                        "title": f"Chat {index}",
+                        "chat": {},
+                        "archived": False,
+                        "pinned": False,
+                        "meta": {},
+                        "created_at": now - index,
+                        # Several chats per second, so updated_at has ties
+                        "updated_at": now - index // 4,
+                    }
+                    for index in range(start, min(start + BATCH_SIZE, count))
+                ],
+            )
+
+
+def time_page(db, runs: int, **kwargs) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        Chats.get_chat_title_id_list_by_user_id(USER_ID, db=db, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main(chats: int, limit: int, runs: int):
+    url = os.environ.get("BENCH_DATABASE_URL", "sqlite:///bench_pagination.db")
+    engine = create_engine(url)
+    populate(engine, chats)
+
+    # Use the benchmark session in the table methods
+    open_webui.internal.db.DATABASE_ENABLE_SESSION_SHARING = True
+    db = sessionmaker(bind=engine)()
+
+    user_chats = db.execute(
+        select(func.count()).select_from(Chat).where(Chat.user_id == USER_ID)
+    ).scalar()
+    print(f"{engine.dialect.name}, {user_chats} chats of the user, pages of {limit}")
+    print(f"{'depth':>10} {'offset ms':>12} {'cursor ms':>12}")
+
+    depth = limit
+    while depth < user_chats:
+        # The row just before the page, as the previous page would have returned
+        last = db.execute(
+            select(Chat.updated_at, Chat.id)
+            .where(Chat.user_id == USER_ID, Chat.archived == False)
+            .order_by(Chat.updated_at.desc(), Chat.id.desc())
+            .offset(depth - 1)
+            .limit(1)
+        ).one()
+
+        offset_ms = time_page(db, runs, skip=depth, limit=limit)
+        cursor_ms = time_page(db, runs, cursor=encode_cursor(*last), limit=limit)
+        print(f"{depth:>10} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+        depth *= 10
+
+    db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chats", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=60)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.chats, args.limit, args.runs)
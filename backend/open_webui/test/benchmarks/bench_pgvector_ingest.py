@@ -0,0 +1,72 @@
+"""
+Ingest benchmark for the pgvector backend.
+
+Inserts and upserts the same synthetic chunks through the row-by-row ORM / per
+chunk statement path and through the binary COPY path (`bulk_ingest`), and
+reports chunks/sec for each. Requires a Postgres database with the vector
+extension, set through PGVECTOR_DB_URL (or DATABASE_URL). The benchmark
+collections are deleted afterwards.
+
+Usage (from the `backend` directory):
+    PGVECTOR_DB_URL=postgresql://... python -m open_webui.test.benchmarks.bench_pgvector_ingest [--chunks N] [--batch N]
+"""
+
+import argparse
+import random
+import time
+from uuid import uuid4
+
+from open_webui.retrieval.vector.dbs.pgvector import VECTOR_LENGTH, PgvectorClient
+
+
+def make_items(count: int) -> list[dict]:
+    return [
+        {
+            "id": str(uuid4()),
+            "text": f"chunk {idx} " + "lorem ipsum " * 60,
+            "vector": [random.random() for _ in range(VECTOR_LENGTH)],
+            "metadata": {"file_id": f"file-{idx // 100}", "start_index": idx},
+        }
+        for idx in range(count)
+    ]
+
+
+def run(client: PgvectorClient, label: str, items: list[dict], batch: int, copy: bool):
+    collection_name = f"bench-ingest-{uuid4().hex[:8]}"
+    client.copy_threshold = 1 if copy else 0
+
+    try:
+        results = {}
+        for method in ("insert", "upsert"):
+            start = time.perf_counter()
+            for offset in range(0, len(items), batch):
+                getattr(client, method)(collection_name, items[offset : offset + batch])
+            results[method] = len(items) / (time.perf_counter() - start)
+
+        print(
+            f"{label:<6} insert={results['insert']:10.0f} chunks/s  "
+            f"upsert={results['upsert']:10.0f} chunks/s"
+        )
+        return results
+    finally:
+        client.delete_collection(collection_name)
+
+
+def main(chunks: int, batch: int):
+    client = PgvectorClient()
+    items = make_items(chunks)
+    print(f"{chunks} chunks of dimension {VECTOR_LENGTH}, batches of {batch}")
+
+    rows = run(client, "rows", items, batch, copy=False)
+    copy = run(client, "copy", items, batch, copy=True)
+
+    for method in ("insert", "upsert"):
+        print(f"{method} speedup: {copy[method] / rows[method]:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.chunks, args.batch)
@@ -0,0 +1,166 @@
+"""
+Benchmark for the HTTP middleware stack.
+
+Compares the former `BaseHTTPMiddleware` based stack against the composed
+`RequestPipelineMiddleware` on a plain JSON endpoint (per-request overhead) and
+on a `/api/chat/completions`-style SSE stream (time-to-first-byte and total
+stream time). The ASGI app is driven directly, so no server or network is
+involved and the numbers reflect middleware cost only.
+
+Usage (from the `backend` directory):
+    python -m open_webui.test.benchmarks.bench_request_middleware [--requests N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from open_webui.utils.request_middleware import RequestPipelineMiddleware
+
+STREAM_CHUNKS = 64
+STREAM_CHUNK_DELAY = 0.0005
+
+
+async def models_endpoint(request):
+    return JSONResponse({"data": []})
+
+
+async def chat_completions_endpoint(request):
+    async def stream():
+        for i in range(STREAM_CHUNKS):
+            yield f'data: {{"choices":[{{"delta":{{"content":"{i}"}}}}]}}\n\n'
+            await asyncio.sleep(STREAM_CHUNK_DELAY)
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+def noop_commit():
+    pass
+
+
+class PassthroughMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def create_app(pipeline: bool) -> Starlette:
+    app = Starlette(
+        routes=[
+            Route("/api/models", models_endpoint),
+            Route("/api/chat/completions", chat_completions_endpoint, methods=["POST"]),
+        ]
+    )
+    app.state.config = SimpleNamespace(
+        ENABLE_API_KEYS=False,
+        ENABLE_API_KEYS_ENDPOINT_RESTRICTIONS=False,
+        API_KEYS_ALLOWED_ENDPOINTS="",
+    )
+
+    if pipeline:
+        app.add_middleware(RequestPipelineMiddleware, on_response_start=noop_commit)
+    else:
+        # Same layer count as the previous stack: three BaseHTTPMiddleware
+        # classes and three @app.middleware("http") functions.
+        for _ in range(6):
+            app.add_middleware(PassthroughMiddleware)
+
+    return app
+
+
+def make_scope(method: str, path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"authorization", b"Bearer benchmark-token"),
+            (b"content-type", b"application/json"),
+        ],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 8080),
+    }
+
+
+async def run_request(app, method: str, path: str) -> tuple[float, float]:
+    """Returns (time-to-first-byte, total time) in seconds for one request."""
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": b"{}", "more_body": False}
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    first_byte = None
+    start = time.perf_counter()
+
+    async def send(message):
+        nonlocal first_byte
+        if (
+            first_byte is None
+            and message["type"] == "http.response.body"
+            and message.get("body")
+        ):
+            first_byte = time.perf_counter()
+
+    await app(make_scope(method, path), receive, send)
+    end = time.perf_counter()
+    return (first_byte or end) - start, end - start
+
+
+def summarize(samples: list[float]) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples) * 1e6
+    p99 = samples[int(len(samples) * 0.99) - 1] * 1e6
+    return f"p50={p50:9.1f}us p99={p99:9.1f}us"
+
+
+async def bench(app, method: str, path: str, n: int):
+    # Warm up routing and lazy imports
+    for _ in range(10):
+        await run_request(app, method, path)
+
+    ttfb, total = [], []
+    for _ in range(n):
+        first, whole = await run_request(app, method, path)
+        ttfb.append(first)
+        total.append(whole)
+    return ttfb, total
+
+
+async def main(n: int):
+    for name, pipeline in (("BaseHTTPMiddleware x6", False), ("pipeline", True)):
+        app = create_app(pipeline)
+
+        _, total = await bench(app, "GET", "/api/models", n)
+        print(f"{name:<22} GET  /api/models            total {summarize(total)}")
+
+        ttfb, total = await bench(
+            app, "POST", "/api/chat/completions", max(n // 10, 10)
+        )
+        print(f"{name:<22} POST /api/chat/completions  ttfb  {summarize(ttfb)}")
+        print(f"{name:<22} POST /api/chat/completions  total {summarize(total)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,117 @@
+"""
+Startup benchmark based on `python -X importtime`.
+
+Imports `open_webui.main` in a fresh interpreter, once with the default eager
+startup and once with ENABLE_DEFERRED_STARTUP=true, and reports wall time, total
+import time, peak RSS and the packages with the highest import cost. Results can
+be appended to a JSON Lines file so startup cost can be tracked across commits.
+
+Usage (from the `backend` directory):
+    python -m open_webui.test.benchmarks.bench_startup [--runs N] [--top N] [--output startup.jsonl]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+
+IMPORTTIME_PATTERN = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$"
+)
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Returns (module, self_us, cumulative_us, depth) for each imported module."""
+    modules = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            depth = (len(indent) - 1) // 2
+            modules.append((module, int(self_us), int(cumulative_us), depth))
+    return modules
+
+
+# Imports the app, then prints the peak RSS of this process only (KB on Linux)
+IMPORT_SCRIPT = (
+    "import resource, open_webui.main; "
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+)
+
+
+def run_once(deferred: bool) -> dict:
+    env = {**os.environ, "ENABLE_DEFERRED_STARTUP": str(deferred).lower()}
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+
+    if result.returncode != 0:
+        raise RuntimeError(f"import open_webui.main failed:\n{result.stderr[-4000:]}")
+    max_rss = int(result.stdout.strip().splitlines()[-1])
+
+    modules = parse_importtime(result.stderr)
+    top_level = [m for m in modules if m[3] == 0]
+
+    # Self time aggregated by top-level package (torch, langchain_core, ...)
+    packages = Counter()
+    for module, self_us, _, _ in modules:
+        packages[module.split(".")[0]] += self_us
+
+    return {
+        "wall_s": wall,
+        "import_s": sum(m[2] for m in top_level) / 1e6,
+        "modules": len(modules),
+        "max_rss_mb": max_rss / 1024,
+        "packages": packages,
+    }
+
+
+def main(runs: int, top: int, output: str = None):
+    summary = {"timestamp": time.time()}
+
+    for label, deferred in (("eager", False), ("deferred", True)):
+        results = [run_once(deferred) for _ in range(runs)]
+
+        wall = statistics.median(r["wall_s"] for r in results)
+        import_s = statistics.median(r["import_s"] for r in results)
+        max_rss_mb = statistics.median(r["max_rss_mb"] for r in results)
+        print(
+            f"{label:<9} wall={wall:6.2f}s imports={import_s:6.2f}s "
+            f"modules={results[-1]['modules']} max_rss={max_rss_mb:.0f}MB"
+        )
+
+        slowest = results[-1]["packages"].most_common(top)
+        for package, self_us in slowest:
+            print(f"    {self_us / 1e6:6.3f}s  {package}")
+
+        summary[label] = {
+            "wall_s": wall,
+            "import_s": import_s,
+            "modules": results[-1]["modules"],
+            "max_rss_mb": max_rss_mb,
+            "slowest": slowest,
+        }
+
+    if output:
+        with open(output, "a") as f:
+            f.write(json.dumps(summary) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="Append results to this JSON Lines file")
+    args = parser.parse_args()
+    main(args.runs, args.top, args.output)
@@ -0,0 +1,157 @@
+"""
+Web page loading benchmark.
+
+Serves synthetic pages built from the search results in retrieval/web/testdata
+on a local server and loads them twice: the way SafeWebBaseLoader used to (a
+new aiohttp session per URL, then BeautifulSoup's html.parser on the event
+loop) and through SafeWebBaseLoader.aload (pooled WEB_FETCHER, lxml extraction
+on WEB_EXTRACT_EXECUTOR). Reports pages/sec and the longest event loop stall
+seen while loading, which is what other requests of the worker wait on.
+
+Usage (from the `backend` directory):
+    python -m open_webui.test.benchmarks.bench_web_fetch [--pages N] [--size KB] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import html
+import json
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+from bs4 import BeautifulSoup
+
+from open_webui.retrieval.web.cache import WEB_FETCH_CACHE
+from open_webui.retrieval.web.fetcher import WEB_FETCHER
+from open_webui.retrieval.web.utils import SafeWebBaseLoader
+from open_webui.test.stub_server import start_stub_server
+
+TESTDATA = Path(__file__).parents[2] / "retrieval" / "web" / "testdata"
+
+
+def load_results() -> list[dict]:
+    results = []
+    for path in sorted(TESTDATA.glob("*.json")):
+        data = json.loads(path.read_text())
+        for items in (
+            data.get("results"),
+            data.get("organic"),
+            data.get("organic_results"),
+            data.get("items"),
+            data.get("web", {}).get("results") if isinstance(data, dict) else None,
+        ):
+            for item in items or []:
+                if isinstance(item, dict):
+                    results.append(
+                        {
+                            "title": item.get("title", ""),
+                            "snippet": item.get("content")
+                            or item.get("snippet")
+                            or item.get("description")
+                            or "",
+                        }
+                    )
+    return [result for result in results if result["title"]]
+
+
+def make_page(result: dict, size: int) -> str:
+    paragraph = f"<p>{html.escape(result['snippet'])} <a href='#'>link</a></p>\n"
+    body = paragraph * max(size // len(paragraph), 1)
+    return (
+        "<!DOCTYPE html><html lang='en'><head>"
+        f"<title>{html.escape(result['title'])}</title>"
+        f"<meta name='description' content='{html.escape(result['snippet'])}'>"
+        "<style>body { font-family: sans-serif; }</style>"
+        "<script>window.analytics = {};</script>"
+        f"</head><body><nav><ul><li>Home</li><li>About</li></ul></nav>{body}</body></html>"
+    )
+
+
+async def start_server(pages: list[str]):
+    async def page(request):
+        return web.Response(
+            text=pages[int(request.match_info["idx"])], content_type="text/html"
+        )
+
+    app = web.Application()
+    app.router.add_get("/page/{idx}", page)
+    return await start_stub_server(app)
+
+
+async def load_baseline(urls: list[str], concurrency: int) -> list[str]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load(url):
+        async with semaphore:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, allow_redirects=False) as response:
+                    text = await response.text()
+        return BeautifulSoup(text, "html.parser").get_text()
+
+    return await asyncio.gather(*[load(url) for url in urls])
+
+
+async def load_fetcher(urls: list[str], concurrency: int) -> list[str]:
+    loader = SafeWebBaseLoader(
+        web_paths=urls, requests_per_second=concurrency, show_progress=False
+    )
+    return [doc.page_content for doc in await loader.aload()]
+
+
+async def measure(label: str, load, urls: list[str], concurrency: int):
+    max_stall = 0.0
+    running = True
+
+    async def monitor():
+        nonlocal max_stall
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            max_stall = max(max_stall, time.perf_counter() - start - 0.005)
+
+    monitor_task = asyncio.create_task(monitor())
+    start = time.perf_counter()
+    texts = await load(urls, concurrency)
+    elapsed = time.perf_counter() - start
+    running = False
+    await monitor_task
+
+    assert len(texts) == len(urls) and all(texts)
+    print(
+        f"{label:<9} {len(urls) / elapsed:8.1f} pages/s  "
+        f"max loop stall {max_stall * 1000:7.1f} ms"
+    )
+    return elapsed
+
+
+async def main(pages: int, size: int, concurrency: int):
+    results = load_results()
+    html_pages = [make_page(results[idx % len(results)], size) for idx in range(pages)]
+    runner, url = await start_server(html_pages)
+    urls = [f"{url}/page/{idx}" for idx in range(pages)]
+
+    # Measure fetching and extraction, not the page cache
+    WEB_FETCH_CACHE.ttl = 0
+    print(
+        f"{pages} pages of ~{size // 1024} KB from {len(results)} testdata results, "
+        f"concurrency {concurrency}"
+    )
+
+    try:
+        baseline = await measure("baseline", load_baseline, urls, concurrency)
+        fetcher = await measure("fetcher", load_fetcher, urls, concurrency)
+        print(f"speedup: {baseline / fetcher:.1f}x")
+    finally:
+        await WEB_FETCHER.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--size", type=int, default=200, help="page size in KB")
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.size * 1024, args.concurrency))
@@ -0,0 +1,22 @@
+import pytest_asyncio
+
+from open_webui.test.stub_server import start_stub_server
+
+
+@pytest_asyncio.fixture
+async def stub_server():
+    """
+    Starts aiohttp applications standing in for remote servers, stopped after
+    the test: `url = await stub_server(app)`
+    """
+    runners = []
+
+    async def start(app):
+        runner, url = await start_stub_server(app)
+        runners.append(runner)
+        return url
+
+    yield start
+
+    for runner in runners:
+        await runner.cleanup()
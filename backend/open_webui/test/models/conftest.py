@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from open_webui.internal.db import Base
+
+
+@pytest.fixture
+def tables() -> list[str]:
+    """Names of the tables `engine` creates, overridden by each test module."""
+    return []
+
+
+@pytest.fixture
+def engine(monkeypatch, tables):
+    """In-memory SQLite database with the `tables` of the test module."""
+    # Use the session passed to the table methods
+    monkeypatch.setattr("open_webui.internal.db.DATABASE_ENABLE_SESSION_SHARING", True)
+
+    # Registers the tables the models refer to
+    import open_webui.models.chats  # noqa: F401
+    import open_webui.models.groups  # noqa: F401
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(
+        engine, tables=[Base.metadata.tables[name] for name in tables]
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
@@ -0,0 +1,130 @@
+import io
+import json
+import zipfile
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from open_webui.models.chats import Chat, Chats
+
+
+@pytest.fixture
+def tables():
+    return ["chat"]
+
+
+@pytest.fixture
+def sessions(monkeypatch, engine):
+    Session = sessionmaker(bind=engine)
+
+    opened = []
+
+    @contextmanager
+    def get_db_context(db=None):
+        session = Session()
+        opened.append(session)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("open_webui.models.chats.get_db_context", get_db_context)
+
+    with Session() as session:
+        session.add_all(
+            [
+                Chat(
+                    id=f"chat-{index:02d}",
+                    user_id="user" if index % 3 else "other",
+                    title=f"Chat {index}",
+                    chat={"messages": []},
+                    # Ties on created_at across batch boundaries
+                    created_at=index // 4,
+                    updated_at=index,
+                    meta={},
+                )
+                for index in range(20)
+            ]
+        )
+        session.commit()
+    yield opened
+
+
+def test_iter_chats_streams_every_chat_once_in_batches(sessions):
+    chats = list(Chats.iter_chats(batch_size=3))
+
+    assert len(chats) == 20
+    assert len({chat.id for chat in chats}) == 20
+    assert [(chat.created_at, chat.id) for chat in chats] == sorted(
+        [(chat.created_at, chat.id) for chat in chats]
+    )
+    # One short-lived session per batch
+    assert len(sessions) == 7
+
+
+def test_iter_chats_of_one_user(sessions):
+    chats = list(Chats.iter_chats("other", batch_size=2))
+
+    assert {chat.id for chat in chats} == {
+        f"chat-{index:02d}" for index in range(0, 20, 3)
+    }
+    assert all(chat.user_id == "other" for chat in chats)
+
+
+def test_iter_chats_survives_chats_updated_during_the_export(sessions):
+    chats = Chats.iter_chats(batch_size=3)
+    exported = [next(chats)]
+
+    # Bumping updated_at of a chat still to come or already exported
+    with sessionmaker(bind=sessions[0].bind)() as session:
+        for id in ("chat-00", "chat-10"):
+            session.get(Chat, id).updated_at = 100
+        session.commit()
+    exported.extend(chats)
+
+    assert sorted(chat.id for chat in exported) == [
+        f"chat-{index:02d}" for index in range(20)
+    ]
+
+
+def export(user_id, format):
+    from open_webui.routers.chats import generate_chats_export
+
+    chunks = list(generate_chats_export(user_id, format))
+    if format == "zip":
+        return b"".join(chunks)
+    return "".join(chunks)
+
+
+@pytest.mark.parametrize("user_id,count", [("other", 7), (None, 20)])
+def test_export_json(sessions, user_id, count):
+    chats = json.loads(export(user_id, "json"))
+
+    assert len(chats) == count
+    assert chats[0]["id"] == "chat-00"
+    assert chats[0]["chat"] == {"messages": []}
+
+
+def test_export_json_without_chats(sessions):
+    assert json.loads(export("nobody", "json")) == []
+
+
+def test_export_jsonl(sessions):
+    lines = export("user", "jsonl").splitlines()
+
+    chats = [json.loads(line) for line in lines]
+    assert len(chats) == 13
+    assert all(chat["user_id"] == "user" for chat in chats)
+
+
+@pytest.mark.parametrize("user_id,prefix", [("other", ""), (None, "other/")])
+def test_export_zip(sessions, user_id, prefix):
+    with zipfile.ZipFile(io.BytesIO(export(user_id, "zip"))) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        chat = json.loads(archive.read(f"{prefix}chat-03.json"))
+
+    assert len(names) == (7 if user_id else 20)
+    assert chat["id"] == "chat-03"
+    assert chat["title"] == "Chat 3"
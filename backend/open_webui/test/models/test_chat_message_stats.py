@@ -0,0 +1,183 @@
+import time
+
+import pytest
+
+from open_webui.models.chat_messages import (
+    ChatMessageActivity,
+    ChatMessages,
+    ChatMessageStat,
+)
+
+
+@pytest.fixture
+def tables():
+    return [
+        "chat",
+        "chat_message",
+        "chat_message_stat",
+        "chat_message_activity",
+        "group",
+        "group_member",
+    ]
+
+
+def get_stats(db):
+    return {
+        (row.period, row.bucket, row.user_id, row.model_id): (
+            row.message_count,
+            row.assistant_count,
+            row.usage_count,
+            row.input_tokens,
+            row.output_tokens,
+        )
+        for row in db.query(ChatMessageStat).all()
+    }
+
+
+def write_messages(db, now):
+    old = now - 3 * 86400
+    ChatMessages.upsert_message(
+        "u1", "c1", "alice", {"role": "user", "timestamp": old}, db=db
+    )
+    ChatMessages.upsert_message(
+        "a1", "c1", "alice", {"role": "assistant", "timestamp": old}, db=db
+    )
+    # The model and usage arrive while the response is streamed
+    ChatMessages.upsert_message("a1", "c1", "alice", {"model": "gpt"}, db=db)
+    ChatMessages.upsert_message(
+        "a1",
+        "c1",
+        "alice",
+        {"info": {"usage": {"input_tokens": 10, "output_tokens": 5}}},
+        db=db,
+    )
+    ChatMessages.upsert_message(
+        "u2", "c2", "bob", {"role": "user", "timestamp": now}, db=db
+    )
+    ChatMessages.upsert_message(
+        "a2",
+        "c2",
+        "bob",
+        {
+            "role": "assistant",
+            "model": "llama",
+            "timestamp": now,
+            "usage": {"input_tokens": 3, "output_tokens": 4},
+        },
+        db=db,
+    )
+    ChatMessages.upsert_message(
+        "a3", "c3", "shared-c3", {"role": "assistant", "model": "gpt"}, db=db
+    )
+
+
+def test_incremental_rollups_match_rebuild(db):
+    now = int(time.time())
+    write_messages(db, now)
+
+    assert ChatMessages.get_message_count_by_model(db=db) == {"gpt": 1, "llama": 1}
+    assert ChatMessages.get_message_count_by_user(db=db) == {"alice": 2, "bob": 2}
+    assert ChatMessages.get_token_usage_by_model(db=db)["gpt"] == {
+        "input_tokens": 10,
+        "output_tokens": 5,
+        "total_tokens": 15,
+        "message_count": 1,
+    }
+    assert ChatMessages.get_chat_count(db=db) == 2
+
+    incremental = get_stats(db)
+    assert ChatMessages.rebuild_stats(db=db) == 4
+    assert get_stats(db) == incremental
+    assert db.query(ChatMessageActivity).count() == 4
+
+
+def test_ranges_combine_days_and_edge_hours(db):
+    now = int(time.time())
+    write_messages(db, now)
+
+    # The last 24 hours start and end in the middle of a day
+    start_date = now - 86400
+    assert ChatMessages.get_message_count_by_model(
+        start_date=start_date, end_date=now, db=db
+    ) == {"llama": 1}
+    assert ChatMessages.get_chat_count(start_date=start_date, end_date=now, db=db) == 1
+    assert ChatMessages.get_token_usage_by_user(
+        start_date=now - 4 * 86400, end_date=now - 86400, db=db
+    ) == {
+        "alice": {
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "total_tokens": 15,
+            "message_count": 1,
+        }
+    }
+
+    hourly = ChatMessages.get_hourly_message_counts_by_model(
+        start_date=start_date, end_date=now, db=db
+    )
+    assert len(hourly) in (24, 25)
+    assert sum(sum(models.values()) for models in hourly.values()) == 1
+
+    daily = ChatMessages.get_daily_message_counts_by_model(
+        start_date=now - 7 * 86400, end_date=now, db=db
+    )
+    assert sum(models.get("gpt", 0) for models in daily.values()) == 1
+    assert sum(models.get("llama", 0) for models in daily.values()) == 1
+
+
+def test_deleting_chats_subtracts_their_messages(db):
+    from open_webui.models.chats import Chat, Chats
+
+    now = int(time.time())
+    for chat_id, user_id in (("c1", "alice"), ("c2", "bob")):
+        db.add(Chat(id=chat_id, user_id=user_id, title="", chat={}, meta={}))
+    write_messages(db, now)
+
+    assert Chats.delete_chat_by_id("c1", db=db)
+    assert ChatMessages.get_message_count_by_user(db=db) == {"bob": 2}
+    assert ChatMessages.get_message_count_by_model(db=db) == {"llama": 1}
+    assert ChatMessages.get_chat_count(db=db) == 1
+
+    # Rows left at zero are dropped, what remains matches a rebuild
+    remaining = get_stats(db)
+    assert {key[2] for key in remaining} == {"bob"}
+    ChatMessages.rebuild_stats(db=db)
+    assert get_stats(db) == remaining
+
+    assert Chats.delete_chats_by_user_id("bob", db=db)
+    assert get_stats(db) == {}
+    assert db.query(ChatMessageActivity).count() == 0
+
+
+def test_deleting_user_stats(db):
+    write_messages(db, int(time.time()))
+
+    ChatMessages.delete_stats_by_user_id("alice", db=db)
+    assert ChatMessages.get_message_count_by_user(db=db) == {"bob": 2}
+    assert {row.user_id for row in db.query(ChatMessageActivity)} == {"bob"}
+
+
+def test_backfill_matches_rebuild(db):
+    import importlib
+
+    from open_webui.models.chat_messages import get_stat_rows
+
+    migration = importlib.import_module(
+        "open_webui.migrations.versions.5e8f2a9c1d34_add_chat_message_stat_tables"
+    )
+    write_messages(db, int(time.time()))
+
+    messages = list(ChatMessages._get_stat_sources(db))
+    assert migration.get_stat_rows(messages) == get_stat_rows(messages)
+
+
+def test_failed_rollups_keep_the_message(db, monkeypatch, caplog):
+    def fail(*args, **kwargs):
+        raise RuntimeError("stats")
+
+    monkeypatch.setattr(ChatMessages, "_update_stats", fail)
+    ChatMessages.upsert_message("u1", "c1", "alice", {"role": "user"}, db=db)
+
+    assert ChatMessages.get_message_by_id("c1-u1", db=db) is not None
+    assert get_stats(db) == {}
+    assert "Failed to update chat message stats: stats" in caplog.text
@@ -0,0 +1,93 @@
+import pytest
+
+from open_webui.models.chats import Chat, Chats
+from open_webui.models.files import File, Files
+from open_webui.utils.pagination import encode_cursor, get_next_cursor
+
+
+@pytest.fixture
+def tables():
+    return ["chat", "file"]
+
+
+@pytest.fixture
+def db(db):
+    for index in range(25):
+        # Ties on updated_at across page boundaries
+        db.add(
+            Chat(
+                id=f"chat-{index:02d}",
+                user_id="user",
+                title=f"Chat {index}",
+                chat={},
+                archived=False,
+                pinned=False,
+                meta={},
+                created_at=index,
+                updated_at=index // 3,
+            )
+        )
+        db.add(
+            File(
+                id=f"file-{index:02d}",
+                user_id="user",
+                filename=f"{index}.txt",
+                meta={},
+                created_at=index,
+                updated_at=index // 4,
+            )
+        )
+    db.commit()
+    return db
+
+
+def test_chat_cursor_pages_match_offset_pages(db):
+    pages = []
+    cursor = None
+    while True:
+        chats = Chats.get_chat_title_id_list_by_user_id(
+            "user", limit=10, cursor=cursor, db=db
+        )
+        pages.append([chat.id for chat in chats])
+        cursor = get_next_cursor(chats, 10, "updated_at", "id")
+        if cursor is None:
+            break
+
+    offset_pages = [
+        [
+            chat.id
+            for chat in Chats.get_chat_title_id_list_by_user_id(
+                "user", skip=skip, limit=10, db=db
+            )
+        ]
+        for skip in (0, 10, 20)
+    ]
+    assert pages == offset_pages
+    assert len({id for page in pages for id in page}) == 25
+
+
+def test_file_search_cursor(db):
+    files = Files.search_files(user_id="user", limit=10, db=db)
+    cursor = get_next_cursor(files, 10, "updated_at", "id")
+
+    next_files = Files.search_files(user_id="user", limit=10, cursor=cursor, db=db)
+    assert [file.id for file in next_files] == [
+        file.id for file in Files.search_files(user_id="user", skip=10, limit=10, db=db)
+    ]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor(1, "a", "b"),
+        # Values of the wrong type for (updated_at, id)
+        encode_cursor("a", "b"),
+        encode_cursor(1, 2),
+        encode_cursor(True, "a"),
+        encode_cursor([1], "a"),
+    ],
+)
+def test_invalid_cursor(db, cursor):
+    with pytest.raises(ValueError):
+        Files.search_files(user_id="user", cursor=cursor, db=db)
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from open_webui.models.feedbacks import FeedbackForm, Feedbacks, RatingData
+
+
+@pytest.fixture
+def tables():
+    return ["feedback", "model_rating"]
+
+
+def rate(db, model_id, rating, siblings, tags=()):
+    return Feedbacks.insert_new_feedback(
+        "user",
+        FeedbackForm(
+            type="rating",
+            data=RatingData(
+                model_id=model_id,
+                rating=rating,
+                sibling_model_ids=list(siblings),
+                tags=list(tags),
+            ),
+        ),
+        db=db,
+    )
+
+
+def get_ratings(db):
+    return {
+        rating.model_id: (round(rating.rating, 6), rating.won, rating.lost, rating.tags)
+        for rating in Feedbacks.get_model_ratings(db=db)
+    }
+
+
+def test_incremental_ratings_match_replay(db):
+    rate(db, "a", 1, ["b"], ["code"])
+    # The first read builds the ratings, later feedback updates them
+    assert get_ratings(db)["a"][1:] == (1, 0, {"code": 1})
+
+    rate(db, "b", 1, ["a", "c"], ["code", "math"])
+    feedback = rate(db, "c", -1, ["a"])
+    rate(db, "a", 1, ["c"], ["math"])
+    incremental = get_ratings(db)
+    assert incremental["a"][1:] == (3, 1, {"code": 1, "math": 1})
+    assert incremental["c"][1:3] == (0, 3)
+
+    Feedbacks.reset_model_ratings(db=db)
+    assert get_ratings(db) == incremental
+
+    # Editing feedback replays all feedback on the next read
+    Feedbacks.update_feedback_by_id(
+        feedback.id,
+        FeedbackForm(
+            type="rating",
+            data=RatingData(model_id="c", rating=1, sibling_model_ids=["a"]),
+        ),
+        db=db,
+    )
+    edited = get_ratings(db)
+    assert edited["c"][1:3] == (1, 2)
+    Feedbacks.reset_model_ratings(db=db)
+    assert get_ratings(db) == edited
+
+
+def test_deleted_feedback_is_replayed(db):
+    rate(db, "a", 1, ["b"], ["code"])
+    expected = get_ratings(db)
+    feedback = rate(db, "c", 1, ["a"], ["math"])
+    assert get_ratings(db)["c"][1:] == (1, 0, {"math": 1})
+
+    assert Feedbacks.delete_feedback_by_id(feedback.id, db=db)
+    # As if the feedback had never been given
+    assert get_ratings(db) == expected
+
+
+def test_empty_ratings_are_not_rebuilt_on_every_read(db, monkeypatch):
+    Feedbacks.insert_new_feedback(
+        "user", FeedbackForm(type="rating", data=RatingData(rating=1)), db=db
+    )
+    assert get_ratings(db) == {}
+
+    rebuilds = []
+    rebuild = Feedbacks._rebuild_model_ratings
+    monkeypatch.setattr(
+        Feedbacks,
+        "_rebuild_model_ratings",
+        lambda db: rebuilds.append(1) or rebuild(db),
+    )
+    assert get_ratings(db) == {}
+    assert rebuilds == []
+
+    Feedbacks.delete_all_feedbacks(db=db)
+    assert get_ratings(db) == {}
+    assert rebuilds == [1]
+
+
+def test_weighted_elo_uses_cached_tag_embeddings(db, monkeypatch):
+    from open_webui.routers import evaluations
+
+    vectors = {"code": [1.0, 0.0], "math": [0.0, 1.0], "coding": [1.0, 0.1]}
+    encoded = []
+
+    class EmbeddingModel:
+        def encode(self, texts):
+            encoded.extend(texts)
+            return np.array([vectors[text] for text in texts])
+
+    monkeypatch.setattr(evaluations, "_get_embedding_model", EmbeddingModel)
+    monkeypatch.setattr(evaluations, "_tag_embeddings", evaluations.OrderedDict())
+
+    rate(db, "a", 1, ["b"], ["math"])
+    rate(db, "b", 1, ["a"], ["code", "math"])
+    rate(db, "b", 1, ["a"])
+    feedbacks = Feedbacks.get_feedbacks_for_leaderboard(db=db)
+
+    weights = evaluations._compute_similarities(feedbacks, "coding")
+    assert weights == pytest.approx([0.0995, 0.995, 0], abs=1e-3)
+    evaluations._compute_similarities(feedbacks, "coding")
+    assert sorted(encoded) == ["code", "coding", "math"]
+
+    stats = evaluations._calculate_elo(feedbacks, weights)
+    assert stats["b"]["rating"] > stats["a"]["rating"]
+    assert (stats["b"]["won"], stats["a"]["won"]) == (2, 1)
+    # Unweighted, the replay matches the stored ratings
+    stored = {rating.model_id: rating for rating in Feedbacks.get_model_ratings(db=db)}
+    assert evaluations._calculate_elo(feedbacks)["a"]["rating"] == pytest.approx(
+        stored["a"].rating
+    )
@@ -0,0 +1,84 @@
+import time
+
+import pytest
+from fpdf import FPDF
+from langchain_community.document_loaders import PyPDFLoader, TextLoader
+
+from open_webui.retrieval.loaders.process_pool import (
+    DocumentParserPool,
+    DocumentParserTimeout,
+)
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    pdf = FPDF()
+    pdf.set_font("helvetica", size=12)
+    for page in range(7):
+        pdf.add_page()
+        pdf.cell(text=f"Page number {page} of the test document")
+    path = tmp_path / "test.pdf"
+    pdf.output(str(path))
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    # Spawning the workers is slow, share them between the tests
+    pool = DocumentParserPool(workers=2, timeout=30, pdf_pages_per_job=3)
+    yield pool
+    pool.shutdown()
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return []
+
+
+def _wait_for_metrics(pool, predicate, timeout=5):
+    # Job outcomes are counted by future callbacks, right after the result is set
+    deadline = time.monotonic() + timeout
+    while not predicate(pool.get_metrics()) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate(pool.get_metrics())
+
+
+class TestDocumentParserPool:
+    def test_disabled_without_workers(self, pdf_path):
+        loader = PyPDFLoader(pdf_path)
+        assert not DocumentParserPool(workers=0).handles(loader)
+        assert DocumentParserPool(workers=1).handles(loader)
+
+    def test_split_pdf_matches_in_process_load(self, pool, pdf_path):
+        loader = PyPDFLoader(pdf_path, mode="page")
+        expected = loader.load()
+
+        docs = pool.load(loader)
+
+        assert [doc.page_content for doc in docs] == [
+            doc.page_content for doc in expected
+        ]
+        assert [doc.metadata for doc in docs] == [doc.metadata for doc in expected]
+
+        assert pool.get_metrics()["split_pdfs"] == 1
+        assert _wait_for_metrics(
+            pool, lambda metrics: metrics["jobs"] >= 3 and metrics["queue_depth"] == 0
+        )
+
+    def test_fixes_text(self, pool, tmp_path):
+        path = tmp_path / "mojibake.txt"
+        path.write_text("The Mona Lisa doesnÃ¢â‚¬â„¢t have eyebrows.")
+
+        docs = pool.load(TextLoader(str(path)))
+        assert docs[0].page_content == "The Mona Lisa doesn't have eyebrows."
+
+    def test_job_timeout(self, pool, monkeypatch):
+        monkeypatch.setattr(pool, "timeout", 1)
+        monkeypatch.setattr(pool, "_get_jobs", lambda loader: [(_sleep, (5,))])
+
+        timed_out_jobs = pool.get_metrics()["timed_out_jobs"]
+        with pytest.raises(DocumentParserTimeout):
+            pool.load(None)
+        assert _wait_for_metrics(
+            pool, lambda metrics: metrics["timed_out_jobs"] == timed_out_jobs + 1
+        )
@@ -0,0 +1,118 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from open_webui.retrieval import embedding_batcher
+from open_webui.retrieval.embedding_batcher import EmbeddingMicroBatcher
+
+
+class TestEmbeddingMicroBatcher:
+    """Test coalescing of concurrent embedding calls"""
+
+    @staticmethod
+    def make_batcher(calls, **kwargs):
+        async def embed_batch(texts, prefix=None, user=None):
+            calls.append((list(texts), prefix))
+            return [[float(len(text))] for text in texts]
+
+        return EmbeddingMicroBatcher("test", embed_batch, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        """Concurrent calls are sent upstream as a single request"""
+        calls = []
+        batcher = self.make_batcher(calls, max_batch_size=16, max_latency_ms=20)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed(["bb", "ccc"]), batcher.embed("dddd")
+        )
+
+        assert calls == [(["a", "bb", "ccc", "dddd"], None)]
+        assert results == [[1.0], [[2.0], [3.0]], [4.0]]
+
+        metrics = batcher.get_metrics()
+        assert metrics["requests"] == 3
+        assert metrics["batches"] == 1
+        assert metrics["avg_batch_texts"] == 4
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_and_grouped_by_prefix(self):
+        """Batches never exceed max_batch_size and never mix prefixes"""
+        calls = []
+        batcher = self.make_batcher(calls, max_batch_size=2, max_latency_ms=20)
+
+        await asyncio.gather(
+            batcher.embed("a"),
+            batcher.embed("b"),
+            batcher.embed("c"),
+            batcher.embed("d", prefix="query: "),
+        )
+
+        assert sorted(calls, key=lambda c: (c[1] or "", c[0])) == [
+            (["a", "b"], None),
+            (["c"], None),
+            (["d"], "query: "),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_returns_none(self):
+        """An upstream failure is reported to every caller in the batch"""
+
+        async def embed_batch(texts, prefix=None, user=None):
+            return None
+
+        batcher = EmbeddingMicroBatcher("test", embed_batch, max_latency_ms=1)
+        results = await asyncio.gather(batcher.embed("a"), batcher.embed(["b"]))
+
+        assert results == [None, None]
+        assert batcher.get_metrics()["failed_batches"] == 1
+
+    def test_large_calls_bypass_batcher(self):
+        """Bulk document embeddings are not routed through the batcher"""
+        batcher = self.make_batcher([], max_batch_size=4)
+
+        assert batcher.accepts("query")
+        assert batcher.accepts(["a", "b", "c"])
+        assert not batcher.accepts(["a", "b", "c", "d"])
+        assert not batcher.accepts([])
+
+
+class TestEmbeddingFunctionBatcher:
+    """Test the batcher installed by get_embedding_function"""
+
+    @pytest.fixture(autouse=True)
+    def reset_batcher(self):
+        yield
+        embedding_batcher.set_embedding_batcher(None)
+
+    @staticmethod
+    def make_function(batch_size, enable_micro_batching):
+        from open_webui.retrieval.utils import get_embedding_function
+
+        class EmbeddingModel:
+            def encode(self, texts, batch_size=None):
+                return np.array([[float(len(text))] for text in texts])
+
+        return get_embedding_function(
+            "",
+            "model",
+            EmbeddingModel(),
+            None,
+            None,
+            batch_size,
+            enable_micro_batching=enable_micro_batching,
+        )
+
+    def test_batch_size_is_capped_by_embedding_batch_size(self):
+        self.make_function(8, True)
+        assert embedding_batcher.EMBEDDING_BATCHER.max_batch_size == 8
+
+    def test_disabling_drops_the_shared_batcher(self):
+        self.make_function(8, True)
+        # One-off embedding functions leave the shared batcher alone
+        self.make_function(8, None)
+        assert embedding_batcher.get_embedding_batcher_metrics() is not None
+
+        self.make_function(8, False)
+        assert embedding_batcher.get_embedding_batcher_metrics() is None
@@ -0,0 +1,263 @@
+import numpy as np
+import pytest
+
+from open_webui.models.memories import MemoryModel
+from open_webui.retrieval import memory as memory_module
+from open_webui.retrieval.memory import MemoryStore
+from open_webui.retrieval.vector.main import GetResult, SearchResult, VectorDBBase
+
+
+class InMemoryVectorDB(VectorDBBase):
+    """Backend that, unless `applies_filters`, ignores search filters"""
+
+    def __init__(self, supports_get_vectors=True, applies_filters=False):
+        self.collections = {}
+        self.supports_get_vectors = supports_get_vectors
+        self.applies_filters = applies_filters
+        self.searches = 0
+
+    def search(self, collection_name, vectors, filter=None, limit=10):
+        self.searches += 1
+        items = list(self.collections.get(collection_name, {}).values())
+        if filter and self.applies_filters:
+            items = [
+                item
+                for item in items
+                if all(item["metadata"].get(k) == v for k, v in filter.items())
+            ]
+        query = np.asarray(vectors[0])
+        items.sort(key=lambda item: -float(np.dot(item["vector"], query)))
+        items = items[:limit]
+        return SearchResult(
+            ids=[[item["id"] for item in items]],
+            documents=[[item["text"] for item in items]],
+            metadatas=[[item["metadata"] for item in items]],
+            distances=[[1.0 for _ in items]],
+        )
+
+    def get_vectors(self, collection_name, ids):
+        if not self.supports_get_vectors:
+            return None
+        items = self.collections.get(collection_name, {})
+        return {id: items[id]["vector"] for id in ids if id in items}
+
+    def get(self, collection_name):
+        return None
+
+    def has_collection(self, collection_name):
+        return collection_name in self.collections
+
+    def delete_collection(self, collection_name):
+        self.collections.pop(collection_name, None)
+
+    def insert(self, collection_name, items):
+        self.upsert(collection_name, items)
+
+    def upsert(self, collection_name, items):
+        collection = self.collections.setdefault(collection_name, {})
+        for item in items:
+            collection[item["id"]] = dict(item)
+
+    def query(self, collection_name, filter, limit=None):
+        items = [
+            item
+            for item in self.collections.get(collection_name, {}).values()
+            if item["metadata"].get("user_id") == filter["user_id"]
+        ]
+        return GetResult(
+            ids=[[item["id"] for item in items]],
+            documents=[[item["text"] for item in items]],
+            metadatas=[[item["metadata"] for item in items]],
+        )
+
+    def delete(self, collection_name, ids=None, filter=None):
+        collection = self.collections.get(collection_name, {})
+        for id, item in list(collection.items()):
+            if (ids and id in ids) or (
+                filter and item["metadata"].get("user_id") == filter["user_id"]
+            ):
+                del collection[id]
+
+    def reset(self):
+        self.collections = {}
+
+
+VECTORS = {
+    "likes tea": [1.0, 0.0, 0.0],
+    "likes coffee": [0.9, 0.1, 0.0],
+    "lives in paris": [0.0, 1.0, 0.0],
+    "drinks": [1.0, 0.05, 0.0],
+    "likes espresso": [0.95, 0.05, 0.0],
+    "likes latte": [0.96, 0.03, 0.0],
+    "likes mocha": [0.97, 0.02, 0.0],
+}
+
+
+class User:
+    def __init__(self, id):
+        self.id = id
+
+
+class Embedder:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, query, user=None):
+        self.calls.append(query)
+        if isinstance(query, list):
+            return [VECTORS[text] for text in query]
+        return VECTORS[query]
+
+
+@pytest.fixture
+def memories(monkeypatch):
+    stored = {}
+
+    class FakeMemories:
+        def get_memories_by_user_id(self, user_id):
+            return [memory for memory in stored.values() if memory.user_id == user_id]
+
+    monkeypatch.setattr(memory_module, "Memories", FakeMemories())
+
+    def add(user_id, content):
+        memory = MemoryModel(
+            id=f"{user_id}-{len(stored)}",
+            user_id=user_id,
+            content=content,
+            created_at=1,
+            updated_at=1,
+        )
+        stored[memory.id] = memory
+        return memory
+
+    return add
+
+
+class TestMemoryStore:
+    @pytest.mark.asyncio
+    async def test_shared_collection_recall_from_cache(self, memories):
+        db = InMemoryVectorDB()
+        store = MemoryStore(db, multitenant=True, collection_name="memories")
+        embed = Embedder()
+        alice, bob = User("alice"), User("bob")
+
+        await store.upsert(
+            embed,
+            alice,
+            [memories("alice", "likes tea"), memories("alice", "lives in paris")],
+        )
+        await store.upsert(embed, bob, [memories("bob", "likes coffee")])
+        # One embedding request per batch
+        assert embed.calls[0] == ["likes tea", "lives in paris"]
+        assert list(db.collections) == ["memories"]
+
+        result = await store.search(embed, alice, "drinks", limit=2)
+        assert result.documents == [["likes tea", "lives in paris"]]
+        assert result.metadatas[0][0]["user_id"] == "alice"
+
+        # Writes update the cached vectors, searches never reach the backend
+        await store.upsert(embed, alice, [memories("alice", "likes coffee")])
+        await store.delete("alice", [result.ids[0][0]])
+        result = await store.search(embed, alice, "drinks", limit=1)
+        assert result.documents == [["likes coffee"]]
+        assert db.searches == 0
+
+        await store.delete_all("alice")
+        assert [
+            item["metadata"]["user_id"] for item in db.collections["memories"].values()
+        ] == ["bob"]
+
+    @pytest.mark.asyncio
+    async def test_backend_search_never_leaks_other_users(self, memories):
+        db = InMemoryVectorDB(supports_get_vectors=False)
+        store = MemoryStore(db, multitenant=True, collection_name="memories")
+        embed = Embedder()
+
+        await store.upsert(embed, User("bob"), [memories("bob", "likes coffee")])
+        await store.upsert(embed, User("alice"), [memories("alice", "lives in paris")])
+
+        result = await store.search(embed, User("alice"), "drinks", limit=1)
+        # Bob's closer memory is dropped and the search repeated with more rows
+        assert db.searches == 2
+        assert result.documents == [["lives in paris"]]
+        assert await store.search(embed, User("carol"), "drinks", limit=1) is None
+
+    @pytest.mark.asyncio
+    async def test_indexes_memories_missing_from_collection(self, memories):
+        db = InMemoryVectorDB()
+        store = MemoryStore(db, multitenant=True, collection_name="memories")
+        embed = Embedder()
+        # Stored in a per-user collection before the store became multitenant
+        memories("alice", "likes tea")
+
+        result = await store.search(embed, User("alice"), "drinks", limit=3)
+
+        assert result.documents == [["likes tea"]]
+        assert list(db.collections["memories"]) == ["alice-0"]
+
+    @pytest.mark.asyncio
+    async def test_indexes_missing_memories_without_get_vectors(self, memories):
+        db = InMemoryVectorDB(supports_get_vectors=False)
+        store = MemoryStore(db, multitenant=True, collection_name="memories")
+        embed = Embedder()
+        await store.upsert(embed, User("alice"), [memories("alice", "likes tea")])
+        store.invalidate()
+        memories("alice", "likes coffee")
+
+        result = await store.search(embed, User("alice"), "drinks", limit=3)
+        assert sorted(result.documents[0]) == ["likes coffee", "likes tea"]
+        # Only the memory missing from the collection was embedded
+        assert embed.calls[1:] == [["likes coffee"], "drinks"]
+
+        await store.search(embed, User("alice"), "drinks", limit=3)
+        assert embed.calls[3:] == ["drinks"]
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded_by_size(self, memories):
+        db = InMemoryVectorDB()
+        embed = Embedder()
+        alice, bob = User("alice"), User("bob")
+        await MemoryStore(db).upsert(embed, alice, [memories("alice", "likes tea")])
+        await MemoryStore(db).upsert(embed, bob, [memories("bob", "likes coffee")])
+
+        # Room for a single user's vectors and documents
+        store = MemoryStore(db, max_bytes=30)
+        await store.search(embed, alice, "drinks", limit=1)
+        assert list(store._cache) == ["alice"]
+        await store.search(embed, bob, "drinks", limit=1)
+        assert list(store._cache) == ["bob"]
+
+        store.max_bytes = 0
+        await store.upsert(embed, bob, [memories("bob", "lives in paris")])
+        assert not store._cache
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("applies_filters,searches", [(True, 1), (False, 2)])
+    async def test_shared_collection_recall_of_two_users(
+        self, memories, applies_filters, searches
+    ):
+        db = InMemoryVectorDB(
+            supports_get_vectors=False, applies_filters=applies_filters
+        )
+        store = MemoryStore(db, multitenant=True, collection_name="memories")
+        embed = Embedder()
+        bob = User("bob")
+        await store.upsert(
+            embed,
+            bob,
+            [
+                memories("bob", content)
+                for content in ["likes coffee", "likes espresso", "likes latte"]
+            ],
+        )
+        await store.upsert(
+            embed,
+            User("alice"),
+            [memories("alice", "likes tea"), memories("alice", "lives in paris")],
+        )
+        await store.upsert(embed, bob, [memories("bob", "likes mocha")])
+
+        # Bob's memories are closer, they can't take alice's places in the top 2
+        result = await store.search(embed, User("alice"), "drinks", limit=2)
+        assert result.documents == [["likes tea", "lives in paris"]]
+        assert db.searches == searches
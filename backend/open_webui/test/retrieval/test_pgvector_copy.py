@@ -0,0 +1,60 @@
+import json
+import struct
+
+from open_webui.retrieval.vector.dbs.pgvector import (
+    PGCOPY_HEADER,
+    PGCOPY_TRAILER,
+    VECTOR_LENGTH,
+    PgvectorClient,
+)
+
+
+def read_tuples(payload: bytes) -> list[list[bytes]]:
+    assert payload.startswith(PGCOPY_HEADER)
+    assert payload.endswith(PGCOPY_TRAILER)
+
+    offset, tuples = len(PGCOPY_HEADER), []
+    while True:
+        (count,) = struct.unpack_from("!h", payload, offset)
+        offset += 2
+        if count == -1:
+            return tuples
+
+        fields = []
+        for _ in range(count):
+            (length,) = struct.unpack_from("!i", payload, offset)
+            offset += 4
+            fields.append(payload[offset : offset + length])
+            offset += length
+        tuples.append(fields)
+
+
+class TestCopyPayload:
+    """Test the binary COPY encoding used for bulk ingest"""
+
+    def test_rows_are_encoded_in_staging_column_order(self):
+        client = PgvectorClient.__new__(PgvectorClient)
+        items = [
+            {
+                "id": "chunk-1",
+                "text": "héllo",
+                "vector": [0.5, 1.0],
+                "metadata": {"file_id": "f1", "pages": [1, 2]},
+            }
+        ]
+
+        payload = client._copy_payload("kb", items).getvalue()
+        [[id_, vector, collection_name, text, metadata]] = read_tuples(payload)
+
+        assert id_ == b"chunk-1"
+        assert collection_name == b"kb"
+        assert text.decode() == "héllo"
+
+        # Vectors are padded to VECTOR_LENGTH
+        dim, _ = struct.unpack_from("!HH", vector)
+        assert dim == VECTOR_LENGTH
+        assert struct.unpack_from("!2f", vector, 4) == (0.5, 1.0)
+
+        # jsonb version byte, large fields stripped as in the row path
+        assert metadata[0] == 1
+        assert json.loads(metadata[1:]) == {"file_id": "f1"}
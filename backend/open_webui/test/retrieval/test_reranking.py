@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from open_webui.retrieval.reranking import (
+    RerankBatcher,
+    RerankingFunction,
+    RerankScoreCache,
+    get_predict_batch,
+)
+
+
+def make_docs(*texts):
+    return [SimpleNamespace(page_content=text, metadata={}) for text in texts]
+
+
+class TestRerankingFunction:
+    """Test (query, chunk) score caching"""
+
+    def test_only_uncached_documents_are_scored(self):
+        """Cached scores are reused and only new chunks reach the reranker"""
+        calls = []
+
+        def predict(sentences, user=None):
+            calls.append([doc for _, doc in sentences])
+            return [float(len(doc)) for _, doc in sentences]
+
+        cache = RerankScoreCache(max_size=10)
+        rerank = RerankingFunction(predict, cache=cache)
+
+        assert rerank("q", make_docs("a", "bb")) == [1.0, 2.0]
+        assert rerank("q", make_docs("bb", "ccc")) == [2.0, 3.0]
+        assert calls == [["a", "bb"], ["ccc"]]
+        assert cache.get_stats()["hits"] == 1
+
+    def test_failed_prediction_is_not_cached(self):
+        """A reranker failure returns None and leaves the cache empty"""
+        cache = RerankScoreCache(max_size=10)
+        rerank = RerankingFunction(lambda sentences, user=None: None, cache=cache)
+
+        assert rerank("q", make_docs("a")) is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_cache_evicts_least_recently_used(self):
+        """The cache never grows beyond max_size"""
+        cache = RerankScoreCache(max_size=2)
+        cache.set(("q", "a"), 1.0)
+        cache.set(("q", "b"), 2.0)
+        cache.get(("q", "a"))
+        cache.set(("q", "c"), 3.0)
+
+        assert cache.get(("q", "a")) == 1.0
+        assert cache.get(("q", "b")) is None
+        assert cache.get(("q", "c")) == 3.0
+
+
+class TestRerankBatcher:
+    """Test batching of concurrent cross-encoder calls"""
+
+    def test_concurrent_queries_share_one_model_call(self):
+        """Pairs from concurrent queries are scored in a single predict call"""
+        model_calls = []
+
+        class CrossEncoder:
+            def predict(self, pairs):
+                model_calls.append(len(pairs))
+                return [float(len(q) + len(d)) for q, d in pairs]
+
+        batcher = RerankBatcher(
+            get_predict_batch(CrossEncoder()), max_batch_pairs=100, max_wait_ms=200
+        )
+
+        queries = [[("q", "a"), ("q", "bb")], [("qq", "a")], [("qqq", "dddd")]]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(batcher.predict, queries))
+
+        assert results == [[2.0, 3.0], [3.0], [7.0]]
+        assert model_calls == [4]
+
+    def test_errors_propagate_to_every_caller(self):
+        """A failing model call raises in each waiting caller"""
+
+        def predict_batch(batches):
+            raise RuntimeError("model failed")
+
+        batcher = RerankBatcher(predict_batch, max_wait_ms=1)
+        with pytest.raises(RuntimeError, match="model failed"):
+            batcher.predict([("q", "a")])
@@ -0,0 +1,213 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from open_webui.retrieval.vector.main import (
+    GetResult,
+    SearchError,
+    SearchResult,
+    VectorDBBase,
+)
+
+
+class BlockingVectorDB(VectorDBBase):
+    """Sync-only backend whose search blocks like a network round trip"""
+
+    def __init__(self, delay=0.2, failing=()):
+        self.delay = delay
+        self.failing = failing
+        self.threads = set()
+
+    def search(self, collection_name, vectors, filter=None, limit=10):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        # Collections, or (collection, vector) pairs, whose searches fail
+        if collection_name in self.failing or (collection_name, vectors[0]) in (
+            self.failing
+        ):
+            raise RuntimeError("unavailable")
+        return SearchResult(
+            ids=[[collection_name]],
+            documents=[["doc"]],
+            metadatas=[[{}]],
+            distances=[[1.0]],
+        )
+
+    def get(self, collection_name):
+        return GetResult(ids=[[collection_name]], documents=[["doc"]], metadatas=[[{}]])
+
+    def has_collection(self, collection_name):
+        return True
+
+    def delete_collection(self, collection_name):
+        pass
+
+    def insert(self, collection_name, items):
+        pass
+
+    def upsert(self, collection_name, items):
+        pass
+
+    def query(self, collection_name, filter, limit=None):
+        return None
+
+    def delete(self, collection_name, ids=None, filter=None):
+        pass
+
+    def reset(self):
+        pass
+
+
+class TestVectorDBBaseAsync:
+    """Test the executor fallback of the async VectorDBBase methods"""
+
+    @pytest.mark.asyncio
+    async def test_fallback_runs_off_the_event_loop(self):
+        """Concurrent asearch calls overlap instead of blocking the loop"""
+        db = BlockingVectorDB(delay=0.2)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[db.asearch(f"c{i}", vectors=[[0.0]], limit=1) for i in range(4)]
+        )
+        elapsed = time.perf_counter() - start
+
+        assert [result.ids[0][0] for result in results] == ["c0", "c1", "c2", "c3"]
+        assert threading.get_ident() not in db.threads
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_aget_returns_sync_result(self):
+        db = BlockingVectorDB()
+        result = await db.aget("c")
+        assert result.ids == [["c"]]
+
+    @pytest.mark.asyncio
+    async def test_asearch_many_stacks_rows_per_vector(self):
+        """The default search_many issues one search per collection and vector"""
+        db = BlockingVectorDB(delay=0)
+        results = await db.asearch_many(["a", "b"], vectors=[[0.0], [1.0]])
+
+        assert results["a"].ids == [["a"], ["a"]]
+        assert results["b"].ids == [["b"], ["b"]]
+        assert db.search_many(["a"], vectors=[[0.0]])["a"].ids == [["a"]]
+
+    @pytest.mark.asyncio
+    async def test_search_many_marks_failed_collections(self):
+        """A failed collection is told apart from one without results"""
+        db = BlockingVectorDB(delay=0, failing=["a", ("b", [1.0])])
+        for results in [
+            db.search_many(["a", "b"], vectors=[[0.0], [1.0]]),
+            await db.asearch_many(["a", "b"], vectors=[[0.0], [1.0]]),
+        ]:
+            assert results["a"] == SearchError(error="unavailable")
+            # Only the row of the failed vector is empty
+            assert results["b"].ids == [["b"], []]
+
+
+class AsyncClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class NativeAsyncVectorDB(BlockingVectorDB):
+    def __init__(self):
+        super().__init__(delay=0)
+        self.clients = []
+
+    def _create_async_client(self):
+        self.clients.append(AsyncClient())
+        return self.clients[-1]
+
+
+class TestAsyncClient:
+    """Test the lifecycle of the native async clients"""
+
+    def test_client_of_a_previous_loop_is_closed(self):
+        db = NativeAsyncVectorDB()
+
+        async def use_client():
+            client = db._get_async_client()
+            assert db._get_async_client() is client
+            # Let the close of the previous client run
+            await asyncio.sleep(0)
+
+        asyncio.run(use_client())
+        asyncio.run(use_client())
+
+        first, second = db.clients
+        assert first.closed and not second.closed
+
+    @pytest.mark.asyncio
+    async def test_aclose(self):
+        db = NativeAsyncVectorDB()
+        client = db._get_async_client()
+        await db.aclose()
+        assert client.closed
+        assert db._get_async_client() is not client
+
+    @pytest.mark.asyncio
+    async def test_backends_without_native_client(self):
+        with pytest.raises(NotImplementedError, match="BlockingVectorDB"):
+            BlockingVectorDB()._get_async_client()
+        # Nothing to close
+        await BlockingVectorDB().aclose()
+
+
+class TestQdrantNativeAsync:
+    """Test the native async methods of Qdrant against its in-memory mode"""
+
+    @pytest.mark.asyncio
+    async def test_upsert_search_and_get(self):
+        from qdrant_client import AsyncQdrantClient
+        from qdrant_client.models import Distance, VectorParams
+
+        from open_webui.retrieval.vector.dbs.qdrant import QdrantClient
+
+        # Skip __init__, which requires QDRANT_URI
+        qdrant = QdrantClient.__new__(QdrantClient)
+        qdrant.collection_prefix = "test"
+        qdrant._create_async_client = lambda: AsyncQdrantClient(":memory:")
+
+        client = qdrant._get_async_client()
+        await client.create_collection(
+            "test_memories",
+            vectors_config=VectorParams(size=2, distance=Distance.COSINE),
+        )
+        await qdrant.aupsert(
+            "memories",
+            [
+                {
+                    "id": "00000000-0000-0000-0000-00000000000" + str(idx),
+                    "text": text,
+                    "vector": vector,
+                    "metadata": {"user_id": user_id},
+                }
+                for idx, (text, vector, user_id) in enumerate(
+                    [
+                        ("tea", [1.0, 0.0], "alice"),
+                        ("coffee", [0.9, 0.1], "bob"),
+                        ("paris", [0.0, 1.0], "alice"),
+                    ]
+                )
+            ],
+        )
+
+        result = await qdrant.asearch("memories", [[1.0, 0.0]], limit=2)
+        assert result.documents == [["tea", "coffee"]]
+        result = await qdrant.asearch(
+            "memories", [[1.0, 0.0]], filter={"user_id": "alice"}, limit=2
+        )
+        assert result.documents == [["tea", "paris"]]
+        assert sorted((await qdrant.aget("memories")).documents[0]) == [
+            "coffee",
+            "paris",
+            "tea",
+        ]
+
+        await qdrant.aclose()
@@ -0,0 +1,170 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from qdrant_client import QdrantClient as Qclient
+from sqlalchemy.dialects import postgresql
+
+from open_webui.retrieval.vector.dbs.pgvector import PgvectorClient
+from open_webui.retrieval.vector.dbs.qdrant_multitenancy import QdrantClient
+from open_webui.retrieval.vector.main import SearchError
+
+
+@pytest.fixture
+def qdrant():
+    # Skip __init__, which requires QDRANT_URI, and use the in-memory local mode
+    client = QdrantClient.__new__(QdrantClient)
+    client.client = Qclient(":memory:")
+    client.collection_prefix = "test"
+    client.QDRANT_ON_DISK = False
+    client.QDRANT_HNSW_M = 16
+    client.MEMORY_COLLECTION = "test_memories"
+    client.KNOWLEDGE_COLLECTION = "test_knowledge"
+    client.FILE_COLLECTION = "test_files"
+    client.WEB_SEARCH_COLLECTION = "test_web-search"
+    client.HASH_BASED_COLLECTION = "test_hash-based"
+    return client
+
+
+def insert(client, collection_name, *vectors):
+    client.upsert(
+        collection_name,
+        [
+            {
+                "id": str(uuid4()),
+                "text": f"{collection_name}-{idx}",
+                "vector": vector,
+                "metadata": {"collection": collection_name},
+            }
+            for idx, vector in enumerate(vectors)
+        ],
+    )
+
+
+class TestQdrantMultitenancySearchMany:
+    """Test batched multi-collection search"""
+
+    def test_matches_per_collection_search(self, qdrant):
+        """Each collection gets its own top-k for each query vector"""
+        insert(qdrant, "kb-a", [1.0, 0.0], [0.9, 0.1], [0.0, 1.0])
+        insert(qdrant, "kb-b", [0.0, 1.0], [0.1, 0.9])
+        insert(qdrant, "file-c", [1.0, 0.0])
+
+        collection_names = ["kb-a", "kb-b", "file-c", "file-missing"]
+        vectors = [[1.0, 0.0], [0.0, 1.0]]
+        results = qdrant.search_many(collection_names, vectors, limit=2)
+
+        for collection_name in ["kb-a", "kb-b", "file-c"]:
+            result = results[collection_name]
+            assert len(result.documents) == len(vectors)
+            for qid, vector in enumerate(vectors):
+                expected = qdrant.search(collection_name, [vector], limit=2)
+                assert result.documents[qid] == expected.documents[0]
+                assert all(
+                    metadata["collection"] == collection_name
+                    for metadata in result.metadatas[qid]
+                )
+
+        assert results["file-missing"].documents == [[], []]
+
+    @pytest.mark.asyncio
+    async def test_async_variant(self, qdrant):
+        insert(qdrant, "kb-a", [1.0, 0.0])
+        results = await qdrant.asearch_many(["kb-a"], [[1.0, 0.0]], limit=1)
+        assert results["kb-a"].documents == [["kb-a-0"]]
+
+    def test_no_limit_returns_every_match(self, qdrant):
+        insert(qdrant, "kb-a", *[[1.0, idx / 20] for idx in range(12)])
+        results = qdrant.search_many(["kb-a"], [[1.0, 0.0]], limit=None)
+        assert len(results["kb-a"].ids[0]) == 12
+
+    def test_failed_batch_marks_its_collections(self, qdrant, monkeypatch):
+        insert(qdrant, "kb-a", [1.0, 0.0])
+
+        def fail(**kwargs):
+            raise RuntimeError("unavailable")
+
+        monkeypatch.setattr(qdrant.client, "query_batch_points", fail)
+        results = qdrant.search_many(["kb-a", "kb-b"], [[1.0, 0.0]], limit=1)
+        assert results == {
+            "kb-a": SearchError(error="unavailable"),
+            "kb-b": SearchError(error="unavailable"),
+        }
+
+
+class FakeSession:
+    """Session returning canned rows for the statements it is given"""
+
+    def __init__(self, rows=(), error=None):
+        self.rows = list(rows)
+        self.error = error
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(all=lambda: self.rows)
+
+    def rollback(self):
+        pass
+
+
+def pgvector_client(session):
+    # Skip __init__, which connects to Postgres
+    client = PgvectorClient.__new__(PgvectorClient)
+    client.session = session
+    return client
+
+
+def row(qid, collection_name, id, distance):
+    return SimpleNamespace(
+        qid=qid,
+        q_collection=collection_name,
+        id=id,
+        text=f"text-{id}",
+        vmetadata={"collection": collection_name},
+        distance=distance,
+    )
+
+
+class TestPgvectorSearchMany:
+    """Test the single-statement multi-collection search of pgvector"""
+
+    def test_one_statement_for_all_collections_and_vectors(self):
+        session = FakeSession(
+            [
+                row(0, "kb-a", "a1", 0.0),
+                row(0, "kb-a", "a2", 1.0),
+                row(1, "kb-a", "a2", 0.5),
+                row(1, "kb-b", "b1", 2.0),
+            ]
+        )
+        results = pgvector_client(session).search_many(
+            ["kb-a", "kb-b", "kb-c"],
+            [[1.0, 0.0], [0.0, 1.0]],
+            filter={"file_id": "f1"},
+            limit=2,
+        )
+
+        [stmt] = session.statements
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        # The limit applies per (query vector, collection) pair
+        assert "LATERAL" in str(compiled) and "LIMIT" in str(compiled)
+        assert {"file_id", "f1", 2} <= set(compiled.params.values())
+
+        assert results["kb-a"].ids == [["a1", "a2"], ["a2"]]
+        assert results["kb-a"].distances == [[1.0, 0.5], [0.75]]
+        assert results["kb-b"].ids == [[], ["b1"]]
+        assert results["kb-c"].ids == [[], []]
+
+    @pytest.mark.asyncio
+    async def test_failure_marks_every_collection(self):
+        client = pgvector_client(FakeSession(error=RuntimeError("down")))
+        client.async_db_url = None
+
+        results = await client.asearch_many(["kb-a", "kb-b"], [[1.0]], limit=1)
+        assert results == {
+            "kb-a": SearchError(error="down"),
+            "kb-b": SearchError(error="down"),
+        }
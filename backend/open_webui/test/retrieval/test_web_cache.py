@@ -0,0 +1,191 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from open_webui.retrieval.web.cache import (
+    WEB_FETCH_CACHE,
+    WebCache,
+    get_cache_control_ttl,
+)
+from open_webui.retrieval.web.utils import SafeWebBaseLoader
+
+
+class TestCacheControl:
+    def test_max_age_caps_ttl(self):
+        assert get_cache_control_ttl(None, 3600) == 3600
+        assert get_cache_control_ttl("public, max-age=60", 3600) == 60
+        assert get_cache_control_ttl("max-age=60, s-maxage=120", 3600) == 120
+        assert get_cache_control_ttl("max-age=86400", 3600) == 3600
+
+    def test_uncacheable_responses(self):
+        assert get_cache_control_ttl("no-store", 3600) == 0
+        assert get_cache_control_ttl("private, max-age=600", 3600) == 0
+        assert get_cache_control_ttl("No-Cache", 3600) == 0
+
+
+class TestWebCache:
+    def test_lru_and_ttl(self):
+        cache = WebCache("test", ttl=60, max_entries=2, backend="memory")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)  # evicts b, a was used more recently
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+        cache.set("short", 4, ttl=0)
+        assert cache.get("short") is None
+
+        cache.set("expiring", 5, ttl=1)
+        cache._entries["expiring"] = (time.time() - 1, 5)
+        assert cache.get("expiring") is None
+
+    def test_disabled(self):
+        cache = WebCache("test", ttl=0, backend="memory")
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_disk_backend_is_shared(self, tmp_path):
+        first = WebCache("test", ttl=60, backend="disk", cache_dir=tmp_path)
+        first.set("a", {"value": [1, 2]})
+
+        second = WebCache("test", ttl=60, backend="disk", cache_dir=tmp_path)
+        assert second.get("a") == {"value": [1, 2]}
+
+        second.clear()
+        assert (
+            WebCache("test", ttl=60, backend="disk", cache_dir=tmp_path).get("a")
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_access_to_disk_backend(self, tmp_path):
+        first = WebCache("test", ttl=60, backend="disk", cache_dir=tmp_path)
+        await first.aset("a", {"value": 1})
+        await first.aset("b", {"value": 2}, ttl=0)
+
+        second = WebCache("test", ttl=60, backend="disk", cache_dir=tmp_path)
+        assert await second.aget("a") == {"value": 1}
+        assert await second.aget("b") is None
+        assert (second.hits, second.misses) == (1, 1)
+
+
+@pytest_asyncio.fixture
+async def page_server(stub_server):
+    """Serves a cacheable, an uncacheable and a missing page, counting the requests"""
+    requests = []
+
+    async def page(request):
+        requests.append(request.path)
+        cache_control = "no-store" if request.path == "/private" else "max-age=60"
+        return web.Response(
+            text=f"<html><title>{request.path}</title><body>hello</body></html>",
+            content_type="text/html",
+            headers={"Cache-Control": cache_control},
+            status=404 if request.path == "/missing" else 200,
+        )
+
+    app = web.Application()
+    app.router.add_get("/public", page)
+    app.router.add_get("/private", page)
+    app.router.add_get("/missing", page)
+    yield await stub_server(app), requests
+
+    WEB_FETCH_CACHE.clear()
+
+
+class TestSafeWebBaseLoaderCache:
+    @pytest.mark.asyncio
+    async def test_pages_are_fetched_once(self, page_server, monkeypatch):
+        url, requests = page_server
+        monkeypatch.setattr(WEB_FETCH_CACHE, "ttl", 3600)
+        urls = [f"{url}/public", f"{url}/private"]
+
+        for _ in range(2):
+            docs = await SafeWebBaseLoader(web_paths=urls).aload()
+            assert [doc.metadata["title"] for doc in docs] == ["/public", "/private"]
+
+        assert requests == ["/public", "/private", "/private"]
+
+    @pytest.mark.asyncio
+    async def test_sync_load_respects_cache_control_and_status(
+        self, page_server, monkeypatch
+    ):
+        url, requests = page_server
+        monkeypatch.setattr(WEB_FETCH_CACHE, "ttl", 3600)
+        urls = [f"{url}/public", f"{url}/private", f"{url}/missing"]
+
+        for _ in range(2):
+            # The sync loader blocks, keep the event loop serving the pages
+            docs = await asyncio.to_thread(SafeWebBaseLoader(web_paths=urls).load)
+            assert len(docs) == 3
+
+        assert requests == ["/public", "/private", "/missing", "/private", "/missing"]
+
+
+class TestWebSearchCacheKey:
+    @staticmethod
+    def make_request(**config):
+        from types import SimpleNamespace
+
+        config = {
+            "WEB_SEARCH_RESULT_COUNT": 3,
+            "WEB_SEARCH_DOMAIN_FILTER_LIST": [],
+            "BRAVE_SEARCH_API_KEY": "key",
+            "EXTERNAL_WEB_SEARCH_URL": "http://search",
+            "EXTERNAL_WEB_SEARCH_API_KEY": "key",
+            **config,
+        }
+        return SimpleNamespace(
+            app=SimpleNamespace(state=SimpleNamespace(config=SimpleNamespace(**config)))
+        )
+
+    @staticmethod
+    def get_key(request, engine, user=None):
+        from open_webui.routers.retrieval import (
+            get_web_search_cache_key,
+            get_web_search_call,
+        )
+
+        call = get_web_search_call(request, engine, "query", user)
+        return get_web_search_cache_key(request, engine, call, user)
+
+    def test_key_covers_engine_settings(self):
+        key = self.get_key(self.make_request(), "brave")
+        assert self.get_key(self.make_request(), "brave") == key
+        assert (
+            self.get_key(self.make_request(BRAVE_SEARCH_API_KEY="other"), "brave")
+            != key
+        )
+
+        external = self.get_key(self.make_request(), "external")
+        assert (
+            self.get_key(
+                self.make_request(EXTERNAL_WEB_SEARCH_URL="http://other"), "external"
+            )
+            != external
+        )
+
+    def test_key_ignores_the_request_but_not_the_user(self):
+        from types import SimpleNamespace
+
+        alice, bob = SimpleNamespace(id="alice"), SimpleNamespace(id="bob")
+        key = self.get_key(self.make_request(), "external", alice)
+        assert self.get_key(self.make_request(), "external", alice) == key
+        assert self.get_key(self.make_request(), "external", bob) != key
+
+    def test_invalidate_drops_the_memory_copy(self, tmp_path):
+        first = WebCache("test", ttl=60, backend="disk", cache_dir=tmp_path)
+        second = WebCache("test", ttl=60, backend="disk", cache_dir=tmp_path)
+        first.set("a", 1)
+        assert second.get("a") == 1
+
+        # Another worker cleared the shared entries, the copy in memory remains
+        first.clear()
+        assert second.get("a") == 1
+        second.invalidate()
+        assert second.get("a") is None
@@ -0,0 +1,78 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from open_webui.retrieval.web.fetcher import WebFetcher, aextract_html, extract_html
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <title>Example page</title>
+  <meta name="description" content="A page for testing">
+  <style>body { color: red; }</style>
+  <script>var tracking = "not content";</script>
+</head>
+<body>
+  <!-- a comment -->
+  <h1>Hello</h1>
+  <p>World <b>and</b> more</p>
+  <noscript>Enable JavaScript</noscript>
+</body>
+</html>"""
+
+
+class TestExtractHtml:
+    def test_text_and_metadata(self):
+        text, metadata = extract_html(PAGE, "https://example.com")
+
+        assert metadata == {
+            "source": "https://example.com",
+            "title": "Example page",
+            "description": "A page for testing",
+            "language": "en",
+        }
+        assert "Hello" in text and "World and more" in text
+        for excluded in ("tracking", "color: red", "a comment", "Enable JavaScript"):
+            assert excluded not in text
+
+    def test_empty_and_broken_pages(self):
+        assert extract_html("", "https://example.com")[0] == ""
+        text, metadata = extract_html("<p>unclosed <b>tags", "https://example.com")
+        assert text == "unclosed tags"
+        assert metadata["language"] == "No language found."
+
+    @pytest.mark.asyncio
+    async def test_extract_off_the_event_loop(self):
+        text, metadata = await aextract_html(PAGE, "https://example.com")
+        assert metadata["title"] == "Example page"
+
+
+@pytest_asyncio.fixture
+async def server_url(stub_server):
+    async def page(request):
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def large(request):
+        return web.Response(body=b"a" * 1024 * 1024, content_type="text/plain")
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    app.router.add_get("/large", large)
+    return await stub_server(app)
+
+
+class TestWebFetcher:
+    @pytest.mark.asyncio
+    async def test_reuses_session_and_caps_body(self, server_url):
+        fetcher = WebFetcher(max_bytes=100_000)
+        try:
+            page = await fetcher.fetch(f"{server_url}/page")
+            session = fetcher._get_session(trust_env=False)
+            assert page.status == 200 and page.text == PAGE
+            assert not page.truncated
+
+            large = await fetcher.fetch(f"{server_url}/large")
+            assert large.truncated and len(large.text) == 100_000
+            assert fetcher._get_session(trust_env=False) is session
+        finally:
+            await fetcher.close()
@@ -0,0 +1,159 @@
+import importlib
+import inspect
+import json
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from open_webui.retrieval.web.client import WebSearchClient
+from open_webui.retrieval.web.main import SearchResult
+
+TESTDATA = Path(__file__).parents[2] / "retrieval" / "web" / "testdata"
+
+
+@pytest_asyncio.fixture
+async def server(stub_server):
+    state = {"requests": [], "throttled": 0}
+
+    async def search(request):
+        provider = request.match_info["provider"]
+        state["requests"].append((provider, time.monotonic(), request.query))
+
+        if provider == "throttled" and state["throttled"] == 0:
+            state["throttled"] += 1
+            return web.Response(status=429, headers={"Retry-After": "0.1"})
+        if provider in ("throttled", "limited"):
+            return web.json_response({"ok": True})
+
+        return web.Response(
+            text=(TESTDATA / f"{provider}.json").read_text(),
+            content_type="application/json",
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/{provider}", search)
+    state["url"] = await stub_server(app)
+    return state
+
+
+class StubClient(WebSearchClient):
+    """Sends the requests of every provider to the stub server instead."""
+
+    def __init__(self, url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.url = url
+
+    async def request(self, provider, method, url, **kwargs):
+        query = urlparse(url).query
+        stub_url = f"{self.url}/{provider}" + (f"?{query}" if query else "")
+        return await super().request(provider, method, stub_url, **kwargs)
+
+
+PROVIDERS = [
+    ("brave", "asearch_brave", ("key", "query", 5)),
+    ("google_pse", "asearch_google_pse", ("key", "engine", "query", 5)),
+    ("searchapi", "asearch_searchapi", ("key", "google", "query", 5)),
+    ("serper", "asearch_serper", ("key", "query", 5)),
+    ("serply", "asearch_serply", ("key", "query", 5)),
+    ("serpstack", "asearch_serpstack", ("key", "query", 5)),
+]
+
+
+class TestAsyncProviders:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider,function,args", PROVIDERS)
+    async def test_parses_fixture(self, server, monkeypatch, provider, function, args):
+        module = importlib.import_module(f"open_webui.retrieval.web.{provider}")
+        client = StubClient(server["url"])
+        monkeypatch.setattr(module, "WEB_SEARCH_CLIENT", client)
+        try:
+            results = await getattr(module, function)(*args)
+        finally:
+            await client.close()
+
+        assert results
+        assert all(isinstance(result, SearchResult) for result in results)
+        assert all(result.link.startswith("http") for result in results)
+
+    @pytest.mark.asyncio
+    async def test_searxng_matches_sync_results(self, server, monkeypatch):
+        from open_webui.retrieval.web import searxng
+
+        client = WebSearchClient()
+        monkeypatch.setattr(searxng, "WEB_SEARCH_CLIENT", client)
+        try:
+            results = await searxng.asearch_searxng(
+                f"{server['url']}/searxng", "query", 3, safesearch=1
+            )
+        finally:
+            await client.close()
+
+        fixture = json.loads((TESTDATA / "searxng.json").read_text())["results"]
+        expected = sorted(fixture, key=lambda x: x.get("score", 0), reverse=True)[:3]
+        assert [result.link for result in results] == [
+            result["url"] for result in expected
+        ]
+        assert server["requests"][0][2]["safesearch"] == "1"
+
+
+class TestWebSearchClient:
+    @pytest.mark.asyncio
+    async def test_retries_429_once(self, server):
+        client = WebSearchClient()
+        try:
+            response = await client.request(
+                "throttled", "GET", f"{server['url']}/throttled"
+            )
+        finally:
+            await client.close()
+
+        assert response == {"ok": True}
+        assert len(server["requests"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_spaces_requests_per_provider(self, server):
+        client = WebSearchClient(rate_limits={"limited": 10})
+        try:
+            for _ in range(3):
+                await client.request("limited", "GET", f"{server['url']}/limited")
+        finally:
+            await client.close()
+
+        times = [request[1] for request in server["requests"]]
+        assert all(b - a >= 0.09 for a, b in zip(times, times[1:]))
+
+
+def test_async_engines_take_the_sync_arguments():
+    """asearch_web_engine calls the async functions with the sync call's arguments"""
+    from open_webui.routers.retrieval import (
+        ASYNC_WEB_SEARCH_ENGINES,
+        get_async_web_search,
+    )
+
+    for engine in ASYNC_WEB_SEARCH_ENGINES:
+        async_search = get_async_web_search(engine)
+        module = importlib.import_module(async_search.__module__)
+        sync_search = getattr(module, async_search.__name__.removeprefix("a"))
+        assert list(inspect.signature(async_search).parameters) == list(
+            inspect.signature(sync_search).parameters
+        ), engine
+
+
+def test_async_engines_are_imported_on_first_use():
+    """Importing the router doesn't import the web search providers"""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, open_webui.routers.retrieval; "
+        "print(any(name.startswith('open_webui.retrieval.web.') and "
+        "name.rsplit('.', 1)[1] in ('brave', 'tavily', 'ydc') for name in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip().splitlines()[-1] == "False"
@@ -0,0 +1,11 @@
+from aiohttp import web
+
+
+async def start_stub_server(app: web.Application) -> tuple[web.AppRunner, str]:
+    """Serves `app` on a free local port, returns its runner and base URL"""
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
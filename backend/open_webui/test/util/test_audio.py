@@ -0,0 +1,112 @@
+import asyncio
+import os
+import threading
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from open_webui.utils.audio import (
+    FRAME_BYTES,
+    SAMPLE_RATE,
+    split_on_silence,
+    transcribe_chunks,
+)
+
+
+def pcm(seconds, loud):
+    samples = int(seconds * SAMPLE_RATE)
+    if not loud:
+        return np.zeros(samples, dtype=np.int16).tobytes()
+    wave_ = 8000 * np.sin(2 * np.pi * 440 * np.arange(samples) / SAMPLE_RATE)
+    return wave_.astype(np.int16).tobytes()
+
+
+async def frames(audio):
+    for start in range(0, len(audio), FRAME_BYTES):
+        yield audio[start : start + FRAME_BYTES]
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestSplitOnSilence:
+    @pytest.mark.asyncio
+    async def test_splits_in_first_pause_after_chunk_length(self):
+        # 3s speech, 0.5s pause, 1s speech, 1s pause, 2s speech
+        audio = (
+            pcm(3, True) + pcm(0.5, False) + pcm(1, True) + pcm(1, False) + pcm(2, True)
+        )
+
+        chunks = await collect(split_on_silence(frames(audio), 2, 10))
+
+        assert [round(start, 1) for start, _, _ in chunks] == [0, 3.3, 5.3]
+        assert sum(len(chunk) for _, chunk, _ in chunks) == len(audio)
+        assert all(voiced for _, _, voiced in chunks)
+
+    @pytest.mark.asyncio
+    async def test_cuts_long_speech_and_flags_silence(self):
+        audio = pcm(5, True) + pcm(3, False)
+
+        chunks = await collect(split_on_silence(frames(audio), 1, 2))
+
+        lengths = [len(chunk) / SAMPLE_RATE / 2 for _, chunk, _ in chunks]
+        # Cut at the first frame past the maximum
+        assert lengths[:2] == [pytest.approx(2, abs=0.03)] * 2
+        assert max(lengths) < 2.03
+        voiced = [voiced for _, _, voiced in chunks]
+        assert voiced[2] and not any(voiced[3:])
+
+
+class TestTranscribeChunks:
+    @pytest.mark.asyncio
+    async def test_concurrent_in_order_and_cleaned_up(self, tmp_path):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def transcribe(chunk_path):
+            with wave.open(chunk_path) as f:
+                assert f.getframerate() == SAMPLE_RATE
+            index = int(chunk_path.rsplit("_", 1)[1].split(".")[0])
+            with lock:
+                running.append(index)
+                max_running.append(len(running))
+            # Later chunks finish first
+            time.sleep(0.2 - index * 0.04)
+            with lock:
+                running.remove(index)
+            return {"text": f" chunk {index} "}
+
+        async def chunks():
+            for index in range(5):
+                yield index * 1.0, pcm(1, True), True
+            yield 5.0, pcm(1, False), False
+
+        segments = await collect(
+            transcribe_chunks(chunks(), transcribe, str(tmp_path / "audio"), 2)
+        )
+
+        assert [segment["text"] for segment in segments] == [
+            f"chunk {index}" for index in range(5)
+        ]
+        assert segments[1] == {"index": 1, "start": 1.0, "end": 2.0, "text": "chunk 1"}
+        assert max(max_running) == 2
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_pipeline(self, tmp_path):
+        def transcribe(chunk_path):
+            raise RuntimeError("boom")
+
+        async def chunks():
+            yield 0.0, pcm(1, True), True
+
+        with pytest.raises(RuntimeError):
+            await collect(
+                transcribe_chunks(chunks(), transcribe, str(tmp_path / "audio"), 2)
+            )
+        await asyncio.sleep(0)
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,136 @@
+import base64
+import io
+import os
+
+from PIL import Image
+
+from open_webui.utils.image_cache import ImageCache, encode_image
+
+
+def make_png(width=400, height=200, color="red"):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def decode(data_url):
+    header, data = data_url.split(",", 1)
+    return header, Image.open(io.BytesIO(base64.b64decode(data)))
+
+
+class Loader:
+    def __init__(self, data, content_type="image/png"):
+        self.data = data
+        self.content_type = content_type
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.data, self.content_type
+
+
+class TestEncodeImage:
+    def test_keeps_original_without_conversion(self):
+        data = make_png()
+        data_url, converted = encode_image(data, "image/png")
+
+        assert not converted
+        assert data_url == f"data:image/png;base64,{base64.b64encode(data).decode()}"
+
+    def test_downscales_and_reencodes(self):
+        data_url, converted = encode_image(make_png(), "image/png", 100, "jpeg")
+        header, image = decode(data_url)
+
+        assert converted
+        assert header == "data:image/jpeg;base64"
+        assert image.size == (100, 50)
+
+    def test_small_image_in_target_format_is_kept(self):
+        _, converted = encode_image(make_png(50, 50), "image/png", 100, "png")
+        assert not converted
+
+    def test_invalid_image_is_kept(self):
+        data_url, converted = encode_image(b"<svg></svg>", "image/svg+xml", 100)
+        assert not converted
+        assert data_url.startswith("data:image/svg+xml;base64,")
+
+
+class TestImageCache:
+    def test_hits_across_calls_and_sources(self, tmp_path):
+        cache = ImageCache(max_memory_mb=1, max_disk_mb=0, cache_dir=tmp_path)
+        data = make_png()
+        load = Loader(data)
+
+        first = cache.get_data_url(("file", "a", 1), load, 100, "webp")
+        assert cache.get_data_url(("file", "a", 1), load, 100, "webp") == first
+        assert load.calls == 1
+
+        # Same content under another source is read, but not encoded again
+        other = Loader(data)
+        assert cache.get_data_url(("url", "https://x/a.png"), other, 100, "webp") == (
+            first
+        )
+        assert other.calls == 1
+
+        # A new version of the file is loaded again
+        cache.get_data_url(("file", "a", 2), load, 100, "webp")
+        assert load.calls == 2
+
+        metrics = cache.get_metrics()
+        assert metrics["hits"] == 1
+        assert metrics["content_hits"] == 2
+        assert metrics["converted"] == 1
+        assert metrics["memory_entries"] == 1
+
+    def test_url_sources_expire(self, tmp_path):
+        cache = ImageCache(max_memory_mb=1, max_disk_mb=0, cache_dir=tmp_path)
+        load = Loader(make_png())
+
+        cache.get_data_url(("url", "https://x/a.png"), load, ttl=0)
+        cache.get_data_url(("url", "https://x/a.png"), load, ttl=0)
+        assert load.calls == 2
+
+    def test_memory_bound_and_disk(self, tmp_path):
+        cache = ImageCache(max_memory_mb=1, max_disk_mb=1, cache_dir=tmp_path)
+        images = []
+        # Random pixels don't compress, each image is about 360KB encoded
+        for index in range(6):
+            buffer = io.BytesIO()
+            Image.frombytes("RGB", (300, 300), os.urandom(300 * 300 * 3)).save(
+                buffer, format="PNG"
+            )
+            images.append(buffer.getvalue())
+            cache.get_data_url(("file", index), Loader(images[-1]))
+
+        metrics = cache.get_metrics()
+        assert 0 < metrics["memory_mb"] <= 1
+        assert metrics["memory_entries"] < len(images)
+        assert 0 < metrics["disk_mb"] <= 1
+
+        # Another worker finds the encoded image on disk
+        fresh = ImageCache(max_memory_mb=1, max_disk_mb=1, cache_dir=tmp_path)
+        assert fresh.get_metrics()["disk_mb"] == metrics["disk_mb"]
+        fresh.get_data_url(("file", 5), Loader(images[-1]))
+        assert fresh.get_metrics()["disk_hits"] == 1
+
+    def test_failed_load(self, tmp_path):
+        cache = ImageCache(max_memory_mb=1, max_disk_mb=0, cache_dir=tmp_path)
+        assert cache.get_data_url(("file", "missing"), lambda: None) is None
+        assert cache.get_metrics()["failed"] == 1
+
+
+def test_model_image_options(monkeypatch):
+    from open_webui.utils import middleware
+
+    monkeypatch.setattr(middleware, "CHAT_IMAGE_MAX_SIZE", 2048)
+    monkeypatch.setattr(middleware, "CHAT_IMAGE_FORMAT", "")
+
+    def options(meta):
+        return middleware.get_model_image_options({"id": "m", "info": {"meta": meta}})
+
+    assert options({}) == (2048, "")
+    assert options({"imageMaxSize": "512", "imageFormat": "webp"}) == (512, "webp")
+    # Invalid values fall back to the defaults instead of failing the request
+    for max_size in ("large", "", [512], -1):
+        assert options({"imageMaxSize": max_size}) == (2048, "")
+    assert middleware.get_model_image_options({"info": None}) == (2048, "")
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from open_webui.utils.invalidation import CacheInvalidator
+
+
+class TestCacheInvalidator:
+    """Test cross-worker cache invalidation over local sockets"""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_workers_only(self, tmp_path):
+        """Handlers run in every other worker, but not in the publishing one"""
+        workers = [CacheInvalidator(socket_dir=tmp_path, workers=2) for _ in range(3)]
+        received = {idx: [] for idx in range(3)}
+        for idx, worker in enumerate(workers):
+            worker.register("tools", received[idx].append)
+            await worker.start()
+
+        try:
+            workers[0].publish("tools", "tool-a")
+            workers[0].publish("models")
+            await asyncio.sleep(0.05)
+        finally:
+            for worker in workers:
+                await worker.stop()
+
+        assert received == {0: [], 1: ["tool-a"], 2: ["tool-a"]}
+        assert list(tmp_path.glob("*.sock")) == []
+
+    @pytest.mark.asyncio
+    async def test_single_worker_does_not_publish(self, tmp_path):
+        """Without Redis and with a single worker, publishing is a no-op"""
+        worker = CacheInvalidator(socket_dir=tmp_path, workers=1)
+        await worker.start()
+        worker.publish("tools", "tool-a")
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_debounced_invalidations_run_once(self, tmp_path):
+        """Invalidations of a debounced scope are coalesced into one handler call"""
+        workers = [CacheInvalidator(socket_dir=tmp_path, workers=2) for _ in range(2)]
+        received = []
+
+        async def handler(key):
+            received.append(key)
+
+        workers[1].register("config", handler, debounce=0.1)
+        for worker in workers:
+            await worker.start()
+
+        try:
+            for key in ["A", "B", "C"]:
+                workers[0].publish("config", key)
+            workers[0].publish("tools", "tool-a")
+            await asyncio.sleep(0.05)
+            assert received == []
+            await asyncio.sleep(0.15)
+            # The keys differed, so the handler invalidates the whole scope
+            assert received == [None]
+
+            workers[0].publish("config", "A")
+            workers[0].publish("config", "A")
+            await asyncio.sleep(0.2)
+            assert received == [None, "A"]
+        finally:
+            for worker in workers:
+                await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_redis_listener_resubscribes(self):
+        """A dropped Redis subscription is restored and every cache invalidated"""
+        subscriptions = []
+
+        class PubSub:
+            async def subscribe(self, channel):
+                subscriptions.append(channel)
+
+            async def listen(self):
+                if len(subscriptions) == 1:
+                    raise ConnectionError("Connection reset by peer")
+                yield {
+                    "type": "message",
+                    "data": '{"worker": "other", "scope": "tools", "key": "tool-a"}',
+                }
+                await asyncio.Event().wait()
+
+            async def aclose(self):
+                pass
+
+        class Redis:
+            def pubsub(self):
+                return PubSub()
+
+        worker = CacheInvalidator(workers=1)
+        received = []
+        worker.register("tools", received.append)
+        await worker.start(Redis())
+        try:
+            await asyncio.sleep(1.2)
+        finally:
+            await worker.stop()
+
+        assert len(subscriptions) == 2
+        # None for the messages missed while disconnected
+        assert received == [None, "tool-a"]
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from open_webui.utils.lazy import LazyObject, resolve
+
+
+class TestLazyObject:
+    """Test deferred initialization proxy"""
+
+    def test_factory_runs_on_first_use_only(self):
+        """The object is built on first attribute access, exactly once"""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return "value"
+
+        lazy = LazyObject(factory)
+        assert calls == []
+        assert not lazy.is_resolved
+
+        assert lazy.upper() == "VALUE"
+        assert lazy.lower() == "value"
+        assert calls == [1]
+        assert resolve(lazy) == "value"
+
+    def test_concurrent_first_use_builds_once(self):
+        """Concurrent first use from worker threads only builds one object"""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        lazy = LazyObject(factory)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: resolve(lazy), range(32)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_calls_and_truthiness_are_forwarded(self):
+        """Lazy callables and lazily-built None behave like the real object"""
+        assert LazyObject(lambda: (lambda x: x * 2))(3) == 6
+        assert not LazyObject(lambda: None)
+        assert resolve("plain") == "plain"
@@ -0,0 +1,152 @@
+import socket
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import uvicorn
+from mcp.server.fastmcp import FastMCP
+
+from open_webui.utils.mcp.pool import MCPSessionPool
+from open_webui.utils.middleware import get_mcp_server_tools
+
+
+@pytest.fixture(scope="module")
+def mcp_url():
+    """Serves a small streamable HTTP MCP server on a free local port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    mcp = FastMCP("test")
+
+    @mcp.tool()
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @mcp.tool()
+    def subtract(a: int, b: int) -> int:
+        return a - b
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            mcp.streamable_http_app(), host="127.0.0.1", port=port, log_level="error"
+        )
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    yield f"http://127.0.0.1:{port}/mcp"
+
+    server.should_exit = True
+    thread.join()
+
+
+class TestMCPSessionPool:
+    """Test session reuse and tool spec caching"""
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_reused_per_auth_identity(self, mcp_url):
+        pool = MCPSessionPool()
+        try:
+            session = await pool.acquire("test", mcp_url, {"Authorization": "a"})
+            assert await session.client.call_tool("add", {"a": 1, "b": 2}) == [
+                {"type": "text", "text": "3", "annotations": None, "meta": None}
+            ]
+            session.release()
+
+            assert (
+                await pool.acquire("test", mcp_url, {"Authorization": "a"}) is session
+            )
+            other = await pool.acquire("test", mcp_url, {"Authorization": "b"})
+            assert other is not session
+
+            stats = pool.get_stats()
+            assert stats["connects"] == 2
+            assert stats["reuses"] == 1
+            assert stats["leases"] == 2
+        finally:
+            await pool.stop()
+
+        assert pool.get_stats()["sessions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_tool_specs_are_cached_until_invalidated(self, mcp_url):
+        pool = MCPSessionPool(tool_specs_ttl=60)
+        try:
+            session = await pool.acquire("test", mcp_url)
+            tool_specs = await pool.get_tool_specs(session)
+            assert [tool_spec["name"] for tool_spec in tool_specs] == [
+                "add",
+                "subtract",
+            ]
+
+            assert await pool.get_tool_specs(session) is tool_specs
+            session.invalidate_tool_specs()
+            assert await pool.get_tool_specs(session) is not tool_specs
+
+            stats = pool.get_stats()
+            assert stats["tool_specs_hits"] == 1
+            assert stats["tool_specs_misses"] == 2
+        finally:
+            await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_are_closed(self, mcp_url):
+        pool = MCPSessionPool(idle_timeout=0)
+        try:
+            session = await pool.acquire("test", mcp_url)
+            await pool.check_sessions()
+            assert pool.get_stats()["sessions"] == 1  # still leased
+
+            session.release()
+            await pool.check_sessions()
+            assert pool.get_stats()["sessions"] == 0
+            assert not session.is_alive
+        finally:
+            await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_function_name_filter_skips_only_filtered_tools(mcp_url, monkeypatch):
+    """Tools rejected by the filter list are left out, the others are kept"""
+    pool = MCPSessionPool()
+    monkeypatch.setattr("open_webui.utils.middleware.ENABLE_MCP_SESSION_POOL", True)
+    monkeypatch.setattr("open_webui.utils.middleware.MCP_SESSION_POOL", pool)
+    request = SimpleNamespace(
+        app=SimpleNamespace(
+            state=SimpleNamespace(
+                config=SimpleNamespace(
+                    TOOL_SERVER_CONNECTIONS=[
+                        {
+                            "type": "mcp",
+                            "url": mcp_url,
+                            "auth_type": "none",
+                            "info": {"id": "calc"},
+                            "config": {"function_name_filter_list": "add"},
+                        }
+                    ]
+                )
+            )
+        )
+    )
+
+    mcp_sessions = []
+    try:
+        tools = await get_mcp_server_tools(
+            request,
+            "calc",
+            SimpleNamespace(id="admin", role="admin"),
+            {},
+            {},
+            {},
+            mcp_sessions,
+        )
+    finally:
+        for mcp_session in mcp_sessions:
+            mcp_session.release()
+        await pool.stop()
+
+    assert list(tools) == ["calc_add"]
@@ -0,0 +1,73 @@
+from open_webui.utils.plugin import PluginCache
+
+
+class TestPluginCache:
+    def test_is_current_follows_updated_at(self):
+        cache = PluginCache(revalidate_interval=0)
+        updated_at = {"tool": 1}
+        calls = []
+
+        def get_updated_at(plugin_id):
+            calls.append(plugin_id)
+            return updated_at.get(plugin_id)
+
+        assert not cache.is_current("tool", get_updated_at)
+
+        cache.set("tool", 1, "print('a')")
+        assert cache.is_current("tool", get_updated_at)
+
+        updated_at["tool"] = 2
+        assert not cache.is_current("tool", get_updated_at)
+        assert cache.has_content("tool", "print('a')")
+        assert not cache.has_content("tool", "print('b')")
+
+        # Deleted rows are never current
+        updated_at.pop("tool")
+        assert not cache.is_current("tool", get_updated_at)
+        assert calls == ["tool"] * 3
+
+    def test_revalidate_interval_skips_lookups(self):
+        cache = PluginCache(revalidate_interval=60)
+        cache.set("tool", 1, "")
+
+        def get_updated_at(plugin_id):
+            raise AssertionError("should not be called")
+
+        assert cache.is_current("tool", get_updated_at)
+
+    def test_valves_cached_per_version(self):
+        cache = PluginCache(revalidate_interval=0)
+        updated_at = {"fn": 1}
+        loads = []
+
+        def load_valves(plugin_id):
+            loads.append(plugin_id)
+            return {"version": updated_at[plugin_id]}
+
+        # Also cached for modules loaded outside the cache
+        assert cache.get_valves("fn", updated_at.get, load_valves) == {"version": 1}
+        assert cache.get_valves("fn", updated_at.get, load_valves) == {"version": 1}
+        assert len(loads) == 1
+
+        updated_at["fn"] = 2
+        assert cache.get_valves("fn", updated_at.get, load_valves) == {"version": 2}
+        assert len(loads) == 2
+
+        cache.invalidate("fn")
+        cache.get_valves("fn", updated_at.get, load_valves)
+        assert len(loads) == 3
+
+    def test_invalidate_valves_keeps_module(self):
+        cache = PluginCache(revalidate_interval=60)
+        cache.set("fn", 1, "print('a')")
+        loads = []
+
+        def load_valves(plugin_id):
+            loads.append(plugin_id)
+            return {"priority": len(loads)}
+
+        assert cache.get_valves("fn", lambda _: 1, load_valves) == {"priority": 1}
+        cache.invalidate_valves("fn")
+        assert cache.get_valves("fn", lambda _: 1, load_valves) == {"priority": 2}
+        assert cache.is_current("fn", lambda _: 1)
+        assert cache.has_content("fn", "print('a')")
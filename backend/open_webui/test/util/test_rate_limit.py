@@ -0,0 +1,18 @@
+from open_webui.utils.rate_limit import RateLimiter
+
+
+class TestSharedRateLimiter:
+    """Test rate limit counters shared between workers"""
+
+    def test_limit_is_shared_across_limiters(self, tmp_path):
+        """Two limiters on the same store enforce a single combined limit"""
+        path = str(tmp_path / "ratelimit.db")
+        workers = [
+            RateLimiter(None, limit=3, window=60, shared_store_path=path)
+            for _ in range(2)
+        ]
+
+        results = [workers[idx % 2].is_limited("user@example.com") for idx in range(4)]
+
+        assert results == [False, False, False, True]
+        assert workers[1].get_count("user@example.com") == 4
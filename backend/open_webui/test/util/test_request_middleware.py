@@ -0,0 +1,146 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from open_webui.utils.request_middleware import RequestPipelineMiddleware
+
+
+def make_app(events: list, release: asyncio.Event = None) -> FastAPI:
+    app = FastAPI()
+    app.state.config = SimpleNamespace(
+        ENABLE_API_KEYS=True,
+        ENABLE_API_KEYS_ENDPOINT_RESTRICTIONS=True,
+        API_KEYS_ALLOWED_ENDPOINTS="/api/allowed",
+    )
+
+    @app.get("/api/allowed")
+    async def allowed():
+        events.append("endpoint")
+        return PlainTextResponse("ok")
+
+    @app.get("/api/stream")
+    async def stream():
+        async def chunks():
+            yield b"first"
+            # Only sent once the client has seen the first chunk
+            await release.wait()
+            yield b"second"
+
+        return StreamingResponse(chunks())
+
+    app.add_middleware(
+        RequestPipelineMiddleware,
+        on_response_start=lambda: events.append("session committed"),
+    )
+    return app
+
+
+async def call(app, path: str, headers: dict = None, query: str = "", on_send=None):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [
+            (key.lower().encode(), value.encode())
+            for key, value in (headers or {}).items()
+        ],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    messages = []
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if requested:
+            # The client stays connected
+            await asyncio.Event().wait()
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+        if on_send:
+            on_send(message)
+
+    await app(scope, receive, send)
+
+    start = messages[0]
+    return (
+        start["status"],
+        {key.decode().lower(): value.decode() for key, value in start["headers"]},
+        [message.get("body", b"") for message in messages[1:]],
+    )
+
+
+@pytest.fixture(autouse=True)
+def security_headers(monkeypatch):
+    monkeypatch.setenv("XFRAME_OPTIONS", "DENY")
+
+
+@pytest.mark.asyncio
+async def test_response_headers_and_session_commit():
+    events = []
+    status, headers, body = await call(make_app(events), "/api/allowed")
+
+    assert status == 200
+    assert b"".join(body) == b"ok"
+    assert headers["x-frame-options"] == "DENY"
+    assert "x-process-time" in headers
+    # The session is committed when the response starts, after the endpoint
+    assert events == ["endpoint", "session committed"]
+
+
+@pytest.mark.asyncio
+async def test_layer_order():
+    events = []
+    app = make_app(events)
+
+    # Malformed socket.io upgrades are rejected before any other stage
+    status, headers, _ = await call(app, "/ws/socket.io/", query="transport=websocket")
+    assert status == 400
+    assert "x-process-time" not in headers
+    assert events == []
+
+    # API key restrictions run inside the timing/session stages but outside
+    # the security headers
+    status, headers, _ = await call(
+        app, "/api/stream", headers={"Authorization": "Bearer sk-key"}
+    )
+    assert status == 403
+    assert "x-process-time" in headers
+    assert "x-frame-options" not in headers
+    assert events == ["session committed"]
+
+    # Redirects get the security headers
+    status, headers, _ = await call(app, "/watch", query="v=abc")
+    assert status == 307
+    assert headers["location"] == "/?youtube=abc"
+    assert headers["x-frame-options"] == "DENY"
+
+
+@pytest.mark.asyncio
+async def test_streaming_responses_are_not_buffered():
+    release = asyncio.Event()
+    app = make_app([], release)
+
+    def on_send(message):
+        if message.get("body") == b"first":
+            release.set()
+
+    # Deadlocks if the middleware waits for the whole body before sending
+    status, headers, body = await asyncio.wait_for(
+        call(app, "/api/stream", on_send=on_send), timeout=5
+    )
+    assert status == 200
+    assert headers["x-frame-options"] == "DENY"
+    assert [chunk for chunk in body if chunk] == [b"first", b"second"]
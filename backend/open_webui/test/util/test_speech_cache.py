@@ -0,0 +1,78 @@
+import json
+import os
+import time
+
+import pytest
+
+from open_webui.utils.speech_cache import SpeechCache
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+class TestSpeechCache:
+    @pytest.mark.asyncio
+    async def test_tee_streams_and_caches(self, tmp_path):
+        cache = SpeechCache(cache_dir=tmp_path, max_size_mb=1)
+        assert cache.get("a") is None
+
+        streamed = [
+            chunk
+            async for chunk in cache.tee("a", chunks(b"ab", b"cd"), {"input": "hi"})
+        ]
+
+        assert streamed == [b"ab", b"cd"]
+        assert cache.get("a").read_bytes() == b"abcd"
+        assert json.loads((tmp_path / "a.json").read_text()) == {"input": "hi"}
+        assert list(tmp_path.glob("*.part")) == []
+
+        metrics = cache.get_metrics()
+        assert (metrics["hits"], metrics["misses"], metrics["stored"]) == (1, 1, 1)
+        assert metrics["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_not_cached(self, tmp_path):
+        cache = SpeechCache(cache_dir=tmp_path, max_size_mb=1)
+        closed = []
+
+        async def upstream():
+            try:
+                yield b"ab"
+                yield b"cd"
+            finally:
+                closed.append(True)
+
+        stream = cache.tee("a", upstream())
+        assert await stream.__anext__() == b"ab"
+        await stream.aclose()
+
+        assert closed == [True]
+        assert cache.get("a") is None
+        assert list(tmp_path.iterdir()) == []
+        assert cache.get_metrics()["aborted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path):
+        cache = SpeechCache(cache_dir=tmp_path, max_size_mb=1)
+        audio = os.urandom(300 * 1024)
+
+        for index, name in enumerate(["a", "b", "c"]):
+            async for _ in cache.tee(name, chunks(audio), {}):
+                pass
+            os.utime(tmp_path / f"{name}.mp3", (time.time() - 10 + index,) * 2)
+        # Reading "a" makes "b" the least recently used file
+        cache.get("a")
+
+        async for _ in cache.tee("d", chunks(audio), {}):
+            pass
+
+        assert sorted(path.name for path in tmp_path.glob("*.mp3")) == [
+            "a.mp3",
+            "c.mp3",
+            "d.mp3",
+        ]
+        assert not (tmp_path / "b.json").exists()
+        assert cache.get_metrics()["evicted"] == 1
+        assert cache.get_metrics()["size_mb"] <= 1
@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import pytest
+
+from open_webui.utils.stages import Stage, get_stage_timings, run_stages
+
+
+def sleeping(seconds, value=None, log=None, name=None):
+    async def run():
+        if log is not None:
+            log.append(f"start:{name}")
+        await asyncio.sleep(seconds)
+        if log is not None:
+            log.append(f"end:{name}")
+        return value
+
+    return run
+
+
+class TestRunStages:
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self):
+        start = time.perf_counter()
+        results = await run_stages(
+            [
+                Stage("memory", sleeping(0.2, "m")),
+                Stage("web_search", sleeping(0.2, "w")),
+                Stage("mcp", sleeping(0.2, "t")),
+            ]
+        )
+
+        assert time.perf_counter() - start < 0.4
+        assert {name: result.value for name, result in results.items()} == {
+            "memory": "m",
+            "web_search": "w",
+            "mcp": "t",
+        }
+
+    @pytest.mark.asyncio
+    async def test_dependencies_finish_first(self):
+        log = []
+        await run_stages(
+            [
+                Stage("files", sleeping(0, log=log, name="files"), ("tools",)),
+                Stage("tools", sleeping(0.05, log=log, name="tools")),
+                Stage("memory", sleeping(0.01, log=log, name="memory")),
+            ]
+        )
+
+        assert log.index("end:tools") < log.index("start:files")
+        assert log.index("start:memory") < log.index("end:tools")
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_failure_fall_back_to_default(self):
+        async def fail():
+            raise RuntimeError("boom")
+
+        results = await run_stages(
+            [
+                Stage("slow", sleeping(5), default={}),
+                Stage("broken", fail, default=[]),
+                Stage("after", sleeping(0, "ok"), ("slow", "broken")),
+            ],
+            timeouts={"slow": 0.05},
+        )
+
+        assert (results["slow"].status, results["slow"].value) == ("timeout", {})
+        assert (results["broken"].status, results["broken"].value) == ("failed", [])
+        assert results["after"].value == "ok"
+        assert get_stage_timings(results)["slow"]["status"] == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_required_failure_cancels_other_stages(self):
+        log = []
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await run_stages(
+                [
+                    Stage("broken", fail, required=True),
+                    Stage("slow", sleeping(5, log=log, name="slow")),
+                ]
+            )
+
+        await asyncio.sleep(0)
+        assert log == ["start:slow"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_graphs(self):
+        with pytest.raises(ValueError):
+            await run_stages(
+                [Stage("a", sleeping(0), ("b",)), Stage("b", sleeping(0), ("a",))]
+            )
+        with pytest.raises(ValueError):
+            await run_stages([Stage("a", sleeping(0), ("missing",))])
@@ -0,0 +1,118 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from open_webui.utils.tools import ToolServerRegistry, get_tool_servers_data
+
+SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "Test", "version": "1"},
+    "paths": {
+        "/add": {
+            "post": {
+                "operationId": "add",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/AddForm"}
+                        }
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "AddForm": {
+                "type": "object",
+                "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}},
+                "required": ["a", "b"],
+            }
+        }
+    },
+}
+
+
+@pytest_asyncio.fixture
+async def spec_server(stub_server):
+    """Serves SPEC with an ETag, answering 304 to matching conditional requests"""
+    state = {"etag": '"v1"', "spec": SPEC, "requests": [], "not_modified": 0}
+
+    async def openapi(request):
+        state["requests"].append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == state["etag"]:
+            state["not_modified"] += 1
+            return web.Response(status=304)
+        return web.Response(
+            text=json.dumps(state["spec"]),
+            content_type="application/json",
+            headers={"ETag": state["etag"]},
+        )
+
+    app = web.Application()
+    app.router.add_get("/openapi.json", openapi)
+    state["url"] = await stub_server(app)
+    return state
+
+
+def make_connections(url):
+    return [
+        {
+            "url": url,
+            "path": "openapi.json",
+            "auth_type": "none",
+            "config": {"enable": True},
+            "info": {"id": "calc", "name": "Calculator"},
+        }
+    ]
+
+
+class TestToolServerSpecs:
+    @pytest.mark.asyncio
+    async def test_conditional_fetch_reuses_converted_specs(self, spec_server):
+        connections = make_connections(spec_server["url"])
+        spec_cache = {}
+
+        first = await get_tool_servers_data(connections, spec_cache=spec_cache)
+        second = await get_tool_servers_data(connections, spec_cache=spec_cache)
+
+        assert spec_server["requests"] == [None, '"v1"']
+        assert spec_server["not_modified"] == 1
+        assert second[0]["specs"] is first[0]["specs"]
+        assert sorted(first[0]["specs"][0]["parameters"]["required"]) == ["a", "b"]
+        assert first[0]["openapi"]["info"]["title"] == "Calculator"
+        # The cached spec keeps its own title
+        assert spec_cache and SPEC["info"]["title"] == "Test"
+
+    @pytest.mark.asyncio
+    async def test_registry_serves_from_memory_and_detects_changes(self, spec_server):
+        app = SimpleNamespace(
+            state=SimpleNamespace(
+                redis=None,
+                config=SimpleNamespace(
+                    TOOL_SERVER_CONNECTIONS=make_connections(spec_server["url"])
+                ),
+            )
+        )
+        registry = ToolServerRegistry(refresh_interval=0)
+
+        servers = await registry.get(app)
+        assert await registry.get(app) is servers
+        assert len(spec_server["requests"]) == 1
+        assert registry.version == 1
+
+        _, changed = await registry.refresh(app)
+        assert not changed and registry.version == 1
+
+        spec_server["etag"] = '"v2"'
+        spec_server["spec"] = {**SPEC, "info": {"title": "Test", "version": "2"}}
+        servers, changed = await registry.refresh(app)
+        assert changed and registry.version == 2
+        assert servers[0]["openapi"]["info"]["version"] == "2"
+
+        registry.invalidate()
+        await registry.get(app)
+        assert spec_server["requests"][-1] == '"v2"'
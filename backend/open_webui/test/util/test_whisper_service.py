@@ -0,0 +1,100 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from open_webui.utils.whisper_service import (
+    WhisperServer,
+    WhisperService,
+    WhisperServiceError,
+)
+
+
+class FakeModel:
+    def __init__(self, model_kwargs):
+        self.model_kwargs = model_kwargs
+
+    def transcribe(self, file_path, language=None):
+        if file_path.endswith("broken.wav"):
+            raise RuntimeError("boom")
+
+        time.sleep(0.1)
+        segments = [SimpleNamespace(text=f" {file_path.rsplit('/', 1)[-1]}")]
+        info = SimpleNamespace(language=language, language_probability=1.0, duration=2)
+        return iter(segments), info
+
+
+@pytest.fixture
+def service(tmp_path):
+    address = str(tmp_path / "whisper.sock")
+    loaded = []
+
+    def load_model(model_kwargs):
+        loaded.append(model_kwargs)
+        return FakeModel(model_kwargs)
+
+    server = WhisperServer(address, b"secret", load_model=load_model)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    while not (tmp_path / "whisper.sock").exists():
+        time.sleep(0.01)
+
+    service = WhisperService(address, b"secret")
+    service.loaded = loaded
+    return service
+
+
+class TestWhisperService:
+    def test_jobs_share_one_model_and_are_queued(self, service):
+        with ThreadPoolExecutor(4) as executor:
+            results = list(
+                executor.map(
+                    lambda index: service.transcribe(
+                        f"/audio/{index}.wav", {"model": "base"}, language="en"
+                    ),
+                    range(4),
+                )
+            )
+
+        assert [result["text"] for result in results] == [
+            f" {index}.wav" for index in range(4)
+        ]
+        assert results[0]["language"] == "en"
+        assert service.loaded == [{"model": "base"}]
+
+        metrics = service.get_metrics()
+        assert metrics["running"] and metrics["jobs"] == 4
+        # One job at a time, the last one waited for the three others
+        assert metrics["p95_queue_latency_ms"] >= 250
+        assert 0 < metrics["real_time_factor"] < 1
+
+    def test_model_change_and_errors(self, service):
+        service.transcribe("/audio/a.wav", {"model": "base"})
+        service.transcribe("/audio/a.wav", {"model": "small"})
+        assert service.loaded == [{"model": "base"}, {"model": "small"}]
+
+        with pytest.raises(WhisperServiceError):
+            service.transcribe("/audio/broken.wav", {"model": "small"})
+        assert service.get_metrics()["failed_jobs"] == 1
+
+    def test_wrong_authkey(self, service):
+        intruder = WhisperService(service.address, b"wrong")
+        with pytest.raises(Exception):
+            intruder.transcribe("/audio/a.wav", {"model": "base"})
+        assert service.get_metrics()["jobs"] == 0
+
+    def test_starts_service_process(self, tmp_path):
+        service = WhisperService(str(tmp_path / "spawned.sock"), b"secret")
+        assert service.get_metrics() == {"running": False}
+
+        # faster-whisper may be missing here, the job reaches the service either way
+        try:
+            service.transcribe("/audio/missing.wav", {"model_size_or_path": "none"})
+        except WhisperServiceError:
+            pass
+
+        metrics = service.get_metrics()
+        assert metrics["running"] and metrics["jobs"] == 1
+        assert metrics["pid"] == service._process.pid
+        service._process.kill()
@@ -15,7 +15,7 @@ from typing import Optional
 from fastapi import Request
 
 from open_webui.models.users import UserModel
-from open_webui.routers.retrieval import search_web as _search_web
+from open_webui.routers.retrieval import asearch_web as _search_web
 from open_webui.retrieval.utils import get_content_from_url
 from open_webui.routers.images import (
     image_generations,
@@ -37,7 +37,7 @@ from open_webui.models.channels import Channels, ChannelMember, Channel
 from open_webui.models.messages import Messages, Message
 from open_webui.models.groups import Groups
 from open_webui.models.memories import Memories
-from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.memory import MEMORY_STORE
 from open_webui.utils.sanitize import sanitize_code
 
 log = logging.getLogger(__name__)
@@ -172,7 +172,7 @@ async def search_web(
         # Use admin-configured result count if configured, falling back to model-provided count of provided, else default to 5
         count = __request__.app.state.config.WEB_SEARCH_RESULT_COUNT or count
 
-        results = await asyncio.to_thread(_search_web, __request__, engine, query, user)
+        results = await _search_web(__request__, engine, query, user)
 
         # Limit results
         results = results[:count] if results else []
@@ -656,9 +656,7 @@ async def delete_memory(
         result = Memories.delete_memory_by_id_and_user_id(memory_id, user.id)
 
         if result:
-            VECTOR_DB_CLIENT.delete(
-                collection_name=f"user-memory-{user.id}", ids=[memory_id]
-            )
+            await MEMORY_STORE.delete(user.id, [memory_id])
             return json.dumps(
                 {"status": "success", "message": f"Memory {memory_id} deleted"},
                 ensure_ascii=False,
@@ -1977,7 +1975,7 @@ async def query_knowledge_bases(
 
             accessible_ids = [kb.id for kb in accessible_knowledge_bases.items]
 
-            search_results = VECTOR_DB_CLIENT.search(
+            search_results = await VECTOR_DB_CLIENT.asearch(
                 collection_name=KNOWLEDGE_BASES_COLLECTION,
                 vectors=[query_embedding],
                 filter={"knowledge_base_id": {"$in": accessible_ids}},
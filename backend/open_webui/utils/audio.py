@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import math
+import os
+import wave
+from collections import deque
+from typing import AsyncIterator, Callable
+
+import numpy as np
+from starlette.concurrency import run_in_threadpool
+
+log = logging.getLogger(__name__)
+
+
+# Audio is decoded to 16 kHz mono 16-bit PCM, what speech to text models use
+SAMPLE_RATE = 16000
+BYTES_PER_SECOND = SAMPLE_RATE * 2
+FRAME_MS = 30
+FRAME_BYTES = BYTES_PER_SECOND * FRAME_MS // 1000
+
+# Frames quieter than SILENCE_DBFS for MIN_SILENCE_MS are a pause to split at
+SILENCE_DBFS = -40.0
+MIN_SILENCE_MS = 300
+
+
+async def decode_audio(file_path: str) -> AsyncIterator[bytes]:
+    """
+    Yields the audio of `file_path` as PCM frames of FRAME_MS, decoded by
+    ffmpeg as they are read so the whole file is never held in memory.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-i",
+        file_path,
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-ar",
+        str(SAMPLE_RATE),
+        "-",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    try:
+        while True:
+            try:
+                yield await process.stdout.readexactly(FRAME_BYTES)
+            except asyncio.IncompleteReadError as e:
+                if e.partial:
+                    yield e.partial
+                break
+
+        stderr = await process.stderr.read()
+        if await process.wait() != 0:
+            raise Exception(f"Error decoding audio: {stderr.decode().strip()}")
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+def get_dbfs(frame: bytes) -> float:
+    samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+    if not len(samples):
+        return -math.inf
+
+    rms = math.sqrt(float(np.mean(samples**2)))
+    return 20 * math.log10(rms / 32768) if rms > 0 else -math.inf
+
+
+async def split_on_silence(
+    frames: AsyncIterator[bytes], chunk_seconds: float, max_chunk_seconds: float
+) -> AsyncIterator[tuple[float, bytes, bool]]:
+    """
+    Groups PCM `frames` into chunks of at least `chunk_seconds`, cut in the
+    first pause after that and never longer than `max_chunk_seconds`, so words
+    are rarely split and at most one chunk is held in memory.
+
+    Yields (start in seconds, PCM, whether the chunk has any speech).
+    """
+    min_bytes = int(chunk_seconds * BYTES_PER_SECOND)
+    max_bytes = int(max_chunk_seconds * BYTES_PER_SECOND)
+    min_silence_bytes = MIN_SILENCE_MS * BYTES_PER_SECOND // 1000
+
+    start = 0.0
+    chunk = bytearray()
+    silence = 0
+    voiced = False
+
+    async for frame in frames:
+        chunk += frame
+        if get_dbfs(frame) < SILENCE_DBFS:
+            silence += len(frame)
+        else:
+            silence = 0
+            voiced = True
+
+        if (len(chunk) >= min_bytes and silence >= min_silence_bytes) or len(
+            chunk
+        ) >= max_bytes:
+            yield start, bytes(chunk), voiced
+            start += len(chunk) / BYTES_PER_SECOND
+            chunk = bytearray()
+            silence = 0
+            voiced = False
+
+    if chunk:
+        yield start, bytes(chunk), voiced
+
+
+def write_wav(file_path: str, pcm: bytes):
+    with wave.open(file_path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(pcm)
+
+
+async def transcribe_chunks(
+    chunks: AsyncIterator[tuple[float, bytes, bool]],
+    transcribe_chunk: Callable[[str], dict],
+    file_prefix: str,
+    workers: int,
+) -> AsyncIterator[dict]:
+    """
+    Writes each chunk to `{file_prefix}_{index}.wav` and transcribes it with
+    `transcribe_chunk` (run in the thread pool), at most `workers` at a time.
+    Reading the next chunk waits for a free worker, so memory stays bounded
+    however long the audio is.
+
+    Yields {"index", "start", "end", "text"} in order, as soon as the chunk
+    and the ones before it are transcribed. Chunks without speech are skipped.
+    """
+    semaphore = asyncio.Semaphore(max(workers, 1))
+    pending = deque()
+
+    async def transcribe(chunk_path: str) -> dict:
+        try:
+            return await run_in_threadpool(transcribe_chunk, chunk_path)
+        finally:
+            semaphore.release()
+            if os.path.isfile(chunk_path):
+                os.remove(chunk_path)
+
+    def get_segment(index, start, end, chunk_path, task) -> dict:
+        return {
+            "index": index,
+            "start": round(start, 2),
+            "end": round(end, 2),
+            "text": (task.result().get("text") or "").strip(),
+        }
+
+    try:
+        index = 0
+        async for start, pcm, voiced in chunks:
+            if not voiced:
+                continue
+
+            await semaphore.acquire()
+            chunk_path = f"{file_prefix}_{index}.wav"
+            write_wav(chunk_path, pcm)
+            pending.append(
+                (
+                    index,
+                    start,
+                    start + len(pcm) / BYTES_PER_SECOND,
+                    chunk_path,
+                    asyncio.create_task(transcribe(chunk_path)),
+                )
+            )
+            index += 1
+
+            while pending and pending[0][4].done():
+                yield get_segment(*pending.popleft())
+
+        while pending:
+            await asyncio.wait([pending[0][4]])
+            yield get_segment(*pending.popleft())
+    finally:
+        # The client went away or a chunk failed, drop the chunks not transcribed yet
+        for _, _, _, chunk_path, task in pending:
+            task.cancel()
+            if os.path.isfile(chunk_path):
+                os.remove(chunk_path)
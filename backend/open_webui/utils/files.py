@@ -16,10 +16,12 @@ from pathlib import Path
 from open_webui.storage.provider import Storage
 
 from open_webui.models.chats import Chats
-from open_webui.models.files import Files
+from open_webui.models.files import FileModel, Files
 from open_webui.routers.files import upload_file_handler
 from open_webui.retrieval.web.utils import validate_url
+from open_webui.utils.image_cache import IMAGE_CACHE
 
+import logging
 import mimetypes
 import base64
 import io
@@ -27,40 +29,81 @@ import re
 
 import requests
 
+log = logging.getLogger(__name__)
+
 BASE64_IMAGE_URL_PREFIX = re.compile(r"data:image/\w+;base64,", re.IGNORECASE)
 MARKDOWN_IMAGE_URL_PATTERN = re.compile(r"!\[(.*?)\]\((.+?)\)", re.IGNORECASE)
 
 
+def fetch_image_from_url(url: str) -> tuple[bytes, str]:
+    # Validate URL to prevent SSRF attacks against local/private networks
+    validate_url(url)
+    # Download the image from the URL
+    response = requests.get(url)
+    response.raise_for_status()
+    return response.content, response.headers.get("Content-Type", "image/png")
+
+
+def read_image_file(file: FileModel) -> Optional[tuple[bytes, Optional[str]]]:
+    file_path = Path(Storage.get_file(file.path))
+    if not file_path.is_file():
+        return None
+
+    content_type, _ = mimetypes.guess_type(file_path.name)
+    return file_path.read_bytes(), content_type
+
+
 def get_image_base64_from_url(url: str) -> Optional[str]:
     try:
         if url.startswith("http"):
-            # Validate URL to prevent SSRF attacks against local/private networks
-            validate_url(url)
-            # Download the image from the URL
-            response = requests.get(url)
-            response.raise_for_status()
-            image_data = response.content
-            encoded_string = base64.b64encode(image_data).decode("utf-8")
-            content_type = response.headers.get("Content-Type", "image/png")
-            return f"data:{content_type};base64,{encoded_string}"
+            image_data, content_type = fetch_image_from_url(url)
         else:
             file = Files.get_file_by_id(url)
 
             if not file:
                 return None
 
-            file_path = Storage.get_file(file.path)
-            file_path = Path(file_path)
-
-            if file_path.is_file():
-                with open(file_path, "rb") as image_file:
-                    encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
-                    content_type, _ = mimetypes.guess_type(file_path.name)
-                    return f"data:{content_type};base64,{encoded_string}"
-            else:
+            image = read_image_file(file)
+            if image is None:
                 return None
+            image_data, content_type = image
 
+        encoded_string = base64.b64encode(image_data).decode("utf-8")
+        return f"data:{content_type};base64,{encoded_string}"
+    except Exception as e:
+        return None
+
+
+def get_cached_image_base64_from_url(
+    url: str, max_size: int = 0, image_format: str = ""
+) -> Optional[str]:
+    """
+    Like get_image_base64_from_url, optionally downscaled and re-encoded (see
+    encode_image), but served from IMAGE_CACHE when the image was sent before.
+    """
+    try:
+        if url.startswith("http"):
+            return IMAGE_CACHE.get_data_url(
+                ("url", url),
+                lambda: fetch_image_from_url(url),
+                max_size,
+                image_format,
+                ttl=IMAGE_CACHE.url_ttl,
+            )
+
+        file = Files.get_file_by_id(url)
+        if not file:
+            return None
+
+        # Files are replaced in place on update, their version is part of the source
+        return IMAGE_CACHE.get_data_url(
+            ("file", file.id, file.updated_at, file.hash),
+            lambda: read_image_file(file),
+            max_size,
+            image_format,
+        )
     except Exception as e:
+        log.debug(f"Error encoding image {url}: {e}")
         return None
 
 
@@ -4,6 +4,7 @@ import logging
 from open_webui.utils.plugin import (
     load_function_module_by_id,
     get_function_module_from_cache,
+    get_function_valves_from_cache,
 )
 from open_webui.models.functions import Functions
 
@@ -25,7 +26,7 @@ def get_sorted_filter_ids(request, model: dict, enabled_filter_ids: list = None)
         try:
             function_module = get_function_module(request, function_id)
             if function_module and hasattr(function_module, "Valves"):
-                valves_db = Functions.get_function_valves_by_id(function_id)
+                valves_db = get_function_valves_from_cache(request, function_id)
                 valves = function_module.Valves(**(valves_db if valves_db else {}))
                 return getattr(valves, "priority", 0)
         except Exception:
@@ -84,7 +85,7 @@ async def process_filter_functions(
 
         # Apply valves to the function
         if hasattr(function_module, "valves") and hasattr(function_module, "Valves"):
-            valves = Functions.get_function_valves_by_id(filter_id)
+            valves = get_function_valves_from_cache(request, filter_id)
             function_module.valves = function_module.Valves(
                 **(valves if valves else {})
             )
@@ -0,0 +1,324 @@
+import base64
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+from PIL import Image, ImageOps
+
+from open_webui.config import (
+    CACHE_DIR,
+    CHAT_IMAGE_CACHE_MAX_DISK_MB,
+    CHAT_IMAGE_CACHE_MAX_MEMORY_MB,
+    CHAT_IMAGE_QUALITY,
+    CHAT_IMAGE_URL_CACHE_TTL,
+)
+
+log = logging.getLogger(__name__)
+
+
+IMAGE_FORMATS = {"jpeg": "JPEG", "jpg": "JPEG", "png": "PNG", "webp": "WEBP"}
+
+
+def encode_image(
+    data: bytes,
+    content_type: Optional[str],
+    max_size: int = 0,
+    image_format: str = "",
+    quality: int = CHAT_IMAGE_QUALITY,
+) -> tuple[str, bool]:
+    """
+    Returns the image as a data URL, downscaled so neither side is larger than
+    `max_size` pixels and re-encoded as `image_format` when given, and whether
+    it was converted. Images Pillow can't handle and animations are kept as is.
+    """
+    original = (
+        f"data:{content_type or 'image/png'};base64,"
+        f"{base64.b64encode(data).decode('utf-8')}"
+    )
+    target_format = IMAGE_FORMATS.get(image_format.lower()) if image_format else None
+    if not max_size and not target_format:
+        return original, False
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if getattr(image, "is_animated", False):
+                return original, False
+
+            target_format = target_format or IMAGE_FORMATS.get(
+                (image.format or "").lower(), "PNG"
+            )
+            if target_format == image.format and (
+                not max_size or max(image.size) <= max_size
+            ):
+                return original, False
+
+            # Pixels are rewritten, apply the EXIF rotation before it is dropped
+            converted = ImageOps.exif_transpose(image)
+            if max_size:
+                converted.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            if target_format == "JPEG" and converted.mode not in ("RGB", "L"):
+                converted = converted.convert("RGB")
+
+            buffer = io.BytesIO()
+            converted.save(buffer, format=target_format, quality=quality)
+    except Exception as e:
+        log.debug(f"Could not convert image, sending the original: {e}")
+        return original, False
+
+    return (
+        f"data:image/{target_format.lower()};base64,"
+        f"{base64.b64encode(buffer.getvalue()).decode('utf-8')}",
+        True,
+    )
+
+
+class ImageCache:
+    """
+    Content addressed cache of the data URLs images are sent to models as.
+
+    Sources (file ids with their version, URLs) are mapped to the sha256 of
+    their content, and encoded images are keyed by that hash and the size and
+    format they were converted to, so an image is read and encoded once however
+    many turns, chats or users send it. Encoded images are kept in worker memory
+    (LRU, `max_memory_mb`) and, when `max_disk_mb` is set, in CACHE_DIR/images
+    where all workers share them.
+    """
+
+    def __init__(
+        self,
+        max_memory_mb: int = CHAT_IMAGE_CACHE_MAX_MEMORY_MB,
+        max_disk_mb: int = CHAT_IMAGE_CACHE_MAX_DISK_MB,
+        url_ttl: int = CHAT_IMAGE_URL_CACHE_TTL,
+        cache_dir: Path = CACHE_DIR / "images",
+        max_sources: int = 10000,
+    ):
+        self.max_memory_bytes = max(max_memory_mb, 0) * 1024 * 1024
+        self.max_disk_bytes = max(max_disk_mb, 0) * 1024 * 1024
+        self.url_ttl = url_ttl
+        self.max_sources = max_sources
+
+        self._lock = threading.Lock()
+        # source -> (expires_at, content hash, content type)
+        self._sources: OrderedDict[tuple, tuple[float, str, str]] = OrderedDict()
+        # key -> data URL
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._memory_bytes = 0
+
+        self._dir = None
+        self._disk_bytes = 0
+        if self.max_disk_bytes:
+            self._dir = cache_dir
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(
+                path.stat().st_size for path in self._dir.glob("*.txt")
+            )
+
+        self._metrics = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "content_hits": 0,
+            "misses": 0,
+            "converted": 0,
+            "failed": 0,
+        }
+
+    @staticmethod
+    def get_key(content_hash: str, max_size: int, image_format: str) -> str:
+        return hashlib.sha256(
+            f"{content_hash}:{max_size}:{image_format}".encode()
+        ).hexdigest()
+
+    def _remember(self, key: str, data_url: str):
+        if len(data_url) > self.max_memory_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+
+            self._entries[key] = data_url
+            self._memory_bytes += len(data_url)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _load(self, key: str) -> Optional[str]:
+        if self._dir is None:
+            return None
+
+        path = self._dir / f"{key}.txt"
+        try:
+            data_url = path.read_text()
+            # Recently used entries are the last ones pruned
+            os.utime(path)
+            return data_url
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.debug(f"Error reading image cache entry: {e}")
+            return None
+
+    def _store(self, key: str, data_url: str):
+        if self._dir is None or len(data_url) > self.max_disk_bytes:
+            return
+
+        path = self._dir / f"{key}.txt"
+        try:
+            # Written to a temporary file first, other workers never read a partial entry
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(data_url)
+            tmp_path.replace(path)
+            with self._lock:
+                self._disk_bytes += len(data_url)
+                prune = self._disk_bytes > self.max_disk_bytes
+            if prune:
+                self._prune_dir()
+        except Exception as e:
+            log.debug(f"Error writing image cache entry: {e}")
+
+    def _prune_dir(self):
+        paths = []
+        for path in self._dir.glob("*.txt"):
+            try:
+                stat = path.stat()
+                paths.append((stat.st_mtime, stat.st_size, path))
+            except FileNotFoundError:
+                continue
+
+        # Drop the least recently used entries until the cache is back to 90% of its size
+        total = sum(size for _, size, _ in paths)
+        paths.sort()
+        for _, size, path in paths:
+            if total <= self.max_disk_bytes * 0.9:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        with self._lock:
+            self._disk_bytes = total
+
+    def _get_encoded(self, key: str) -> Optional[str]:
+        with self._lock:
+            data_url = self._entries.get(key)
+            if data_url is not None:
+                self._entries.move_to_end(key)
+                self._metrics["memory_hits"] += 1
+                return data_url
+
+        data_url = self._load(key)
+        if data_url is not None:
+            self._remember(key, data_url)
+            with self._lock:
+                self._metrics["disk_hits"] += 1
+        return data_url
+
+    def _get_source(self, source: tuple) -> Optional[tuple[str, str]]:
+        with self._lock:
+            entry = self._sources.get(source)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._sources[source]
+                return None
+            self._sources.move_to_end(source)
+            return entry[1], entry[2]
+
+    def _set_source(self, source: tuple, ttl: float, content_hash: str, content_type):
+        with self._lock:
+            self._sources[source] = (time.time() + ttl, content_hash, content_type)
+            self._sources.move_to_end(source)
+            while len(self._sources) > self.max_sources:
+                self._sources.popitem(last=False)
+
+    def get_data_url(
+        self,
+        source: tuple,
+        load: Callable[[], Optional[tuple[bytes, Optional[str]]]],
+        max_size: int = 0,
+        image_format: str = "",
+        ttl: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Returns the data URL of the image identified by `source`, converted with
+        encode_image. `load` is only called when the content of `source` isn't
+        known, and returns the image bytes and content type or None. `source`
+        must change when its content does, or be remembered for `ttl` seconds.
+        """
+        ttl = float("inf") if ttl is None else ttl
+
+        known = self._get_source(source)
+        if known is not None:
+            data_url = self._get_encoded(self.get_key(known[0], max_size, image_format))
+            if data_url is not None:
+                with self._lock:
+                    self._metrics["hits"] += 1
+                return data_url
+
+        with self._lock:
+            self._metrics["misses"] += 1
+
+        loaded = load()
+        if loaded is None:
+            with self._lock:
+                self._metrics["failed"] += 1
+            return None
+
+        data, content_type = loaded
+        content_hash = hashlib.sha256(data).hexdigest()
+        if ttl > 0:
+            self._set_source(source, ttl, content_hash, content_type)
+
+        # The same image may already be cached under another source
+        key = self.get_key(content_hash, max_size, image_format)
+        data_url = self._get_encoded(key)
+        if data_url is not None:
+            with self._lock:
+                self._metrics["content_hits"] += 1
+            return data_url
+
+        data_url, converted = encode_image(data, content_type, max_size, image_format)
+        if converted:
+            with self._lock:
+                self._metrics["converted"] += 1
+
+        self._remember(key, data_url)
+        self._store(key, data_url)
+        return data_url
+
+    def get_metrics(self) -> dict:
+        metrics = self._metrics
+        lookups = metrics["hits"] + metrics["misses"]
+
+        return {
+            **metrics,
+            "hit_rate": metrics["hits"] / lookups if lookups else 0,
+            "sources": len(self._sources),
+            "memory_entries": len(self._entries),
+            "memory_mb": round(self._memory_bytes / 1024 / 1024, 2),
+            "max_memory_mb": self.max_memory_bytes // 1024 // 1024,
+            "disk_mb": round(self._disk_bytes / 1024 / 1024, 2),
+            "max_disk_mb": self.max_disk_bytes // 1024 // 1024,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._sources.clear()
+            self._entries.clear()
+            self._memory_bytes = 0
+
+        if self._dir is not None:
+            for path in self._dir.glob("*.txt"):
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+
+
+IMAGE_CACHE = ImageCache()
@@ -0,0 +1,238 @@
+import asyncio
+import inspect
+import json
+import logging
+import os
+import socket
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+from open_webui.env import REDIS_KEY_PREFIX, UVICORN_WORKERS, WORKER_RUNTIME_DIR
+from open_webui.utils.redis import get_redis_client
+
+log = logging.getLogger(__name__)
+
+
+REDIS_INVALIDATION_CHANNEL = f"{REDIS_KEY_PREFIX}:cache:invalidate"
+REDIS_RECONNECT_MAX_DELAY = 30
+
+
+class CacheInvalidator:
+    """
+    Keeps per-worker caches (persistent config, model lists, loaded tool and
+    function modules, ...) consistent when several workers or replicas serve the
+    same instance. A worker that changes the underlying data publishes an
+    invalidation and every other worker runs the handlers registered for that
+    scope against its own copy.
+
+    Messages are sent over Redis pub/sub when Redis is configured (covering all
+    replicas), otherwise over Unix datagram sockets between the workers of this
+    node when UVICORN_WORKERS > 1. With a single worker and no Redis, publishing
+    is a no-op.
+    """
+
+    def __init__(
+        self,
+        socket_dir=WORKER_RUNTIME_DIR / "invalidation",
+        workers: int = UVICORN_WORKERS,
+    ):
+        self._token = f"{os.getpid()}-{uuid4().hex[:8]}"
+        self.worker_id = f"{socket.gethostname()}-{self._token}"
+        self.socket_dir = socket_dir
+        self.workers = workers
+
+        self._handlers: dict[str, list[Callable[[Optional[str]], Any]]] = {}
+        self._debounce: dict[str, float] = {}
+        # Keys of the debounced scopes waiting for their handlers to run
+        self._pending: dict[str, set[Optional[str]]] = {}
+        self._transport: Optional[str] = None
+
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+
+        self._socket: Optional[socket.socket] = None
+        self._socket_path = None
+
+    def register(
+        self,
+        scope: str,
+        handler: Callable[[Optional[str]], Any],
+        debounce: float = 0,
+    ):
+        """
+        Registers `handler(key)` (a function or coroutine function) to run when
+        another worker invalidates `scope`. With `debounce`, the invalidations
+        received within that many seconds run the handlers once, with their key
+        if they all had the same one and None otherwise.
+        """
+        self._handlers.setdefault(scope, []).append(handler)
+        if debounce:
+            self._debounce[scope] = debounce
+
+    def publish(self, scope: str, key: Optional[str] = None):
+        """Tells every other worker to drop its cached copy of `scope` (or `key` in it)."""
+        if self._transport is None:
+            return
+
+        message = json.dumps({"worker": self.worker_id, "scope": scope, "key": key})
+        try:
+            if self._transport == "redis":
+                self._redis.publish(REDIS_INVALIDATION_CHANNEL, message)
+            else:
+                self._send_to_workers(message.encode())
+        except Exception as e:
+            log.warning(f"Failed to publish cache invalidation for {scope}: {e}")
+
+    def _apply(self, data):
+        try:
+            message = json.loads(data)
+            if message.get("worker") == self.worker_id:
+                return
+
+            scope, key = message.get("scope"), message.get("key")
+            log.debug(f"Invalidating {scope} ({key}) on request of {message['worker']}")
+        except Exception as e:
+            log.exception(f"Error handling cache invalidation: {e}")
+            return
+
+        if scope not in self._debounce:
+            self._run_handlers(scope, key)
+        elif scope in self._pending:
+            self._pending[scope].add(key)
+        else:
+            self._pending[scope] = {key}
+            asyncio.get_running_loop().call_later(
+                self._debounce[scope], self._flush, scope
+            )
+
+    def _flush(self, scope: str):
+        keys = self._pending.pop(scope, set())
+        self._run_handlers(scope, keys.pop() if len(keys) == 1 else None)
+
+    def _run_handlers(self, scope: str, key: Optional[str]):
+        for handler in self._handlers.get(scope, []):
+            try:
+                result = handler(key)
+                if inspect.isawaitable(result):
+                    asyncio.ensure_future(result).add_done_callback(
+                        self._log_handler_error
+                    )
+            except Exception as e:
+                log.exception(f"Error handling cache invalidation of {scope}: {e}")
+
+    @staticmethod
+    def _log_handler_error(task: asyncio.Future):
+        if not task.cancelled() and task.exception() is not None:
+            log.error(f"Error handling cache invalidation: {task.exception()}")
+
+    def invalidate_all(self):
+        """Runs every handler for its whole scope, e.g. after missing messages."""
+        for scope in self._handlers:
+            self._run_handlers(scope, None)
+
+    async def start(self, redis=None):
+        """
+        Starts listening for invalidations. `redis` is the async client of the app;
+        publishing uses a separate sync connection so it can be called from sync code.
+        """
+        if redis is not None:
+            self._redis = get_redis_client()
+            self._listener = asyncio.create_task(self._listen_redis(redis))
+            self._transport = "redis"
+        elif self.workers > 1:
+            try:
+                self._start_socket()
+                self._transport = "socket"
+            except (AttributeError, NotImplementedError, OSError) as e:
+                log.warning(
+                    f"Cross-worker cache invalidation is unavailable ({e}), "
+                    "configure REDIS_URL to keep worker caches consistent"
+                )
+
+        if self._transport:
+            log.info(f"Cross-worker cache invalidation enabled over {self._transport}")
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+        if self._socket is not None:
+            asyncio.get_running_loop().remove_reader(self._socket.fileno())
+            self._socket.close()
+            self._socket = None
+            try:
+                os.unlink(self._socket_path)
+            except OSError:
+                pass
+
+        self._transport = None
+
+    async def _listen_redis(self, redis):
+        delay, reconnecting = 1, False
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(REDIS_INVALIDATION_CHANNEL)
+                if reconnecting:
+                    # Invalidations sent while disconnected were lost
+                    log.info("Resubscribed to Redis, invalidating all caches")
+                    self.invalidate_all()
+                delay, reconnecting = 1, False
+
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._apply(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning(
+                    f"Lost Redis cache invalidation subscription ({e}), "
+                    f"resubscribing in {delay}s"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, REDIS_RECONNECT_MAX_DELAY)
+            finally:
+                reconnecting = True
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def _start_socket(self):
+        self.socket_dir.mkdir(parents=True, exist_ok=True)
+        self._socket_path = self.socket_dir / f"{self._token}.sock"
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self._socket.bind(str(self._socket_path))
+
+        asyncio.get_running_loop().add_reader(
+            self._socket.fileno(), self._on_socket_readable
+        )
+
+    def _on_socket_readable(self):
+        while True:
+            try:
+                data = self._socket.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            self._apply(data)
+
+    def _send_to_workers(self, data: bytes):
+        for path in self.socket_dir.glob("*.sock"):
+            if path == self._socket_path:
+                continue
+            try:
+                self._socket.sendto(data, str(path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Socket left behind by a worker that exited
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            except BlockingIOError:
+                log.warning(f"Dropped cache invalidation for busy worker {path.stem}")
+
+
+CACHE_INVALIDATOR = CacheInvalidator()
@@ -0,0 +1,73 @@
+import logging
+import threading
+from typing import Any, Callable
+
+log = logging.getLogger(__name__)
+
+
+_UNSET = object()
+
+
+class LazyObject:
+    """
+    Proxy that defers building an expensive object (vector DB client, embedding or
+    reranking model, ...) until it is first used. Attribute access, calls and
+    truthiness checks are forwarded to the object, which is built exactly once
+    even when first used from several threads at the same time.
+
+    Used by the deferred startup mode (ENABLE_DEFERRED_STARTUP) so that workers
+    only pay for the subsystems they actually serve.
+
+    Parameters:
+    factory (Callable): Builds the underlying object.
+    name (str): Label used in logs.
+    """
+
+    __slots__ = ("_factory", "_name", "_lock", "_value")
+
+    def __init__(self, factory: Callable[[], Any], name: str = ""):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_name", name or getattr(factory, "__name__", ""))
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_value", _UNSET)
+
+    def _resolve(self) -> Any:
+        value = object.__getattribute__(self, "_value")
+        if value is _UNSET:
+            with object.__getattribute__(self, "_lock"):
+                value = object.__getattribute__(self, "_value")
+                if value is _UNSET:
+                    log.info(f"Initializing {object.__getattribute__(self, '_name')}")
+                    value = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_value", value)
+        return value
+
+    @property
+    def is_resolved(self) -> bool:
+        return object.__getattribute__(self, "_value") is not _UNSET
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __bool__(self) -> bool:
+        return bool(self._resolve())
+
+    def __repr__(self) -> str:
+        if self.is_resolved:
+            return repr(self._resolve())
+        return (
+            f"<LazyObject {object.__getattribute__(self, '_name')} (not initialized)>"
+        )
+
+
+def resolve(obj: Any) -> Any:
+    """Returns the object behind a LazyObject, or `obj` itself."""
+    if isinstance(obj, LazyObject):
+        return obj._resolve()
+    return obj
@@ -5,6 +5,7 @@ from contextlib import AsyncExitStack
 import anyio
 
 from mcp import ClientSession
+from mcp.client.session import MessageHandlerFnT
 from mcp.client.auth import OAuthClientProvider, TokenStorage
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.shared.auth import OAuthClientInformationFull, OAuthClientMetadata, OAuthToken
@@ -37,7 +38,12 @@ class MCPClient:
         self.session: Optional[ClientSession] = None
         self.exit_stack = None
 
-    async def connect(self, url: str, headers: Optional[dict] = None):
+    async def connect(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        message_handler: Optional[MessageHandlerFnT] = None,
+    ):
         async with AsyncExitStack() as exit_stack:
             try:
                 if AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL:
@@ -53,7 +59,7 @@ class MCPClient:
                 read_stream, write_stream, _ = transport
 
                 self._session_context = ClientSession(
-                    read_stream, write_stream
+                    read_stream, write_stream, message_handler=message_handler
                 )  # pylint: disable=W0201
 
                 self.session = await exit_stack.enter_async_context(
@@ -131,9 +137,16 @@ class MCPClient:
 
         return result_dict
 
+    async def ping(self):
+        if not self.session:
+            raise RuntimeError("MCP client is not connected.")
+
+        await self.session.send_ping()
+
     async def disconnect(self):
         # Clean up and close the session
-        await self.exit_stack.aclose()
+        if self.exit_stack is not None:
+            await self.exit_stack.aclose()
 
     async def __aenter__(self):
         await self.exit_stack.__aenter__()
@@ -0,0 +1,276 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import Counter
+from typing import Optional
+
+from mcp import types
+
+from open_webui.env import (
+    MCP_SESSION_HEALTH_CHECK_INTERVAL,
+    MCP_SESSION_IDLE_TIMEOUT,
+    MCP_SESSION_POOL_MAX_SIZE,
+    MCP_TOOL_SPECS_CACHE_TTL,
+)
+from open_webui.utils.mcp.client import MCPClient
+
+log = logging.getLogger(__name__)
+
+
+class PooledMCPSession:
+    """
+    An MCP client session kept open by the pool.
+
+    The transport and session contexts are entered and exited by a dedicated
+    owner task (anyio cancel scopes must be closed by the task that opened them),
+    while requests on the session can be issued from any task. Tool specs are
+    cached until the TTL expires or the server sends `notifications/tools/list_changed`.
+    """
+
+    def __init__(self, key: tuple, url: str, headers: Optional[dict]):
+        self.key = key
+        self.server_id = key[0]
+        self.url = url
+        self.headers = headers
+
+        self.client: Optional[MCPClient] = None
+        self.leases = 0
+        self.last_used = time.monotonic()
+
+        self._tool_specs: Optional[list] = None
+        self._tool_specs_expires_at = 0.0
+        self._tool_specs_lock = asyncio.Lock()
+
+        self._task: Optional[asyncio.Task] = None
+        self._closed = asyncio.Event()
+
+    @property
+    def is_alive(self) -> bool:
+        return (
+            self._task is not None
+            and not self._task.done()
+            and not self._closed.is_set()
+        )
+
+    async def start(self):
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(
+            self._run(ready), name=f"mcp-session-{self.server_id}"
+        )
+        await ready
+
+    async def _run(self, ready: asyncio.Future):
+        client = MCPClient()
+        try:
+            await client.connect(
+                self.url, headers=self.headers, message_handler=self._handle_message
+            )
+        except Exception as e:
+            ready.set_exception(e)
+            return
+
+        self.client = client
+        ready.set_result(None)
+        try:
+            await self._closed.wait()
+        finally:
+            try:
+                await client.disconnect()
+            except BaseException as e:
+                log.debug(f"Error closing MCP session for {self.server_id}: {e}")
+
+    async def _handle_message(self, message):
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            log.debug(f"Tool list of MCP server {self.server_id} changed")
+            self.invalidate_tool_specs()
+
+    @property
+    def has_cached_tool_specs(self) -> bool:
+        return (
+            self._tool_specs is not None
+            and time.monotonic() < self._tool_specs_expires_at
+        )
+
+    def invalidate_tool_specs(self):
+        self._tool_specs = None
+
+    async def get_tool_specs(self, ttl: int = MCP_TOOL_SPECS_CACHE_TTL) -> list:
+        """Returns the server's tool specs, cached for `ttl` seconds (0 disables caching)."""
+        if self.has_cached_tool_specs:
+            return self._tool_specs
+
+        async with self._tool_specs_lock:
+            if self.has_cached_tool_specs:
+                return self._tool_specs
+
+            tool_specs = await self.client.list_tool_specs()
+            if ttl > 0:
+                self._tool_specs = tool_specs
+                self._tool_specs_expires_at = time.monotonic() + ttl
+            return tool_specs
+
+    def release(self):
+        self.leases = max(self.leases - 1, 0)
+        self.last_used = time.monotonic()
+
+    async def close(self):
+        self._closed.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout=5)
+            except BaseException as e:
+                log.debug(
+                    f"MCP session for {self.server_id} did not close cleanly: {e}"
+                )
+
+
+class MCPSessionPool:
+    """
+    App-level pool of MCP client sessions, keyed by server, URL and the exact
+    request headers (i.e. the auth identity), so sessions are only shared by
+    requests that would have connected with the same credentials.
+
+    Sessions are leased for the duration of a chat completion and released
+    afterwards. A background task pings sessions every `health_check_interval`
+    seconds, replacing broken ones and closing those idle for `idle_timeout`.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: int = MCP_SESSION_IDLE_TIMEOUT,
+        health_check_interval: int = MCP_SESSION_HEALTH_CHECK_INTERVAL,
+        max_size: int = MCP_SESSION_POOL_MAX_SIZE,
+        tool_specs_ttl: int = MCP_TOOL_SPECS_CACHE_TTL,
+    ):
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.max_size = max_size
+        self.tool_specs_ttl = tool_specs_ttl
+
+        self._sessions: dict[tuple, PooledMCPSession] = {}
+        self._key_locks: dict[tuple, asyncio.Lock] = {}
+        self._maintenance_task: Optional[asyncio.Task] = None
+
+        self._stats = Counter()
+
+    @staticmethod
+    def get_key(server_id: str, url: str, headers: Optional[dict]) -> tuple:
+        headers_digest = hashlib.sha256(
+            json.dumps(headers or {}, sort_keys=True).encode()
+        ).hexdigest()
+        return (server_id, url, headers_digest)
+
+    async def acquire(
+        self, server_id: str, url: str, headers: Optional[dict] = None
+    ) -> PooledMCPSession:
+        """Leases a connected session, reusing a pooled one when possible."""
+        key = self.get_key(server_id, url, headers)
+
+        async with self._key_locks.setdefault(key, asyncio.Lock()):
+            session = self._sessions.get(key)
+            if session is not None and not session.is_alive:
+                await self._remove(session)
+                session = None
+
+            if session is None:
+                session = PooledMCPSession(key, url, headers)
+                try:
+                    await session.start()
+                except Exception:
+                    self._stats["failures"] += 1
+                    raise
+
+                self._stats["connects"] += 1
+                self._sessions[key] = session
+                await self._evict_overflow()
+            else:
+                self._stats["reuses"] += 1
+
+            session.leases += 1
+            session.last_used = time.monotonic()
+            return session
+
+    async def get_tool_specs(self, session: PooledMCPSession) -> list:
+        cached = session.has_cached_tool_specs
+        tool_specs = await session.get_tool_specs(ttl=self.tool_specs_ttl)
+        self._stats["tool_specs_hits" if cached else "tool_specs_misses"] += 1
+        return tool_specs
+
+    async def _remove(self, session: PooledMCPSession):
+        if self._sessions.get(session.key) is session:
+            del self._sessions[session.key]
+        await session.close()
+
+    async def _evict_overflow(self):
+        overflow = len(self._sessions) - self.max_size
+        if overflow <= 0:
+            return
+
+        idle = sorted(
+            (session for session in self._sessions.values() if session.leases == 0),
+            key=lambda session: session.last_used,
+        )
+        for session in idle[:overflow]:
+            self._stats["evictions"] += 1
+            await self._remove(session)
+
+    async def check_sessions(self):
+        """Closes idle sessions and replaces the ones that no longer answer pings."""
+        now = time.monotonic()
+        for session in list(self._sessions.values()):
+            if session.leases == 0 and now - session.last_used > self.idle_timeout:
+                self._stats["idle_closed"] += 1
+                await self._remove(session)
+                continue
+
+            try:
+                if not session.is_alive:
+                    raise RuntimeError("session task exited")
+                await asyncio.wait_for(session.client.ping(), timeout=10)
+            except Exception as e:
+                log.info(f"Dropping unhealthy MCP session for {session.server_id}: {e}")
+                self._stats["unhealthy"] += 1
+                await self._remove(session)
+
+    async def _maintenance_loop(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self.check_sessions()
+            except Exception as e:
+                log.exception(f"Error checking MCP sessions: {e}")
+
+    def start(self):
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+
+    async def clear(self, server_id: Optional[str] = None):
+        """Closes all pooled sessions, or only those of `server_id`."""
+        for session in list(self._sessions.values()):
+            if server_id is None or session.server_id == server_id:
+                await self._remove(session)
+
+    async def stop(self):
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        await self.clear()
+
+    def get_stats(self) -> dict:
+        sessions = list(self._sessions.values())
+        return {
+            "sessions": len(sessions),
+            "leased_sessions": sum(1 for session in sessions if session.leases),
+            "leases": sum(session.leases for session in sessions),
+            "sessions_by_server": dict(
+                Counter(session.server_id for session in sessions)
+            ),
+            **self._stats,
+        }
+
+
+MCP_SESSION_POOL = MCPSessionPool()
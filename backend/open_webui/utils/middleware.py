@@ -6,6 +6,7 @@ import base64
 import textwrap
 
 import asyncio
+from functools import partial
 from aiocache import cached
 from typing import Any, Optional
 import random
@@ -61,7 +62,7 @@ from open_webui.utils.webhook import post_webhook
 from open_webui.utils.files import (
     convert_markdown_base64_images,
     get_file_url_from_base64,
-    get_image_base64_from_url,
+    get_cached_image_base64_from_url,
     get_image_url_from_base64,
 )
 
@@ -112,10 +113,13 @@ from open_webui.utils.code_interpreter import execute_code_jupyter
 from open_webui.utils.payload import apply_system_prompt_to_body
 from open_webui.utils.response import normalize_usage
 from open_webui.utils.mcp.client import MCPClient
+from open_webui.utils.mcp.pool import MCP_SESSION_POOL
 
 
 from open_webui.config import (
     CACHE_DIR,
+    CHAT_IMAGE_FORMAT,
+    CHAT_IMAGE_MAX_SIZE,
     DEFAULT_VOICE_MODE_PROMPT_TEMPLATE,
     DEFAULT_TOOLS_FUNCTION_CALLING_PROMPT_TEMPLATE,
     DEFAULT_CODE_INTERPRETER_PROMPT,
@@ -131,10 +135,13 @@ from open_webui.env import (
     ENABLE_QUERIES_CACHE,
     RAG_SYSTEM_CONTEXT,
     ENABLE_FORWARD_USER_INFO_HEADERS,
+    ENABLE_MCP_SESSION_POOL,
     FORWARD_SESSION_INFO_HEADER_CHAT_ID,
     FORWARD_SESSION_INFO_HEADER_MESSAGE_ID,
+    CHAT_PAYLOAD_STAGE_TIMEOUTS,
 )
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.stages import Stage, get_stage_timings, run_stages
 from open_webui.constants import TASKS
 
 logging.basicConfig(stream=sys.stdout, level=GLOBAL_LOG_LEVEL)
@@ -1881,7 +1888,7 @@ async def chat_completion_files_handler(
                             query, documents, user=user
                         )
                     )
-                    if request.app.state.RERANKING_FUNCTION
+                    if request.app.state.RERANKING_FUNCTION is not None
                     else None
                 ),
                 k_reranker=request.app.state.config.TOP_K_RERANKER,
@@ -1981,9 +1988,59 @@ def apply_params_to_form_data(form_data, model):
     return form_data
 
 
-async def convert_url_images_to_base64(form_data):
+def get_model_image_options(model: Optional[dict] = None) -> tuple[int, str]:
+    """
+    Returns the max size and format images are encoded with for `model`. Models
+    may ask for smaller or differently encoded images than the default.
+    """
+    meta = ((model or {}).get("info") or {}).get("meta") or {}
+
+    max_size = CHAT_IMAGE_MAX_SIZE
+    if meta.get("imageMaxSize") not in (None, ""):
+        try:
+            max_size = int(meta["imageMaxSize"])
+            if max_size < 0:
+                raise ValueError("negative size")
+        except (TypeError, ValueError):
+            max_size = CHAT_IMAGE_MAX_SIZE
+            log.warning(
+                f"Invalid imageMaxSize {meta['imageMaxSize']!r} for model "
+                f"{(model or {}).get('id')}, using {CHAT_IMAGE_MAX_SIZE}"
+            )
+
+    image_format = meta.get("imageFormat")
+    if image_format is None:
+        image_format = CHAT_IMAGE_FORMAT
+    return max_size, image_format
+
+
+async def convert_url_images_to_base64(form_data, model: Optional[dict] = None):
+    max_size, image_format = get_model_image_options(model)
+
     messages = form_data.get("messages", [])
 
+    image_urls = {
+        item.get("image_url", {}).get("url", "")
+        for message in messages
+        if isinstance(message.get("content"), list)
+        for item in message["content"]
+        if isinstance(item, dict) and item.get("type") == "image_url"
+    }
+    image_urls = [url for url in image_urls if not url.startswith("data:image/")]
+    if not image_urls:
+        return form_data
+
+    # Each distinct image is encoded once, cached across turns (see IMAGE_CACHE)
+    encoded = await asyncio.gather(
+        *[
+            asyncio.to_thread(
+                get_cached_image_base64_from_url, url, max_size, image_format
+            )
+            for url in image_urls
+        ]
+    )
+    base64_urls = dict(zip(image_urls, encoded))
+
     for message in messages:
         content = message.get("content")
         if not isinstance(content, list):
@@ -1996,23 +2053,15 @@ async def convert_url_images_to_base64(form_data):
                 new_content.append(item)
                 continue
 
-            image_url = item.get("image_url", {}).get("url", "")
-            if image_url.startswith("data:image/"):
-                new_content.append(item)
-                continue
-
-            try:
-                base64_data = await asyncio.to_thread(
-                    get_image_base64_from_url, image_url
-                )
+            base64_data = base64_urls.get(item.get("image_url", {}).get("url", ""))
+            if base64_data:
                 new_content.append(
                     {
                         "type": "image_url",
                         "image_url": {"url": base64_data},
                     }
                 )
-            except Exception as e:
-                log.debug(f"Error converting image URL to base64: {e}")
+            else:
                 new_content.append(item)
 
         message["content"] = new_content
@@ -2063,6 +2112,199 @@ def process_messages_with_output(messages: list[dict]) -> list[dict]:
     return processed
 
 
+async def get_mcp_server_tools(
+    request,
+    server_id: str,
+    user,
+    metadata: dict,
+    extra_params: dict,
+    mcp_clients: dict,
+    mcp_sessions: list,
+) -> dict:
+    """
+    Connects to the MCP server `server_id` (through MCP_SESSION_POOL when enabled)
+    and returns its tools. Clients and sessions are added to `mcp_clients` and
+    `mcp_sessions` as soon as they exist, so they are cleaned up even if the
+    connection is cancelled halfway.
+    """
+    event_emitter = extra_params.get("__event_emitter__", None)
+    mcp_tools_dict = {}
+
+    try:
+        mcp_server_connection = None
+        for server_connection in request.app.state.config.TOOL_SERVER_CONNECTIONS:
+            if (
+                server_connection.get("type", "") == "mcp"
+                and server_connection.get("info", {}).get("id") == server_id
+            ):
+                mcp_server_connection = server_connection
+                break
+
+        if not mcp_server_connection:
+            log.error(f"MCP server with id {server_id} not found")
+            return {}
+
+        # Check access control for MCP server
+        if not has_connection_access(user, mcp_server_connection):
+            log.warning(f"Access denied to MCP server {server_id} for user {user.id}")
+            return {}
+
+        auth_type = mcp_server_connection.get("auth_type", "")
+        headers = {}
+        if auth_type == "bearer":
+            headers["Authorization"] = f"Bearer {mcp_server_connection.get('key', '')}"
+        elif auth_type == "none":
+            # No authentication
+            pass
+        elif auth_type == "session":
+            headers["Authorization"] = f"Bearer {request.state.token.credentials}"
+        elif auth_type == "system_oauth":
+            oauth_token = extra_params.get("__oauth_token__", None)
+            if oauth_token:
+                headers["Authorization"] = (
+                    f"Bearer {oauth_token.get('access_token', '')}"
+                )
+        elif auth_type == "oauth_2.1":
+            try:
+                splits = server_id.split(":")
+                server_id = splits[-1] if len(splits) > 1 else server_id
+
+                oauth_token = (
+                    await request.app.state.oauth_client_manager.get_oauth_token(
+                        user.id, f"mcp:{server_id}"
+                    )
+                )
+
+                if oauth_token:
+                    headers["Authorization"] = (
+                        f"Bearer {oauth_token.get('access_token', '')}"
+                    )
+            except Exception as e:
+                log.error(f"Error getting OAuth token: {e}")
+                oauth_token = None
+
+        connection_headers = mcp_server_connection.get("headers", None)
+        if connection_headers and isinstance(connection_headers, dict):
+            for key, value in connection_headers.items():
+                headers[key] = value
+
+        # Add user info headers if enabled
+        if ENABLE_FORWARD_USER_INFO_HEADERS and user:
+            headers = include_user_info_headers(headers, user)
+            if metadata and metadata.get("chat_id"):
+                headers[FORWARD_SESSION_INFO_HEADER_CHAT_ID] = metadata.get("chat_id")
+            if metadata and metadata.get("message_id"):
+                headers[FORWARD_SESSION_INFO_HEADER_MESSAGE_ID] = metadata.get(
+                    "message_id"
+                )
+
+        # Sessions carrying per-message headers cannot be shared
+        if ENABLE_MCP_SESSION_POOL and not (
+            FORWARD_SESSION_INFO_HEADER_CHAT_ID in headers
+            or FORWARD_SESSION_INFO_HEADER_MESSAGE_ID in headers
+        ):
+            mcp_session = await MCP_SESSION_POOL.acquire(
+                server_id,
+                url=mcp_server_connection.get("url", ""),
+                headers=headers if headers else None,
+            )
+            mcp_sessions.append(mcp_session)
+            mcp_client = mcp_session.client
+            tool_specs = await MCP_SESSION_POOL.get_tool_specs(mcp_session)
+        else:
+            mcp_client = MCPClient()
+            mcp_clients[server_id] = mcp_client
+            await mcp_client.connect(
+                url=mcp_server_connection.get("url", ""),
+                headers=headers if headers else None,
+            )
+            tool_specs = await mcp_client.list_tool_specs()
+
+        function_name_filter_list = mcp_server_connection.get("config", {}).get(
+            "function_name_filter_list", ""
+        )
+
+        if isinstance(function_name_filter_list, str):
+            function_name_filter_list = function_name_filter_list.split(",")
+
+        for tool_spec in tool_specs:
+
+            def make_tool_function(client, function_name):
+                async def tool_function(**kwargs):
+                    return await client.call_tool(
+                        function_name,
+                        function_args=kwargs,
+                    )
+
+                return tool_function
+
+            if function_name_filter_list:
+                if not is_string_allowed(tool_spec["name"], function_name_filter_list):
+                    # Skip this function
+                    continue
+
+            tool_function = make_tool_function(mcp_client, tool_spec["name"])
+
+            mcp_tools_dict[f"{server_id}_{tool_spec['name']}"] = {
+                "spec": {
+                    **tool_spec,
+                    "name": f"{server_id}_{tool_spec['name']}",
+                },
+                "callable": tool_function,
+                "type": "mcp",
+                "client": mcp_client,
+                "direct": False,
+            }
+    except Exception as e:
+        log.debug(e)
+        if event_emitter:
+            await event_emitter(
+                {
+                    "type": "chat:message:error",
+                    "data": {
+                        "error": {
+                            "content": f"Failed to connect to MCP server '{server_id}'"
+                        }
+                    },
+                }
+            )
+        return {}
+
+    return mcp_tools_dict
+
+
+async def get_mcp_tools(
+    request,
+    tool_ids: list[str],
+    user,
+    metadata: dict,
+    extra_params: dict,
+    mcp_clients: dict,
+    mcp_sessions: list,
+) -> dict:
+    """Connects to the MCP servers among `tool_ids` concurrently and returns their tools."""
+    results = await asyncio.gather(
+        *[
+            get_mcp_server_tools(
+                request,
+                tool_id[len("server:mcp:") :],
+                user,
+                metadata,
+                extra_params,
+                mcp_clients,
+                mcp_sessions,
+            )
+            for tool_id in tool_ids
+            if tool_id.startswith("server:mcp:")
+        ]
+    )
+
+    mcp_tools_dict = {}
+    for server_tools in results:
+        mcp_tools_dict.update(server_tools)
+    return mcp_tools_dict
+
+
 async def process_chat_payload(request, form_data, user, metadata, model):
     # Pipeline Inlet -> Filter Inlet -> Chat Memory -> Chat Web Search -> Chat Image Generation
     # -> Chat Code Interpreter (Form Data Update) -> (Default) Chat Tools Function Calling
@@ -2121,7 +2363,7 @@ async def process_chat_payload(request, form_data, user, metadata, model):
         except:
             pass
 
-    form_data = await convert_url_images_to_base64(form_data)
+    form_data = await convert_url_images_to_base64(form_data, model)
 
     event_emitter = get_event_emitter(metadata)
     event_caller = get_event_call(metadata)
@@ -2249,62 +2491,119 @@ async def process_chat_payload(request, form_data, user, metadata, model):
 
     features = form_data.pop("features", None) or {}
     extra_params["__features__"] = features
-    if features:
-        if "voice" in features and features["voice"]:
-            if request.app.state.config.VOICE_MODE_PROMPT_TEMPLATE != None:
-                if request.app.state.config.VOICE_MODE_PROMPT_TEMPLATE != "":
-                    template = request.app.state.config.VOICE_MODE_PROMPT_TEMPLATE
-                else:
-                    template = DEFAULT_VOICE_MODE_PROMPT_TEMPLATE
-
-                form_data["messages"] = add_or_update_system_message(
-                    template,
-                    form_data["messages"],
-                )
-
-        if "memory" in features and features["memory"]:
-            # Skip forced memory injection when native FC is enabled - model can use memory tools
-            if metadata.get("params", {}).get("function_calling") != "native":
-                form_data = await chat_memory_handler(
-                    request, form_data, extra_params, user
-                )
-
-        if "web_search" in features and features["web_search"]:
-            # Skip forced RAG web search when native FC is enabled - model can use web_search tool
-            if metadata.get("params", {}).get("function_calling") != "native":
-                form_data = await chat_web_search_handler(
-                    request, form_data, extra_params, user
-                )
+    native_function_calling = (
+        metadata.get("params", {}).get("function_calling") == "native"
+    )
 
-        if "image_generation" in features and features["image_generation"]:
-            # Skip forced image generation when native FC is enabled - model can use generate_image tool
-            if metadata.get("params", {}).get("function_calling") != "native":
-                form_data = await chat_image_generation_handler(
-                    request, form_data, extra_params, user
-                )
+    if features.get("voice"):
+        if request.app.state.config.VOICE_MODE_PROMPT_TEMPLATE != None:
+            if request.app.state.config.VOICE_MODE_PROMPT_TEMPLATE != "":
+                template = request.app.state.config.VOICE_MODE_PROMPT_TEMPLATE
+            else:
+                template = DEFAULT_VOICE_MODE_PROMPT_TEMPLATE
 
-        if "code_interpreter" in features and features["code_interpreter"]:
-            # Skip XML-tag prompt injection when native FC is enabled —
-            # execute_code will be injected as a builtin tool instead
-            if metadata.get("params", {}).get("function_calling") != "native":
-                form_data["messages"] = add_or_update_user_message(
-                    (
-                        request.app.state.config.CODE_INTERPRETER_PROMPT_TEMPLATE
-                        if request.app.state.config.CODE_INTERPRETER_PROMPT_TEMPLATE
-                        != ""
-                        else DEFAULT_CODE_INTERPRETER_PROMPT
-                    ),
-                    form_data["messages"],
-                )
+            form_data["messages"] = add_or_update_system_message(
+                template,
+                form_data["messages"],
+            )
 
     tool_ids = form_data.pop("tool_ids", None)
     terminal_id = form_data.pop("terminal_id", None)
-    files = form_data.pop("files", None)
 
     # Caller-provided OpenAI-style tools take precedence over server-side
     # tool resolution (tool_ids, MCP servers, builtin tools).
     payload_tools = form_data.get("tools", None)
 
+    # Memory, web search, image generation and the connections to MCP servers
+    # and terminals don't depend on each other, so they run concurrently
+    # instead of adding up their latencies before the first token. Handlers
+    # update form_data in place.
+    # Registered in the caller's metadata before anything connects, so the
+    # caller disconnects and releases them even if a later step raises
+    mcp_clients = metadata["mcp_clients"] = {}
+    mcp_sessions = metadata["mcp_sessions"] = []
+
+    stages = []
+    # Skip forced memory injection, RAG web search and image generation when
+    # native FC is enabled - model can use the memory, web_search and generate_image tools
+    if features.get("memory") and not native_function_calling:
+        stages.append(
+            Stage(
+                "memory",
+                partial(chat_memory_handler, request, form_data, extra_params, user),
+            )
+        )
+    if features.get("web_search") and not native_function_calling:
+        stages.append(
+            Stage(
+                "web_search",
+                partial(
+                    chat_web_search_handler, request, form_data, extra_params, user
+                ),
+            )
+        )
+    if features.get("image_generation") and not native_function_calling:
+        stages.append(
+            Stage(
+                "image_generation",
+                partial(
+                    chat_image_generation_handler,
+                    request,
+                    form_data,
+                    extra_params,
+                    user,
+                ),
+                # Both update the system message, keep their order stable
+                depends_on=("memory",) if features.get("memory") else (),
+            )
+        )
+    if not payload_tools and tool_ids:
+        stages.append(
+            Stage(
+                "mcp",
+                partial(
+                    get_mcp_tools,
+                    request,
+                    tool_ids,
+                    user,
+                    metadata,
+                    extra_params,
+                    mcp_clients,
+                    mcp_sessions,
+                ),
+                default={},
+            )
+        )
+    # Resolve terminal tools if terminal_id is set (independently of tool_ids
+    # so system terminals work even when no other tools are selected)
+    if not payload_tools and terminal_id:
+        stages.append(
+            Stage(
+                "terminal_tools",
+                partial(get_terminal_tools, request, terminal_id, user, extra_params),
+                default={},
+            )
+        )
+
+    stage_results = await run_stages(
+        stages, name="chat_payload", timeouts=CHAT_PAYLOAD_STAGE_TIMEOUTS
+    )
+
+    if features.get("code_interpreter"):
+        # Skip XML-tag prompt injection when native FC is enabled —
+        # execute_code will be injected as a builtin tool instead
+        if not native_function_calling:
+            form_data["messages"] = add_or_update_user_message(
+                (
+                    request.app.state.config.CODE_INTERPRETER_PROMPT_TEMPLATE
+                    if request.app.state.config.CODE_INTERPRETER_PROMPT_TEMPLATE != ""
+                    else DEFAULT_CODE_INTERPRETER_PROMPT
+                ),
+                form_data["messages"],
+            )
+
+    files = form_data.pop("files", None)
+
     # Skills
     user_skill_ids = set(form_data.pop("skill_ids", None) or [])
     model_skill_ids = set(model.get("info", {}).get("meta", {}).get("skillIds", []))
@@ -2380,6 +2679,7 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     # When the caller provides an explicit OpenAI-style `tools` array in the
     # request body, skip all server-side tool resolution and pass the caller's
     # tools through to the model unchanged.
+    tools_dict = {}
     if not payload_tools:
         # Server side tools
         tool_ids = metadata.get("tool_ids", None)
@@ -2389,156 +2689,7 @@ async def process_chat_payload(request, form_data, user, metadata, model):
         log.debug(f"{tool_ids=}")
         log.debug(f"{direct_tool_servers=}")
 
-        tools_dict = {}
-
-        mcp_clients = {}
-        mcp_tools_dict = {}
-
         if tool_ids:
-            for tool_id in tool_ids:
-                if tool_id.startswith("server:mcp:"):
-                    try:
-                        server_id = tool_id[len("server:mcp:") :]
-
-                        mcp_server_connection = None
-                        for (
-                            server_connection
-                        ) in request.app.state.config.TOOL_SERVER_CONNECTIONS:
-                            if (
-                                server_connection.get("type", "") == "mcp"
-                                and server_connection.get("info", {}).get("id")
-                                == server_id
-                            ):
-                                mcp_server_connection = server_connection
-                                break
-
-                        if not mcp_server_connection:
-                            log.error(f"MCP server with id {server_id} not found")
-                            continue
-
-                        # Check access control for MCP server
-                        if not has_connection_access(user, mcp_server_connection):
-                            log.warning(
-                                f"Access denied to MCP server {server_id} for user {user.id}"
-                            )
-                            continue
-
-                        auth_type = mcp_server_connection.get("auth_type", "")
-                        headers = {}
-                        if auth_type == "bearer":
-                            headers["Authorization"] = (
-                                f"Bearer {mcp_server_connection.get('key', '')}"
-                            )
-                        elif auth_type == "none":
-                            # No authentication
-                            pass
-                        elif auth_type == "session":
-                            headers["Authorization"] = (
-                                f"Bearer {request.state.token.credentials}"
-                            )
-                        elif auth_type == "system_oauth":
-                            oauth_token = extra_params.get("__oauth_token__", None)
-                            if oauth_token:
-                                headers["Authorization"] = (
-                                    f"Bearer {oauth_token.get('access_token', '')}"
-                                )
-                        elif auth_type == "oauth_2.1":
-                            try:
-                                splits = server_id.split(":")
-                                server_id = splits[-1] if len(splits) > 1 else server_id
-
-                                oauth_token = await request.app.state.oauth_client_manager.get_oauth_token(
-                                    user.id, f"mcp:{server_id}"
-                                )
-
-                                if oauth_token:
-                                    headers["Authorization"] = (
-                                        f"Bearer {oauth_token.get('access_token', '')}"
-                                    )
-                            except Exception as e:
-                                log.error(f"Error getting OAuth token: {e}")
-                                oauth_token = None
-
-                        connection_headers = mcp_server_connection.get("headers", None)
-                        if connection_headers and isinstance(connection_headers, dict):
-                            for key, value in connection_headers.items():
-                                headers[key] = value
-
-                        # Add user info headers if enabled
-                        if ENABLE_FORWARD_USER_INFO_HEADERS and user:
-                            headers = include_user_info_headers(headers, user)
-                            if metadata and metadata.get("chat_id"):
-                                headers[FORWARD_SESSION_INFO_HEADER_CHAT_ID] = (
-                                    metadata.get("chat_id")
-                                )
-                            if metadata and metadata.get("message_id"):
-                                headers[FORWARD_SESSION_INFO_HEADER_MESSAGE_ID] = (
-                                    metadata.get("message_id")
-                                )
-
-                        mcp_clients[server_id] = MCPClient()
-                        await mcp_clients[server_id].connect(
-                            url=mcp_server_connection.get("url", ""),
-                            headers=headers if headers else None,
-                        )
-
-                        function_name_filter_list = mcp_server_connection.get(
-                            "config", {}
-                        ).get("function_name_filter_list", "")
-
-                        if isinstance(function_name_filter_list, str):
-                            function_name_filter_list = function_name_filter_list.split(
-                                ","
-                            )
-
-                        tool_specs = await mcp_clients[server_id].list_tool_specs()
-                        for tool_spec in tool_specs:
-
-                            def make_tool_function(client, function_name):
-                                async def tool_function(**kwargs):
-                                    return await client.call_tool(
-                                        function_name,
-                                        function_args=kwargs,
-                                    )
-
-                                return tool_function
-
-                            if function_name_filter_list:
-                                if not is_string_allowed(
-                                    tool_spec["name"], function_name_filter_list
-                                ):
-                                    # Skip this function
-                                    continue
-
-                            tool_function = make_tool_function(
-                                mcp_clients[server_id], tool_spec["name"]
-                            )
-
-                            mcp_tools_dict[f"{server_id}_{tool_spec['name']}"] = {
-                                "spec": {
-                                    **tool_spec,
-                                    "name": f"{server_id}_{tool_spec['name']}",
-                                },
-                                "callable": tool_function,
-                                "type": "mcp",
-                                "client": mcp_clients[server_id],
-                                "direct": False,
-                            }
-                    except Exception as e:
-                        log.debug(e)
-                        if event_emitter:
-                            await event_emitter(
-                                {
-                                    "type": "chat:message:error",
-                                    "data": {
-                                        "error": {
-                                            "content": f"Failed to connect to MCP server '{server_id}'"
-                                        }
-                                    },
-                                }
-                            )
-                        continue
-
             tools_dict = await get_tools(
                 request,
                 tool_ids,
@@ -2551,23 +2702,14 @@ async def process_chat_payload(request, form_data, user, metadata, model):
                 },
             )
 
+            mcp_tools_dict = stage_results["mcp"].value
             if mcp_tools_dict:
                 tools_dict = {**tools_dict, **mcp_tools_dict}
 
-        # Resolve terminal tools if terminal_id is set (outside tool_ids check
-        # so system terminals work even when no other tools are selected)
         if terminal_id:
-            try:
-                terminal_tools = await get_terminal_tools(
-                    request,
-                    terminal_id,
-                    user,
-                    extra_params,
-                )
-                if terminal_tools:
-                    tools_dict = {**tools_dict, **terminal_tools}
-            except Exception as e:
-                log.exception(e)
+            terminal_tools = stage_results["terminal_tools"].value
+            if terminal_tools:
+                tools_dict = {**tools_dict, **terminal_tools}
 
         if direct_tool_servers:
             for tool_server in direct_tool_servers:
@@ -2580,9 +2722,6 @@ async def process_chat_payload(request, form_data, user, metadata, model):
                         "server": tool_server,
                     }
 
-        if mcp_clients:
-            metadata["mcp_clients"] = mcp_clients
-
         # Inject builtin tools for native function calling based on enabled features and model capability
         # Check if builtin_tools capability is enabled for this model (defaults to True if not specified)
         builtin_tools_enabled = (
@@ -2613,37 +2752,80 @@ async def process_chat_payload(request, form_data, user, metadata, model):
                 if name not in tools_dict:
                     tools_dict[name] = tool_dict
 
-        if tools_dict:
-            if metadata.get("params", {}).get("function_calling") == "native":
-                # If the function calling is native, then call the tools function calling handler
-                metadata["tools"] = tools_dict
-                form_data["tools"] = [
-                    {"type": "function", "function": tool.get("spec", {})}
-                    for tool in tools_dict.values()
-                ]
-            else:
-                # If the function calling is not native, then call the tools function calling handler
-                try:
-                    form_data, flags = await chat_completion_tools_handler(
-                        request, form_data, extra_params, user, models, tools_dict
-                    )
-                    sources.extend(flags.get("sources", []))
-                except Exception as e:
-                    log.exception(e)
+        if tools_dict and native_function_calling:
+            # If the function calling is native, then the model calls the tools itself
+            metadata["tools"] = tools_dict
+            form_data["tools"] = [
+                {"type": "function", "function": tool.get("spec", {})}
+                for tool in tools_dict.values()
+            ]
 
     # Check if file context extraction is enabled for this model (default True)
     file_context_enabled = (
         model.get("info", {}).get("meta", {}).get("capabilities") or {}
     ).get("file_context", True)
 
+    # Non-native tool calling and retrieval from the attached files run
+    # concurrently, unless a tool handles the files itself and may drop them
+    stages = []
+    if tools_dict and not native_function_calling:
+        stages.append(
+            Stage(
+                "tools",
+                partial(
+                    chat_completion_tools_handler,
+                    request,
+                    form_data,
+                    extra_params,
+                    user,
+                    models,
+                    tools_dict,
+                ),
+                default=(form_data, {}),
+            )
+        )
     if file_context_enabled:
-        try:
-            form_data, flags = await chat_completion_files_handler(
-                request, form_data, extra_params, user
+        file_handler_tools = stages and any(
+            tool.get("metadata", {}).get("file_handler", False)
+            for tool in tools_dict.values()
+        )
+        stages.append(
+            Stage(
+                "files",
+                partial(
+                    chat_completion_files_handler,
+                    request,
+                    form_data,
+                    extra_params,
+                    user,
+                ),
+                depends_on=("tools",) if file_handler_tools else (),
+                default=(form_data, {}),
             )
+        )
+
+    handler_results = await run_stages(
+        stages, name="chat_payload", timeouts=CHAT_PAYLOAD_STAGE_TIMEOUTS
+    )
+    # Tool results come before the file sources
+    for stage_name in ("tools", "files"):
+        if stage_name in handler_results:
+            _, flags = handler_results[stage_name].value
             sources.extend(flags.get("sources", []))
-        except Exception as e:
-            log.exception(e)
+
+    stage_results.update(handler_results)
+    if stage_results and event_emitter:
+        await event_emitter(
+            {
+                "type": "status",
+                "data": {
+                    "action": "chat_payload_stages",
+                    "stages": get_stage_timings(stage_results),
+                    "done": True,
+                    "hidden": True,
+                },
+            }
+        )
 
     # If context is not empty, insert it into the messages
     if sources and prompt:
@@ -8,6 +8,7 @@ from aiocache import cached
 from fastapi import Request
 
 from open_webui.socket.utils import RedisDict
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
 from open_webui.routers import openai, ollama
 from open_webui.functions import get_function_models
 
@@ -21,6 +22,7 @@ from open_webui.models.groups import Groups
 from open_webui.utils.plugin import (
     load_function_module_by_id,
     get_function_module_from_cache,
+    get_function_valves_from_cache,
 )
 from open_webui.utils.access_control import has_access
 
@@ -90,6 +92,9 @@ async def get_all_models(request, refresh: bool = False, user: UserModel = None)
         base_models = await get_all_base_models(request, user=user)
         request.app.state.BASE_MODELS = base_models
 
+        if refresh:
+            CACHE_INVALIDATOR.publish("models")
+
     # deep copy the base models to avoid modifying the original list
     models = [model.copy() for model in base_models]
 
@@ -335,7 +340,7 @@ async def get_all_models(request, refresh: bool = False, user: UserModel = None)
         try:
             function_module = request.app.state.FUNCTIONS.get(action_id)
             if function_module and hasattr(function_module, "Valves"):
-                valves_db = Functions.get_function_valves_by_id(action_id)
+                valves_db = get_function_valves_from_cache(request, action_id)
                 valves = function_module.Valves(**(valves_db if valves_db else {}))
                 return getattr(valves, "priority", 0)
         except Exception:
@@ -0,0 +1,61 @@
+"""
+Keyset (cursor) pagination.
+
+A cursor is the opaque encoding of the sort key of the last row of a page. The
+next page continues with the rows sorting after it, which the database finds
+through an index on the sort columns instead of counting and skipping every
+row before it like OFFSET does.
+"""
+
+import base64
+import json
+from typing import Optional, Sequence
+
+from fastapi import Response
+from sqlalchemy import tuple_
+
+# Carries the next cursor of listings that respond with a bare list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values) -> str:
+    data = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> list:
+    """The values of `cursor`, which must have one of each of `types`."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+    for value, value_type in zip(values, types):
+        # JSON booleans would pass as ints
+        if not isinstance(value, value_type) or isinstance(value, bool):
+            raise ValueError("Invalid cursor")
+    return values
+
+
+def after_cursor(columns: Sequence, cursor: str):
+    """
+    The condition selecting the rows after `cursor` when ordering by `columns`
+    descending, e.g. (Chat.updated_at, Chat.id). Raises ValueError for a cursor
+    that wasn't issued for these columns.
+    """
+    values = decode_cursor(cursor, [column.type.python_type for column in columns])
+    return tuple_(*columns) < tuple_(*values)
+
+
+def get_next_cursor(items: list, limit: Optional[int], *fields: str) -> Optional[str]:
+    """The cursor of the page after `items`, None when it was the last one."""
+    if not limit or len(items) < limit:
+        return None
+    return encode_cursor(*[getattr(items[-1], field) for field in fields])
+
+
+def set_next_cursor(response: Response, cursor: Optional[str]):
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import re
 import subprocess
@@ -5,14 +6,16 @@ import sys
 from importlib import util
 import types
 import tempfile
+import time
 import logging
-from typing import Any
+from typing import Any, Callable, Optional
 
 from open_webui.env import (
     PIP_OPTIONS,
     PIP_PACKAGE_INDEX_OPTIONS,
     OFFLINE_MODE,
     ENABLE_PIP_INSTALL_FRONTMATTER_REQUIREMENTS,
+    PLUGIN_CACHE_REVALIDATE_INTERVAL,
 )
 from open_webui.models.functions import Functions
 from open_webui.models.tools import Tools
@@ -307,9 +310,156 @@ def load_function_module_by_id(function_id: str, content: str | None = None):
         os.unlink(temp_file.name)
 
 
+class PluginCache:
+    """
+    Version information for the tool or function modules loaded by a worker
+    (the modules themselves live in app.state.TOOLS / app.state.FUNCTIONS).
+
+    A cached module is trusted for PLUGIN_CACHE_REVALIDATE_INTERVAL seconds,
+    after which only the row's `updated_at` is read back. When it changed, the
+    content hash decides whether the module has to be executed again. Global
+    valves are revalidated the same way, as valve updates bump `updated_at`,
+    but apart from the module so they are also cached for modules loaded
+    elsewhere. Updates made through the API drop the entry right away, on
+    every worker.
+    """
+
+    def __init__(self, revalidate_interval: int = PLUGIN_CACHE_REVALIDATE_INTERVAL):
+        self.revalidate_interval = revalidate_interval
+        # id -> [updated_at, content hash, last check]
+        self.versions: dict[str, list] = {}
+        # id -> [updated_at, valves, last check]
+        self.valves: dict[str, list] = {}
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def is_current(
+        self, plugin_id: str, get_updated_at: Callable[[str], Optional[int]]
+    ) -> bool:
+        version = self.versions.get(plugin_id)
+        if version is None:
+            return False
+
+        now = time.monotonic()
+        if now - version[2] < self.revalidate_interval:
+            return True
+
+        updated_at = get_updated_at(plugin_id)
+        if updated_at is not None and updated_at == version[0]:
+            version[2] = now
+            return True
+        return False
+
+    def has_content(self, plugin_id: str, content: str) -> bool:
+        version = self.versions.get(plugin_id)
+        return version is not None and version[1] == self.hash_content(content)
+
+    def set(self, plugin_id: str, updated_at: int, content: str):
+        self.versions[plugin_id] = [
+            updated_at,
+            self.hash_content(content),
+            time.monotonic(),
+        ]
+
+    def get_valves(
+        self,
+        plugin_id: str,
+        get_updated_at: Callable[[str], Optional[int]],
+        load_valves: Callable[[str], Optional[dict]],
+    ) -> Optional[dict]:
+        cached = self.valves.get(plugin_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[2] < self.revalidate_interval:
+            return cached[1]
+
+        updated_at = get_updated_at(plugin_id)
+        if cached is not None and updated_at is not None and updated_at == cached[0]:
+            cached[2] = now
+            return cached[1]
+
+        valves = load_valves(plugin_id)
+        if valves is not None and updated_at is not None:
+            self.valves[plugin_id] = [updated_at, valves, now]
+        else:
+            self.valves.pop(plugin_id, None)
+        return valves
+
+    def invalidate_valves(self, plugin_id: Optional[str] = None):
+        if plugin_id is None:
+            self.valves.clear()
+        else:
+            self.valves.pop(plugin_id, None)
+
+    def invalidate(self, plugin_id: Optional[str] = None):
+        """Drops the entry of `plugin_id`, or of every plugin when None."""
+        if plugin_id is None:
+            self.versions.clear()
+        else:
+            self.versions.pop(plugin_id, None)
+        self.invalidate_valves(plugin_id)
+
+
+def get_tool_cache(app_state) -> PluginCache:
+    if not hasattr(app_state, "TOOLS"):
+        app_state.TOOLS = {}
+    if not hasattr(app_state, "TOOL_CACHE"):
+        app_state.TOOL_CACHE = PluginCache()
+    return app_state.TOOL_CACHE
+
+
+def get_function_cache(app_state) -> PluginCache:
+    if not hasattr(app_state, "FUNCTIONS"):
+        app_state.FUNCTIONS = {}
+    if not hasattr(app_state, "FUNCTION_CACHE"):
+        app_state.FUNCTION_CACHE = PluginCache()
+    return app_state.FUNCTION_CACHE
+
+
+def invalidate_tool_cache(app_state, tool_id: Optional[str] = None):
+    """
+    Drops the loaded module, version and valves of `tool_id` on this worker,
+    or of every tool when None.
+    """
+    get_tool_cache(app_state).invalidate(tool_id)
+    if tool_id is None:
+        app_state.TOOLS.clear()
+    else:
+        app_state.TOOLS.pop(tool_id, None)
+
+
+def invalidate_function_cache(app_state, function_id: Optional[str] = None):
+    """
+    Drops the loaded module, version and valves of `function_id` on this worker,
+    or of every function when None.
+    """
+    get_function_cache(app_state).invalidate(function_id)
+    if function_id is None:
+        app_state.FUNCTIONS.clear()
+    else:
+        app_state.FUNCTIONS.pop(function_id, None)
+
+
+def invalidate_tool_valves(app_state, tool_id: Optional[str] = None):
+    """Drops the valves of `tool_id` on this worker, keeping the loaded module."""
+    get_tool_cache(app_state).invalidate_valves(tool_id)
+
+
+def invalidate_function_valves(app_state, function_id: Optional[str] = None):
+    """Drops the valves of `function_id` on this worker, keeping the loaded module."""
+    get_function_cache(app_state).invalidate_valves(function_id)
+
+
 def get_tool_module_from_cache(request, tool_id, load_from_db=True):
+    cache = get_tool_cache(request.app.state)
+    TOOLS = request.app.state.TOOLS
+
     if load_from_db:
-        # Always load from the database by default
+        # Make sure the latest content is used, without reading the row on every call
+        if tool_id in TOOLS and cache.is_current(tool_id, Tools.get_tool_updated_at):
+            return TOOLS[tool_id], None
+
         tool = Tools.get_tool_by_id(tool_id)
         if not tool:
             raise Exception(f"Tool not found: {tool_id}")
@@ -319,41 +469,44 @@ def get_tool_module_from_cache(request, tool_id, load_from_db=True):
         if new_content != content:
             content = new_content
             # Update the tool content in the database
-            Tools.update_tool_by_id(tool_id, {"content": content})
+            tool = Tools.update_tool_by_id(tool_id, {"content": content}) or tool
 
-        if (
-            hasattr(request.app.state, "TOOL_CONTENTS")
-            and tool_id in request.app.state.TOOL_CONTENTS
-        ) and (
-            hasattr(request.app.state, "TOOLS") and tool_id in request.app.state.TOOLS
-        ):
-            if request.app.state.TOOL_CONTENTS[tool_id] == content:
-                return request.app.state.TOOLS[tool_id], None
+        if tool_id in TOOLS and cache.has_content(tool_id, content):
+            cache.set(tool_id, tool.updated_at, content)
+            return TOOLS[tool_id], None
 
         tool_module, frontmatter = load_tool_module_by_id(tool_id, content)
+        cache.set(tool_id, tool.updated_at, content)
     else:
-        if hasattr(request.app.state, "TOOLS") and tool_id in request.app.state.TOOLS:
-            return request.app.state.TOOLS[tool_id], None
+        if tool_id in TOOLS:
+            return TOOLS[tool_id], None
 
         tool_module, frontmatter = load_tool_module_by_id(tool_id)
+        cache.invalidate(tool_id)
 
-    if not hasattr(request.app.state, "TOOLS"):
-        request.app.state.TOOLS = {}
+    TOOLS[tool_id] = tool_module
 
-    if not hasattr(request.app.state, "TOOL_CONTENTS"):
-        request.app.state.TOOL_CONTENTS = {}
+    return tool_module, frontmatter
 
-    request.app.state.TOOLS[tool_id] = tool_module
-    request.app.state.TOOL_CONTENTS[tool_id] = content
 
-    return tool_module, frontmatter
+def get_tool_valves_from_cache(request, tool_id) -> Optional[dict]:
+    return get_tool_cache(request.app.state).get_valves(
+        tool_id, Tools.get_tool_updated_at, Tools.get_tool_valves_by_id
+    )
 
 
 def get_function_module_from_cache(request, function_id, load_from_db=True):
+    cache = get_function_cache(request.app.state)
+    FUNCTIONS = request.app.state.FUNCTIONS
+
     if load_from_db:
-        # Always load from the database by default
-        # This is useful for hooks like "inlet" or "outlet" where the content might change
-        # and we want to ensure the latest content is used.
+        # Hooks like "inlet" or "outlet" must use the latest content. The cached
+        # module is revalidated against the row's updated_at instead of reading
+        # and comparing the full content on every call.
+        if function_id in FUNCTIONS and cache.is_current(
+            function_id, Functions.get_function_updated_at
+        ):
+            return FUNCTIONS[function_id], None, None
 
         function = Functions.get_function_by_id(function_id)
         if not function:
@@ -364,45 +517,42 @@ def get_function_module_from_cache(request, function_id, load_from_db=True):
         if new_content != content:
             content = new_content
             # Update the function content in the database
-            Functions.update_function_by_id(function_id, {"content": content})
-
-        if (
-            hasattr(request.app.state, "FUNCTION_CONTENTS")
-            and function_id in request.app.state.FUNCTION_CONTENTS
-        ) and (
-            hasattr(request.app.state, "FUNCTIONS")
-            and function_id in request.app.state.FUNCTIONS
-        ):
-            if request.app.state.FUNCTION_CONTENTS[function_id] == content:
-                return request.app.state.FUNCTIONS[function_id], None, None
+            function = (
+                Functions.update_function_by_id(function_id, {"content": content})
+                or function
+            )
+
+        if function_id in FUNCTIONS and cache.has_content(function_id, content):
+            cache.set(function_id, function.updated_at, content)
+            return FUNCTIONS[function_id], None, None
 
         function_module, function_type, frontmatter = load_function_module_by_id(
             function_id, content
         )
+        cache.set(function_id, function.updated_at, content)
     else:
         # Load from cache (e.g. "stream" hook)
         # This is useful for performance reasons
 
-        if (
-            hasattr(request.app.state, "FUNCTIONS")
-            and function_id in request.app.state.FUNCTIONS
-        ):
-            return request.app.state.FUNCTIONS[function_id], None, None
+        if function_id in FUNCTIONS:
+            return FUNCTIONS[function_id], None, None
 
         function_module, function_type, frontmatter = load_function_module_by_id(
             function_id
         )
+        cache.invalidate(function_id)
 
-    if not hasattr(request.app.state, "FUNCTIONS"):
-        request.app.state.FUNCTIONS = {}
+    FUNCTIONS[function_id] = function_module
 
-    if not hasattr(request.app.state, "FUNCTION_CONTENTS"):
-        request.app.state.FUNCTION_CONTENTS = {}
+    return function_module, function_type, frontmatter
 
-    request.app.state.FUNCTIONS[function_id] = function_module
-    request.app.state.FUNCTION_CONTENTS[function_id] = content
 
-    return function_module, function_type, frontmatter
+def get_function_valves_from_cache(request, function_id) -> Optional[dict]:
+    return get_function_cache(request.app.state).get_valves(
+        function_id,
+        Functions.get_function_updated_at,
+        Functions.get_function_valves_by_id,
+    )
 
 
 def install_frontmatter_requirements(requirements: str):
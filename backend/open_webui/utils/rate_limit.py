@@ -1,12 +1,15 @@
+import sqlite3
 import time
+from contextlib import closing
 from typing import Optional, Dict
-from open_webui.env import REDIS_KEY_PREFIX
+from open_webui.env import REDIS_KEY_PREFIX, UVICORN_WORKERS, WORKER_RUNTIME_DIR
 
 
 class RateLimiter:
     """
     General-purpose rate limiter using Redis with a rolling window strategy.
-    Falls back to in-memory storage if Redis is not available.
+    Falls back to in-memory storage if Redis is not available, or to a SQLite
+    file shared by all workers of the node when running multiple workers.
     """
 
     # In-memory fallback storage
@@ -19,6 +22,7 @@ class RateLimiter:
         window: int,
         bucket_size: int = 60,
         enabled: bool = True,
+        shared_store_path: Optional[str] = None,
     ):
         """
         :param redis_client: Redis client instance or None
@@ -26,6 +30,10 @@ class RateLimiter:
         :param window: Time window in seconds
         :param bucket_size: Bucket resolution
         :param enabled: Turn on/off rate limiting globally
+        :param shared_store_path: SQLite file used instead of in-memory storage
+            when Redis is not available (defaults to a node-local file with
+            UVICORN_WORKERS > 1, so that the limit is not multiplied by the
+            number of workers)
         """
         self.r = redis_client
         self.limit = limit
@@ -34,6 +42,10 @@ class RateLimiter:
         self.num_buckets = window // bucket_size
         self.enabled = enabled
 
+        if shared_store_path is None and UVICORN_WORKERS > 1:
+            shared_store_path = str(WORKER_RUNTIME_DIR / "ratelimit.db")
+        self.shared_store_path = shared_store_path
+
     def _bucket_key(self, key: str, bucket_index: int) -> str:
         return f"{REDIS_KEY_PREFIX}:ratelimit:{key.lower()}:{bucket_index}"
 
@@ -55,9 +67,9 @@ class RateLimiter:
             try:
                 return self._is_limited_redis(key)
             except Exception:
-                return self._is_limited_memory(key)
+                return self._is_limited_local(key)
         else:
-            return self._is_limited_memory(key)
+            return self._is_limited_local(key)
 
     def get_count(self, key: str) -> int:
         if not self.enabled:
@@ -67,9 +79,9 @@ class RateLimiter:
             try:
                 return self._get_count_redis(key)
             except Exception:
-                return self._get_count_memory(key)
+                return self._get_count_local(key)
         else:
-            return self._get_count_memory(key)
+            return self._get_count_local(key)
 
     def remaining(self, key: str) -> int:
         used = self.get_count(key)
@@ -101,6 +113,59 @@ class RateLimiter:
         counts = self.r.mget(buckets)
         return sum(int(c) for c in counts if c)
 
+    def _is_limited_local(self, key: str) -> bool:
+        if self.shared_store_path:
+            try:
+                return self._is_limited_shared(key)
+            except sqlite3.Error:
+                pass
+        return self._is_limited_memory(key)
+
+    def _get_count_local(self, key: str) -> int:
+        if self.shared_store_path:
+            try:
+                return self._get_count_shared(key)
+            except sqlite3.Error:
+                pass
+        return self._get_count_memory(key)
+
+    def _connect_shared(self) -> sqlite3.Connection:
+        WORKER_RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.shared_store_path, timeout=5, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS ratelimit "
+            "(key TEXT, bucket INTEGER, count INTEGER, PRIMARY KEY (key, bucket))"
+        )
+        return conn
+
+    def _is_limited_shared(self, key: str) -> bool:
+        now_bucket = self._current_bucket()
+        with closing(self._connect_shared()) as conn:
+            # Serialize increment and count across workers
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT INTO ratelimit VALUES (?, ?, 1) "
+                "ON CONFLICT (key, bucket) DO UPDATE SET count = count + 1",
+                (key, now_bucket),
+            )
+            conn.execute(
+                "DELETE FROM ratelimit WHERE key = ? AND bucket < ?",
+                (key, now_bucket - self.num_buckets),
+            )
+            (total,) = conn.execute(
+                "SELECT SUM(count) FROM ratelimit WHERE key = ?", (key,)
+            ).fetchone()
+            conn.execute("COMMIT")
+        return total > self.limit
+
+    def _get_count_shared(self, key: str) -> int:
+        with closing(self._connect_shared()) as conn:
+            (total,) = conn.execute(
+                "SELECT SUM(count) FROM ratelimit WHERE key = ? AND bucket >= ?",
+                (key, self._current_bucket() - self.num_buckets),
+            ).fetchone()
+        return total or 0
+
     def _is_limited_memory(self, key: str) -> bool:
         now_bucket = self._current_bucket()
 
@@ -0,0 +1,223 @@
+import logging
+import re
+import time
+from typing import Callable, MutableMapping, Optional, cast
+from urllib.parse import parse_qs, urlencode
+
+from asgiref.typing import (
+    ASGI3Application,
+    ASGIReceiveCallable,
+    ASGISendCallable,
+    ASGISendEvent,
+    Scope as ASGIScope,
+)
+from fastapi import status
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import JSONResponse, RedirectResponse, Response
+
+from open_webui.utils.auth import get_http_authorization_cred
+from open_webui.utils.security_headers import set_security_headers
+
+log = logging.getLogger(__name__)
+
+
+ANTHROPIC_MESSAGES_PATHS = ("/api/message", "/api/v1/messages")
+
+
+class RequestPipelineMiddleware:
+    """
+    Pure ASGI middleware that composes the per-request HTTP hooks of the app into
+    a single layer, replacing the former stack of `BaseHTTPMiddleware` classes and
+    `@app.middleware("http")` functions. Running them in one ASGI callable avoids
+    the extra task, memory stream and response re-wrapping each of those layers
+    added, and leaves streaming responses untouched.
+
+    The stages run in the same order (outermost first) as the stack it replaces:
+
+    1. websocket upgrade inspection (reject malformed socket.io upgrades)
+    2. request credential resolution (`request.state.token`) and `X-Process-Time`
+    3. database session commit/removal once the response starts
+    4. API key endpoint restrictions
+    5. security headers
+    6. GET redirects (YouTube watch links and PWA share targets)
+
+    Parameters:
+    app (ASGI3Application): The downstream ASGI application.
+    on_response_start (Callable): Hook invoked when the response headers are sent,
+        used to commit and release the scoped database session.
+    """
+
+    def __init__(
+        self,
+        app: ASGI3Application,
+        *,
+        on_response_start: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.app = app
+        self.on_response_start = on_response_start
+
+    async def __call__(
+        self,
+        scope: ASGIScope,
+        receive: ASGIReceiveCallable,
+        send: ASGISendCallable,
+    ) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request = Request(scope=cast(MutableMapping, scope))
+
+        # 1. Websocket upgrade inspection
+        if not self._is_valid_websocket_upgrade(request):
+            response = JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Invalid WebSocket upgrade request"},
+            )
+            return await response(scope, receive, send)
+
+        # 2. Credential resolution
+        start_time = int(time.time())
+        self._resolve_token(request)
+        request.state.enable_api_keys = request.app.state.config.ENABLE_API_KEYS
+
+        # Security headers only apply to responses produced below the API key
+        # restriction stage, matching the previous middleware ordering.
+        apply_security_headers = False
+
+        async def send_wrapper(message: ASGISendEvent) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=cast(MutableMapping, message))
+
+                # 5. Security headers
+                if apply_security_headers:
+                    headers.update(set_security_headers())
+
+                # 3. Session commit
+                if self.on_response_start:
+                    self.on_response_start()
+
+                # 2. Process time
+                process_time = int(time.time()) - start_time
+                headers["X-Process-Time"] = str(process_time)
+
+            await send(message)
+
+        # 4. API key restrictions
+        if not self._is_api_key_allowed(request):
+            response = JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "API key not allowed to access this endpoint."},
+            )
+            return await response(scope, receive, send_wrapper)
+
+        apply_security_headers = True
+
+        # 6. Redirects
+        response = self._get_redirect_response(request)
+        if response is not None:
+            return await response(scope, receive, send_wrapper)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _is_valid_websocket_upgrade(request: Request) -> bool:
+        if (
+            "/ws/socket.io" in request.url.path
+            and request.query_params.get("transport") == "websocket"
+        ):
+            upgrade = (request.headers.get("Upgrade") or "").lower()
+            connection = (request.headers.get("Connection") or "").lower().split(",")
+            # Check that there's the correct headers for an upgrade, else reject the connection
+            # This is to work around this upstream issue: https://github.com/miguelgrinberg/python-engineio/issues/367
+            if upgrade != "websocket" or "upgrade" not in connection:
+                return False
+        return True
+
+    @staticmethod
+    def _resolve_token(request: Request) -> None:
+        request.state.token = get_http_authorization_cred(
+            request.headers.get("Authorization")
+        )
+
+        # Fallback to cookie token for browser sessions
+        if request.state.token is None and request.cookies.get("token"):
+            request.state.token = HTTPAuthorizationCredentials(
+                scheme="Bearer", credentials=request.cookies.get("token")
+            )
+
+        # Fallback to x-api-key header for Anthropic Messages API routes
+        if request.state.token is None and request.headers.get("x-api-key"):
+            if request.url.path in ANTHROPIC_MESSAGES_PATHS:
+                request.state.token = HTTPAuthorizationCredentials(
+                    scheme="Bearer", credentials=request.headers.get("x-api-key")
+                )
+
+    @staticmethod
+    def _is_api_key_allowed(request: Request) -> bool:
+        auth_header = request.headers.get("Authorization")
+        token = None
+
+        if auth_header:
+            parts = auth_header.split(" ", 1)
+            if len(parts) == 2:
+                token = parts[1]
+
+        # Only apply restrictions if an sk- API key is used
+        if not (token and token.startswith("sk-")):
+            return True
+
+        # Check if restrictions are enabled
+        config = request.app.state.config
+        if not config.ENABLE_API_KEYS_ENDPOINT_RESTRICTIONS:
+            return True
+
+        allowed_paths = [
+            path.strip()
+            for path in str(config.API_KEYS_ALLOWED_ENDPOINTS).split(",")
+            if path.strip()
+        ]
+
+        request_path = request.url.path
+
+        # Match exact path or prefix path
+        return any(
+            request_path == allowed or request_path.startswith(allowed + "/")
+            for allowed in allowed_paths
+        )
+
+    @staticmethod
+    def _get_redirect_response(request: Request) -> Optional[Response]:
+        if request.method != "GET":
+            return None
+
+        path = request.url.path
+        query_params = parse_qs(request.url.query)
+
+        redirect_params = {}
+
+        # Check for the specific watch path and the presence of 'v' parameter
+        if path.endswith("/watch") and "v" in query_params:
+            # Extract the first 'v' parameter
+            redirect_params["youtube"] = query_params["v"][0]
+
+        if "shared" in query_params and len(query_params["shared"]) > 0:
+            # PWA share_target support
+            text = query_params["shared"][0]
+            if text:
+                urls = re.match(r"https://\S+", text)
+                if urls:
+                    from open_webui.retrieval.loaders.youtube import _parse_video_id
+
+                    if youtube_video_id := _parse_video_id(urls[0]):
+                        redirect_params["youtube"] = youtube_video_id
+                    else:
+                        redirect_params["load-url"] = urls[0]
+                else:
+                    redirect_params["q"] = text
+
+        if redirect_params:
+            return RedirectResponse(url=f"/?{urlencode(redirect_params)}")
+
+        return None
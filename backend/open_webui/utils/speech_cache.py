@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+import aiofiles
+import aiohttp
+from fastapi.responses import StreamingResponse
+
+from open_webui.config import AUDIO_TTS_CACHE_MAX_SIZE_MB, CACHE_DIR
+from open_webui.utils.misc import stream_wrapper
+
+log = logging.getLogger(__name__)
+
+
+class SpeechCache:
+    """
+    Synthesized speech, stored as `{name}.mp3` (with the request payload in
+    `{name}.json`) in `cache_dir` where all workers share it.
+
+    Responses are written to the cache while they are streamed to the client
+    (see `tee`) and only become visible once complete. Reading a file marks it
+    as used, and the least recently used files are removed once the cache
+    holds more than `max_size_mb`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR / "audio" / "speech",
+        max_size_mb: int = AUDIO_TTS_CACHE_MAX_SIZE_MB,
+    ):
+        self.dir = cache_dir
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max(max_size_mb, 0) * 1024 * 1024
+
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self.dir.glob("*.mp3"))
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "aborted": 0,
+            "evicted": 0,
+        }
+
+    def get_path(self, name: str) -> Path:
+        return self.dir / f"{name}.mp3"
+
+    def get(self, name: str) -> Optional[Path]:
+        path = self.get_path(name)
+        try:
+            # Recently used files are the last ones evicted
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._metrics["misses"] += 1
+            return None
+
+        with self._lock:
+            self._metrics["hits"] += 1
+        return path
+
+    def add(self, name: str, payload: Optional[dict] = None):
+        """Accounts for `{name}.mp3`, written to the cache directory by the caller."""
+        path = self.get_path(name)
+        if payload is not None:
+            path.with_suffix(".json").write_text(json.dumps(payload))
+
+        with self._lock:
+            self._size += path.stat().st_size
+            self._metrics["stored"] += 1
+            evict = self.max_size_bytes and self._size > self.max_size_bytes
+        if evict:
+            self._evict()
+
+    async def tee(
+        self, name: str, chunks: AsyncIterator[bytes], payload: Optional[dict] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields `chunks` while writing them to the cache. Streams that fail or
+        are abandoned by the client are discarded.
+        """
+        # Concurrent requests for the same speech each write their own file
+        tmp_path = self.dir / f"{name}.{uuid.uuid4().hex}.part"
+        complete = False
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    yield chunk
+            complete = True
+        finally:
+            # Release the upstream response right away when the client goes away
+            if hasattr(chunks, "aclose"):
+                await chunks.aclose()
+
+            if complete:
+                tmp_path.replace(self.get_path(name))
+                self.add(name, payload)
+            else:
+                tmp_path.unlink(missing_ok=True)
+                with self._lock:
+                    self._metrics["aborted"] += 1
+
+    def _evict(self):
+        files = []
+        for path in self.dir.glob("*.mp3"):
+            try:
+                stat = path.stat()
+                files.append((stat.st_mtime, stat.st_size, path))
+            except FileNotFoundError:
+                continue
+
+        # Other workers write here too, start from what is actually on disk
+        total = sum(size for _, size, _ in files)
+        evicted = 0
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_size_bytes * 0.9:
+                break
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._size = total
+            self._metrics["evicted"] += evicted
+
+    def get_metrics(self) -> dict:
+        metrics = self._metrics
+        lookups = metrics["hits"] + metrics["misses"]
+
+        return {
+            **metrics,
+            "hit_rate": metrics["hits"] / lookups if lookups else 0,
+            "size_mb": round(self._size / 1024 / 1024, 2),
+            "max_size_mb": self.max_size_bytes // 1024 // 1024,
+        }
+
+
+SPEECH_CACHE = SpeechCache()
+
+
+def get_speech_response(
+    name: str,
+    r: aiohttp.ClientResponse,
+    session: aiohttp.ClientSession,
+    payload: Optional[dict] = None,
+) -> StreamingResponse:
+    """
+    Streams the audio of the upstream TTS response `r` to the client as it
+    arrives, caching it as `name` once complete. Closes `r` and `session`.
+    """
+    return StreamingResponse(
+        SPEECH_CACHE.tee(
+            name,
+            stream_wrapper(r, session, lambda content: content.iter_any()),
+            payload,
+        ),
+        media_type="audio/mpeg",
+    )
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from opentelemetry import trace
+
+log = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+
+@dataclass
+class Stage:
+    """
+    A step of a pipeline run by run_stages.
+
+    Parameters:
+    name (str): Unique name of the stage, used by `depends_on`, logs and traces.
+    run (Callable): Coroutine function without arguments returning the stage's result.
+    depends_on (tuple[str]): Stages that must be finished before this one starts.
+    timeout (float): Seconds after which the stage is cancelled, None for no limit.
+    default (Any): Result of the stage when it fails or times out.
+    required (bool): Fail the whole pipeline (cancelling the other stages) when
+        this stage fails instead of continuing with `default`.
+    """
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    default: Any = None
+    required: bool = False
+
+
+@dataclass
+class StageResult:
+    name: str
+    value: Any = None
+    # "done", "failed" or "timeout"
+    status: str = "done"
+    started_at: float = 0.0
+    duration: float = 0.0
+    waited: float = field(default=0.0, repr=False)
+
+
+def _check_graph(stages: list[Stage]):
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate stage names in {names}")
+
+    for stage in stages:
+        for dependency in stage.depends_on:
+            if dependency not in names:
+                raise ValueError(f"Stage {stage.name} depends on unknown {dependency}")
+
+    # Kahn's algorithm, a stage left over is part of a cycle
+    remaining = {stage.name: set(stage.depends_on) for stage in stages}
+    while remaining:
+        ready = [name for name, dependencies in remaining.items() if not dependencies]
+        if not ready:
+            raise ValueError(f"Stages {sorted(remaining)} have circular dependencies")
+        for name in ready:
+            del remaining[name]
+        for dependencies in remaining.values():
+            dependencies.difference_update(ready)
+
+
+async def run_stages(
+    stages: list[Stage], name: str = "pipeline", timeouts: Optional[dict] = None
+) -> dict[str, StageResult]:
+    """
+    Runs `stages` concurrently, each one as soon as the stages it depends on
+    are finished, and returns their results by name. Each stage is traced as a
+    "<name>.<stage>" span. `timeouts` maps stage names to the timeout of stages
+    without one.
+    """
+    _check_graph(stages)
+    timeouts = timeouts or {}
+    started_at = time.perf_counter()
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run_stage(stage: Stage) -> StageResult:
+        if stage.depends_on:
+            await asyncio.gather(
+                *[tasks[dependency] for dependency in stage.depends_on]
+            )
+
+        result = StageResult(name=stage.name, started_at=time.perf_counter())
+        result.waited = result.started_at - started_at
+
+        timeout = stage.timeout or timeouts.get(stage.name)
+        with tracer.start_as_current_span(f"{name}.{stage.name}") as span:
+            try:
+                if timeout:
+                    result.value = await asyncio.wait_for(stage.run(), timeout)
+                else:
+                    result.value = await stage.run()
+            except asyncio.TimeoutError:
+                if stage.required:
+                    raise
+                log.warning(f"{name} stage {stage.name} timed out after {timeout}s")
+                result.value, result.status = stage.default, "timeout"
+            except Exception as e:
+                if stage.required:
+                    raise
+                log.exception(f"{name} stage {stage.name} failed: {e}")
+                result.value, result.status = stage.default, "failed"
+            finally:
+                result.duration = time.perf_counter() - result.started_at
+
+            span.set_attribute("stage.status", result.status)
+            span.set_attribute("stage.waited_ms", result.waited * 1000)
+
+        return result
+
+    # Dependencies come first, so every task can await the ones it depends on
+    order = {stage.name: stage for stage in stages}
+    pending = list(order)
+    while pending:
+        for stage_name in list(pending):
+            if all(dependency in tasks for dependency in order[stage_name].depends_on):
+                tasks[stage_name] = asyncio.create_task(run_stage(order[stage_name]))
+                pending.remove(stage_name)
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    return {stage_name: task.result() for stage_name, task in tasks.items()}
+
+
+def get_stage_timings(results: dict[str, StageResult]) -> dict[str, dict]:
+    return {
+        stage_name: {
+            "status": result.status,
+            "duration_ms": round(result.duration * 1000, 1),
+            "waited_ms": round(result.waited * 1000, 1),
+        }
+        for stage_name, result in results.items()
+    }
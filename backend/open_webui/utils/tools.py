@@ -1,3 +1,4 @@
+import hashlib
 import inspect
 import logging
 import re
@@ -39,7 +40,11 @@ from open_webui.models.tools import Tools
 from open_webui.models.users import UserModel
 from open_webui.models.groups import Groups
 from open_webui.models.access_grants import AccessGrants
-from open_webui.utils.plugin import load_tool_module_by_id
+from open_webui.utils.plugin import (
+    load_tool_module_by_id,
+    get_tool_module_from_cache,
+    get_tool_valves_from_cache,
+)
 from open_webui.utils.access_control import has_access, has_connection_access
 from open_webui.config import BYPASS_ADMIN_ACCESS_CONTROL
 from open_webui.env import (
@@ -49,8 +54,10 @@ from open_webui.env import (
     ENABLE_FORWARD_USER_INFO_HEADERS,
     FORWARD_SESSION_INFO_HEADER_CHAT_ID,
     FORWARD_SESSION_INFO_HEADER_MESSAGE_ID,
+    TOOL_SERVER_SPEC_REFRESH_INTERVAL,
 )
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.invalidation import CACHE_INVALIDATOR
 from open_webui.tools.builtin import (
     search_web,
     fetch_url,
@@ -174,10 +181,7 @@ async def get_tools(
                 log.warning(f"Access denied to tool {tool_id} for user {user.id}")
                 continue
 
-            module = request.app.state.TOOLS.get(tool_id, None)
-            if module is None:
-                module, _ = load_tool_module_by_id(tool_id)
-                request.app.state.TOOLS[tool_id] = module
+            module, _ = get_tool_module_from_cache(request, tool_id)
 
             __user__ = {
                 **extra_params["__user__"],
@@ -185,7 +189,7 @@ async def get_tools(
 
             # Set valves for the tool
             if hasattr(module, "valves") and hasattr(module, "Valves"):
-                valves = Tools.get_tool_valves_by_id(tool_id) or {}
+                valves = get_tool_valves_from_cache(request, tool_id) or {}
                 module.valves = module.Valves(**valves)
             if hasattr(module, "UserValves"):
                 __user__["valves"] = module.UserValves(  # type: ignore
@@ -843,32 +847,107 @@ def convert_openapi_to_tool_payload(openapi_spec):
     return tool_payload
 
 
-async def set_tool_servers(request: Request):
-    request.app.state.TOOL_SERVERS = await get_tool_servers_data(
-        request.app.state.config.TOOL_SERVER_CONNECTIONS
-    )
+class ToolServerRegistry:
+    """
+    Worker-local registry of the OpenAPI tool servers in TOOL_SERVER_CONNECTIONS.
+
+    Specs are kept in memory together with their already converted tool payloads
+    and the ETag / Last-Modified validators of the response, so a background
+    task can revalidate them every `refresh_interval` seconds with conditional
+    requests and only re-convert the specs that actually changed. Requests are
+    served from memory; whenever the servers change the `version` is bumped,
+    the list is written to Redis and other workers are told to reload it.
+    """
 
-    if request.app.state.redis is not None:
-        await request.app.state.redis.set(
-            "tool_servers", json.dumps(request.app.state.TOOL_SERVERS)
-        )
+    def __init__(self, refresh_interval: int = TOOL_SERVER_SPEC_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self.servers: Optional[list] = None
+        self.version = 0
+
+        # (spec url, token) or json spec hash -> validators, spec and tool payload
+        self._specs: dict = {}
+        self._stale = True
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self, app) -> tuple[list, bool]:
+        """Revalidates the specs of the configured servers, returns (servers, changed)."""
+        async with self._lock:
+            servers = await get_tool_servers_data(
+                app.state.config.TOOL_SERVER_CONNECTIONS, spec_cache=self._specs
+            )
 
-    return request.app.state.TOOL_SERVERS
+            changed = servers != self.servers
+            self.servers = servers
+            self._stale = False
+            app.state.TOOL_SERVERS = servers
+
+            if changed:
+                self.version += 1
+                if app.state.redis is not None:
+                    await app.state.redis.set("tool_servers", json.dumps(servers))
+
+            return servers, changed
+
+    async def get(self, app) -> list:
+        if not self._stale:
+            return self.servers
+
+        if app.state.redis is not None:
+            try:
+                data = await app.state.redis.get("tool_servers")
+                if data:
+                    servers = json.loads(data)
+                    if servers != self.servers:
+                        self.version += 1
+                    self.servers = servers
+                    self._stale = False
+                    app.state.TOOL_SERVERS = servers
+                    return servers
+            except Exception as e:
+                log.error(f"Error fetching tool_servers from Redis: {e}")
+
+        servers, _ = await self.refresh(app)
+        return servers
+
+    def invalidate(self, key: Optional[str] = None):
+        # The validators are kept, the next refresh can still use conditional requests
+        self._stale = True
+
+    async def _refresh_loop(self, app):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                if app.state.config.TOOL_SERVER_CONNECTIONS:
+                    _, changed = await self.refresh(app)
+                    if changed:
+                        log.info("OpenAPI tool server specs changed, reloading")
+                        CACHE_INVALIDATOR.publish("tool_servers")
+            except Exception as e:
+                log.exception(f"Error refreshing tool server specs: {e}")
+
+    def start(self, app):
+        if self.refresh_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop(app))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+TOOL_SERVER_REGISTRY = ToolServerRegistry()
 
 
-async def get_tool_servers(request: Request):
-    tool_servers = []
-    if request.app.state.redis is not None:
-        try:
-            tool_servers = json.loads(await request.app.state.redis.get("tool_servers"))
-            request.app.state.TOOL_SERVERS = tool_servers
-        except Exception as e:
-            log.error(f"Error fetching tool_servers from Redis: {e}")
+async def set_tool_servers(request: Request):
+    servers, changed = await TOOL_SERVER_REGISTRY.refresh(request.app)
+    if changed:
+        CACHE_INVALIDATOR.publish("tool_servers")
+    return servers
 
-    if not tool_servers:
-        tool_servers = await set_tool_servers(request)
 
-    return tool_servers
+async def get_tool_servers(request: Request):
+    return await TOOL_SERVER_REGISTRY.get(request.app)
 
 
 async def get_terminal_cwd(
@@ -1046,6 +1125,18 @@ async def get_terminal_tools(
 
 
 async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, Any]:
+    data = await fetch_tool_server_data(url, headers)
+    return data["spec"]
+
+
+async def fetch_tool_server_data(
+    url: str, headers: Optional[dict], cached: Optional[dict] = None
+) -> Dict[str, Any]:
+    """
+    Fetches the spec at `url` as {"spec", "etag", "last_modified"}. When `cached`
+    (a previous result) is given the request is conditional, and `cached` itself
+    is returned if the server answers 304 Not Modified.
+    """
     _headers = {
         "Accept": "application/json",
         "Content-Type": "application/json",
@@ -1054,6 +1145,12 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
     if headers:
         _headers.update(headers)
 
+    if cached:
+        if cached.get("etag"):
+            _headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            _headers["If-Modified-Since"] = cached["last_modified"]
+
     error = None
     try:
         timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA)
@@ -1061,6 +1158,10 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
             async with session.get(
                 url, headers=_headers, ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL
             ) as response:
+                if response.status == 304 and cached:
+                    log.debug(f"Tool server spec at {url} not modified")
+                    return cached
+
                 if response.status != 200:
                     error_body = await response.json()
                     raise Exception(error_body)
@@ -1082,6 +1183,9 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
                     except Exception as e:
                         raise e
 
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
     except Exception as err:
         log.exception(f"Could not fetch tool server spec from {url}")
         if isinstance(err, dict) and "detail" in err:
@@ -1091,12 +1195,21 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
         raise Exception(error)
 
     log.debug(f"Fetched data: {res}")
-    return res
+    return {"spec": res, "etag": etag, "last_modified": last_modified}
 
 
-async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    # Prepare list of enabled servers along with their original index
+async def get_tool_servers_data(
+    servers: List[Dict[str, Any]], spec_cache: Optional[dict] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetches and converts the specs of the enabled OpenAPI servers. `spec_cache`
+    (see ToolServerRegistry) is updated in place: specs still matching their
+    cached validators or JSON content are not fetched or converted again.
+    """
+    if spec_cache is None:
+        spec_cache = {}
 
+    # Prepare list of enabled servers along with their original index
     tasks = []
     server_entries = []
     for idx, server in enumerate(servers):
@@ -1124,75 +1237,95 @@ async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str,
 
             # Create async tasks to fetch data
             task = None
+            cache_key = None
             if spec_type == "url":
                 # Path (to OpenAPI spec URL) can be either a full URL or a path to append to the base URL
                 openapi_path = server.get("path", "openapi.json")
                 spec_url = get_tool_server_url(server_url, openapi_path)
+                cache_key = (spec_url, token)
                 # Fetch from URL
-                task = get_tool_server_data(
+                task = fetch_tool_server_data(
                     spec_url,
                     {"Authorization": f"Bearer {token}"} if token else None,
+                    spec_cache.get(cache_key),
                 )
             elif spec_type == "json" and server.get("spec", ""):
-                # Use provided JSON spec
-                spec_json = None
-                try:
-                    spec_json = json.loads(server.get("spec", ""))
-                except Exception as e:
-                    log.error(f"Error parsing JSON spec for tool server {id}: {e}")
-
-                if spec_json:
-                    task = asyncio.sleep(
-                        0,
-                        result=spec_json,
-                    )
+                cache_key = hashlib.sha256(server.get("spec", "").encode()).hexdigest()
+                if cache_key in spec_cache:
+                    task = asyncio.sleep(0, result=spec_cache[cache_key])
+                else:
+                    # Use provided JSON spec
+                    spec_json = None
+                    try:
+                        spec_json = json.loads(server.get("spec", ""))
+                    except Exception as e:
+                        log.error(f"Error parsing JSON spec for tool server {id}: {e}")
+
+                    if spec_json:
+                        task = asyncio.sleep(
+                            0,
+                            result={"spec": spec_json},
+                        )
 
             if task:
                 tasks.append(task)
-                server_entries.append((id, idx, server, server_url, info, token))
+                server_entries.append((id, idx, server, server_url, info, cache_key))
 
     # Execute tasks concurrently
     responses = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Build final results with index and server metadata
     results = []
-    for (id, idx, server, url, info, _), response in zip(server_entries, responses):
+    used_keys = set()
+    for (id, idx, server, url, info, cache_key), response in zip(
+        server_entries, responses
+    ):
         if isinstance(response, Exception):
-            log.error(f"Failed to connect to {url} OpenAPI tool server")
-            continue
+            if cache_key not in spec_cache:
+                log.error(f"Failed to connect to {url} OpenAPI tool server")
+                continue
+
+            # Keep serving the last known spec while the server is unreachable
+            log.warning(f"Failed to revalidate {url} OpenAPI tool server spec")
+            response = spec_cache[cache_key]
+
+        spec = response.get("spec")
 
         # Guard against invalid or non-OpenAPI specs (e.g., MCP-style configs)
-        if not isinstance(response, dict) or "paths" not in response:
+        if not isinstance(spec, dict) or "paths" not in spec:
             log.warning(f"Invalid OpenAPI spec from {url}: missing 'paths'")
             continue
 
-        response = {
-            "openapi": response,
-            "info": response.get("info", {}),
-            "specs": convert_openapi_to_tool_payload(response),
-        }
-
-        openapi_data = response.get("openapi", {})
-        if info and isinstance(openapi_data, dict):
-            openapi_data["info"] = openapi_data.get("info", {})
+        # Converting resolves every $ref, only do it once per spec version
+        if "specs" not in response:
+            response["specs"] = convert_openapi_to_tool_payload(spec)
+        spec_cache[cache_key] = response
+        used_keys.add(cache_key)
 
+        # Copy the info so the cached spec is not modified
+        openapi_info = dict(spec.get("info", {}))
+        if info:
             if "name" in info:
-                openapi_data["info"]["title"] = info.get("name", "Tool Server")
+                openapi_info["title"] = info.get("name", "Tool Server")
 
             if "description" in info:
-                openapi_data["info"]["description"] = info.get("description", "")
+                openapi_info["description"] = info.get("description", "")
 
         results.append(
             {
                 "id": str(id),
                 "idx": idx,
                 "url": server.get("url"),
-                "openapi": openapi_data,
-                "info": response.get("info"),
-                "specs": response.get("specs"),
+                "openapi": {**spec, "info": openapi_info},
+                "info": openapi_info,
+                "specs": response["specs"],
             }
         )
 
+    # Forget servers that were removed or whose spec changed
+    for key in set(spec_cache) - used_keys:
+        del spec_cache[key]
+
     return results
 
 
@@ -0,0 +1,314 @@
+"""
+A local faster-whisper inference service, shared by all the workers of a node.
+
+The first worker needing it spawns the service process, which owns the only
+copy of the model and transcribes the jobs sent over a Unix socket one at a
+time, batching the speech segments of each file. It exits with the worker
+that started it, the next job then starts a new one.
+
+This module is imported by the service process, keep it free of app imports.
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable, Optional
+
+log = logging.getLogger(__name__)
+
+
+# Seconds to wait for a new service process to accept connections
+START_TIMEOUT = 30
+
+
+####################################
+# Service process side
+####################################
+
+
+def load_faster_whisper_model(model_kwargs: dict):
+    from faster_whisper import WhisperModel
+
+    try:
+        return WhisperModel(**model_kwargs)
+    except Exception:
+        log.warning(
+            "WhisperModel initialization failed, attempting download with local_files_only=False"
+        )
+        return WhisperModel(**{**model_kwargs, "local_files_only": False})
+
+
+@dataclass
+class Job:
+    file_path: str
+    model_kwargs: dict
+    options: dict
+    conn: Connection
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class WhisperServer:
+    """
+    Accepts jobs on `address` and transcribes them with one model on a single
+    inference thread. `batch_size` speech segments of a file are decoded
+    together (faster-whisper's BatchedInferencePipeline), 0 decodes them one by
+    one like WhisperModel.transcribe.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        authkey: bytes,
+        batch_size: int = 0,
+        load_model: Callable[[dict], object] = load_faster_whisper_model,
+    ):
+        self.address = address
+        self.authkey = authkey
+        self.batch_size = batch_size
+        self.load_model = load_model
+
+        self._jobs: queue.Queue[Job] = queue.Queue()
+        self._model = None
+        self._model_kwargs = None
+        self._lock = threading.Lock()
+
+        self._latencies = deque(maxlen=1000)
+        self._metrics = {
+            "jobs": 0,
+            "failed_jobs": 0,
+            "audio_seconds": 0.0,
+            "processing_seconds": 0.0,
+        }
+
+    def _get_model(self, model_kwargs: dict):
+        # The model is only reloaded when the admin changes it
+        if self._model is None or self._model_kwargs != model_kwargs:
+            self._model = None
+            self._model = self.load_model(model_kwargs)
+            self._model_kwargs = model_kwargs
+
+            if self.batch_size > 0:
+                from faster_whisper import BatchedInferencePipeline
+
+                self._pipeline = BatchedInferencePipeline(model=self._model)
+        return self._model
+
+    def _transcribe(self, job: Job) -> dict:
+        model = self._get_model(job.model_kwargs)
+        if self.batch_size > 0:
+            segments, info = self._pipeline.transcribe(
+                job.file_path, batch_size=self.batch_size, **job.options
+            )
+        else:
+            segments, info = model.transcribe(job.file_path, **job.options)
+
+        return {
+            # Segments are decoded lazily, while joining them
+            "text": "".join([segment.text for segment in list(segments)]),
+            "language": info.language,
+            "language_probability": info.language_probability,
+            "duration": info.duration,
+        }
+
+    def run_inference(self):
+        while True:
+            job = self._jobs.get()
+            started_at = time.monotonic()
+            try:
+                result = self._transcribe(job)
+            except Exception as e:
+                log.exception(f"Error transcribing {job.file_path}: {e}")
+                result = {"error": str(e)}
+
+            with self._lock:
+                self._latencies.append(started_at - job.enqueued_at)
+                self._metrics["jobs"] += 1
+                if "error" in result:
+                    self._metrics["failed_jobs"] += 1
+                else:
+                    self._metrics["audio_seconds"] += result["duration"]
+                    self._metrics["processing_seconds"] += time.monotonic() - started_at
+
+            try:
+                job.conn.send(result)
+            except Exception as e:
+                log.debug(f"Could not send transcription of {job.file_path}: {e}")
+            finally:
+                job.conn.close()
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            metrics = dict(self._metrics)
+            latencies = sorted(self._latencies)
+
+        return {
+            **metrics,
+            "pid": os.getpid(),
+            "batch_size": self.batch_size,
+            "queue_depth": self._jobs.qsize(),
+            "avg_queue_latency_ms": (
+                sum(latencies) / len(latencies) * 1000 if latencies else 0
+            ),
+            "p95_queue_latency_ms": (
+                latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0
+            ),
+            # Processing time per second of audio, below 1 is faster than real time
+            "real_time_factor": (
+                metrics["processing_seconds"] / metrics["audio_seconds"]
+                if metrics["audio_seconds"]
+                else 0
+            ),
+        }
+
+    def handle(self, conn: Connection):
+        try:
+            message = conn.recv()
+            if message.get("type") == "transcribe":
+                self._jobs.put(
+                    Job(
+                        file_path=message["file_path"],
+                        model_kwargs=message["model_kwargs"],
+                        options=message.get("options", {}),
+                        conn=conn,
+                    )
+                )
+                return
+
+            conn.send(self.get_metrics() if message.get("type") == "metrics" else {})
+        except Exception as e:
+            log.debug(f"Invalid whisper service request: {e}")
+        conn.close()
+
+    def serve_forever(self, listener: Optional[Listener] = None):
+        if listener is None:
+            if os.path.exists(self.address):
+                # Left over by a service that died, nothing answers on it
+                os.unlink(self.address)
+            listener = Listener(self.address, family="AF_UNIX", authkey=self.authkey)
+
+        threading.Thread(target=self.run_inference, daemon=True).start()
+        while True:
+            try:
+                conn = listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError) as e:
+                # Wrong authkey or a client that went away
+                log.debug(f"Rejected whisper service connection: {e}")
+                continue
+            threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+
+
+def serve(address: str, authkey: bytes, batch_size: int, log_level: str):
+    logging.basicConfig(level=log_level)
+    WhisperServer(address, authkey, batch_size).serve_forever()
+
+
+####################################
+# Worker side
+####################################
+
+
+class WhisperServiceError(Exception):
+    pass
+
+
+class WhisperService:
+    """
+    Client of the WhisperServer listening on `address`, started by the first
+    call that finds none.
+    """
+
+    def __init__(self, address: str, authkey: bytes, batch_size: int = 0):
+        self.address = address
+        self.authkey = authkey
+        self.batch_size = batch_size
+        self._process = None
+
+    def _connect(self) -> Connection:
+        return Client(self.address, family="AF_UNIX", authkey=self.authkey)
+
+    def _start(self):
+        import fcntl
+
+        os.makedirs(os.path.dirname(self.address) or ".", exist_ok=True)
+        # Workers race to start the service, the first one takes the lock
+        with open(f"{self.address}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._connect().close()
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                pass
+
+            log.info(f"Starting whisper service on {self.address}")
+            # Daemonic, the service stops with the worker that started it
+            self._process = multiprocessing.get_context("spawn").Process(
+                target=serve,
+                args=(
+                    self.address,
+                    self.authkey,
+                    self.batch_size,
+                    logging.getLevelName(logging.getLogger().level),
+                ),
+                daemon=True,
+            )
+            self._process.start()
+
+            deadline = time.monotonic() + START_TIMEOUT
+            while time.monotonic() < deadline and self._process.is_alive():
+                try:
+                    self._connect().close()
+                    return
+                except (FileNotFoundError, ConnectionRefusedError):
+                    time.sleep(0.1)
+
+        raise WhisperServiceError("Whisper service did not start")
+
+    def _request(self, message: dict):
+        try:
+            conn = self._connect()
+        except (FileNotFoundError, ConnectionRefusedError):
+            self._start()
+            conn = self._connect()
+
+        try:
+            conn.send(message)
+            return conn.recv()
+        except EOFError:
+            raise WhisperServiceError("Whisper service stopped while transcribing")
+        finally:
+            conn.close()
+
+    def transcribe(self, file_path: str, model_kwargs: dict, **options) -> dict:
+        """
+        Transcribes `file_path` with the model of `model_kwargs` (see
+        WhisperModel) and WhisperModel.transcribe `options`. Blocks until done.
+        """
+        result = self._request(
+            {
+                "type": "transcribe",
+                "file_path": os.path.abspath(file_path),
+                "model_kwargs": model_kwargs,
+                "options": options,
+            }
+        )
+        if "error" in result:
+            raise WhisperServiceError(result["error"])
+        return result
+
+    def get_metrics(self) -> dict:
+        try:
+            conn = self._connect()
+        except (FileNotFoundError, ConnectionRefusedError):
+            return {"running": False}
+
+        try:
+            conn.send({"type": "metrics"})
+            return {"running": True, **conn.recv()}
+        finally:
+            conn.close()